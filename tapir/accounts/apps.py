@@ -11,3 +11,7 @@ class AccountsConfig(AppConfig):
         from tapir.accounts.drf_authentication import (
             DrfForwardAuthenticationScheme,
         )  # noqa: E402
+
+        from tapir.accounts.services.keycloak_role_cache import KeycloakRoleCache
+
+        KeycloakRoleCache.connect_signals()
@@ -0,0 +1,40 @@
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0006_emailchangerequest_updated_at"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name="tapiruser",
+            name="search_text",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.db.models.functions.text.Lower(
+                    django.db.models.functions.text.Concat(
+                        "first_name",
+                        models.Value(" "),
+                        "last_name",
+                        models.Value(" "),
+                        "email",
+                    )
+                ),
+                output_field=models.TextField(),
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="tapiruser",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_text"],
+                name="idx_tapiruser_search_text",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+    ]
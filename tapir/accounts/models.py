@@ -4,7 +4,10 @@ from functools import partial
 from django.conf import settings
 from django.contrib.auth import user_logged_out
 from django.contrib.auth.models import AbstractUser
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models, transaction
+from django.db.models import Value
+from django.db.models.functions import Concat, Lower
 from django.dispatch import receiver
 from django.urls import reverse
 from django.utils import translation
@@ -15,10 +18,12 @@ from phonenumber_field.modelfields import PhoneNumberField
 from tapir_mail.models import StaticSegmentRecipient
 
 from tapir import utils
+from tapir.accounts.services.keycloak_role_cache import KeycloakRoleCache
 from tapir.accounts.services.keycloak_user_manager import KeycloakUserManager
 from tapir.core.models import ID_LENGTH, TapirModel, generate_id
 from tapir.log.models import TextLogEntry, UpdateModelLogEntry
 from tapir.utils.models import CountryField
+from tapir.utils.services.tapir_cache_manager import TapirCacheManager
 from tapir.utils.shortcuts import is_running_tests
 from tapir.utils.user_utils import UserUtils
 
@@ -90,7 +95,7 @@ class KeycloakUser(AbstractUser):
             target = obj
 
         if target.roles is None:
-            target.roles = KeycloakUserManager.get_user_roles(
+            target.roles = KeycloakRoleCache.get_user_roles(
                 keycloak_id=target.keycloak_id
             )
 
@@ -179,6 +184,7 @@ class KeycloakUser(AbstractUser):
                 kc.delete_user(self.keycloak_id)
             except KeycloakDeleteError as e:
                 print("Error deleting Keycloak user: ", e)
+        KeycloakRoleCache.invalidate_user_roles(self.keycloak_id)
         super().delete(*args, **kwargs)
 
     def change_email(self, new_email: str, cache: dict):
@@ -215,6 +221,23 @@ class TapirUser(KeycloakUser):
         default="de",
         max_length=16,
     )
+    # Maintained by the database, used by MemberSearchService
+    search_text = models.GeneratedField(
+        expression=Lower(
+            Concat("first_name", Value(" "), "last_name", Value(" "), "email")
+        ),
+        output_field=models.TextField(),
+        db_persist=True,
+    )
+
+    class Meta:
+        indexes = [
+            GinIndex(
+                fields=["search_text"],
+                opclasses=["gin_trgm_ops"],
+                name="idx_tapiruser_search_text",
+            )
+        ]
 
     @transaction.atomic
     def save(self, *args, **kwargs):
@@ -224,6 +247,9 @@ class TapirUser(KeycloakUser):
     @transaction.atomic
     def change_email(self, new_email: str, cache: dict):
         TapirUser.objects.filter(id=self.id).update(email=new_email, username=new_email)
+        TapirCacheManager.clear_category(
+            cache=cache, category=TapirCacheManager.CATEGORY_MEMBERS
+        )
         super().change_email(new_email, cache=cache)
 
     def get_display_name(self):
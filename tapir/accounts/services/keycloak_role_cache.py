@@ -0,0 +1,92 @@
+import threading
+
+from django.conf import settings
+from django.contrib.auth.signals import user_logged_in
+from django.core.cache import caches
+
+from tapir.accounts.services.keycloak_user_manager import KeycloakUserManager
+
+
+class KeycloakRoleCache:
+    """
+    The roles of each user, stored in a django cache backend so that permission checks don't request them from keycloak on every request.
+    Role changes done in keycloak are visible after at most KEYCLOAK_ROLE_CACHE_TIMEOUT seconds,
+    or immediately after invalidate_user_roles, which is called when the user logs in.
+    """
+
+    KEY_PREFIX = "keycloak_roles"
+
+    _metrics_lock = threading.Lock()
+    _nb_hits = 0
+    _nb_misses = 0
+
+    @classmethod
+    def get_backend(cls):
+        return caches[getattr(settings, "KEYCLOAK_ROLE_CACHE_ALIAS", "default")]
+
+    @classmethod
+    def get_timeout(cls) -> int:
+        return getattr(settings, "KEYCLOAK_ROLE_CACHE_TIMEOUT", 5 * 60)
+
+    @classmethod
+    def build_key(cls, keycloak_id: str) -> str:
+        return f"{cls.KEY_PREFIX}:{keycloak_id}"
+
+    @classmethod
+    def get_user_roles(cls, keycloak_id: str) -> list[str]:
+        backend = cls.get_backend()
+        key = cls.build_key(keycloak_id)
+
+        roles = backend.get(key)
+        if roles is not None:
+            cls._record(hit=True)
+            return roles
+
+        cls._record(hit=False)
+        roles = KeycloakUserManager.get_user_roles(keycloak_id=keycloak_id)
+        backend.set(key, roles, timeout=cls.get_timeout())
+        return roles
+
+    @classmethod
+    def invalidate_user_roles(cls, keycloak_id: str | None):
+        if keycloak_id is None:
+            return
+
+        cls.get_backend().delete(cls.build_key(keycloak_id))
+
+    @classmethod
+    def connect_signals(cls):
+        user_logged_in.connect(
+            cls.on_user_logged_in,
+            weak=False,
+            dispatch_uid="keycloak_role_cache:user_logged_in",
+        )
+
+    @classmethod
+    def on_user_logged_in(cls, sender, user, **kwargs):
+        cls.invalidate_user_roles(getattr(user, "keycloak_id", None))
+
+    @classmethod
+    def _record(cls, hit: bool):
+        with cls._metrics_lock:
+            if hit:
+                cls._nb_hits += 1
+            else:
+                cls._nb_misses += 1
+
+    @classmethod
+    def get_metrics(cls) -> dict[str, int | float]:
+        # The counters are per process
+        with cls._metrics_lock:
+            nb_lookups = cls._nb_hits + cls._nb_misses
+            return {
+                "hits": cls._nb_hits,
+                "misses": cls._nb_misses,
+                "hit_rate": cls._nb_hits / nb_lookups if nb_lookups > 0 else 0.0,
+            }
+
+    @classmethod
+    def reset_metrics(cls):
+        with cls._metrics_lock:
+            cls._nb_hits = 0
+            cls._nb_misses = 0
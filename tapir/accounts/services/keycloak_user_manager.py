@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import threading
 from typing import TYPE_CHECKING
 
 from allauth.socialaccount.models import SocialAccount
@@ -13,6 +14,9 @@ if TYPE_CHECKING:
 
 
 class KeycloakUserManager:
+    _shared_client: KeycloakAdmin | None = None
+    _shared_client_lock = threading.Lock()
+
     @classmethod
     def create_keycloak_user(
         cls,
@@ -102,23 +106,38 @@ class KeycloakUserManager:
 
     @classmethod
     def get_keycloak_client(cls, cache: dict):
-        def compute():
-            config = settings.KEYCLOAK_ADMIN_CONFIG
-
-            keycloak_connection = KeycloakOpenIDConnection(
-                server_url=config["SERVER_URL"],
-                realm_name=config["REALM_NAME"],
-                client_id=config["CLIENT_ID"],
-                client_secret_key=config["CLIENT_SECRET_KEY"],
-                verify=True,
-            )
+        return get_from_cache_or_compute(
+            cache=cache,
+            key="keycloak_client",
+            compute_function=cls.get_shared_keycloak_client,
+        )
 
-            return KeycloakAdmin(connection=keycloak_connection)
+    @classmethod
+    def get_shared_keycloak_client(cls) -> KeycloakAdmin:
+        # One client per process: the connection keeps its admin token and refreshes it when it expires,
+        # instead of requesting a new token for every request.
+        if cls._shared_client is not None:
+            return cls._shared_client
 
-        return get_from_cache_or_compute(
-            cache=cache, key="keycloak_client", compute_function=compute
+        with cls._shared_client_lock:
+            if cls._shared_client is None:
+                cls._shared_client = cls.build_keycloak_client()
+        return cls._shared_client
+
+    @classmethod
+    def build_keycloak_client(cls) -> KeycloakAdmin:
+        config = settings.KEYCLOAK_ADMIN_CONFIG
+
+        keycloak_connection = KeycloakOpenIDConnection(
+            server_url=config["SERVER_URL"],
+            realm_name=config["REALM_NAME"],
+            client_id=config["CLIENT_ID"],
+            client_secret_key=config["CLIENT_SECRET_KEY"],
+            verify=True,
         )
 
+        return KeycloakAdmin(connection=keycloak_connection)
+
     @classmethod
     def get_user_roles(cls, keycloak_id):
         keycloak_client = KeycloakUserManager.get_keycloak_client(cache={})
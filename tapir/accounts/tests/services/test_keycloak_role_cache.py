@@ -0,0 +1,91 @@
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from django.test import override_settings
+
+from tapir.accounts.services.keycloak_role_cache import KeycloakRoleCache
+from tapir.accounts.services.keycloak_user_manager import KeycloakUserManager
+from tapir.wirgarten.tests.test_utils import TapirUnitTest
+
+
+class FakeKeycloakAdmin:
+    def __init__(self, roles_by_keycloak_id: dict[str, list[str]]):
+        self.roles_by_keycloak_id = roles_by_keycloak_id
+        self.nb_role_requests = 0
+
+    def get_composite_realm_roles_of_user(self, keycloak_id: str):
+        self.nb_role_requests += 1
+        return [{"name": role} for role in self.roles_by_keycloak_id[keycloak_id]]
+
+
+@override_settings(
+    KEYCLOAK_ROLE_CACHE_ALIAS="keycloak_role_cache_test",
+    CACHES={
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+        "keycloak_role_cache_test": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "keycloak_role_cache_test",
+        },
+    },
+)
+class TestKeycloakRoleCache(TapirUnitTest):
+    def setUp(self):
+        super().setUp()
+        KeycloakRoleCache.get_backend().clear()
+        KeycloakRoleCache.reset_metrics()
+
+        self.fake_keycloak = FakeKeycloakAdmin(
+            {"user_1": ["admin", "offline_access"], "user_2": []}
+        )
+        patcher = patch.object(
+            KeycloakUserManager, "get_keycloak_client", autospec=True
+        )
+        self.mock_get_keycloak_client = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.mock_get_keycloak_client.return_value = self.fake_keycloak
+
+    def test_getUserRoles_calledTwice_requestsKeycloakOnlyOnce(self):
+        first_result = KeycloakRoleCache.get_user_roles(keycloak_id="user_1")
+        second_result = KeycloakRoleCache.get_user_roles(keycloak_id="user_1")
+
+        self.assertEqual(["admin"], first_result)
+        self.assertEqual(["admin"], second_result)
+        self.assertEqual(1, self.fake_keycloak.nb_role_requests)
+        self.assertEqual(
+            {"hits": 1, "misses": 1, "hit_rate": 0.5}, KeycloakRoleCache.get_metrics()
+        )
+
+    def test_getUserRoles_userWithoutRoles_emptyListIsCached(self):
+        KeycloakRoleCache.get_user_roles(keycloak_id="user_2")
+        result = KeycloakRoleCache.get_user_roles(keycloak_id="user_2")
+
+        self.assertEqual([], result)
+        self.assertEqual(1, self.fake_keycloak.nb_role_requests)
+
+    def test_getUserRoles_rolesInvalidated_requestsKeycloakAgain(self):
+        KeycloakRoleCache.get_user_roles(keycloak_id="user_1")
+        self.fake_keycloak.roles_by_keycloak_id["user_1"] = ["member"]
+        KeycloakRoleCache.invalidate_user_roles(keycloak_id="user_1")
+
+        result = KeycloakRoleCache.get_user_roles(keycloak_id="user_1")
+
+        self.assertEqual(["member"], result)
+        self.assertEqual(2, self.fake_keycloak.nb_role_requests)
+
+    def test_getUserRoles_otherUserInvalidated_usesCachedRoles(self):
+        KeycloakRoleCache.get_user_roles(keycloak_id="user_1")
+        KeycloakRoleCache.invalidate_user_roles(keycloak_id="user_2")
+
+        KeycloakRoleCache.get_user_roles(keycloak_id="user_1")
+
+        self.assertEqual(1, self.fake_keycloak.nb_role_requests)
+
+    def test_onUserLoggedIn_default_invalidatesRolesOfTheUser(self):
+        KeycloakRoleCache.get_user_roles(keycloak_id="user_1")
+
+        KeycloakRoleCache.on_user_logged_in(
+            sender=None, user=SimpleNamespace(keycloak_id="user_1")
+        )
+        KeycloakRoleCache.get_user_roles(keycloak_id="user_1")
+
+        self.assertEqual(2, self.fake_keycloak.nb_role_requests)
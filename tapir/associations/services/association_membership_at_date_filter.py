@@ -0,0 +1,44 @@
+import datetime
+
+from django.db.models import QuerySet, Q, Exists, OuterRef
+
+from tapir.associations.models import AssociationMembership
+from tapir.wirgarten.models import Member
+
+
+class AssociationMembershipAtDateFilter:
+    @classmethod
+    def get_memberships_active_at_date(
+        cls, reference_date: datetime.date
+    ) -> QuerySet[AssociationMembership]:
+        return AssociationMembership.objects.filter(
+            Q(start_date__lte=reference_date)
+            & (Q(end_date__isnull=True) | Q(end_date__gte=reference_date))
+        )
+
+    @classmethod
+    def filter_members_with_membership_at_date(
+        cls,
+        queryset: QuerySet[Member],
+        reference_date: datetime.date,
+        membership_type_id: str | None = None,
+    ) -> QuerySet[Member]:
+        memberships = cls.get_memberships_active_at_date(reference_date).filter(
+            member_id=OuterRef("id")
+        )
+        if membership_type_id is not None:
+            memberships = memberships.filter(type_id=membership_type_id)
+
+        return queryset.filter(Exists(memberships))
+
+    @classmethod
+    def filter_members_without_membership_at_date(
+        cls, queryset: QuerySet[Member], reference_date: datetime.date
+    ) -> QuerySet[Member]:
+        return queryset.filter(
+            ~Exists(
+                cls.get_memberships_active_at_date(reference_date).filter(
+                    member_id=OuterRef("id")
+                )
+            )
+        )
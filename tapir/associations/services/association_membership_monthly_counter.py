@@ -0,0 +1,100 @@
+import bisect
+import datetime
+
+from django.db.models import Count, DateField, Q
+from django.db.models.functions import TruncMonth
+
+from tapir.associations.models import AssociationMembership
+from tapir.utils.shortcuts import get_last_day_of_month
+
+
+class AssociationMembershipMonthlyCounter:
+    """
+    The counts used by the association dashboard, for all months and all membership types at once.
+    The months are given as the first day of each month, in ascending order.
+    The results are keyed by (membership type id, month), missing keys mean 0.
+    """
+
+    @classmethod
+    def count_active_memberships(
+        cls, months: list[datetime.date]
+    ) -> dict[tuple[str, datetime.date], int]:
+        """
+        Number of memberships active at the first day of each month.
+        A single query loads the memberships that overlap the range,
+        each membership then adds 1 to every month between its start and end date.
+        """
+        if len(months) == 0:
+            return {}
+
+        memberships = AssociationMembership.objects.filter(
+            Q(end_date=None) | Q(end_date__gte=months[0]),
+            start_date__lte=months[-1],
+        ).values_list("type_id", "start_date", "end_date")
+
+        differences_by_type_id: dict[str, list[int]] = {}
+        for type_id, start_date, end_date in memberships:
+            first_index = bisect.bisect_left(months, start_date)
+            after_last_index = (
+                len(months)
+                if end_date is None
+                else bisect.bisect_right(months, end_date)
+            )
+            if first_index >= after_last_index:
+                continue
+
+            differences = differences_by_type_id.setdefault(
+                type_id, [0] * (len(months) + 1)
+            )
+            differences[first_index] += 1
+            differences[after_last_index] -= 1
+
+        counts = {}
+        for type_id, differences in differences_by_type_id.items():
+            count = 0
+            for month, difference in zip(months, differences):
+                count += difference
+                counts[(type_id, month)] = count
+        return counts
+
+    @classmethod
+    def count_memberships_ending_in_month(
+        cls, months: list[datetime.date]
+    ) -> dict[tuple[str, datetime.date], int]:
+        return cls.count_per_month(
+            months, date_field="end_date", date_lookup="end_date"
+        )
+
+    @classmethod
+    def count_memberships_cancelled_in_month(
+        cls, months: list[datetime.date]
+    ) -> dict[tuple[str, datetime.date], int]:
+        # The lookup and the truncation use the current timezone, the same way the __year and __month lookups do
+        return cls.count_per_month(
+            months, date_field="cancellation_ts", date_lookup="cancellation_ts__date"
+        )
+
+    @classmethod
+    def count_per_month(
+        cls, months: list[datetime.date], date_field: str, date_lookup: str
+    ) -> dict[tuple[str, datetime.date], int]:
+        """
+        A single query grouped by membership type and month of the given field.
+        """
+        if len(months) == 0:
+            return {}
+
+        rows = (
+            AssociationMembership.objects.filter(
+                **{
+                    f"{date_lookup}__gte": months[0],
+                    f"{date_lookup}__lte": get_last_day_of_month(months[-1]),
+                }
+            )
+            .annotate(month=TruncMonth(date_field, output_field=DateField()))
+            .values("type_id", "month")
+            .annotate(count=Count("id"))
+            .values_list("type_id", "month", "count")
+        )
+
+        return {(type_id, month): count for type_id, month, count in rows}
@@ -8,40 +8,41 @@ from tapir.utils.shortcuts import get_first_of_next_month
 
 
 class DashboardDataBuilder:
+    # The range is chosen by the client, it is cut after that many months
+    MAX_NB_MONTHS = 10 * 12
+
     @classmethod
     def build_dashboard_data(
         cls,
         start_date: datetime.date,
         end_date: datetime.date,
-        count_function: Callable[[datetime.date, AssociationMembershipType], int],
+        count_function: Callable[
+            [list[datetime.date]], dict[tuple[str, datetime.date], int]
+        ],
     ):
+        """
+        count_function receives the first day of every month of the range
+        and returns the counts for all membership types, keyed by (membership type id, month).
+        """
         membership_types = AssociationMembershipType.objects.order_by("name")
-        labels = []
         colors = distinctipy.get_colors(
             len(membership_types) + 1, rng=123456, pastel_factor=0.5
         )
-        datasets = {
-            membership_type: {
+
+        months = cls.get_months(start_date=start_date, end_date=end_date)
+        labels = [month.strftime("%m.%Y") for month in months]
+        counts = count_function(months)
+
+        datasets = [
+            {
                 "name": membership_type.name,
                 "color": distinctipy.get_hex(colors[index]),
+                "values": [
+                    counts.get((membership_type.id, month), 0) for month in months
+                ],
             }
             for index, membership_type in enumerate(membership_types)
-        }
-
-        current_date = start_date.replace(day=1)
-        while current_date < end_date:
-            labels.append(current_date.strftime("%m.%Y"))
-            current_date = get_first_of_next_month(current_date)
-
-        for membership_type in membership_types:
-            datasets[membership_type]["values"] = cls._build_dataset_values(
-                membership_type=membership_type,
-                start_date=start_date,
-                end_date=end_date,
-                count_function=count_function,
-            )
-
-        datasets = list(datasets.values())
+        ]
 
         if len(membership_types) > 1:
             totals = [0 for _ in labels]
@@ -60,17 +61,13 @@ class DashboardDataBuilder:
         return labels, datasets
 
     @classmethod
-    def _build_dataset_values(
-        cls,
-        membership_type: AssociationMembershipType,
-        start_date: datetime.date,
-        end_date: datetime.date,
-        count_function: Callable[[datetime.date, AssociationMembershipType], int],
-    ):
+    def get_months(
+        cls, start_date: datetime.date, end_date: datetime.date
+    ) -> list[datetime.date]:
+        months = []
         current_date = start_date.replace(day=1)
-        values = []
-        while current_date < end_date:
-            values.append(count_function(current_date, membership_type))
+        while current_date < end_date and len(months) < cls.MAX_NB_MONTHS:
+            months.append(current_date)
             current_date = get_first_of_next_month(current_date)
 
-        return values
+        return months
@@ -0,0 +1,104 @@
+import datetime
+
+from tapir.associations.services.association_membership_at_date_filter import (
+    AssociationMembershipAtDateFilter,
+)
+from tapir.associations.tests.factories import AssociationMembershipFactory
+from tapir.utils.services.tapir_cache import TapirCache
+from tapir.wirgarten.models import Member
+from tapir.wirgarten.parameters import ParameterDefinitions
+from tapir.wirgarten.tests.factories import MemberFactory
+from tapir.wirgarten.tests.test_utils import TapirIntegrationTest
+
+
+class TestAssociationMembershipAtDateFilter(TapirIntegrationTest):
+    @classmethod
+    def setUpTestData(cls):
+        ParameterDefinitions().import_definitions(bulk_create=True)
+
+    def setUp(self):
+        super().setUp()
+        self.reference_date = datetime.date(year=2024, month=6, day=15)
+        (
+            self.member_with_open_membership,
+            self.member_with_membership_ending_at_reference_date,
+            self.member_with_past_membership,
+            self.member_with_future_membership,
+            self.member_without_membership,
+        ) = MemberFactory.create_batch(size=5)
+
+        self.open_membership = AssociationMembershipFactory.create(
+            member=self.member_with_open_membership,
+            start_date=datetime.date(year=2023, month=1, day=1),
+        )
+        AssociationMembershipFactory.create(
+            member=self.member_with_membership_ending_at_reference_date,
+            start_date=datetime.date(year=2024, month=1, day=1),
+            end_date=self.reference_date,
+        )
+        AssociationMembershipFactory.create(
+            member=self.member_with_past_membership,
+            start_date=datetime.date(year=2023, month=1, day=1),
+            end_date=datetime.date(year=2024, month=6, day=14),
+        )
+        AssociationMembershipFactory.create(
+            member=self.member_with_future_membership,
+            start_date=datetime.date(year=2024, month=6, day=16),
+        )
+
+    def test_filterMembersWithMembershipAtDate_default_sameMembersAsTheCache(self):
+        cache = {}
+        expected_ids = {
+            member.id
+            for member in Member.objects.all()
+            if TapirCache.get_member_association_membership_at_date(
+                member=member, reference_date=self.reference_date, cache=cache
+            )
+            is not None
+        }
+
+        members = (
+            AssociationMembershipAtDateFilter.filter_members_with_membership_at_date(
+                queryset=Member.objects.all(), reference_date=self.reference_date
+            )
+        )
+
+        self.assertEqual(
+            {
+                self.member_with_open_membership.id,
+                self.member_with_membership_ending_at_reference_date.id,
+            },
+            expected_ids,
+        )
+        self.assertEqual(expected_ids, set(members.values_list("id", flat=True)))
+
+    def test_filterMembersWithMembershipAtDate_membershipTypeGiven_returnsOnlyMembersWithThatType(
+        self,
+    ):
+        members = (
+            AssociationMembershipAtDateFilter.filter_members_with_membership_at_date(
+                queryset=Member.objects.all(),
+                reference_date=self.reference_date,
+                membership_type_id=self.open_membership.type_id,
+            )
+        )
+
+        self.assertEqual([self.member_with_open_membership], list(members))
+
+    def test_filterMembersWithoutMembershipAtDate_default_returnsMembersWithoutActiveMembership(
+        self,
+    ):
+        members = (
+            AssociationMembershipAtDateFilter.filter_members_without_membership_at_date(
+                queryset=Member.objects.all(), reference_date=self.reference_date
+            )
+        )
+
+        self.assertEqual(
+            {
+                self.member_with_past_membership.id,
+                self.member_with_future_membership.id,
+                self.member_without_membership.id,
+            },
+            set(members.values_list("id", flat=True)),
+        )
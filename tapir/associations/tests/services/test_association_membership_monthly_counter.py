@@ -0,0 +1,125 @@
+import datetime
+
+from django.utils import timezone
+
+from tapir.associations.services.association_membership_monthly_counter import (
+    AssociationMembershipMonthlyCounter,
+)
+from tapir.associations.tests.factories import (
+    AssociationMembershipFactory,
+    AssociationMembershipTypeFactory,
+)
+from tapir.wirgarten.parameters import ParameterDefinitions
+from tapir.wirgarten.tests.test_utils import TapirIntegrationTest
+
+
+class TestAssociationMembershipMonthlyCounter(TapirIntegrationTest):
+    MONTHS = [
+        datetime.date(year=2017, month=1, day=1),
+        datetime.date(year=2017, month=2, day=1),
+        datetime.date(year=2017, month=3, day=1),
+    ]
+
+    @classmethod
+    def setUpTestData(cls):
+        ParameterDefinitions().import_definitions(bulk_create=True)
+
+    def test_countActiveMemberships_default_countsMembershipsActiveAtFirstDayOfMonth(
+        self,
+    ):
+        type_a, type_b = AssociationMembershipTypeFactory.create_batch(size=2)
+        AssociationMembershipFactory.create(
+            type=type_a,
+            start_date=datetime.date(year=2016, month=5, day=1),
+            end_date=None,
+        )
+        AssociationMembershipFactory.create(
+            type=type_a,
+            start_date=datetime.date(year=2017, month=1, day=1),
+            end_date=datetime.date(year=2017, month=2, day=1),
+        )
+        AssociationMembershipFactory.create(
+            type=type_b,
+            start_date=datetime.date(year=2017, month=1, day=2),
+            end_date=datetime.date(year=2017, month=12, day=31),
+        )
+        AssociationMembershipFactory.create(
+            type=type_b,
+            start_date=datetime.date(year=2016, month=1, day=1),
+            end_date=datetime.date(year=2016, month=12, day=31),
+        )
+
+        result = AssociationMembershipMonthlyCounter.count_active_memberships(
+            self.MONTHS
+        )
+
+        self.assertEqual(
+            [2, 2, 1], [result.get((type_a.id, month), 0) for month in self.MONTHS]
+        )
+        self.assertEqual(
+            [0, 1, 1], [result.get((type_b.id, month), 0) for month in self.MONTHS]
+        )
+
+    def test_countMembershipsEndingInMonth_default_groupsByTypeAndMonth(self):
+        type_a, type_b = AssociationMembershipTypeFactory.create_batch(size=2)
+        for membership_type, end_date in [
+            (type_a, datetime.date(year=2017, month=1, day=1)),
+            (type_a, datetime.date(year=2017, month=1, day=31)),
+            (type_a, datetime.date(year=2017, month=4, day=1)),
+            (type_b, datetime.date(year=2017, month=3, day=31)),
+            (type_b, None),
+        ]:
+            AssociationMembershipFactory.create(
+                type=membership_type,
+                start_date=datetime.date(year=2016, month=1, day=1),
+                end_date=end_date,
+            )
+
+        result = AssociationMembershipMonthlyCounter.count_memberships_ending_in_month(
+            self.MONTHS
+        )
+
+        self.assertEqual(
+            {
+                (type_a.id, datetime.date(year=2017, month=1, day=1)): 2,
+                (type_b.id, datetime.date(year=2017, month=3, day=1)): 1,
+            },
+            result,
+        )
+
+    def test_countMembershipsCancelledInMonth_default_usesTheLocalMonthOfTheCancellation(
+        self,
+    ):
+        membership_type = AssociationMembershipTypeFactory.create()
+        for cancellation_ts in [
+            # Still january in UTC, but already february in the local timezone
+            timezone.make_aware(datetime.datetime(year=2017, month=2, day=1, hour=0)),
+            timezone.make_aware(datetime.datetime(year=2017, month=2, day=28, hour=23)),
+            timezone.make_aware(datetime.datetime(year=2017, month=5, day=1, hour=12)),
+        ]:
+            AssociationMembershipFactory.create(
+                type=membership_type,
+                start_date=datetime.date(year=2016, month=1, day=1),
+                end_date=datetime.date(year=2017, month=6, day=30),
+                cancellation_ts=cancellation_ts,
+            )
+
+        result = (
+            AssociationMembershipMonthlyCounter.count_memberships_cancelled_in_month(
+                self.MONTHS
+            )
+        )
+
+        self.assertEqual(
+            {(membership_type.id, datetime.date(year=2017, month=2, day=1)): 2},
+            result,
+        )
+
+    def test_countActiveMemberships_noMonths_returnsEmptyDict(self):
+        AssociationMembershipFactory.create(
+            start_date=datetime.date(year=2016, month=1, day=1)
+        )
+
+        self.assertEqual(
+            {}, AssociationMembershipMonthlyCounter.count_active_memberships([])
+        )
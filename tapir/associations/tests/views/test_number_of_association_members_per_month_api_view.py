@@ -3,6 +3,7 @@ import datetime
 from django.urls import reverse
 from rest_framework import status
 
+from tapir.associations.services.dashboard_data_builder import DashboardDataBuilder
 from tapir.associations.tests.factories import (
     AssociationMembershipFactory,
     AssociationMembershipTypeFactory,
@@ -87,3 +88,18 @@ class TestNumberOfAssociationMembersPerMonthApiView(TapirIntegrationTest):
         self.assertStatusCode(response, status.HTTP_200_OK)
         data = response.json()
         self.assertEqual(1, len(data["datasets"]))
+
+    def test_get_rangeLongerThanMaximum_returnsOnlyMaximumNumberOfMonths(self):
+        self.client.force_login(MemberFactory.create(is_superuser=True))
+        AssociationMembershipTypeFactory.create(name="type_A")
+        url = reverse("associations:number_of_association_members_per_month")
+
+        response = self.client.get(f"{url}?start_date=2000-01-01&end_date=2030-01-01")
+
+        self.assertStatusCode(response, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual(DashboardDataBuilder.MAX_NB_MONTHS, len(data["labels"]))
+        self.assertEqual("01.2000", data["labels"][0])
+        self.assertEqual(
+            DashboardDataBuilder.MAX_NB_MONTHS, len(data["datasets"][0]["values"])
+        )
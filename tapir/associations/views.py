@@ -3,7 +3,6 @@ import datetime
 from django.contrib.auth.mixins import PermissionRequiredMixin
 from django.core.exceptions import ValidationError as DjangoValidationError
 from django.db import transaction
-from django.db.models import Q
 from django.shortcuts import get_object_or_404
 from django.urls import reverse
 from django.views.generic import TemplateView
@@ -40,6 +39,9 @@ from tapir.associations.serializers import (
 from tapir.associations.services.association_membership_change_handler import (
     AssociationMembershipChangeHandler,
 )
+from tapir.associations.services.association_membership_monthly_counter import (
+    AssociationMembershipMonthlyCounter,
+)
 from tapir.associations.services.dashboard_data_builder import DashboardDataBuilder
 from tapir.coop.services.member_needs_banking_data_checker import (
     MemberNeedsBankingDataChecker,
@@ -430,7 +432,9 @@ class NumberOfAssociationMembersPerMonthApiView(APIView):
         end_date = datetime.datetime.strptime(end_date_as_string, "%Y-%m-%d").date()
 
         labels, datasets = DashboardDataBuilder.build_dashboard_data(
-            start_date=start_date, end_date=end_date, count_function=self.count_function
+            start_date=start_date,
+            end_date=end_date,
+            count_function=AssociationMembershipMonthlyCounter.count_active_memberships,
         )
 
         return Response(
@@ -442,18 +446,6 @@ class NumberOfAssociationMembersPerMonthApiView(APIView):
             ).data
         )
 
-    @classmethod
-    def count_function(
-        cls, current_date: datetime.date, membership_type: AssociationMembershipType
-    ):
-        return (
-            AssociationMembership.objects.filter(
-                start_date__lte=current_date, type=membership_type
-            )
-            .filter(Q(end_date=None) | Q(end_date__gte=current_date))
-            .count()
-        )
-
 
 class NumberOfAssociationMembershipCancellationRelativeToEndDatePerMonthApiView(
     APIView
@@ -474,7 +466,9 @@ class NumberOfAssociationMembershipCancellationRelativeToEndDatePerMonthApiView(
         end_date = datetime.datetime.strptime(end_date_as_string, "%Y-%m-%d").date()
 
         labels, datasets = DashboardDataBuilder.build_dashboard_data(
-            start_date=start_date, end_date=end_date, count_function=self.count_function
+            start_date=start_date,
+            end_date=end_date,
+            count_function=AssociationMembershipMonthlyCounter.count_memberships_ending_in_month,
         )
 
         return Response(
@@ -486,16 +480,6 @@ class NumberOfAssociationMembershipCancellationRelativeToEndDatePerMonthApiView(
             ).data
         )
 
-    @classmethod
-    def count_function(
-        cls, current_date: datetime.date, membership_type: AssociationMembershipType
-    ):
-        return AssociationMembership.objects.filter(
-            type=membership_type,
-            end_date__year=current_date.year,
-            end_date__month=current_date.month,
-        ).count()
-
 
 class NumberOfAssociationMembershipCancellationRelativeToCancellationDatePerMonthApiView(
     APIView
@@ -516,7 +500,9 @@ class NumberOfAssociationMembershipCancellationRelativeToCancellationDatePerMont
         end_date = datetime.datetime.strptime(end_date_as_string, "%Y-%m-%d").date()
 
         labels, datasets = DashboardDataBuilder.build_dashboard_data(
-            start_date=start_date, end_date=end_date, count_function=self.count_function
+            start_date=start_date,
+            end_date=end_date,
+            count_function=AssociationMembershipMonthlyCounter.count_memberships_cancelled_in_month,
         )
 
         return Response(
@@ -527,13 +513,3 @@ class NumberOfAssociationMembershipCancellationRelativeToCancellationDatePerMont
                 }
             ).data
         )
-
-    @classmethod
-    def count_function(
-        cls, current_date: datetime.date, membership_type: AssociationMembershipType
-    ):
-        return AssociationMembership.objects.filter(
-            type=membership_type,
-            cancellation_ts__year=current_date.year,
-            cancellation_ts__month=current_date.month,
-        ).count()
@@ -0,0 +1,126 @@
+import datetime
+from dataclasses import dataclass
+
+from tapir.subscriptions.services.global_capacity_checker import (
+    GlobalCapacityChecker,
+)
+from tapir.subscriptions.services.product_capacity_checker import ProductCapacityChecker
+from tapir.utils.services.tapir_cache import TapirCache
+from tapir.utils.services.tapir_cache_manager import TapirCacheManager
+from tapir.utils.services.tapir_shared_cache import TapirSharedCache
+from tapir.utils.shortcuts import get_from_cache_or_compute
+
+
+class BestellWizardAvailabilitySnapshotProvider:
+    @dataclass
+    class AvailabilitySnapshot:
+        product_ids_that_are_already_at_capacity: list[str]
+        product_type_ids_that_are_already_at_capacity: list[str]
+
+    DEPENDENCY_CATEGORIES = [
+        TapirCacheManager.CATEGORY_SUBSCRIPTIONS,
+        TapirCacheManager.CATEGORY_CAPACITIES,
+        TapirCacheManager.CATEGORY_WAITING_LIST,
+        TapirCacheManager.CATEGORY_PRODUCTS,
+        TapirCacheManager.CATEGORY_PRODUCT_PRICES,
+        TapirCacheManager.CATEGORY_GROWING_PERIODS,
+        TapirCacheManager.CATEGORY_PARAMETERS,
+    ]
+
+    @classmethod
+    def get_snapshot(
+        cls, contract_start_date: datetime.date, cache: dict
+    ) -> AvailabilitySnapshot:
+        snapshots_by_contract_start_date = get_from_cache_or_compute(
+            cache, "bestell_wizard_availability_snapshots_by_contract_start_date", dict
+        )
+        return get_from_cache_or_compute(
+            snapshots_by_contract_start_date,
+            contract_start_date,
+            lambda: TapirSharedCache.get_from_shared_cache_or_compute_for_categories(
+                shared_key=f"bestell_wizard_availability_snapshot:{contract_start_date.isoformat()}",
+                categories=cls.DEPENDENCY_CATEGORIES,
+                compute_function=lambda: cls.build_snapshot(
+                    contract_start_date=contract_start_date, cache=cache
+                ),
+            ),
+        )
+
+    @classmethod
+    def build_snapshot(
+        cls, contract_start_date: datetime.date, cache: dict
+    ) -> AvailabilitySnapshot:
+        product_ids_that_are_already_at_capacity = (
+            cls.build_product_ids_that_are_already_at_capacity(
+                cache=cache, contract_start_date=contract_start_date
+            )
+        )
+        return cls.AvailabilitySnapshot(
+            product_ids_that_are_already_at_capacity=product_ids_that_are_already_at_capacity,
+            product_type_ids_that_are_already_at_capacity=cls.build_product_type_ids_that_are_already_at_capacity(
+                cache=cache,
+                product_ids_that_are_already_at_capacity=product_ids_that_are_already_at_capacity,
+                contract_start_date=contract_start_date,
+            ),
+        )
+
+    @classmethod
+    def build_product_type_ids_that_are_already_at_capacity(
+        cls,
+        cache: dict,
+        product_ids_that_are_already_at_capacity: list[str],
+        contract_start_date: datetime.date,
+    ):
+        ids = []
+
+        for product_type in TapirCache.get_product_types_in_standard_order(cache=cache):
+            products = TapirCache.get_products_with_product_type(
+                cache=cache, product_type_id=product_type.id
+            )
+            if len(products) == 0:
+                continue
+
+            smallest_product = GlobalCapacityChecker.get_smallest_product(
+                product_type=product_type,
+                cache=cache,
+                reference_date=contract_start_date,
+            )
+
+            if not GlobalCapacityChecker.is_there_enough_free_global_capacity_for_single_product_type(
+                order_for_a_single_product_type={smallest_product: 1},
+                product_type_id=product_type.id,
+                cache=cache,
+                member_id=None,
+                check_waiting_list_entries=True,
+                subscription_start_date=contract_start_date,
+            ):
+                ids.append(product_type.id)
+                continue
+
+            no_product_with_free_capacity = all(
+                product.id in product_ids_that_are_already_at_capacity
+                for product in products
+            )
+
+            if no_product_with_free_capacity:
+                ids.append(product_type.id)
+
+        return ids
+
+    @classmethod
+    def build_product_ids_that_are_already_at_capacity(
+        cls, cache: dict, contract_start_date: datetime.date
+    ) -> list[str]:
+        ids = []
+
+        for product in TapirCache.get_all_products(cache=cache):
+            if not ProductCapacityChecker.does_product_have_enough_free_capacity_to_add_order(
+                product=product,
+                ordered_quantity=1,
+                member_id=None,
+                subscription_start_date=contract_start_date,
+                cache=cache,
+            ):
+                ids.append(product.id)
+
+        return ids
@@ -1,6 +1,8 @@
 import datetime
 
-from tapir.bestell_wizard.views import BestellWizardBaseDataApiView
+from tapir.bestell_wizard.services.bestell_wizard_availability_snapshot_provider import (
+    BestellWizardAvailabilitySnapshotProvider,
+)
 from tapir.wirgarten.parameters import ParameterDefinitions
 from tapir.wirgarten.tests.factories import (
     ProductFactory,
@@ -41,10 +43,8 @@ class TestBuildProductIdsThatAreAlreadyAtCapacity(TapirIntegrationTest):
             period=growing_period, product=product_with_free_capacity, quantity=9
         )
 
-        result = (
-            BestellWizardBaseDataApiView.build_product_ids_that_are_already_at_capacity(
-                cache={}, contract_start_date=datetime.date(year=2021, month=3, day=19)
-            )
+        result = BestellWizardAvailabilitySnapshotProvider.build_product_ids_that_are_already_at_capacity(
+            cache={}, contract_start_date=datetime.date(year=2021, month=3, day=19)
         )
 
         self.assertEqual(
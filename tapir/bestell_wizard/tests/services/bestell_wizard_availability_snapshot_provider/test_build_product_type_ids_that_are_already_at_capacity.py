@@ -1,6 +1,8 @@
 import datetime
 
-from tapir.bestell_wizard.views import BestellWizardBaseDataApiView
+from tapir.bestell_wizard.services.bestell_wizard_availability_snapshot_provider import (
+    BestellWizardAvailabilitySnapshotProvider,
+)
 from tapir.waiting_list.tests.factories import WaitingListEntryFactory
 from tapir.wirgarten.models import WaitingListProductWish
 from tapir.wirgarten.parameters import ParameterDefinitions
@@ -48,7 +50,7 @@ class TestBuildProductTypeIdsThatAreAlreadyAtCapacity(TapirIntegrationTest):
     def test_buildProductTypeIdsThatAreAlreadyAtCapacity_noContracts_productNotIncluded(
         self,
     ):
-        result = BestellWizardBaseDataApiView.build_product_type_ids_that_are_already_at_capacity(
+        result = BestellWizardAvailabilitySnapshotProvider.build_product_type_ids_that_are_already_at_capacity(
             cache={},
             product_ids_that_are_already_at_capacity=[],
             contract_start_date=datetime.date(year=2023, month=3, day=17),
@@ -63,7 +65,7 @@ class TestBuildProductTypeIdsThatAreAlreadyAtCapacity(TapirIntegrationTest):
             period=self.growing_period, product=self.product_1_m, quantity=10
         )
 
-        result = BestellWizardBaseDataApiView.build_product_type_ids_that_are_already_at_capacity(
+        result = BestellWizardAvailabilitySnapshotProvider.build_product_type_ids_that_are_already_at_capacity(
             cache={},
             product_ids_that_are_already_at_capacity=[],
             contract_start_date=datetime.date(year=2023, month=3, day=17),
@@ -78,7 +80,7 @@ class TestBuildProductTypeIdsThatAreAlreadyAtCapacity(TapirIntegrationTest):
             period=self.growing_period, product=self.product_2, quantity=30
         )
 
-        result = BestellWizardBaseDataApiView.build_product_type_ids_that_are_already_at_capacity(
+        result = BestellWizardAvailabilitySnapshotProvider.build_product_type_ids_that_are_already_at_capacity(
             cache={},
             product_ids_that_are_already_at_capacity=[],
             contract_start_date=datetime.date(year=2023, month=3, day=17),
@@ -96,7 +98,7 @@ class TestBuildProductTypeIdsThatAreAlreadyAtCapacity(TapirIntegrationTest):
             period=self.growing_period, product=self.product_1_m, quantity=1
         )
 
-        result = BestellWizardBaseDataApiView.build_product_type_ids_that_are_already_at_capacity(
+        result = BestellWizardAvailabilitySnapshotProvider.build_product_type_ids_that_are_already_at_capacity(
             cache={},
             product_ids_that_are_already_at_capacity=[],
             contract_start_date=datetime.date(year=2023, month=3, day=17),
@@ -111,7 +113,7 @@ class TestBuildProductTypeIdsThatAreAlreadyAtCapacity(TapirIntegrationTest):
             period=self.growing_period, product=self.product_1_m, quantity=2
         )
 
-        result = BestellWizardBaseDataApiView.build_product_type_ids_that_are_already_at_capacity(
+        result = BestellWizardAvailabilitySnapshotProvider.build_product_type_ids_that_are_already_at_capacity(
             cache={},
             product_ids_that_are_already_at_capacity=[
                 self.product_1_m.id,
@@ -129,7 +131,7 @@ class TestBuildProductTypeIdsThatAreAlreadyAtCapacity(TapirIntegrationTest):
             period=self.growing_period, product=self.product_1_m, quantity=8
         )
 
-        result = BestellWizardBaseDataApiView.build_product_type_ids_that_are_already_at_capacity(
+        result = BestellWizardAvailabilitySnapshotProvider.build_product_type_ids_that_are_already_at_capacity(
             cache={},
             product_ids_that_are_already_at_capacity=[],
             contract_start_date=datetime.date(year=2023, month=3, day=17),
@@ -141,7 +143,7 @@ class TestBuildProductTypeIdsThatAreAlreadyAtCapacity(TapirIntegrationTest):
             waiting_list_entry=waiting_list_entry, product=self.product_1_m, quantity=2
         )
 
-        result = BestellWizardBaseDataApiView.build_product_type_ids_that_are_already_at_capacity(
+        result = BestellWizardAvailabilitySnapshotProvider.build_product_type_ids_that_are_already_at_capacity(
             cache={},
             product_ids_that_are_already_at_capacity=[],
             contract_start_date=datetime.date(year=2023, month=3, day=17),
@@ -0,0 +1,48 @@
+from unittest.mock import patch, Mock
+
+from django.urls import reverse
+
+from tapir.bestell_wizard.views import BestellWizardBaseDataApiView
+from tapir.wirgarten.tests.test_utils import TapirIntegrationTest
+
+
+class TestBestellWizardBaseDataApiViewGet(TapirIntegrationTest):
+    URL = reverse("bestell_wizard:bestell_wizard_base_data")
+
+    @patch.object(BestellWizardBaseDataApiView, "build_response_data", autospec=True)
+    def test_get_noIfNoneMatchHeader_returnsDataAndETag(
+        self, mock_build_response_data: Mock
+    ):
+        mock_build_response_data.return_value = {"theme": "test_theme"}
+
+        response = self.client.get(self.URL)
+
+        self.assertStatusCode(response, 200)
+        self.assertEqual({"theme": "test_theme"}, response.json())
+        self.assertIn("ETag", response.headers)
+
+    @patch.object(BestellWizardBaseDataApiView, "build_response_data", autospec=True)
+    def test_get_ifNoneMatchHeaderMatchesETag_returnsNotModified(
+        self, mock_build_response_data: Mock
+    ):
+        mock_build_response_data.return_value = {"theme": "test_theme"}
+        etag = self.client.get(self.URL).headers["ETag"]
+
+        response = self.client.get(self.URL, headers={"If-None-Match": etag})
+
+        self.assertStatusCode(response, 304)
+        self.assertEqual(b"", response.content)
+
+    @patch.object(BestellWizardBaseDataApiView, "build_response_data", autospec=True)
+    def test_get_dataChangedSinceETag_returnsNewData(
+        self, mock_build_response_data: Mock
+    ):
+        mock_build_response_data.return_value = {"theme": "old_theme"}
+        etag = self.client.get(self.URL).headers["ETag"]
+        mock_build_response_data.return_value = {"theme": "new_theme"}
+
+        response = self.client.get(self.URL, headers={"If-None-Match": etag})
+
+        self.assertStatusCode(response, 200)
+        self.assertEqual({"theme": "new_theme"}, response.json())
+        self.assertNotEqual(etag, response.headers["ETag"])
@@ -1,13 +1,17 @@
-import datetime
+import hashlib
+import json
 
 from django.conf import settings
 from django.core.exceptions import ValidationError, PermissionDenied
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import transaction
 from django.shortcuts import get_object_or_404
 from django.templatetags.static import static
+from django.utils.http import parse_etags, quote_etag
 from django.views.generic import TemplateView
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import extend_schema, OpenApiParameter
+from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from tapir_mail.triggers.transactional_trigger import TransactionalTriggerData
@@ -22,6 +26,9 @@ from tapir.bestell_wizard.serializers import (
     BestellWizardDeliveryDatesForOrderRequestSerializer,
     PublicProductPricesResponseSerializer,
 )
+from tapir.bestell_wizard.services.bestell_wizard_availability_snapshot_provider import (
+    BestellWizardAvailabilitySnapshotProvider,
+)
 from tapir.bestell_wizard.services.bestell_wizard_order_fulfiller import (
     BestellWizardOrderFulfiller,
 )
@@ -62,6 +69,8 @@ from tapir.subscriptions.services.product_capacity_checker import ProductCapacit
 from tapir.subscriptions.services.tapir_order_builder import TapirOrderBuilder
 from tapir.subscriptions.types import TapirOrder
 from tapir.utils.services.tapir_cache import TapirCache
+from tapir.utils.services.tapir_cache_manager import TapirCacheManager
+from tapir.utils.services.tapir_shared_cache import TapirSharedCache
 from tapir.waiting_list.services.waiting_list_entry_confirmation_email_sender import (
     WaitingListEntryConfirmationEmailSender,
 )
@@ -85,7 +94,6 @@ from tapir.wirgarten.parameter_keys import ParameterKeys
 from tapir.wirgarten.service.delivery import calculate_pickup_location_change_date
 from tapir.wirgarten.service.products import (
     get_active_and_future_subscriptions,
-    get_product_price,
 )
 from tapir.wirgarten.utils import (
     get_today,
@@ -446,6 +454,14 @@ class BestellWizardCapacityCheckApiView(APIView):
 class BestellWizardBaseDataApiView(APIView):
     permission_classes = []
 
+    # Everything the response body is built from, see TapirCacheManager.get_models_by_category
+    RESPONSE_DEPENDENCY_CATEGORIES = [
+        *BestellWizardAvailabilitySnapshotProvider.DEPENDENCY_CATEGORIES,
+        TapirCacheManager.CATEGORY_PICKUP_LOCATIONS,
+        TapirCacheManager.CATEGORY_ASSOCIATION_MEMBERSHIPS,
+        TapirCacheManager.CATEGORY_SOLIDARITY_CONTRIBUTIONS,
+    ]
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.cache = {}
@@ -454,6 +470,33 @@ class BestellWizardBaseDataApiView(APIView):
         responses={200: BestellWizardBaseDataResponseSerializer},
     )
     def get(self, request):
+        response_body = TapirSharedCache.get_from_shared_cache_or_compute_for_categories(
+            shared_key=f"bestell_wizard_base_data:{get_today(cache=self.cache).isoformat()}",
+            categories=self.RESPONSE_DEPENDENCY_CATEGORIES,
+            compute_function=self.build_response_body,
+        )
+
+        headers = {"ETag": response_body["etag"], "Cache-Control": "no-cache"}
+        if_none_match = request.headers.get("If-None-Match")
+        if if_none_match is not None and {response_body["etag"], "*"} & set(
+            parse_etags(if_none_match)
+        ):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        return Response(response_body["data"], headers=headers)
+
+    def build_response_body(self) -> dict:
+        data = self.build_response_data()
+        return {
+            "data": data,
+            "etag": quote_etag(
+                hashlib.sha256(
+                    json.dumps(data, sort_keys=True, cls=DjangoJSONEncoder).encode()
+                ).hexdigest()
+            ),
+        }
+
+    def build_response_data(self):
         available_growing_periods = (
             GrowingPeriodChoiceProvider.get_available_growing_periods(
                 reference_date=get_today(cache=self.cache), cache=self.cache
@@ -467,10 +510,8 @@ class BestellWizardBaseDataApiView(APIView):
                 cache=self.cache,
             )
         )
-        product_ids_that_are_already_at_capacity = (
-            self.build_product_ids_that_are_already_at_capacity(
-                self.cache, contract_start_date=earliest_contract_start_date
-            )
+        availability_snapshot = BestellWizardAvailabilitySnapshotProvider.get_snapshot(
+            contract_start_date=earliest_contract_start_date, cache=self.cache
         )
 
         response_data = self.build_simple_response_fields(self.cache)
@@ -504,12 +545,8 @@ class BestellWizardBaseDataApiView(APIView):
                         cache=self.cache
                     )
                 },
-                "product_type_ids_that_are_already_at_capacity": self.build_product_type_ids_that_are_already_at_capacity(
-                    cache=self.cache,
-                    product_ids_that_are_already_at_capacity=product_ids_that_are_already_at_capacity,
-                    contract_start_date=earliest_contract_start_date,
-                ),
-                "product_ids_that_are_already_at_capacity": product_ids_that_are_already_at_capacity,
+                "product_type_ids_that_are_already_at_capacity": availability_snapshot.product_type_ids_that_are_already_at_capacity,
+                "product_ids_that_are_already_at_capacity": availability_snapshot.product_ids_that_are_already_at_capacity,
                 "logo_url": static(
                     f"core/themes/{get_parameter_value(key=ParameterKeys.ORGANISATION_THEME, cache=self.cache)}/images/Logo_white.webp"
                 ),
@@ -533,15 +570,13 @@ class BestellWizardBaseDataApiView(APIView):
             }
         )
 
-        return Response(
-            BestellWizardBaseDataResponseSerializer(
-                response_data,
-                context={
-                    "cache": self.cache,
-                    "reference_date_for_delivery_charge": earliest_contract_start_date,
-                },
-            ).data
-        )
+        return BestellWizardBaseDataResponseSerializer(
+            response_data,
+            context={
+                "cache": self.cache,
+                "reference_date_for_delivery_charge": earliest_contract_start_date,
+            },
+        ).data
 
     @classmethod
     def build_simple_response_fields(cls, cache: dict):
@@ -661,67 +696,6 @@ class BestellWizardBaseDataApiView(APIView):
             for serializer_key, parameter_key in serializer_key_to_parameter_key_map.items()
         }
 
-    @classmethod
-    def build_product_type_ids_that_are_already_at_capacity(
-        cls,
-        cache: dict,
-        product_ids_that_are_already_at_capacity: list[str],
-        contract_start_date: datetime.date,
-    ):
-        ids = []
-
-        for product_type in TapirCache.get_product_types_in_standard_order(cache=cache):
-            products = TapirCache.get_products_with_product_type(
-                cache=cache, product_type_id=product_type.id
-            )
-            if len(products) == 0:
-                continue
-
-            smallest_product = GlobalCapacityChecker.get_smallest_product(
-                product_type=product_type,
-                cache=cache,
-                reference_date=contract_start_date,
-            )
-
-            if not GlobalCapacityChecker.is_there_enough_free_global_capacity_for_single_product_type(
-                order_for_a_single_product_type={smallest_product: 1},
-                product_type_id=product_type.id,
-                cache=cache,
-                member_id=None,
-                check_waiting_list_entries=True,
-                subscription_start_date=contract_start_date,
-            ):
-                ids.append(product_type.id)
-                continue
-
-            no_product_with_free_capacity = all(
-                product.id in product_ids_that_are_already_at_capacity
-                for product in products
-            )
-
-            if no_product_with_free_capacity:
-                ids.append(product_type.id)
-
-        return ids
-
-    @classmethod
-    def build_product_ids_that_are_already_at_capacity(
-        cls, cache: dict, contract_start_date: datetime.date
-    ) -> list[str]:
-        ids = []
-
-        for product in TapirCache.get_all_products(cache=cache):
-            if not ProductCapacityChecker.does_product_have_enough_free_capacity_to_add_order(
-                product=product,
-                ordered_quantity=1,
-                member_id=None,
-                subscription_start_date=contract_start_date,
-                cache=cache,
-            ):
-                ids.append(product.id)
-
-        return ids
-
 
 class BestellWizardDeliveryDatesForOrderApiView(APIView):
     permission_classes = []
@@ -935,11 +909,15 @@ class PublicProductPricesApiView(APIView):
             )
         )
 
+        price_objects_by_product_id = TapirCache.get_product_price_timeline(
+            cache=cache
+        ).get_prices_at_date(
+            product_ids=Product.objects.values_list("id", flat=True),
+            reference_date=contract_start_date,
+        )
         prices_by_product_id = {
-            product.id: get_product_price(
-                product=product, reference_date=contract_start_date, cache=cache
-            ).price
-            for product in Product.objects.all()
+            product_id: price_object.price
+            for product_id, price_object in price_objects_by_product_id.items()
         }
 
         return Response(
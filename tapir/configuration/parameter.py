@@ -8,6 +8,8 @@ from tapir.configuration.models import (
     TapirParameter,
     TapirParameterDatatype,
 )
+from tapir.utils.services.tapir_cache_manager import TapirCacheManager
+from tapir.utils.services.tapir_shared_cache import TapirSharedCache
 from tapir.utils.shortcuts import get_from_cache_or_compute
 
 
@@ -84,9 +86,15 @@ def get_parameter_meta(key: str) -> ParameterMeta | None:
 
 
 def get_parameter_value(key: str, cache: dict | None = None):
-    parameters_by_key = get_from_cache_or_compute(
+    for cache_key in ["parameters_by_key", "parameter_cache"]:
+        TapirCacheManager.register_key_in_category(
+            cache=cache, key=cache_key, category=TapirCacheManager.CATEGORY_PARAMETERS
+        )
+
+    parameters_by_key = TapirSharedCache.get_from_cache_or_compute(
         cache,
         "parameters_by_key",
+        TapirCacheManager.CATEGORY_PARAMETERS,
         lambda: {
             parameter.key: parameter for parameter in TapirParameter.objects.all()
         },
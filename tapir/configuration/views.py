@@ -9,6 +9,7 @@ from rest_framework.views import APIView
 from tapir.configuration.forms import ParameterForm
 from tapir.configuration.models import TapirParameter
 from tapir.coop.services.member_number_service import MemberNumberService
+from tapir.utils.services.tapir_cache_manager import TapirCacheManager
 from tapir.wirgarten.parameter_keys import ParameterKeys
 
 
@@ -82,5 +83,8 @@ class ParameterView(PermissionRequiredMixin, generic.FormView):
             TapirParameter.objects.filter(pk=field.name).update(
                 value=str(form.cleaned_data[field.name])
             )
+        TapirCacheManager.clear_category(
+            cache=None, category=TapirCacheManager.CATEGORY_PARAMETERS
+        )
 
         return response
@@ -1,6 +1,16 @@
 from __future__ import annotations
 
-from django.db.models import Case, CharField, F, Q, QuerySet, Value, When
+from django.db import connection
+from django.db.models import (
+    Case,
+    CharField,
+    F,
+    IntegerField,
+    Q,
+    QuerySet,
+    Value,
+    When,
+)
 from django.db.models.functions import Cast, Concat, Length, LPad
 
 from tapir.configuration.parameter import get_parameter_value
@@ -19,10 +29,18 @@ class MemberSearchService:
         tokens = search_value.split()
         queryset = cls.annotate_queryset_for_search(queryset, cache=cache)
 
+        if connection.vendor != "postgresql":
+            for token in tokens:
+                queryset = queryset.filter(cls.build_token_query(token))
+            return queryset
+
+        prefix = get_parameter_value(ParameterKeys.MEMBER_NUMBER_PREFIX, cache=cache)
         for token in tokens:
-            queryset = queryset.filter(cls.build_token_query(token))
+            queryset = queryset.filter(
+                cls.build_indexed_token_query(token=token, prefix=prefix)
+            )
 
-        return queryset
+        return cls.order_by_search_rank(queryset=queryset, tokens=tokens, prefix=prefix)
 
     @classmethod
     def annotate_queryset_for_search(cls, queryset: QuerySet, cache: dict) -> QuerySet:
@@ -76,3 +94,65 @@ class MemberSearchService:
             | Q(padded_member_no_text__icontains=token)
             | Q(formatted_member_no_text__icontains=token)
         )
+
+    @classmethod
+    def build_indexed_token_query(cls, token: str, prefix: str) -> Q:
+        # search_text holds the lower-cased names and email and has a trigram index.
+        # Tokens don't contain spaces, so matching search_text is the same as matching one of the name or email fields.
+        query = Q(search_text__contains=token.lower())
+        if cls.could_token_match_member_number(token=token, prefix=prefix):
+            query |= (
+                Q(member_no_text__icontains=token)
+                | Q(padded_member_no_text__icontains=token)
+                | Q(formatted_member_no_text__icontains=token)
+            )
+        return query
+
+    @classmethod
+    def could_token_match_member_number(cls, token: str, prefix: str) -> bool:
+        # Formatted member numbers are the prefix followed by digits:
+        # a token that doesn't fit in such a string can only match the text fields,
+        # in which case the filter can be answered from the index alone.
+        token = token.lower()
+        prefix = prefix.lower()
+        if token.isdigit() or token in prefix:
+            return True
+
+        return any(
+            prefix.endswith(token[:split_index]) and token[split_index:].isdigit()
+            for split_index in range(1, len(token))
+        )
+
+    @classmethod
+    def get_exact_member_number(cls, token: str, prefix: str) -> int | None:
+        if prefix and token.lower().startswith(prefix.lower()):
+            token = token[len(prefix) :]
+        # Longer numbers can't be stored in the member_no column
+        if not token.isdecimal() or len(token) > 9:
+            return None
+        return int(token)
+
+    @classmethod
+    def order_by_search_rank(
+        cls, queryset: QuerySet, tokens: list[str], prefix: str
+    ) -> QuerySet:
+        exact_member_numbers = {
+            member_no
+            for token in tokens
+            if (member_no := cls.get_exact_member_number(token=token, prefix=prefix))
+            is not None
+        }
+        exact_name_query = Q()
+        for token in tokens:
+            exact_name_query |= Q(first_name__iexact=token) | Q(last_name__iexact=token)
+
+        whens = [When(exact_name_query, then=Value(1))]
+        if exact_member_numbers:
+            whens.insert(0, When(member_no__in=exact_member_numbers, then=Value(0)))
+
+        queryset = queryset.annotate(
+            search_rank=Case(*whens, default=Value(2), output_field=IntegerField())
+        )
+        return queryset.order_by(
+            "search_rank", *(queryset.query.order_by or queryset.model._meta.ordering)
+        )
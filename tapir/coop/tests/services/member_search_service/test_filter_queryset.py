@@ -171,3 +171,40 @@ class TestFilterQueryset(TapirIntegrationTest):
         result = self.filter_members("   ")
 
         self.assertEqual(2, result.count())
+
+    def test_filterQueryset_exactNameMatch_rankedBeforePartialMatches(self):
+        member_with_longer_name = MemberFactory.create(
+            first_name="Annabelle",
+            last_name="Becker",
+            email="annabelle@example.com",
+            member_no=2,
+        )
+
+        result = self.filter_members("anna")
+
+        self.assertEqual(
+            [self.other_member.id, member_with_longer_name.id],
+            list(result.values_list("id", flat=True)),
+        )
+
+    def test_filterQueryset_exactMemberNumberMatch_rankedBeforePartialMatches(self):
+        self._set_parameter(ParameterKeys.MEMBER_NUMBER_PREFIX, "BT")
+        member_with_longer_number = MemberFactory.create(
+            first_name="Long",
+            last_name="Number",
+            email="long.number@example.com",
+            member_no=1170,
+        )
+        member_with_exact_number = MemberFactory.create(
+            first_name="Exact",
+            last_name="Number",
+            email="exact.number@example.com",
+            member_no=117,
+        )
+
+        result = self.filter_members("BT117")
+
+        self.assertEqual(
+            [member_with_exact_number.id, member_with_longer_number.id],
+            list(result.values_list("id", flat=True)),
+        )
@@ -1,7 +1,16 @@
+import datetime
+from collections import Counter
+
 from tapir_mail.models import StaticSegmentRecipient
 
+from tapir.pickup_locations.services.member_pickup_location_getter import (
+    MemberPickupLocationGetter,
+)
+from tapir.utils.services.tapir_cache import TapirCache
 from tapir.utils.user_utils import UserUtils
-from tapir.wirgarten.models import Member
+from tapir.wirgarten.models import Member, Subscription
+from tapir.wirgarten.service.products import get_product_price
+from tapir.wirgarten.utils import get_today
 
 
 class MemberMailTokenService:
@@ -16,3 +25,86 @@ class MemberMailTokenService:
             postcode=recipient.postcode,
             city=recipient.city,
         )
+
+    @classmethod
+    def get_pickup_location_name(
+        cls, recipient: Member | StaticSegmentRecipient, cache: dict
+    ):
+        # Same as Member.pickup_location, but from the pickup location history of all members in the cache
+        if not isinstance(recipient, Member):
+            return ""
+
+        pickup_location_id = (
+            MemberPickupLocationGetter.get_member_pickup_location_id_from_cache(
+                member_id=recipient.id,
+                reference_date=get_today(cache=cache),
+                cache=cache,
+            )
+        )
+        pickup_location = TapirCache.get_pickup_location_by_id(
+            cache=cache, pickup_location_id=pickup_location_id
+        )
+        if pickup_location is None:
+            return ""
+
+        return pickup_location.name
+
+    @classmethod
+    def get_base_subscriptions_text(
+        cls, recipient: Member | StaticSegmentRecipient, cache: dict
+    ):
+        # Same as Member.base_subscriptions_text, but from the active subscriptions of all members in the cache
+        if not isinstance(recipient, Member):
+            return ""
+
+        reference_date = get_today(cache=cache)
+        subscriptions = [
+            subscription
+            for subscription in TapirCache.get_active_subscriptions_by_member_id(
+                cache=cache, reference_date=reference_date
+            ).get(recipient.id, [])
+            if subscription.product.type.must_be_subscribed_to
+        ]
+        return cls.build_base_subscriptions_text(
+            subscriptions=subscriptions, reference_date=reference_date, cache=cache
+        )
+
+    @classmethod
+    def build_base_subscriptions_text(
+        cls,
+        subscriptions: list[Subscription],
+        reference_date: datetime.date,
+        cache: dict,
+    ):
+        if not subscriptions:
+            return ""
+
+        # Count the quantity of each base product subscribed
+        product_counts = Counter()
+        for sub in subscriptions:
+            product_counts[sub.product] += sub.quantity
+
+        # Create a list of tuples (product, quantity, price) and sort by price
+        product_info = []
+        for product, quantity in product_counts.items():
+            price = get_product_price(product, reference_date, cache=cache).price
+            product_info.append(
+                (
+                    f"{product.name}-{product.type.name[:-1] if quantity == 1 else product.type.name}",
+                    quantity,
+                    price,
+                )
+            )
+
+        # Sort products by price (ascending)
+        product_info.sort(key=lambda x: x[2])
+
+        # Create the human-readable text
+        base_subscription_texts = []
+        for product_name, quantity, _ in product_info:
+            if quantity == 1:
+                base_subscription_texts.append(f"einen {product_name}")
+            else:
+                base_subscription_texts.append(f"{quantity} {product_name}")
+
+        return " + ".join(base_subscription_texts)
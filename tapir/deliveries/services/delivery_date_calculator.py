@@ -1,13 +1,11 @@
 import datetime
 
-from tapir.deliveries.services.delivery_cycle_service import DeliveryCycleService
-from tapir.deliveries.services.weeks_without_delivery_service import (
-    WeeksWithoutDeliveryService,
-)
+from tapir.deliveries.services.delivery_week_calendar import DeliveryWeekCalendar
 from tapir.pickup_locations.services.pickup_location_opening_times_manager import (
     PickupLocationOpeningTimesManager,
 )
 from tapir.utils.services.tapir_cache import TapirCache
+from tapir.utils.shortcuts import get_monday
 from tapir.wirgarten.constants import NO_DELIVERY
 from tapir.wirgarten.models import ProductType
 
@@ -58,14 +56,31 @@ class DeliveryDateCalculator:
         if len(growing_periods) == 0:
             return None
 
+        opening_times = TapirCache.get_opening_times_by_pickup_location_id(
+            cache=cache, pickup_location_id=pickup_location_id
+        )
         while not cls.is_week_delivered(
             product_type=product_type,
             delivery_date=delivery_date,
             check_for_weeks_without_delivery=check_for_weeks_without_delivery,
             cache=cache,
         ):
+            reference_date = delivery_date + datetime.timedelta(days=1)
+            if opening_times and cache is not None:
+                # The delivery date is on the same week day every week,
+                # the weeks that the calendar knows are not delivered can be skipped.
+                next_monday_to_check = DeliveryWeekCalendar.get_from_cache(
+                    cache=cache
+                ).get_next_monday_to_check(
+                    product_type=product_type,
+                    from_monday=get_monday(delivery_date) + datetime.timedelta(days=7),
+                    check_for_weeks_without_delivery=check_for_weeks_without_delivery,
+                )
+                reference_date = max(
+                    reference_date, next_monday_to_check - datetime.timedelta(days=1)
+                )
             delivery_date = cls.get_next_delivery_date_any_product(
-                reference_date=delivery_date + datetime.timedelta(days=1),
+                reference_date=reference_date,
                 pickup_location_id=pickup_location_id,
                 cache=cache,
             )
@@ -82,14 +97,17 @@ class DeliveryDateCalculator:
         check_for_weeks_without_delivery: bool,
         cache: dict,
     ):
-        if (
-            check_for_weeks_without_delivery
-            and WeeksWithoutDeliveryService.is_delivery_cancelled_this_week(
-                delivery_date=delivery_date, cache=cache
+        if cache is None:
+            # Building the calendar only pays off if it is kept for the next calls
+            return DeliveryWeekCalendar.is_delivered_according_to_rules(
+                product_type=product_type,
+                delivery_date=delivery_date,
+                check_for_weeks_without_delivery=check_for_weeks_without_delivery,
+                cache=cache,
             )
-        ):
-            return False
 
-        return DeliveryCycleService.is_product_type_delivered_in_week(
-            product_type=product_type, date=delivery_date, cache=cache
+        return DeliveryWeekCalendar.get_from_cache(cache=cache).is_delivered(
+            product_type=product_type,
+            delivery_date=delivery_date,
+            check_for_weeks_without_delivery=check_for_weeks_without_delivery,
         )
@@ -0,0 +1,228 @@
+import bisect
+import datetime
+
+from tapir.deliveries.services.delivery_cycle_service import DeliveryCycleService
+from tapir.deliveries.services.weeks_without_delivery_service import (
+    WeeksWithoutDeliveryService,
+)
+from tapir.utils.services.tapir_cache import TapirCache
+from tapir.utils.shortcuts import get_monday, get_from_cache_or_compute
+from tapir.wirgarten.models import ProductType, GrowingPeriod
+
+
+class DeliveryWeekCalendar:
+    """
+    The delivered weeks of each product type, from the first week of the first growing period to the last week of the last one.
+    Weeks are identified by their monday and stored as sorted lists, so that lookups are binary searches.
+
+    Weeks that overlap with two growing periods are not precomputed:
+    the delivery rules depend on the growing period at the exact date, so they are evaluated on demand.
+    """
+
+    def __init__(self, growing_periods: list[GrowingPeriod], cache: dict):
+        self.cache = cache
+        self.precomputed_mondays: list[datetime.date] = []
+        self.mondays_to_evaluate_on_demand: list[datetime.date] = []
+        self.cancelled_mondays: set[datetime.date] = set()
+        self.delivered_mondays_by_product_type: dict[
+            tuple[str, str], tuple[list[datetime.date], list[datetime.date]]
+        ] = {}
+
+        self.first_monday = None
+        self.last_monday = None
+        if len(growing_periods) == 0:
+            return
+
+        self.first_monday = get_monday(
+            min(growing_period.start_date for growing_period in growing_periods)
+        )
+        self.last_monday = get_monday(
+            max(growing_period.end_date for growing_period in growing_periods)
+        )
+
+        monday = self.first_monday
+        while monday <= self.last_monday:
+            growing_period_at_start_of_week = TapirCache.get_growing_period_at_date(
+                reference_date=monday, cache=cache
+            )
+            growing_period_at_end_of_week = TapirCache.get_growing_period_at_date(
+                reference_date=monday + datetime.timedelta(days=6), cache=cache
+            )
+            if growing_period_at_start_of_week != growing_period_at_end_of_week:
+                self.mondays_to_evaluate_on_demand.append(monday)
+            else:
+                self.precomputed_mondays.append(monday)
+                if WeeksWithoutDeliveryService.is_delivery_cancelled_this_week(
+                    delivery_date=monday, cache=cache
+                ):
+                    self.cancelled_mondays.add(monday)
+
+            monday += datetime.timedelta(days=7)
+
+    @classmethod
+    def get_from_cache(cls, cache: dict) -> "DeliveryWeekCalendar":
+        return get_from_cache_or_compute(
+            cache,
+            "delivery_week_calendar",
+            lambda: cls(
+                growing_periods=TapirCache.get_all_growing_periods_ascending(
+                    cache=cache
+                ),
+                cache=cache,
+            ),
+        )
+
+    @staticmethod
+    def contains(sorted_dates: list[datetime.date], date: datetime.date) -> bool:
+        index = bisect.bisect_left(sorted_dates, date)
+        return index < len(sorted_dates) and sorted_dates[index] == date
+
+    def is_precomputed(self, monday: datetime.date) -> bool:
+        return (
+            self.first_monday is not None
+            and self.first_monday <= monday <= self.last_monday
+            and not self.contains(self.mondays_to_evaluate_on_demand, monday)
+        )
+
+    def get_delivered_mondays(
+        self, product_type: ProductType, check_for_weeks_without_delivery: bool
+    ) -> list[datetime.date]:
+        # The delivery cycle is part of the key so that a product type that got its cycle changed isn't read from outdated data.
+        key = (product_type.id, product_type.delivery_cycle)
+        if key not in self.delivered_mondays_by_product_type:
+            delivered_mondays = [
+                monday
+                for monday in self.precomputed_mondays
+                if DeliveryCycleService.is_product_type_delivered_in_week(
+                    product_type=product_type, date=monday, cache=self.cache
+                )
+            ]
+            self.delivered_mondays_by_product_type[key] = (
+                delivered_mondays,
+                [
+                    monday
+                    for monday in delivered_mondays
+                    if monday not in self.cancelled_mondays
+                ],
+            )
+
+        delivered_mondays, delivered_mondays_without_cancelled_weeks = (
+            self.delivered_mondays_by_product_type[key]
+        )
+        if check_for_weeks_without_delivery:
+            return delivered_mondays_without_cancelled_weeks
+        return delivered_mondays
+
+    def is_delivered(
+        self,
+        product_type: ProductType,
+        delivery_date: datetime.date,
+        check_for_weeks_without_delivery: bool,
+    ) -> bool:
+        monday = get_monday(delivery_date)
+        if self.is_precomputed(monday):
+            return self.contains(
+                self.get_delivered_mondays(
+                    product_type=product_type,
+                    check_for_weeks_without_delivery=check_for_weeks_without_delivery,
+                ),
+                monday,
+            )
+
+        return self.is_delivered_according_to_rules(
+            product_type=product_type,
+            delivery_date=delivery_date,
+            check_for_weeks_without_delivery=check_for_weeks_without_delivery,
+            cache=self.cache,
+        )
+
+    @staticmethod
+    def is_delivered_according_to_rules(
+        product_type: ProductType,
+        delivery_date: datetime.date,
+        check_for_weeks_without_delivery: bool,
+        cache: dict | None,
+    ) -> bool:
+        if (
+            check_for_weeks_without_delivery
+            and WeeksWithoutDeliveryService.is_delivery_cancelled_this_week(
+                delivery_date=delivery_date, cache=cache
+            )
+        ):
+            return False
+
+        return DeliveryCycleService.is_product_type_delivered_in_week(
+            product_type=product_type, date=delivery_date, cache=cache
+        )
+
+    def get_next_monday_to_check(
+        self,
+        product_type: ProductType,
+        from_monday: datetime.date,
+        check_for_weeks_without_delivery: bool,
+    ) -> datetime.date:
+        """
+        The first week starting from the given monday that may be delivered:
+        either a precomputed week that is delivered or a week that must be evaluated on demand.
+        The precomputed weeks in between are not delivered and can be skipped.
+        """
+        if not self.is_precomputed(from_monday):
+            return from_monday
+
+        candidates = []
+        for sorted_mondays in [
+            self.get_delivered_mondays(
+                product_type=product_type,
+                check_for_weeks_without_delivery=check_for_weeks_without_delivery,
+            ),
+            self.mondays_to_evaluate_on_demand,
+        ]:
+            index = bisect.bisect_left(sorted_mondays, from_monday)
+            if index < len(sorted_mondays):
+                candidates.append(sorted_mondays[index])
+
+        return min(candidates, default=self.last_monday + datetime.timedelta(days=7))
+
+    def count_delivered_weeks(
+        self,
+        product_type: ProductType,
+        range_start: datetime.date,
+        range_end: datetime.date,
+        check_for_weeks_without_delivery: bool,
+    ) -> int:
+        """
+        The number of weeks that overlap with the given range, both bounds inclusive, in which the product type is delivered.
+        Weeks that are not precomputed are evaluated at the first day of the week that is within the range.
+        """
+        delivered_mondays = self.get_delivered_mondays(
+            product_type=product_type,
+            check_for_weeks_without_delivery=check_for_weeks_without_delivery,
+        )
+        first_monday = get_monday(range_start)
+        last_monday = get_monday(range_end)
+        count = bisect.bisect_right(
+            delivered_mondays, last_monday
+        ) - bisect.bisect_left(delivered_mondays, first_monday)
+
+        monday = first_monday
+        while monday <= last_monday:
+            if not self.is_precomputed(monday) and self.is_delivered(
+                product_type=product_type,
+                delivery_date=max(monday, range_start),
+                check_for_weeks_without_delivery=check_for_weeks_without_delivery,
+            ):
+                count += 1
+            if self.first_monday is not None and self.first_monday <= monday:
+                monday = self.get_next_week_to_evaluate_on_demand(monday)
+            else:
+                monday += datetime.timedelta(days=7)
+
+        return count
+
+    def get_next_week_to_evaluate_on_demand(self, monday: datetime.date):
+        # After the given monday, the next week that is not precomputed:
+        # either a week that overlaps two growing periods or the first week after the last growing period.
+        index = bisect.bisect_right(self.mondays_to_evaluate_on_demand, monday)
+        if index < len(self.mondays_to_evaluate_on_demand):
+            return self.mondays_to_evaluate_on_demand[index]
+        return max(monday, self.last_monday) + datetime.timedelta(days=7)
@@ -1,9 +1,10 @@
 import datetime
 from typing import Set
 
-from tapir.deliveries.services.delivery_cycle_service import DeliveryCycleService
+from tapir.deliveries.services.delivery_date_calculator import DeliveryDateCalculator
 from tapir.deliveries.services.delivery_donation_manager import DeliveryDonationManager
 from tapir.deliveries.services.joker_management_service import JokerManagementService
+from tapir.deliveries.services.member_delivery_calendar import MemberDeliveryCalendar
 from tapir.deliveries.services.member_specific_delivery_day_calculator import (
     MemberSpecificDeliveryDayCalculator,
 )
@@ -17,12 +18,11 @@ from tapir.subscriptions.services.automatic_subscription_renewal_service import
     AutomaticSubscriptionRenewalService,
 )
 from tapir.utils.services.tapir_cache import TapirCache
-from tapir.utils.shortcuts import get_monday, get_next_sunday
+from tapir.utils.shortcuts import get_next_sunday
 from tapir.wirgarten.models import (
     Member,
     Subscription,
 )
-from tapir.wirgarten.service.get_next_delivery_date import get_next_delivery_date
 
 
 class GetDeliveriesService:
@@ -34,21 +34,9 @@ class GetDeliveriesService:
         date_to: datetime.date,
         cache: dict,
     ):
-        deliveries = []
-
-        next_delivery_date = get_next_delivery_date(date_from, cache=cache)
-        while next_delivery_date <= date_to:
-            delivery_object = cls.build_delivery_object(
-                member=member, delivery_date=next_delivery_date, cache=cache
-            )
-            if delivery_object:
-                deliveries.append(delivery_object)
-
-            next_delivery_date = get_next_delivery_date(
-                get_monday(next_delivery_date + datetime.timedelta(days=7)), cache=cache
-            )
-
-        return deliveries
+        return MemberDeliveryCalendar(member=member, cache=cache).get_deliveries(
+            date_from=date_from, date_to=date_to
+        )
 
     @classmethod
     def build_delivery_object(
@@ -128,22 +116,15 @@ class GetDeliveriesService:
         # That means that a (non-renewed) subscription that ends on a Wednesday won't get a delivery on the previous Tuesday.
         reference_date = get_next_sunday(reference_date)
 
-        delivered_subscriptions = {
+        return {
             subscription
-            for subscription in TapirCache.get_all_subscriptions(cache=cache)
-            if DeliveryCycleService.is_product_type_delivered_in_week(
-                product_type=subscription.product.type, date=reference_date, cache=cache
+            for subscription in AutomaticSubscriptionRenewalService.get_subscriptions_and_renewals_of_member(
+                member_id=member.id, reference_date=reference_date, cache=cache
             )
-        }
-
-        def subscription_filter(subscription: Subscription):
-            return (
-                subscription.member_id == member.id
-                and subscription in delivered_subscriptions
+            if DeliveryDateCalculator.is_week_delivered(
+                product_type=subscription.product.type,
+                delivery_date=reference_date,
+                check_for_weeks_without_delivery=False,
+                cache=cache,
             )
-
-        return AutomaticSubscriptionRenewalService.get_subscriptions_and_renewals(
-            reference_date=reference_date,
-            cache=cache,
-            subscription_filter=subscription_filter,
-        )
+        }
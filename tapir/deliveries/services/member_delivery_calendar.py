@@ -0,0 +1,293 @@
+import bisect
+import datetime
+
+from tapir.configuration.parameter import get_parameter_value
+from tapir.deliveries.config import (
+    DELIVERY_DONATION_MODE_DISABLED,
+    DELIVERY_DONATION_MODE_ONLY_AFTER_JOKERS,
+)
+from tapir.deliveries.services.delivery_date_calculator import DeliveryDateCalculator
+from tapir.deliveries.services.joker_management_service import JokerManagementService
+from tapir.deliveries.services.member_specific_delivery_day_calculator import (
+    MemberSpecificDeliveryDayCalculator,
+)
+from tapir.deliveries.services.weeks_without_delivery_service import (
+    WeeksWithoutDeliveryService,
+)
+from tapir.pickup_locations.services.member_pickup_location_getter import (
+    MemberPickupLocationGetter,
+)
+from tapir.utils.services.tapir_cache import TapirCache
+from tapir.utils.shortcuts import get_monday
+from tapir.wirgarten.models import Member, GrowingPeriod
+from tapir.wirgarten.parameter_keys import ParameterKeys
+from tapir.wirgarten.service.get_next_delivery_date import get_next_delivery_date
+
+
+class MemberDeliveryCalendar:
+    """
+    Builds all the deliveries of a member within a date range.
+    The jokers, donations and subscriptions of the member are loaded once for the whole range,
+    each week is then built from those instead of looking them up again.
+    The built objects are the same as GetDeliveriesService.build_delivery_object.
+    """
+
+    def __init__(self, member: Member, cache: dict):
+        self.member = member
+        self.cache = cache
+
+        self.jokers_enabled = get_parameter_value(
+            key=ParameterKeys.JOKERS_ENABLED, cache=cache
+        )
+        self.donation_mode = get_parameter_value(
+            key=ParameterKeys.DELIVERY_DONATION_MODE, cache=cache
+        )
+
+        jokers = TapirCache.get_all_jokers_for_member(member_id=member.id, cache=cache)
+        self.joker_dates = sorted(joker.date for joker in jokers)
+        self.joker_weeks = {
+            (joker.date.year, joker.date.isocalendar().week) for joker in jokers
+        }
+
+        donations = TapirCache.get_all_delivery_donations_for_member(
+            member_id=member.id, cache=cache
+        )
+        self.donation_weeks = {
+            (donation.date.year, donation.date.isocalendar().week)
+            for donation in donations
+        }
+
+        self.subscriptions = TapirCache.get_subscriptions_of_member(
+            cache=cache, member_id=member.id
+        )
+        self.restrictions_by_growing_period_id = {}
+
+    def get_deliveries(self, date_from: datetime.date, date_to: datetime.date):
+        from tapir.deliveries.services.get_deliveries_service import (
+            GetDeliveriesService,
+        )
+
+        deliveries = []
+        for delivery_date in self.get_delivery_dates(date_from, date_to):
+            relevant_subscriptions = GetDeliveriesService.get_relevant_subscriptions(
+                member=self.member, reference_date=delivery_date, cache=self.cache
+            )
+            if len(relevant_subscriptions) == 0:
+                continue
+
+            deliveries.append(
+                self.build_delivery_object(
+                    delivery_date=delivery_date,
+                    relevant_subscriptions=relevant_subscriptions,
+                )
+            )
+
+        return deliveries
+
+    def get_delivery_dates(
+        self, date_from: datetime.date, date_to: datetime.date
+    ) -> list[datetime.date]:
+        delivery_dates = []
+        next_delivery_date = get_next_delivery_date(date_from, cache=self.cache)
+        while next_delivery_date <= date_to:
+            delivery_dates.append(next_delivery_date)
+            next_delivery_date = get_next_delivery_date(
+                get_monday(next_delivery_date + datetime.timedelta(days=7)),
+                cache=self.cache,
+            )
+        return delivery_dates
+
+    def build_delivery_object(
+        self, delivery_date: datetime.date, relevant_subscriptions: set
+    ):
+        pickup_location = TapirCache.get_pickup_location_by_id(
+            cache=self.cache,
+            pickup_location_id=MemberPickupLocationGetter.get_member_pickup_location_id_from_cache(
+                member_id=self.member.id,
+                reference_date=delivery_date,
+                cache=self.cache,
+            ),
+        )
+        opening_times = None
+        if pickup_location is not None:
+            opening_times = TapirCache.get_opening_times_by_pickup_location_id(
+                cache=self.cache, pickup_location_id=pickup_location.id
+            )
+        delivery_date = MemberSpecificDeliveryDayCalculator.get_specific_delivery_date(
+            member_id=self.member.id, delivery_date=delivery_date, cache=self.cache
+        )
+
+        joker_used = self.has_joker_in_week(delivery_date)
+        if joker_used:
+            relevant_subscriptions = {
+                subscription
+                for subscription in relevant_subscriptions
+                if not JokerManagementService.is_subscription_affected_by_joker(
+                    subscription, cache=self.cache
+                )
+            }
+
+        is_delivery_cancelled_this_week = (
+            WeeksWithoutDeliveryService.is_delivery_cancelled_this_week(
+                delivery_date, cache=self.cache
+            )
+        )
+        is_before_date_limit = (
+            JokerManagementService.can_joker_be_used_relative_to_date_limit(
+                delivery_date, cache=self.cache
+            )
+        )
+        donation_used = self.has_donation_in_week(delivery_date)
+        can_joker_be_used = self.can_joker_be_used_in_week(
+            delivery_date=delivery_date,
+            joker_used=joker_used,
+            is_before_date_limit=is_before_date_limit,
+            is_delivery_cancelled_this_week=is_delivery_cancelled_this_week,
+            donation_used=donation_used,
+        )
+
+        return {  # data for DeliverySerializer
+            "delivery_date": delivery_date,
+            "pickup_location": pickup_location,
+            "pickup_location_opening_times": opening_times,
+            "subscriptions": relevant_subscriptions,
+            "joker_used": joker_used,
+            "can_joker_be_used": can_joker_be_used,
+            "can_joker_be_used_relative_to_date_limit": is_before_date_limit,
+            "is_delivery_cancelled_this_week": is_delivery_cancelled_this_week,
+            "can_delivery_be_donated": self.can_delivery_be_donated(
+                delivery_date=delivery_date,
+                joker_used=joker_used,
+                can_joker_be_used=can_joker_be_used,
+                is_before_date_limit=is_before_date_limit,
+                donation_used=donation_used,
+            ),
+            "donation_used": donation_used,
+        }
+
+    def has_joker_in_week(self, reference_date: datetime.date) -> bool:
+        if not self.jokers_enabled:
+            return False
+
+        return (
+            reference_date.year,
+            reference_date.isocalendar().week,
+        ) in self.joker_weeks
+
+    def has_donation_in_week(self, reference_date: datetime.date) -> bool:
+        if self.donation_mode == DELIVERY_DONATION_MODE_DISABLED:
+            return False
+
+        return (
+            reference_date.isocalendar().year,
+            reference_date.isocalendar().week,
+        ) in self.donation_weeks
+
+    def count_jokers_in_range(
+        self, range_start: datetime.date, range_end: datetime.date
+    ) -> int:
+        return bisect.bisect_right(self.joker_dates, range_end) - bisect.bisect_left(
+            self.joker_dates, range_start
+        )
+
+    def get_restrictions(
+        self, growing_period: GrowingPeriod
+    ) -> list[JokerManagementService.JokerRestriction]:
+        if growing_period.id not in self.restrictions_by_growing_period_id:
+            self.restrictions_by_growing_period_id[growing_period.id] = (
+                JokerManagementService.get_extra_joker_restrictions(
+                    growing_period=growing_period
+                )
+            )
+        return self.restrictions_by_growing_period_id[growing_period.id]
+
+    def can_joker_be_used_relative_to_restrictions(
+        self, reference_date: datetime.date
+    ) -> bool:
+        growing_period = TapirCache.get_growing_period_at_date(
+            reference_date=reference_date, cache=self.cache
+        )
+        for restriction in self.get_restrictions(growing_period):
+            restriction_start_date = datetime.date(
+                year=reference_date.year,
+                month=restriction.start_month,
+                day=restriction.start_day,
+            )
+            if restriction_start_date > reference_date:
+                continue
+
+            restriction_end_date = datetime.date(
+                year=reference_date.year,
+                month=restriction.end_month,
+                day=restriction.end_day,
+            )
+            if restriction_end_date < reference_date:
+                continue
+
+            if (
+                self.count_jokers_in_range(restriction_start_date, restriction_end_date)
+                >= restriction.max_jokers
+            ):
+                return False
+
+        return True
+
+    def can_joker_be_used_in_week(
+        self,
+        delivery_date: datetime.date,
+        joker_used: bool,
+        is_before_date_limit: bool,
+        is_delivery_cancelled_this_week: bool,
+        donation_used: bool,
+    ) -> bool:
+        if not self.jokers_enabled:
+            return False
+
+        return (
+            not joker_used
+            and is_before_date_limit
+            and JokerManagementService.can_joker_be_used_relative_to_max_amount_per_growing_period(
+                self.member, delivery_date, cache=self.cache
+            )
+            and self.can_joker_be_used_relative_to_restrictions(delivery_date)
+            and not is_delivery_cancelled_this_week
+            and not donation_used
+        )
+
+    def can_delivery_be_donated(
+        self,
+        delivery_date: datetime.date,
+        joker_used: bool,
+        can_joker_be_used: bool,
+        is_before_date_limit: bool,
+        donation_used: bool,
+    ) -> bool:
+        if self.donation_mode == DELIVERY_DONATION_MODE_DISABLED:
+            return False
+
+        if self.donation_mode == DELIVERY_DONATION_MODE_ONLY_AFTER_JOKERS and (
+            can_joker_be_used
+        ):
+            return False
+
+        if joker_used or not is_before_date_limit:
+            return False
+
+        # Same as DeliveryDonationManager.does_member_have_at_least_one_subscription_delivered_at_date,
+        # but only over the subscriptions of the member and with the joker and donation checks already done
+        if donation_used:
+            return False
+
+        return any(
+            DeliveryDateCalculator.is_week_delivered(
+                product_type=subscription.product.type,
+                delivery_date=delivery_date,
+                check_for_weeks_without_delivery=True,
+                cache=self.cache,
+            )
+            for subscription in self.subscriptions
+            if subscription.start_date <= delivery_date
+            and (
+                subscription.end_date is None or subscription.end_date >= delivery_date
+            )
+        )
@@ -1,4 +1,5 @@
 import datetime
+from dataclasses import dataclass
 from decimal import Decimal
 
 from tapir.configuration.parameter import get_parameter_value
@@ -11,10 +12,11 @@ from tapir.subscriptions.services.subscription_delivered_in_week_checked import
     SubscriptionDeliveredInWeekChecker,
 )
 from tapir.utils.services.tapir_cache import TapirCache
+from tapir.utils.services.tapir_cache_manager import TapirCacheManager
+from tapir.utils.shortcuts import get_from_cache_or_compute
 from tapir.wirgarten.models import (
     ProductType,
     Product,
-    ProductPrice,
     Subscription,
     Member,
     PickupLocation,
@@ -31,14 +33,18 @@ class PickListBuilder:
     KEY_PICKUP_LOCATION = "Abholort"
     KEY_M_EQUIVALENT = "M-Äquivalent"
 
+    @dataclass
+    class PickListMatrix:
+        # pickup location name -> product name -> delivered quantity
+        quantities: dict[str, dict[str, int]]
+        m_equivalent_by_pickup_location_name: dict[str, Decimal]
+
     @classmethod
     def build_pick_list(
         cls, product_type: ProductType, delivery_date: datetime.date, cache: dict
     ):
-        subscriptions_by_pickup_location_name = (
-            cls.get_subscriptions_grouped_by_pickup_location_name(
-                delivery_date=delivery_date, cache=cache, product_type=product_type
-            )
+        matrix = cls.get_pick_list_matrix(
+            product_type=product_type, delivery_date=delivery_date, cache=cache
         )
         products = cls.get_relevant_products(
             product_type=product_type, delivery_date=delivery_date, cache=cache
@@ -52,111 +58,100 @@ class PickListBuilder:
 
         output, writer = begin_csv_string(header)
 
-        sorted_pickup_location_names = sorted(
-            subscriptions_by_pickup_location_name.keys()
-        )
-        for pickup_location_name in sorted_pickup_location_names:
-            data = cls.build_row_data_for_pickup_location(
-                subscriptions_by_pickup_location_name=subscriptions_by_pickup_location_name,
-                pickup_location_name=pickup_location_name,
-                delivery_date=delivery_date,
-                cache=cache,
+        for pickup_location_name in sorted(matrix.quantities.keys()):
+            writer.writerow(
+                {
+                    cls.KEY_PICKUP_LOCATION: pickup_location_name,
+                    **matrix.quantities[pickup_location_name],
+                    cls.KEY_M_EQUIVALENT: matrix.m_equivalent_by_pickup_location_name[
+                        pickup_location_name
+                    ],
+                }
             )
-            writer.writerow(data)
 
         return "".join(output.csv_string)
 
     @classmethod
-    def build_row_data_for_pickup_location(
-        cls,
-        subscriptions_by_pickup_location_name: dict[str, list[Subscription]],
-        pickup_location_name: str,
-        delivery_date: datetime.date,
-        cache: dict,
-    ):
-        subscriptions = cls.get_delivered_subscriptions(
-            subscriptions=subscriptions_by_pickup_location_name[pickup_location_name],
-            delivery_date=delivery_date,
-            cache=cache,
-        )
-        subscriptions.sort(key=lambda x: x.product.name)
-        quantities_by_product_name = cls.get_delivery_quantity_by_product_name(
-            subscriptions
+    def get_pick_list_matrix(
+        cls, product_type: ProductType, delivery_date: datetime.date, cache: dict
+    ) -> PickListMatrix:
+        key = "pick_list_matrices_by_delivery_date"
+        TapirCacheManager.register_key_in_category(
+            cache=cache, key=key, category=TapirCacheManager.CATEGORY_SUBSCRIPTIONS
         )
-
-        return {
-            cls.KEY_PICKUP_LOCATION: pickup_location_name,
-            **quantities_by_product_name,
-            cls.KEY_M_EQUIVALENT: cls.get_m_equivalent_size(
-                subscriptions=subscriptions,
-                delivery_date=delivery_date,
-                cache=cache,
+        matrices_by_product_type_id = get_from_cache_or_compute(
+            get_from_cache_or_compute(cache, key, lambda: {}),
+            delivery_date,
+            lambda: cls.build_pick_list_matrices(
+                delivery_date=delivery_date, cache=cache
             ),
-        }
-
-    @classmethod
-    def get_m_equivalent_size(
-        cls,
-        subscriptions: list[Subscription],
-        delivery_date: datetime.date,
-        cache: dict,
-    ):
-        return sum(
-            [
-                get_product_price(
-                    product=subscription.product,
-                    cache=cache,
-                    reference_date=delivery_date,
-                ).size
-                for subscription in subscriptions
-            ]
+        )
+        return matrices_by_product_type_id.get(
+            product_type.id,
+            cls.PickListMatrix(quantities={}, m_equivalent_by_pickup_location_name={}),
         )
 
     @classmethod
-    def get_delivery_quantity_by_product_name(cls, subscriptions: list[Subscription]):
-        quantities_by_product_name = {}
-
-        for subscription in subscriptions:
-            if subscription.product.name not in quantities_by_product_name:
-                quantities_by_product_name[subscription.product.name] = 0
-            quantities_by_product_name[
-                subscription.product.name
-            ] += subscription.quantity
-
-        return quantities_by_product_name
-
-    @classmethod
-    def get_delivered_subscriptions(
-        cls,
-        subscriptions: list[Subscription],
-        delivery_date: datetime.date,
-        cache: dict,
-    ):
-        return [
-            subscription
-            for subscription in subscriptions
-            if SubscriptionDeliveredInWeekChecker.is_subscription_delivered_in_week(
-                subscription=subscription,
-                delivery_date=delivery_date,
-                cache=cache,
-                skip_donation_check=True,
+    def build_pick_list_matrices(
+        cls, delivery_date: datetime.date, cache: dict
+    ) -> dict[str, PickListMatrix]:
+        # One pass over the subscriptions of all product types,
+        # so that the nightly exports don't have to query them again for every product type.
+        matrices_by_product_type_id = {}
+        for (
+            product_type_id,
+            subscriptions_by_pickup_location_name,
+        ) in cls.get_subscriptions_grouped_by_product_type_id_and_pickup_location_name(
+            delivery_date=delivery_date, cache=cache
+        ).items():
+            matrix = cls.PickListMatrix(
+                quantities={}, m_equivalent_by_pickup_location_name={}
             )
-        ]
+            for (
+                pickup_location_name,
+                subscriptions,
+            ) in subscriptions_by_pickup_location_name.items():
+                quantities = matrix.quantities.setdefault(pickup_location_name, {})
+                m_equivalent = 0
+                for subscription in subscriptions:
+                    if not SubscriptionDeliveredInWeekChecker.is_subscription_delivered_in_week(
+                        subscription=subscription,
+                        delivery_date=delivery_date,
+                        cache=cache,
+                        skip_donation_check=True,
+                    ):
+                        continue
+                    quantities[subscription.product.name] = (
+                        quantities.get(subscription.product.name, 0)
+                        + subscription.quantity
+                    )
+                    m_equivalent += get_product_price(
+                        product=subscription.product,
+                        cache=cache,
+                        reference_date=delivery_date,
+                    ).size
+                matrix.m_equivalent_by_pickup_location_name[pickup_location_name] = (
+                    m_equivalent
+                )
+            matrices_by_product_type_id[product_type_id] = matrix
+
+        return matrices_by_product_type_id
 
     @classmethod
     def get_relevant_products(
         cls, product_type: ProductType, delivery_date: datetime.date, cache: dict
     ):
-        products_ids_with_price = list(
-            ProductPrice.objects.filter(valid_from__lte=delivery_date).values_list(
-                "product_id", flat=True
-            )
+        products_by_product_type_id = get_from_cache_or_compute(
+            get_from_cache_or_compute(
+                cache, "pick_list_products_by_delivery_date", lambda: {}
+            ),
+            delivery_date,
+            lambda: cls.get_products_with_price_by_product_type_id(
+                delivery_date=delivery_date
+            ),
         )
-        products = Product.objects.filter(
-            type_id=product_type.id, id__in=products_ids_with_price
-        ).distinct()
 
-        products = list(products)
+        products = list(products_by_product_type_id.get(product_type.id, []))
         products.sort(
             key=lambda product: cls.get_price_or_zero(
                 product=product, reference_date=delivery_date, cache=cache
@@ -164,6 +159,17 @@ class PickListBuilder:
         )
         return products
 
+    @classmethod
+    def get_products_with_price_by_product_type_id(
+        cls, delivery_date: datetime.date
+    ) -> dict[str, list[Product]]:
+        products_by_product_type_id = {}
+        for product in Product.objects.filter(
+            productprice__valid_from__lte=delivery_date
+        ).distinct():
+            products_by_product_type_id.setdefault(product.type_id, []).append(product)
+        return products_by_product_type_id
+
     @classmethod
     def get_price_or_zero(
         cls, product: Product, reference_date: datetime.date, cache: dict
@@ -176,33 +182,47 @@ class PickListBuilder:
     @classmethod
     def get_subscriptions_grouped_by_pickup_location_name(
         cls, delivery_date: datetime.date, cache: dict, product_type: ProductType
-    ):
-        subscriptions = (
-            get_active_subscriptions(delivery_date, cache=cache)
-            .filter(product__type_id=product_type.id)
-            .select_related("member", "product__type")
-            .distinct()
+    ) -> dict[str, list[Subscription]]:
+        return (
+            cls.get_subscriptions_grouped_by_product_type_id_and_pickup_location_name(
+                delivery_date=delivery_date, cache=cache
+            ).get(product_type.id, {})
         )
-        subscriptions_by_pickup_location_name = {}
 
-        for subscription in subscriptions:
-            pickup_location = cls.get_member_pickup_location_for_pick_list(
-                member=subscription.member,
-                reference_date=delivery_date,
-                cache=cache,
-                product_type_is_affected_by_jokers=product_type.is_affected_by_jokers,
+    @classmethod
+    def get_subscriptions_grouped_by_product_type_id_and_pickup_location_name(
+        cls, delivery_date: datetime.date, cache: dict
+    ) -> dict[str, dict[str, list[Subscription]]]:
+        def compute():
+            subscriptions = (
+                get_active_subscriptions(delivery_date, cache=cache)
+                .select_related("member", "product__type")
+                .distinct()
             )
-            if pickup_location is None:
-                continue
-
-            if pickup_location.name not in subscriptions_by_pickup_location_name:
-                subscriptions_by_pickup_location_name[pickup_location.name] = []
+            result = {}
+            for subscription in subscriptions:
+                product_type = subscription.product.type
+                pickup_location = cls.get_member_pickup_location_for_pick_list(
+                    member=subscription.member,
+                    reference_date=delivery_date,
+                    cache=cache,
+                    product_type_is_affected_by_jokers=product_type.is_affected_by_jokers,
+                )
+                if pickup_location is None:
+                    continue
 
-            subscriptions_by_pickup_location_name[pickup_location.name].append(
-                subscription
-            )
+                result.setdefault(product_type.id, {}).setdefault(
+                    pickup_location.name, []
+                ).append(subscription)
+            return result
 
-        return subscriptions_by_pickup_location_name
+        key = "pick_list_subscriptions_by_delivery_date"
+        TapirCacheManager.register_key_in_category(
+            cache=cache, key=key, category=TapirCacheManager.CATEGORY_SUBSCRIPTIONS
+        )
+        return get_from_cache_or_compute(
+            get_from_cache_or_compute(cache, key, lambda: {}), delivery_date, compute
+        )
 
     @classmethod
     def get_member_pickup_location_for_pick_list(
@@ -0,0 +1,147 @@
+import datetime
+
+from tapir.deliveries.models import CustomCycleScheduledDeliveryWeek
+from tapir.deliveries.services.delivery_date_calculator import DeliveryDateCalculator
+from tapir.deliveries.services.delivery_week_calendar import DeliveryWeekCalendar
+from tapir.wirgarten.constants import (
+    WEEKLY,
+    ODD_WEEKS,
+    EVERY_FOUR_WEEKS,
+    CUSTOM_CYCLE,
+)
+from tapir.wirgarten.models import PickupLocationOpeningTime
+from tapir.wirgarten.parameters import ParameterDefinitions
+from tapir.wirgarten.tests.factories import (
+    GrowingPeriodFactory,
+    PickupLocationFactory,
+    ProductTypeFactory,
+)
+from tapir.wirgarten.tests.test_utils import TapirIntegrationTest
+
+
+class TestDeliveryWeekCalendar(TapirIntegrationTest):
+    @classmethod
+    def setUpTestData(cls):
+        ParameterDefinitions().import_definitions(bulk_create=True)
+        first_growing_period = GrowingPeriodFactory.create(
+            start_date=datetime.date(year=2024, month=1, day=1),
+            end_date=datetime.date(year=2024, month=6, day=26),  # a wednesday
+            weeks_without_delivery=[10, 11],
+        )
+        second_growing_period = GrowingPeriodFactory.create(
+            start_date=datetime.date(year=2024, month=6, day=27),
+            end_date=datetime.date(year=2024, month=12, day=31),
+            weeks_without_delivery=[30],
+        )
+        cls.product_types = [
+            ProductTypeFactory.create(delivery_cycle=cycle[0])
+            for cycle in [WEEKLY, ODD_WEEKS, EVERY_FOUR_WEEKS, CUSTOM_CYCLE]
+        ]
+        custom_cycle_product_type = cls.product_types[-1]
+        for growing_period, calendar_week in [
+            (first_growing_period, 5),
+            (first_growing_period, 26),
+            (second_growing_period, 26),
+            (second_growing_period, 30),
+            (second_growing_period, 40),
+        ]:
+            CustomCycleScheduledDeliveryWeek.objects.create(
+                product_type=custom_cycle_product_type,
+                growing_period=growing_period,
+                calendar_week=calendar_week,
+            )
+
+    @staticmethod
+    def get_all_days():
+        day = datetime.date(year=2023, month=12, day=1)
+        while day <= datetime.date(year=2025, month=1, day=31):
+            yield day
+            day += datetime.timedelta(days=1)
+
+    def test_isDelivered_everyDayAndProductType_sameResultAsDeliveryRules(self):
+        calendar = DeliveryWeekCalendar.get_from_cache(cache={})
+
+        for product_type in self.product_types:
+            for day in self.get_all_days():
+                for check_for_weeks_without_delivery in [True, False]:
+                    self.assertEqual(
+                        DeliveryWeekCalendar.is_delivered_according_to_rules(
+                            product_type=product_type,
+                            delivery_date=day,
+                            check_for_weeks_without_delivery=check_for_weeks_without_delivery,
+                            cache={},
+                        ),
+                        calendar.is_delivered(
+                            product_type=product_type,
+                            delivery_date=day,
+                            check_for_weeks_without_delivery=check_for_weeks_without_delivery,
+                        ),
+                        f"{product_type.delivery_cycle} {day} {check_for_weeks_without_delivery}",
+                    )
+
+    def test_countDeliveredWeeks_default_sameResultAsCountingEachWeek(self):
+        calendar = DeliveryWeekCalendar.get_from_cache(cache={})
+        range_start = datetime.date(year=2023, month=12, day=20)
+        range_end = datetime.date(year=2025, month=1, day=10)
+
+        for product_type in self.product_types:
+            expected = 0
+            monday = range_start - datetime.timedelta(days=range_start.weekday())
+            while monday <= range_end:
+                if calendar.is_delivered(
+                    product_type=product_type,
+                    delivery_date=max(monday, range_start),
+                    check_for_weeks_without_delivery=True,
+                ):
+                    expected += 1
+                monday += datetime.timedelta(days=7)
+
+            self.assertEqual(
+                expected,
+                calendar.count_delivered_weeks(
+                    product_type=product_type,
+                    range_start=range_start,
+                    range_end=range_end,
+                    check_for_weeks_without_delivery=True,
+                ),
+            )
+
+    def test_getNextDeliveryDateForProductType_customCycle_skipsWeeksThatAreNotDelivered(
+        self,
+    ):
+        pickup_location = PickupLocationFactory.create()
+        PickupLocationOpeningTime.objects.create(
+            pickup_location=pickup_location,
+            day_of_week=3,
+            open_time=datetime.time(hour=10),
+            close_time=datetime.time(hour=18),
+        )
+
+        delivery_dates = []
+        reference_date = datetime.date(year=2024, month=1, day=1)
+        cache = {}
+        while True:
+            next_delivery_date = (
+                DeliveryDateCalculator.get_next_delivery_date_for_product_type(
+                    reference_date=reference_date,
+                    pickup_location_id=pickup_location.id,
+                    product_type=self.product_types[-1],
+                    check_for_weeks_without_delivery=True,
+                    cache=cache,
+                )
+            )
+            if next_delivery_date is None:
+                break
+            delivery_dates.append(next_delivery_date)
+            reference_date = next_delivery_date
+
+        self.assertEqual(
+            [
+                datetime.date(year=2024, month=2, day=1),  # week 5
+                datetime.date(
+                    year=2024, month=6, day=27
+                ),  # week 26, second growing period
+                datetime.date(year=2024, month=10, day=3),  # week 40
+            ],
+            delivery_dates,
+        )
@@ -0,0 +1,84 @@
+import datetime
+
+from tapir.configuration.models import TapirParameter
+from tapir.deliveries.config import DELIVERY_DONATION_MODE_ALWAYS_POSSIBLE
+from tapir.deliveries.models import Joker, DeliveryDonation
+from tapir.deliveries.services.get_deliveries_service import GetDeliveriesService
+from tapir.deliveries.services.member_delivery_calendar import MemberDeliveryCalendar
+from tapir.wirgarten.constants import WEEKLY
+from tapir.wirgarten.parameter_keys import ParameterKeys
+from tapir.wirgarten.parameters import ParameterDefinitions
+from tapir.wirgarten.tests.factories import (
+    MemberFactory,
+    ProductFactory,
+    SubscriptionFactory,
+    GrowingPeriodFactory,
+)
+from tapir.wirgarten.tests.test_utils import mock_timezone, TapirIntegrationTest
+
+
+class TestMemberDeliveryCalendarGetDeliveries(TapirIntegrationTest):
+    @classmethod
+    def setUpTestData(cls):
+        ParameterDefinitions().import_definitions(bulk_create=True)
+        TapirParameter.objects.filter(key=ParameterKeys.DELIVERY_DONATION_MODE).update(
+            value=DELIVERY_DONATION_MODE_ALWAYS_POSSIBLE
+        )
+        cls.product = ProductFactory.create(type__delivery_cycle=WEEKLY[0])
+        cls.growing_period = GrowingPeriodFactory.create(
+            start_date=datetime.date(year=2024, month=1, day=1),
+            end_date=datetime.date(year=2024, month=12, day=31),
+            joker_restrictions="01.05.-31.05.[1]",
+        )
+
+    def setUp(self):
+        super().setUp()
+        mock_timezone(self, datetime.datetime(year=2024, month=3, day=15))
+
+        self.member = MemberFactory.create()
+        SubscriptionFactory.create(
+            member=self.member,
+            product=self.product,
+            period=self.growing_period,
+            end_date=datetime.date(year=2024, month=7, day=21),
+        )
+
+    def test_getDeliveries_withJokersAndDonations_sameResultAsBuildingEachWeek(self):
+        for day in [datetime.date(2024, 4, 10), datetime.date(2024, 5, 8)]:
+            Joker.objects.create(member=self.member, date=day)
+        DeliveryDonation.objects.create(
+            member=self.member, date=datetime.date(year=2024, month=6, day=12)
+        )
+        date_from = datetime.date(year=2024, month=4, day=1)
+        date_to = datetime.date(year=2024, month=8, day=31)
+
+        calendar = MemberDeliveryCalendar(member=self.member, cache={})
+        actual_deliveries = calendar.get_deliveries(
+            date_from=date_from, date_to=date_to
+        )
+
+        expected_deliveries = []
+        for delivery_date in calendar.get_delivery_dates(date_from, date_to):
+            delivery_object = GetDeliveriesService.build_delivery_object(
+                member=self.member, delivery_date=delivery_date, cache={}
+            )
+            if delivery_object:
+                expected_deliveries.append(delivery_object)
+
+        self.assertEqual(16, len(actual_deliveries))
+        self.assertEqual(expected_deliveries, actual_deliveries)
+        joker_weeks = [
+            delivery["delivery_date"]
+            for delivery in actual_deliveries
+            if delivery["joker_used"]
+        ]
+        self.assertEqual(
+            [datetime.date(2024, 4, 10), datetime.date(2024, 5, 8)], joker_weeks
+        )
+        self.assertFalse(
+            any(
+                delivery["can_joker_be_used"]
+                for delivery in actual_deliveries
+                if delivery["delivery_date"].month == 5
+            )
+        )
@@ -0,0 +1,104 @@
+import datetime
+from unittest.mock import patch, Mock
+
+from tapir.deliveries.services.pick_list_builder import PickListBuilder
+from tapir.subscriptions.services.subscription_delivered_in_week_checked import (
+    SubscriptionDeliveredInWeekChecker,
+)
+from tapir.wirgarten.tests.test_utils import TapirUnitTest
+
+
+class TestBuildPickList(TapirUnitTest):
+    @staticmethod
+    def build_subscription(product_name: str, quantity: int):
+        subscription = Mock()
+        subscription.product.name = product_name
+        subscription.quantity = quantity
+        return subscription
+
+    @staticmethod
+    def build_product(name: str):
+        product = Mock()
+        product.name = name
+        return product
+
+    @patch("tapir.deliveries.services.pick_list_builder.get_product_price")
+    @patch.object(
+        SubscriptionDeliveredInWeekChecker,
+        "is_subscription_delivered_in_week",
+        autospec=True,
+    )
+    @patch.object(PickListBuilder, "get_relevant_products", autospec=True)
+    @patch.object(
+        PickListBuilder,
+        "get_subscriptions_grouped_by_product_type_id_and_pickup_location_name",
+        autospec=True,
+    )
+    def test_buildPickList_default_sumsDeliveredQuantitiesAndMEquivalentsPerPickupLocation(
+        self,
+        mock_get_subscriptions_grouped: Mock,
+        mock_get_relevant_products: Mock,
+        mock_is_subscription_delivered_in_week: Mock,
+        mock_get_product_price: Mock,
+    ):
+        small_1 = self.build_subscription("S", 2)
+        small_2 = self.build_subscription("S", 1)
+        medium = self.build_subscription("M", 3)
+        not_delivered = self.build_subscription("M", 5)
+        mock_get_subscriptions_grouped.return_value = {
+            "type_1": {
+                "Location B": [small_1, medium],
+                "Location A": [small_2, not_delivered],
+            }
+        }
+        mock_get_relevant_products.return_value = [
+            self.build_product("S"),
+            self.build_product("M"),
+        ]
+        mock_is_subscription_delivered_in_week.side_effect = (
+            lambda subscription, **_: subscription is not not_delivered
+        )
+        mock_get_product_price.side_effect = lambda product, **_: Mock(
+            size={"S": 0.5, "M": 1}[product.name]
+        )
+
+        result = PickListBuilder.build_pick_list(
+            product_type=Mock(id="type_1"),
+            delivery_date=datetime.date(year=2023, month=6, day=8),
+            cache={},
+        )
+
+        self.assertEqual(
+            '"Abholort";"S";"M";"M-Äquivalent"\r\n'
+            '"Location A";1;"";0.5\r\n'
+            '"Location B";2;3;1.5\r\n',
+            result,
+        )
+
+    @patch.object(PickListBuilder, "get_relevant_products", autospec=True)
+    @patch.object(
+        PickListBuilder,
+        "get_subscriptions_grouped_by_product_type_id_and_pickup_location_name",
+        autospec=True,
+    )
+    def test_buildPickList_severalProductTypesWithSameCache_subscriptionsAreLoadedOnce(
+        self,
+        mock_get_subscriptions_grouped: Mock,
+        mock_get_relevant_products: Mock,
+    ):
+        mock_get_subscriptions_grouped.return_value = {}
+        mock_get_relevant_products.return_value = []
+        delivery_date = datetime.date(year=2023, month=6, day=8)
+        cache = {}
+
+        for product_type_id in ["type_1", "type_2"]:
+            result = PickListBuilder.build_pick_list(
+                product_type=Mock(id=product_type_id),
+                delivery_date=delivery_date,
+                cache=cache,
+            )
+            self.assertEqual('"Abholort";"M-Äquivalent"\r\n', result)
+
+        mock_get_subscriptions_grouped.assert_called_once_with(
+            delivery_date=delivery_date, cache=cache
+        )
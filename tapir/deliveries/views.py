@@ -45,6 +45,7 @@ from tapir.deliveries.services.member_specific_delivery_day_calculator import (
     MemberSpecificDeliveryDayCalculator,
 )
 from tapir.generic_exports.permissions import HasCoopManagePermission
+from tapir.utils.services.tapir_cache_manager import TapirCacheManager
 from tapir.utils.shortcuts import get_monday
 from tapir.wirgarten.constants import Permission
 from tapir.wirgarten.models import Member, GrowingPeriod
@@ -493,6 +494,9 @@ class GrowingPeriodWithDeliveryDayAdjustmentsView(APIView):
                     ]
                 ]
             )
+            TapirCacheManager.clear_category(
+                cache=None, category=TapirCacheManager.CATEGORY_DELIVERIES
+            )
 
         return Response(
             "OK",
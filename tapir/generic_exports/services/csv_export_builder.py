@@ -1,7 +1,11 @@
 import csv
 import datetime
 import io
+import itertools
 import locale
+from typing import BinaryIO, Iterable, Iterator
+
+from django.db.models import QuerySet
 
 from tapir.generic_exports.models import CsvExport
 from tapir.generic_exports.services.export_segment_manager import (
@@ -13,6 +17,8 @@ from tapir.wirgarten.models import ExportedFile
 
 
 class CsvExportBuilder:
+    CHUNK_SIZE = 500
+
     class CsvExportBuilderException(Exception):
         pass
 
@@ -20,18 +26,34 @@ class CsvExportBuilder:
     def create_exported_file(
         cls, csv_export: CsvExport, reference_datetime: datetime.datetime
     ):
+        output = io.BytesIO()
+        cls.write_csv_export(csv_export, reference_datetime, output)
         return ExportedFile.objects.create(
             name=cls.build_file_name(csv_export.file_name, reference_datetime, "csv"),
             type=ExportedFile.FileType.CSV,
-            file=bytes(
-                cls.build_csv_export_string(csv_export, reference_datetime), "utf-8"
-            ),
+            # getbuffer() avoids copying the whole file once more, ExportedFile
+            # stores it in a BinaryField so it stays fully buffered in memory.
+            file=output.getbuffer(),
         )
 
     @classmethod
     def build_csv_export_string(
         cls, csv_export: CsvExport, reference_datetime: datetime.datetime
     ):
+        output = io.BytesIO()
+        cls.write_csv_export(csv_export, reference_datetime, output)
+        return output.getvalue().decode("utf-8")
+
+    @classmethod
+    def write_csv_export(
+        cls,
+        csv_export: CsvExport,
+        reference_datetime: datetime.datetime,
+        output: BinaryIO,
+        chunk_size: int = CHUNK_SIZE,
+    ):
+        # Rows are fetched, computed and encoded chunk by chunk, so that only
+        # one chunk of db objects and cell values is held at a time.
         segment = ExportSegmentManager.get_segment_by_id(csv_export.export_segment_id)
         queryset = segment.get_queryset(reference_datetime)
         columns = [
@@ -39,25 +61,50 @@ class CsvExportBuilder:
             for column_id in csv_export.column_ids
         ]
 
-        result = io.StringIO()
-        writer = csv.writer(result, delimiter=csv_export.separator)
+        chunk_buffer = io.StringIO()
+        writer = csv.writer(chunk_buffer, delimiter=csv_export.separator)
 
         # Header row
         writer.writerow([name for name in csv_export.custom_column_names])
+        cls.flush_chunk_buffer(chunk_buffer, output)
 
         previous_locale = locale.getlocale()
         locale.setlocale(locale.LC_NUMERIC, csv_export.locale)
-        cache = {}
-        for db_object in queryset:
-            writer.writerow(
-                [
-                    column.get_value(db_object, reference_datetime, cache)
+        try:
+            cache = {}
+            for db_objects in itertools.batched(
+                cls.iterate_queryset(queryset, chunk_size), chunk_size
+            ):
+                precomputed_values_by_column = [
+                    column.precompute_values(db_objects, reference_datetime, cache)
                     for column in columns
                 ]
-            )
-        locale.setlocale(locale.LC_NUMERIC, previous_locale)
+                for db_object in db_objects:
+                    writer.writerow(
+                        [
+                            column.get_value_or_precomputed(
+                                db_object, precomputed_values, reference_datetime, cache
+                            )
+                            for column, precomputed_values in zip(
+                                columns, precomputed_values_by_column
+                            )
+                        ]
+                    )
+                cls.flush_chunk_buffer(chunk_buffer, output)
+        finally:
+            locale.setlocale(locale.LC_NUMERIC, previous_locale)
+
+    @staticmethod
+    def iterate_queryset(queryset: Iterable, chunk_size: int) -> Iterator:
+        if isinstance(queryset, QuerySet):
+            return queryset.iterator(chunk_size=chunk_size)
+        return iter(queryset)
 
-        return result.getvalue()
+    @staticmethod
+    def flush_chunk_buffer(chunk_buffer: io.StringIO, output: BinaryIO):
+        output.write(chunk_buffer.getvalue().encode("utf-8"))
+        chunk_buffer.seek(0)
+        chunk_buffer.truncate(0)
 
     @classmethod
     def get_column_by_id(
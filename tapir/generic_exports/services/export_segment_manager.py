@@ -9,6 +9,29 @@ class ExportSegmentColumn:
     display_name: str
     description: str
     get_value: Callable[[Any, datetime.datetime, dict], Any]
+    # Optional: computes the values of many objects at once, keyed by object pk.
+    # Objects that are missing from the result fall back to get_value.
+    get_values_for_objects: (
+        Callable[[list, datetime.datetime, dict], dict[Any, Any]] | None
+    ) = None
+
+    def precompute_values(
+        self, db_objects: list, reference_datetime: datetime.datetime, cache: dict
+    ) -> dict[Any, Any]:
+        if self.get_values_for_objects is None:
+            return {}
+        return self.get_values_for_objects(db_objects, reference_datetime, cache)
+
+    def get_value_or_precomputed(
+        self,
+        db_object,
+        precomputed_values: dict[Any, Any],
+        reference_datetime: datetime.datetime,
+        cache: dict,
+    ):
+        if db_object.pk in precomputed_values:
+            return precomputed_values[db_object.pk]
+        return self.get_value(db_object, reference_datetime, cache)
 
 
 @dataclass
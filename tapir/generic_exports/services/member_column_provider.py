@@ -92,6 +92,7 @@ class MemberColumnProvider:
                 "Ernteanteils (ohne Solidarbeitrag!) / Anzahl der Lieferwochen) + Lieferzuschlag der "
                 "Verteilstation) * Anzahl der genutzten Joker",
                 get_value=cls.get_value_member_joker_credit_value,
+                get_values_for_objects=cls.get_values_member_joker_credit_value,
             ),
             ExportSegmentColumn(
                 id="member_joker_credit_intended_use",
@@ -104,6 +105,7 @@ class MemberColumnProvider:
                 display_name="Joker Gutschrift Details",
                 description="Gutschrift [Anzahl genutzte Joker] Joker in [Vertragsjahr]",
                 get_value=cls.get_value_member_joker_credit_details,
+                get_values_for_objects=cls.get_values_member_joker_credit_details,
             ),
             ExportSegmentColumn(
                 id=cls.COLUMN_ID_FULL_ADDRESS,
@@ -116,30 +118,35 @@ class MemberColumnProvider:
                 display_name="Anzahl Anteile",
                 description="",
                 get_value=cls.get_value_member_share_quantity,
+                get_values_for_objects=cls.get_values_member_share_quantity,
             ),
             ExportSegmentColumn(
                 id=cls.COLUMN_ID_ADMISSION_DATE,
                 display_name="Beitrittsdatum",
                 description="",
                 get_value=cls.get_value_member_admission_date,
+                get_values_for_objects=cls.get_values_member_admission_date,
             ),
             ExportSegmentColumn(
                 id=cls.COLUMN_ID_TERMINATION_DATE,
                 display_name="Austrittsdatum",
                 description="",
                 get_value=cls.get_value_member_termination_date,
+                get_values_for_objects=cls.get_values_member_termination_date,
             ),
             ExportSegmentColumn(
                 id=cls.COLUMN_ID_SHARE_HISTORY,
                 display_name="Anteilshistorie",
                 description="",
                 get_value=cls.get_value_member_share_history,
+                get_values_for_objects=cls.get_values_member_share_history,
             ),
             ExportSegmentColumn(
                 id="member_share_quantity_cancelled_in_previous_year",
                 display_name="Anzahl gekündigte Anteile im Vorjahr",
                 description="",
                 get_value=cls.get_value_member_share_quantity_cancelled_in_previous_year,
+                get_values_for_objects=cls.get_values_member_share_quantity_cancelled_in_previous_year,
             ),
         ]
 
@@ -205,6 +212,45 @@ class MemberColumnProvider:
         )
         return locale.format_string("%.2f", credit_value)
 
+    @classmethod
+    def get_values_member_joker_credit_value(
+        cls, members: list[Member], reference_datetime: datetime.datetime, cache: dict
+    ):
+        jokers_by_member_id = cls.get_jokers_in_current_growing_period_by_member_id(
+            members, reference_datetime, cache
+        )
+        result = {}
+        for member in members:
+            credit_value = sum(
+                (
+                    JokerValueService.get_joker_credit_value_for_single_joker(
+                        member=member, joker_date=joker.date, cache=cache
+                    )
+                    for joker in jokers_by_member_id.get(member.id, [])
+                ),
+                start=Decimal(0),
+            )
+            result[member.pk] = locale.format_string("%.2f", credit_value)
+        return result
+
+    @classmethod
+    def get_jokers_in_current_growing_period_by_member_id(
+        cls, members: list[Member], reference_datetime: datetime.datetime, cache: dict
+    ):
+        from tapir.deliveries.models import Joker
+
+        growing_period = TapirCache.get_growing_period_at_date(
+            reference_date=reference_datetime.date(), cache=cache
+        )
+        jokers_by_member_id = {}
+        for joker in Joker.objects.filter(
+            date__gte=growing_period.start_date,
+            date__lte=reference_datetime,
+            member_id__in=[member.id for member in members],
+        ):
+            jokers_by_member_id.setdefault(joker.member_id, []).append(joker)
+        return jokers_by_member_id
+
     @classmethod
     def get_value_member_joker_credit_intended_use(
         cls, member: Member, reference_datetime: datetime.datetime, cache: dict
@@ -236,6 +282,23 @@ class MemberColumnProvider:
         date_to = reference_datetime.strftime("%d.%m.%Y")
         return f"Gutschrift {nb_jokers} genutzte Joker in Vertragsjahr {date_from}-{date_to}"
 
+    @classmethod
+    def get_values_member_joker_credit_details(
+        cls, members: list[Member], reference_datetime: datetime.datetime, cache: dict
+    ):
+        jokers_by_member_id = cls.get_jokers_in_current_growing_period_by_member_id(
+            members, reference_datetime, cache
+        )
+        growing_period = TapirCache.get_growing_period_at_date(
+            reference_date=reference_datetime.date(), cache=cache
+        )
+        date_from = growing_period.start_date.strftime("%d.%m.%Y")
+        date_to = reference_datetime.strftime("%d.%m.%Y")
+        return {
+            member.pk: f"Gutschrift {len(jokers_by_member_id.get(member.id, []))} genutzte Joker in Vertragsjahr {date_from}-{date_to}"
+            for member in members
+        }
+
     @classmethod
     def get_value_member_full_address(cls, member: Member, _, __):
         return UserUtils.build_display_address(
@@ -253,6 +316,23 @@ class MemberColumnProvider:
             or 0
         )
 
+    @classmethod
+    def get_values_member_share_quantity(
+        cls, members: list[Member], reference_datetime: datetime.datetime, _
+    ):
+        quantity_by_member_id = dict(
+            CoopShareTransaction.objects.filter(
+                member_id__in=[member.id for member in members],
+                valid_at__lte=reference_datetime,
+            )
+            .values("member_id")
+            .annotate(quantity=Sum(F("quantity")))
+            .values_list("member_id", "quantity")
+        )
+        return {
+            member.pk: quantity_by_member_id.get(member.id) or 0 for member in members
+        }
+
     @classmethod
     def get_value_member_share_history(
         cls, member: Member, reference_datetime: datetime.datetime, _
@@ -264,6 +344,26 @@ class MemberColumnProvider:
             ).order_by("valid_at")
         )
 
+    @classmethod
+    def get_values_member_share_history(
+        cls, members: list[Member], reference_datetime: datetime.datetime, _
+    ):
+        transactions_by_member_id = {}
+        for transaction in CoopShareTransaction.objects.filter(
+            member_id__in=[member.id for member in members],
+            valid_at__lte=reference_datetime,
+        ).order_by("valid_at"):
+            transactions_by_member_id.setdefault(transaction.member_id, []).append(
+                transaction
+            )
+        return {
+            member.pk: "\n".join(
+                f"{transaction.quantity:+} am {transaction.valid_at.strftime('%d.%m.%Y')}"
+                for transaction in transactions_by_member_id.get(member.id, [])
+            )
+            for member in members
+        }
+
     @classmethod
     def get_value_member_admission_date(cls, member: Member, _, __):
         min_valid_at = member.coopsharetransaction_set.aggregate(
@@ -273,6 +373,24 @@ class MemberColumnProvider:
             return ""
         return min_valid_at.strftime("%d.%m.%Y")
 
+    @classmethod
+    def get_values_member_admission_date(cls, members: list[Member], _, __):
+        min_valid_at_by_member_id = dict(
+            CoopShareTransaction.objects.filter(
+                member_id__in=[member.id for member in members]
+            )
+            .values("member_id")
+            .annotate(min_valid_at=Min("valid_at"))
+            .values_list("member_id", "min_valid_at")
+        )
+        result = {}
+        for member in members:
+            min_valid_at = min_valid_at_by_member_id.get(member.id)
+            result[member.pk] = (
+                min_valid_at.strftime("%d.%m.%Y") if min_valid_at else ""
+            )
+        return result
+
     @classmethod
     def get_value_member_termination_date(cls, member: Member, _, __):
         agg = member.coopsharetransaction_set.aggregate(
@@ -283,6 +401,25 @@ class MemberColumnProvider:
             return ""
         return agg["max_valid_at"].strftime("%d.%m.%Y")
 
+    @classmethod
+    def get_values_member_termination_date(cls, members: list[Member], _, __):
+        aggregates_by_member_id = {
+            aggregate["member_id"]: aggregate
+            for aggregate in CoopShareTransaction.objects.filter(
+                member_id__in=[member.id for member in members]
+            )
+            .values("member_id")
+            .annotate(max_valid_at=Max("valid_at"), quantity=Sum(F("quantity")))
+        }
+        result = {}
+        for member in members:
+            agg = aggregates_by_member_id.get(member.id)
+            if agg is None or agg["quantity"] or not agg["max_valid_at"]:
+                result[member.pk] = ""
+                continue
+            result[member.pk] = agg["max_valid_at"].strftime("%d.%m.%Y")
+        return result
+
     @classmethod
     def get_value_member_share_quantity_cancelled_in_previous_year(
         cls, member: Member, reference_datetime: datetime.datetime, _
@@ -299,3 +436,27 @@ class MemberColumnProvider:
             ).aggregate(quantity=Sum(F("quantity")))["quantity"]
             or 0
         )
+
+    @classmethod
+    def get_values_member_share_quantity_cancelled_in_previous_year(
+        cls, members: list[Member], reference_datetime: datetime.datetime, _
+    ):
+        year = reference_datetime.year
+        timerange = (
+            datetime.date(year - 1, 1, 1),
+            datetime.date(year, 1, 1) - datetime.timedelta(milliseconds=1),
+        )
+        quantity_by_member_id = dict(
+            CoopShareTransaction.objects.filter(
+                member_id__in=[member.id for member in members],
+                transaction_type=CoopShareTransaction.CoopShareTransactionType.CANCELLATION,
+                valid_at__range=timerange,
+            )
+            .values("member_id")
+            .annotate(quantity=Sum(F("quantity")))
+            .values_list("member_id", "quantity")
+        )
+        return {
+            member.pk: -(quantity_by_member_id.get(member.id) or 0)
+            for member in members
+        }
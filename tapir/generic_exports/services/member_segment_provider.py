@@ -2,6 +2,9 @@ import datetime
 
 from django.db.models import QuerySet
 
+from tapir.associations.services.association_membership_at_date_filter import (
+    AssociationMembershipAtDateFilter,
+)
 from tapir.deliveries.models import Joker
 from tapir.generic_exports.services.export_segment_manager import ExportSegment
 from tapir.generic_exports.services.member_column_provider import MemberColumnProvider
@@ -77,15 +80,10 @@ class MemberSegmentProvider:
             )
             return members.filter(coop_shares_total_value__gt=0).order_by("member_no")
         elif legal_status_is_association(cache=cache):
-            members_ids_with_a_membership = [
-                member.id
-                for member in Member.objects.all()
-                if TapirCache.get_member_association_membership_at_date(
-                    member=member, reference_date=reference_datetime.date(), cache=cache
-                )
-                is not None
-            ]
-            return Member.objects.filter(id__in=members_ids_with_a_membership)
+            return AssociationMembershipAtDateFilter.filter_members_with_membership_at_date(
+                queryset=Member.objects.order_by("member_no"),
+                reference_date=reference_datetime.date(),
+            )
 
         return Member.objects.all()
 
@@ -1,10 +1,16 @@
 import datetime
+import itertools
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator
 
 import weasyprint
+from django.conf import settings
 from django.template import engines
 from weasyprint import Document
 
 from tapir.generic_exports.models import PdfExport
+from tapir.generic_exports.services import pdf_export_worker
 from tapir.generic_exports.services.csv_export_builder import CsvExportBuilder
 from tapir.generic_exports.services.export_segment_manager import (
     ExportSegment,
@@ -16,6 +22,10 @@ from tapir.wirgarten.utils import get_today
 
 
 class PdfExportBuilder:
+    BULK_CREATE_BATCH_SIZE = 100
+
+    # Set in each worker process by pdf_export_worker.init_worker
+    _worker_templates: dict = {}
 
     class PdfExportBuilderException(Exception):
         pass
@@ -29,6 +39,15 @@ class PdfExportBuilder:
 
         base_context = {"today": get_today(cache=cache)}
         if pdf_export.generate_one_file_for_every_segment_entry:
+            nb_workers = cls.get_nb_workers()
+            if nb_workers > 1 and len(contexts) > 1:
+                return cls.create_files_in_parallel(
+                    pdf_export,
+                    reference_datetime,
+                    [context | base_context for context in contexts],
+                    nb_workers=nb_workers,
+                )
+
             return [
                 cls.create_single_file(
                     pdf_export,
@@ -55,11 +74,23 @@ class PdfExportBuilder:
             if column.id in pdf_export.template
         ]
 
+        entries = list(segment.get_queryset(reference_datetime))
+        precomputed_values_by_column_id = {
+            column.id: column.precompute_values(entries, reference_datetime, cache)
+            for column in segment.get_available_columns()
+            if column.id in used_column_ids
+        }
+
         return [
             cls.build_context_for_entry(
-                entry, segment, reference_datetime, used_column_ids, cache=cache
+                entry,
+                segment,
+                reference_datetime,
+                used_column_ids,
+                cache=cache,
+                precomputed_values_by_column_id=precomputed_values_by_column_id,
             )
-            for entry in segment.get_queryset(reference_datetime)
+            for entry in entries
         ]
 
     @classmethod
@@ -81,6 +112,74 @@ class PdfExportBuilder:
         )
         return exported_file
 
+    @classmethod
+    def get_nb_workers(cls) -> int:
+        return getattr(settings, "PDF_EXPORT_NB_WORKERS", 1)
+
+    @classmethod
+    def create_files_in_parallel(
+        cls,
+        pdf_export: PdfExport,
+        reference_datetime: datetime.datetime,
+        contexts: list[dict],
+        nb_workers: int,
+    ) -> list[ExportedFile]:
+        exported_files = []
+        rendered_files = cls.render_files_in_parallel(
+            pdf_export, contexts, nb_workers=nb_workers
+        )
+        for batch in itertools.batched(rendered_files, cls.BULK_CREATE_BATCH_SIZE):
+            exported_files.extend(
+                ExportedFile.objects.bulk_create(
+                    [
+                        ExportedFile(
+                            name=CsvExportBuilder.build_file_name(
+                                rendered_file_name, reference_datetime, "pdf"
+                            ),
+                            type=ExportedFile.FileType.PDF,
+                            file=pdf_file,
+                        )
+                        for rendered_file_name, pdf_file in batch
+                    ]
+                )
+            )
+        return exported_files
+
+    @classmethod
+    def render_files_in_parallel(
+        cls, pdf_export: PdfExport, contexts: list[dict], nb_workers: int
+    ) -> Iterator[tuple[str, bytes]]:
+        # Spawned rather than forked: the workers start without the database connections of this process,
+        # which may be inside a transaction that must stay open.
+        with ProcessPoolExecutor(
+            max_workers=nb_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=pdf_export_worker.init_worker,
+            initargs=(pdf_export.template, pdf_export.file_name),
+        ) as executor:
+            yield from executor.map(
+                pdf_export_worker.render_file_in_worker,
+                contexts,
+                chunksize=max(1, len(contexts) // (nb_workers * 4)),
+            )
+
+    @classmethod
+    def build_worker_templates(
+        cls, template_string: str, file_name_template_string: str
+    ):
+        cls._worker_templates = {
+            "template": cls.build_template_object(template_string),
+            "file_name": cls.build_template_object(file_name_template_string),
+        }
+
+    @classmethod
+    def render_file_in_worker(cls, context: dict) -> tuple[str, bytes]:
+        rendered_file_name = cls._worker_templates["file_name"].render(context)
+        document = cls.render_pdf_from_template_object(
+            cls._worker_templates["template"], context
+        )
+        return rendered_file_name, document.write_pdf()
+
     @classmethod
     def build_context_for_entry(
         cls,
@@ -89,16 +188,32 @@ class PdfExportBuilder:
         reference_datetime: datetime.datetime,
         used_column_ids,
         cache: dict,
+        precomputed_values_by_column_id: dict[str, dict] | None = None,
     ):
+        if precomputed_values_by_column_id is None:
+            precomputed_values_by_column_id = {}
+
         return {
-            column.id: column.get_value(db_object, reference_datetime, cache)
+            column.id: column.get_value_or_precomputed(
+                db_object,
+                precomputed_values_by_column_id.get(column.id, {}),
+                reference_datetime,
+                cache,
+            )
             for column in segment.get_available_columns()
             if column.id in used_column_ids
         }
 
     @classmethod
     def render_pdf(cls, template_as_string: str, context: dict) -> Document:
-        template_object = cls.build_template_object(template_as_string)
+        return cls.render_pdf_from_template_object(
+            cls.build_template_object(template_as_string), context
+        )
+
+    @classmethod
+    def render_pdf_from_template_object(
+        cls, template_object, context: dict
+    ) -> Document:
         rendered_template = template_object.render(context)
         document = weasyprint.HTML(
             string=rendered_template, url_fetcher=TapirUrlFetcher()
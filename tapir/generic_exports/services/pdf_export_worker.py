@@ -0,0 +1,21 @@
+import django
+
+# Entry points of the PDF export worker processes.
+# The workers are spawned, so this module is imported before django is set up: it must not import any model at module level.
+
+
+def init_worker(template_string: str, file_name_template_string: str):
+    django.setup()
+
+    from tapir.generic_exports.services.pdf_export_builder import PdfExportBuilder
+
+    PdfExportBuilder.build_worker_templates(
+        template_string=template_string,
+        file_name_template_string=file_name_template_string,
+    )
+
+
+def render_file_in_worker(context: dict) -> tuple[str, bytes]:
+    from tapir.generic_exports.services.pdf_export_builder import PdfExportBuilder
+
+    return PdfExportBuilder.render_file_in_worker(context)
@@ -1,15 +1,26 @@
+import datetime
 from unittest.mock import patch, Mock, call
 
+from django.db import transaction
+from django.test import override_settings
+
 from tapir.generic_exports.models import AutomatedPdfExportResult
 from tapir.generic_exports.services.automated_exports_manager import (
     AutomatedExportsManager,
 )
 from tapir.generic_exports.services.export_mail_sender import ExportMailSender
 from tapir.generic_exports.services.pdf_export_builder import PdfExportBuilder
+from tapir.generic_exports.tests.factories import PdfExportFactory
+from tapir.wirgarten.parameters import ParameterDefinitions
+from tapir.wirgarten.tests.factories import MemberWithCoopSharesFactory
 from tapir.wirgarten.tests.test_utils import TapirIntegrationTest
 
 
 class TestDoSinglePdfExport(TapirIntegrationTest):
+    @classmethod
+    def setUpTestData(cls):
+        ParameterDefinitions().import_definitions(bulk_create=True)
+
     @patch.object(ExportMailSender, "send_mails_for_export")
     @patch.object(AutomatedPdfExportResult, "objects")
     @patch.object(PdfExportBuilder, "create_exported_files")
@@ -40,3 +51,34 @@ class TestDoSinglePdfExport(TapirIntegrationTest):
         )
 
         mock_send_mails_for_export.assert_called_once_with(export_results, cache=cache)
+
+    @override_settings(PDF_EXPORT_NB_WORKERS=2)
+    @patch.object(ExportMailSender, "send_mails_for_export")
+    def test_doSinglePdfExport_twoWorkers_createsTheFilesWithoutBreakingTheTransaction(
+        self, mock_send_mails_for_export: Mock
+    ):
+        export = PdfExportFactory.create(
+            export_segment_id="members.all",
+            template="<p>{{member_last_name}}</p>",
+            file_name="file {{member_last_name}}",
+            generate_one_file_for_every_segment_entry=True,
+        )
+        for _ in range(3):
+            MemberWithCoopSharesFactory.create()
+        on_commit_callback = Mock()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            transaction.on_commit(on_commit_callback)
+            AutomatedExportsManager.do_single_pdf_export(
+                export,
+                datetime.datetime(year=2025, month=11, day=27),
+                cache={},
+            )
+
+        on_commit_callback.assert_called_once_with()
+        results = AutomatedPdfExportResult.objects.filter(export_definition=export)
+        self.assertEqual(3, results.count())
+        self.assertTrue(
+            all(bytes(result.file.file).startswith(b"%PDF") for result in results)
+        )
+        mock_send_mails_for_export.assert_called_once()
@@ -1,6 +1,9 @@
 import datetime
+import io
+from unittest.mock import patch
 
 from tapir.generic_exports.services.csv_export_builder import CsvExportBuilder
+from tapir.generic_exports.services.member_column_provider import MemberColumnProvider
 from tapir.generic_exports.tests.factories import CsvExportFactory
 from tapir.wirgarten.parameters import ParameterDefinitions
 from tapir.wirgarten.tests.factories import MemberWithCoopSharesFactory
@@ -49,3 +52,56 @@ class TestBuildCsvExportString(TapirIntegrationTest):
         )
         expected = "test_custom_1:test_empty:test_custom_2\r\nFN1::LN1\r\nFN2::LN2\r\n"
         self.assertEqual(expected, result)
+
+    def test_buildCsvExportString_columnWithBatchGetter_usesPrecomputedValues(self):
+        export = CsvExportFactory.create(
+            export_segment_id="members.all",
+            column_ids=["member_first_name", "member_share_quantity"],
+            separator=":",
+            custom_column_names=["first_name", "shares"],
+        )
+        members = [
+            MemberWithCoopSharesFactory.create(first_name="FN1"),
+            MemberWithCoopSharesFactory.create(first_name="FN2"),
+        ]
+        reference_datetime = datetime.datetime(
+            year=2030, month=3, day=5, hour=12, minute=17
+        )
+
+        with patch.object(
+            MemberColumnProvider,
+            "get_value_member_share_quantity",
+            autospec=True,
+        ) as mock_get_value_member_share_quantity:
+            result = CsvExportBuilder.build_csv_export_string(
+                csv_export=export, reference_datetime=reference_datetime
+            )
+
+        mock_get_value_member_share_quantity.assert_not_called()
+        expected = "first_name:shares\r\n" + "".join(
+            f"{member.first_name}:{MemberColumnProvider.get_value_member_share_quantity(member, reference_datetime, {})}\r\n"
+            for member in members
+        )
+        self.assertEqual(expected, result)
+
+    def test_writeCsvExport_smallChunkSize_sameOutputAsSingleChunk(self):
+        export = CsvExportFactory.create(
+            export_segment_id="members.all",
+            column_ids=["member_first_name", "member_share_quantity"],
+            separator=";",
+            custom_column_names=["first_name", "shares"],
+        )
+        for index in range(5):
+            MemberWithCoopSharesFactory.create(first_name=f"FN{index}")
+        reference_datetime = datetime.datetime(year=2030, month=3, day=5)
+
+        outputs = []
+        for chunk_size in [2, 1000]:
+            output = io.BytesIO()
+            CsvExportBuilder.write_csv_export(
+                export, reference_datetime, output, chunk_size=chunk_size
+            )
+            outputs.append(output.getvalue())
+
+        self.assertEqual(outputs[0], outputs[1])
+        self.assertEqual(6, outputs[0].decode("utf-8").count("\r\n"))
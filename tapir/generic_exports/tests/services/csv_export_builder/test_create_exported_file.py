@@ -1,4 +1,4 @@
-from unittest.mock import patch, Mock
+from unittest.mock import patch, Mock, ANY
 
 from tapir.wirgarten.tests.test_utils import TapirUnitTest
 
@@ -7,14 +7,14 @@ from tapir.wirgarten.models import ExportedFile
 
 
 class TestCreateExportedFile(TapirUnitTest):
-    @patch.object(CsvExportBuilder, "build_csv_export_string")
+    @patch.object(CsvExportBuilder, "write_csv_export")
     @patch.object(CsvExportBuilder, "build_file_name")
     @patch.object(ExportedFile, "objects")
     def test_createExportedFile_default_createsFile(
         self,
         mock_objects: Mock,
         mock_build_file_name: Mock,
-        mock_build_csv_export_string: Mock,
+        mock_write_csv_export: Mock,
     ):
         export = Mock()
         export.file_name = "input_file_name"
@@ -22,7 +22,9 @@ class TestCreateExportedFile(TapirUnitTest):
         expected = Mock()
         mock_objects.create.return_value = expected
         mock_build_file_name.return_value = "output_file_name"
-        mock_build_csv_export_string.return_value = "file_as_string"
+        mock_write_csv_export.side_effect = lambda _, __, output: output.write(
+            bytes("file_as_string", "utf-8")
+        )
 
         result = CsvExportBuilder.create_exported_file(export, reference_datetime)
 
@@ -33,4 +35,4 @@ class TestCreateExportedFile(TapirUnitTest):
         mock_build_file_name.assert_called_once_with(
             "input_file_name", reference_datetime, "csv"
         )
-        mock_build_csv_export_string.assert_called_once_with(export, reference_datetime)
+        mock_write_csv_export.assert_called_once_with(export, reference_datetime, ANY)
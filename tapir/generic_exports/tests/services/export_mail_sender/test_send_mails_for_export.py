@@ -30,8 +30,7 @@ class TestSendMailForExport(TapirUnitTest):
         ]
         export_result.export_definition.name = "test_definition_name"
         export_result.file.name = "test_file_name"
-        file_bytes = Mock()
-        export_result.file.file = file_bytes
+        export_result.file.file = memoryview(b"test_file_content")
         mock_mimetypes.guess_type.return_value = ("test mime type", "unused")
         cache = Mock()
         ExportMailSender.send_mails_for_export([export_result], cache=cache)
@@ -46,7 +45,7 @@ class TestSendMailForExport(TapirUnitTest):
             attachments=[
                 Attachment(
                     file_name="test_file_name",
-                    content=file_bytes,
+                    content=b"test_file_content",
                     mime_type="test mime type",
                 )
             ],
@@ -39,6 +39,7 @@ class TestBuildContexts(TapirIntegrationTest):
                     reference_datetime,
                     ["member_last_name", "member_number"],
                     cache=ANY,
+                    precomputed_values_by_column_id=ANY,
                 )
                 for member in members
             ]
@@ -1,6 +1,8 @@
 import datetime
 from unittest.mock import patch, Mock, call
 
+from django.test import override_settings
+
 from tapir.wirgarten.tests.test_utils import TapirUnitTest
 
 from tapir.generic_exports.services.pdf_export_builder import PdfExportBuilder
@@ -68,3 +70,36 @@ class TestCreateExportedFiles(TapirUnitTest):
                 for context in mock_contexts
             ]
         )
+
+    @override_settings(PDF_EXPORT_NB_WORKERS=4)
+    @patch.object(PdfExportBuilder, "create_files_in_parallel")
+    @patch.object(PdfExportBuilder, "create_single_file")
+    @patch.object(PdfExportBuilder, "build_contexts")
+    def test_createExportedFiles_severalWorkersConfigured_createsFilesInParallel(
+        self,
+        mock_build_contexts: Mock,
+        mock_create_single_file: Mock,
+        mock_create_files_in_parallel: Mock,
+    ):
+        mock_export = Mock()
+        mock_export.generate_one_file_for_every_segment_entry = True
+        mock_datetime = Mock()
+        mock_contexts = [{"aa": "bb"}, {"cc": "dd"}]
+        mock_build_contexts.return_value = mock_contexts
+        mock_created_files = [Mock(), Mock()]
+        mock_create_files_in_parallel.return_value = mock_created_files
+        mock_timezone(test=self, now=datetime.datetime(year=2016, month=11, day=27))
+
+        result = PdfExportBuilder.create_exported_files(mock_export, mock_datetime)
+
+        self.assertEqual(mock_created_files, result)
+        mock_create_single_file.assert_not_called()
+        mock_create_files_in_parallel.assert_called_once_with(
+            mock_export,
+            mock_datetime,
+            [
+                context | {"today": datetime.date(year=2016, month=11, day=27)}
+                for context in mock_contexts
+            ],
+            nb_workers=4,
+        )
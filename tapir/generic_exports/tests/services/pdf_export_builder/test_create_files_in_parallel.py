@@ -0,0 +1,69 @@
+from unittest.mock import patch, Mock
+
+from tapir.generic_exports.models import PdfExport
+from tapir.generic_exports.services.csv_export_builder import CsvExportBuilder
+from tapir.generic_exports.services.pdf_export_builder import PdfExportBuilder
+from tapir.wirgarten.models import ExportedFile
+from tapir.wirgarten.tests.test_utils import TapirUnitTest
+
+
+class TestCreateFilesInParallel(TapirUnitTest):
+    @patch.object(PdfExportBuilder, "BULK_CREATE_BATCH_SIZE", 2)
+    @patch.object(CsvExportBuilder, "build_file_name")
+    @patch.object(ExportedFile, "objects")
+    @patch.object(PdfExportBuilder, "render_files_in_parallel")
+    def test_createFilesInParallel_default_createsFilesInBatches(
+        self,
+        mock_render_files_in_parallel: Mock,
+        mock_exported_file_objects: Mock,
+        mock_build_file_name: Mock,
+    ):
+        mock_export = Mock()
+        mock_datetime = Mock()
+        contexts = [{"entry": 1}, {"entry": 2}, {"entry": 3}]
+        mock_render_files_in_parallel.return_value = iter(
+            [("file 1", b"pdf 1"), ("file 2", b"pdf 2"), ("file 3", b"pdf 3")]
+        )
+        mock_build_file_name.side_effect = lambda name, *args: f"built {name}"
+        mock_exported_file_objects.bulk_create.side_effect = lambda files: files
+
+        result = PdfExportBuilder.create_files_in_parallel(
+            mock_export, mock_datetime, contexts, nb_workers=3
+        )
+
+        mock_render_files_in_parallel.assert_called_once_with(
+            mock_export, contexts, nb_workers=3
+        )
+        self.assertEqual(2, mock_exported_file_objects.bulk_create.call_count)
+        self.assertEqual(
+            ["built file 1", "built file 2", "built file 3"],
+            [exported_file.name for exported_file in result],
+        )
+        self.assertEqual(
+            [b"pdf 1", b"pdf 2", b"pdf 3"],
+            [exported_file.file for exported_file in result],
+        )
+        self.assertTrue(
+            all(
+                exported_file.type == ExportedFile.FileType.PDF
+                for exported_file in result
+            )
+        )
+
+    def test_renderFilesInParallel_twoWorkers_rendersEveryFileInOrder(self):
+        pdf_export = PdfExport(
+            template="<p>{{ name }}</p>", file_name="file {{ name }}"
+        )
+        contexts = [{"name": "a"}, {"name": "b"}, {"name": "c"}]
+
+        result = list(
+            PdfExportBuilder.render_files_in_parallel(
+                pdf_export, contexts, nb_workers=2
+            )
+        )
+
+        self.assertEqual(
+            ["file a", "file b", "file c"],
+            [rendered_file_name for rendered_file_name, _ in result],
+        )
+        self.assertTrue(all(pdf_file.startswith(b"%PDF") for _, pdf_file in result))
@@ -282,3 +282,57 @@ class TestMemberColumnProvider(TapirIntegrationTest):
             member, datetime.datetime(2025, 1, 1), {}
         )
         self.assertEqual(42, result)
+
+    def test_getValuesForObjects_shareColumns_sameValuesAsSingleMemberGetters(
+        self,
+    ):
+        members = [
+            self.create_terminated_member_with_share_history(),
+            MemberFactory.create(),
+        ]
+        CoopShareTransactionFactory.create(
+            member=members[1], quantity=5, valid_at=datetime.datetime(2024, 1, 15)
+        )
+        columns_with_batch_getter = [
+            column
+            for column in MemberColumnProvider.get_member_columns()
+            if column.get_values_for_objects is not None
+            and not column.id.startswith("member_joker")
+        ]
+
+        for reference_datetime in [
+            datetime.datetime(2023, 12, 1),
+            datetime.datetime(2024, 2, 1),
+            datetime.datetime(2025, 1, 1),
+        ]:
+            for column in columns_with_batch_getter:
+                result = column.get_values_for_objects(members, reference_datetime, {})
+                self.assertEqual(
+                    {
+                        member.pk: column.get_value(member, reference_datetime, {})
+                        for member in members
+                    },
+                    result,
+                    f"Column {column.id} at {reference_datetime}",
+                )
+
+    def test_getValuesMemberJokerCreditDetails_default_returnsCorrectDetailsForAllMembers(
+        self,
+    ):
+        member_with_jokers = MemberFactory.create()
+        self.setupJokerData(member_with_jokers)
+        member_without_jokers = MemberFactory.create()
+
+        result = MemberColumnProvider.get_values_member_joker_credit_details(
+            [member_with_jokers, member_without_jokers],
+            datetime.datetime(year=2025, month=1, day=3),
+            {},
+        )
+
+        self.assertEqual(
+            {
+                member_with_jokers.pk: "Gutschrift 2 genutzte Joker in Vertragsjahr 01.01.2025-03.01.2025",
+                member_without_jokers.pk: "Gutschrift 0 genutzte Joker in Vertragsjahr 01.01.2025-03.01.2025",
+            },
+            result,
+        )
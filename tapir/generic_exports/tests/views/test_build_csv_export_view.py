@@ -26,7 +26,7 @@ class TestBuildCsvExportView(TapirIntegrationTest):
         mock_file = Mock()
         mock_create_exported_file.return_value = mock_file
         mock_file.name = "Test name"
-        mock_file.file.decode.return_value = "Test file content"
+        mock_file.file = memoryview(b"Test file content")
         reference_datetime = datetime.datetime(2024, 5, 27, 10, 48)
 
         base_url = reverse("generic_exports:build_csv_export")
@@ -36,7 +36,6 @@ class TestBuildCsvExportView(TapirIntegrationTest):
 
         self.assertStatusCode(response, 200)
         mock_create_exported_file.assert_called_once_with(export, reference_datetime)
-        mock_file.file.decode.assert_called_once_with("utf-8")
 
         result = json.loads(response.content)
         expected = {"file_name": "Test name", "file_as_string": "Test file content"}
@@ -106,7 +106,7 @@ class BuildCsvExportView(APIView):
             BuildCsvExportResponseSerializer(
                 {
                     "file_name": exported_file.name,
-                    "file_as_string": exported_file.file.decode("utf-8"),
+                    "file_as_string": str(exported_file.file, "utf-8"),
                 }
             ).data,
             status=status.HTTP_200_OK,
@@ -8,9 +8,14 @@ class PaymentsConfig(AppConfig):
     name = "tapir.payments"
 
     def ready(self) -> None:
+        from tapir.payments.services.cashflow_forecast_service import (
+            CashflowForecastService,
+        )
         from tapir.payments.services.monthly_sales_segment_provider import (
             MonthlySalesSegmentProvider,
         )
 
         for segment in MonthlySalesSegmentProvider.get_sales_segments():
             ExportSegmentManager.register_segment(segment)
+
+        CashflowForecastService.connect_signals()
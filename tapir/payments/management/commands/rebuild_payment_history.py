@@ -7,6 +7,7 @@ from tapir.payments.tasks import (
     create_payments_for_this_month,
     export_payments_for_this_month,
 )
+from tapir.utils.services.tapir_cache_manager import TapirCacheManager
 from tapir.utils.shortcuts import get_first_of_next_month
 from tapir.wirgarten.models import Payment, PaymentTransaction
 from tapir.wirgarten.parameter_keys import ParameterKeys
@@ -40,6 +41,9 @@ class Command(BaseCommand):
 
         Payment.objects.exclude(type=PAYMENT_TYPE_COOP_SHARES).delete()
         Payment.objects.update(transaction=None)
+        TapirCacheManager.clear_category(
+            cache=None, category=TapirCacheManager.CATEGORY_PAYMENTS
+        )
         PaymentTransaction.objects.all().delete()
 
         current_date = get_parameter_value(
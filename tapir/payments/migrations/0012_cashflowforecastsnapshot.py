@@ -0,0 +1,41 @@
+# Generated by Django 6.0.5 on 2026-10-18 10:12
+
+import functools
+import tapir.core.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("payments", "0011_membercredit_pickup_location"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CashflowForecastSnapshot",
+            fields=[
+                (
+                    "id",
+                    models.CharField(
+                        default=functools.partial(tapir.core.models.generate_id),
+                        max_length=10,
+                        primary_key=True,
+                        serialize=False,
+                        unique=True,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("month", models.DateField(unique=True)),
+                (
+                    "projected_amount",
+                    models.DecimalField(decimal_places=2, max_digits=12),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 6.0.5 on 2026-10-18 16:02
+
+import datetime
+import functools
+import tapir.core.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("payments", "0012_cashflowforecastsnapshot"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="cashflowforecastsnapshot",
+            name="computed_on",
+            field=models.DateField(default=datetime.date(1970, 1, 1)),
+            preserve_default=False,
+        ),
+        migrations.CreateModel(
+            name="CashflowForecastInvalidation",
+            fields=[
+                (
+                    "id",
+                    models.CharField(
+                        default=functools.partial(tapir.core.models.generate_id),
+                        max_length=10,
+                        primary_key=True,
+                        serialize=False,
+                        unique=True,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("month", models.DateField()),
+            ],
+            options={
+                "abstract": False,
+            },
+        ),
+    ]
@@ -92,3 +92,17 @@ class MemberCreditCreatedLogEntry(ModelLogEntry):
 
 class MemberCreditSettledLogEntry(ModelLogEntry):
     template_name = "payments/log/member_credit_settled_log_entry.html"
+
+
+class CashflowForecastSnapshot(TapirModel):
+    # Sum of the payments that MonthPaymentBuilder projects for the month, without the payments that already exist in the DB.
+    month = models.DateField(unique=True)
+    projected_amount = models.DecimalField(decimal_places=2, max_digits=12)
+    # The projection depends on the current date, snapshots computed on a previous day are stale.
+    computed_on = models.DateField()
+
+
+class CashflowForecastInvalidation(TapirModel):
+    # Logs each invalidation, so that a refresh that was computing while the invalidation happened
+    # can delete the snapshots it stored from the invalidated month on.
+    month = models.DateField()
@@ -0,0 +1,317 @@
+import datetime
+from decimal import Decimal
+
+from dateutil.relativedelta import relativedelta
+from django.db import transaction
+from django.db.models import Max, Min, Sum
+from django.db.models.functions import TruncMonth
+from django.db.models.signals import post_save, post_delete, pre_save
+from django.utils import timezone
+
+from tapir.payments.models import (
+    CashflowForecastInvalidation,
+    CashflowForecastSnapshot,
+    MemberCredit,
+    MemberPaymentRhythm,
+)
+from tapir.payments.services.generated_payments_ledger import GeneratedPaymentsLedger
+from tapir.payments.services.month_payment_builder import MonthPaymentBuilder
+from tapir.wirgarten.models import (
+    GrowingPeriod,
+    Payment,
+    ProductCapacity,
+    ProductPrice,
+    Subscription,
+)
+from tapir.wirgarten.service.payment import get_next_payment_date
+from tapir.wirgarten.utils import get_today
+
+
+class CashflowForecastService:
+    # The payments built for a month only depend on the payments generated for the months
+    # that overlap with its payment rhythm period, which is at most a year long.
+    # When refreshing from a given month, only the months within that window before it have to be built again.
+    NB_WARM_UP_MONTHS = 12
+
+    # Invalidations are only needed by the refreshes that were running while they happened
+    INVALIDATION_RETENTION = datetime.timedelta(days=1)
+
+    # For each model that influences the forecast, the date fields from which the forecast may change
+    AFFECTED_DATE_FIELDS_BY_MODEL = {
+        Subscription: ["start_date", "end_date"],
+        ProductPrice: ["valid_from"],
+        MemberPaymentRhythm: ["valid_from"],
+        MemberCredit: ["due_date"],
+        Payment: ["due_date"],
+    }
+
+    PREVIOUS_DATES_ATTRIBUTE = "_cashflow_forecast_previous_dates"
+    PENDING_INVALIDATION_ATTRIBUTE = "_cashflow_forecast_pending_invalidation"
+
+    @classmethod
+    def get_models_and_affected_date_fields(cls):
+        from tapir.associations.models import AssociationMembership
+        from tapir.pickup_locations.models import PickupLocationDeliveryCharge
+        from tapir.solidarity_contribution.models import SolidarityContribution
+
+        return {
+            **cls.AFFECTED_DATE_FIELDS_BY_MODEL,
+            SolidarityContribution: ["start_date", "end_date"],
+            AssociationMembership: ["start_date", "end_date"],
+            PickupLocationDeliveryCharge: ["valid_from"],
+            GrowingPeriod: ["start_date", "end_date"],
+        }
+
+    @classmethod
+    def get_models_affecting_all_months(cls):
+        from tapir.configuration.models import TapirParameter
+
+        return [TapirParameter, ProductCapacity]
+
+    @classmethod
+    def connect_signals(cls):
+        for model in cls.get_models_and_affected_date_fields().keys():
+            pre_save.connect(
+                cls.on_model_pre_save,
+                sender=model,
+                weak=False,
+                dispatch_uid=f"cashflow_forecast:pre_save:{model.__name__}",
+            )
+            for signal_name, signal in [
+                ("post_save", post_save),
+                ("post_delete", post_delete),
+            ]:
+                signal.connect(
+                    cls.on_model_changed,
+                    sender=model,
+                    weak=False,
+                    dispatch_uid=f"cashflow_forecast:{signal_name}:{model.__name__}",
+                )
+
+        for model in cls.get_models_affecting_all_months():
+            for signal_name, signal in [
+                ("post_save", post_save),
+                ("post_delete", post_delete),
+            ]:
+                signal.connect(
+                    cls.on_model_affecting_all_months_changed,
+                    sender=model,
+                    weak=False,
+                    dispatch_uid=f"cashflow_forecast:{signal_name}:{model.__name__}",
+                )
+
+    @classmethod
+    def on_model_pre_save(cls, sender, instance, raw=False, **kwargs):
+        # Moving a date later must also invalidate the months between the previous and the new date
+        if raw:
+            return
+
+        previous_dates = (
+            sender.objects.filter(pk=instance.pk)
+            .values_list(*cls.get_models_and_affected_date_fields()[sender])
+            .first()
+        )
+        setattr(instance, cls.PREVIOUS_DATES_ATTRIBUTE, previous_dates or ())
+
+    @classmethod
+    def on_model_changed(cls, sender, instance, **kwargs):
+        dates = [
+            getattr(instance, field_name)
+            for field_name in cls.get_models_and_affected_date_fields()[sender]
+        ]
+        dates.extend(getattr(instance, cls.PREVIOUS_DATES_ATTRIBUTE, ()))
+        dates = [date for date in dates if date is not None]
+        if len(dates) == 0:
+            return
+
+        cls.mark_stale_on_commit(min(dates))
+
+    @classmethod
+    def on_model_affecting_all_months_changed(cls, sender, instance, **kwargs):
+        cls.mark_stale_on_commit(datetime.date.min)
+
+    @classmethod
+    def mark_stale_on_commit(cls, reference_date: datetime.date):
+        """
+        All the invalidations of a transaction are collapsed into a single delete, run once the transaction is committed.
+        Outside a transaction, the delete is run immediately.
+        """
+        connection = transaction.get_connection()
+        pending_invalidation = getattr(
+            connection, cls.PENDING_INVALIDATION_ATTRIBUTE, None
+        )
+        # After a rollback, the pending invalidation is not in the on commit callbacks anymore
+        if pending_invalidation is not None and any(
+            callback is pending_invalidation["callback"]
+            for _, callback, _ in connection.run_on_commit
+        ):
+            pending_invalidation["reference_date"] = min(
+                pending_invalidation["reference_date"], reference_date
+            )
+            return
+
+        pending_invalidation = {"reference_date": reference_date}
+
+        def callback():
+            setattr(connection, cls.PENDING_INVALIDATION_ATTRIBUTE, None)
+            cls.mark_stale_from(pending_invalidation["reference_date"])
+
+        pending_invalidation["callback"] = callback
+        setattr(connection, cls.PENDING_INVALIDATION_ATTRIBUTE, pending_invalidation)
+        transaction.on_commit(callback)
+
+    @classmethod
+    def mark_stale_from(cls, reference_date: datetime.date):
+        month = reference_date.replace(day=1)
+        # Logged before deleting, see delete_snapshots_invalidated_during_refresh
+        CashflowForecastInvalidation.objects.create(month=month)
+        CashflowForecastSnapshot.objects.filter(month__gte=month).delete()
+
+    @classmethod
+    def get_payment_dates(cls, cache: dict) -> list[datetime.date]:
+        last_contract_end = Subscription.objects.aggregate(max_date=Max("end_date"))[
+            "max_date"
+        ]
+
+        payment_dates = [get_next_payment_date(cache=cache)]
+        if last_contract_end is None:
+            return payment_dates
+
+        while payment_dates[-1] < last_contract_end:
+            payment_dates.append(payment_dates[-1] + relativedelta(months=1))
+        return payment_dates
+
+    @classmethod
+    def get_monthly_totals(
+        cls, payment_dates: list[datetime.date], cache: dict
+    ) -> list[Decimal]:
+        projected_amounts_by_month = cls.get_projected_amounts_by_month(
+            payment_dates=payment_dates, cache=cache
+        )
+        actual_amounts_by_month = cls.get_actual_amounts_by_month(
+            first_month=payment_dates[0].replace(day=1)
+        )
+
+        return [
+            projected_amounts_by_month[payment_date.replace(day=1)]
+            + actual_amounts_by_month.get(payment_date.replace(day=1), Decimal(0))
+            for payment_date in payment_dates
+        ]
+
+    @classmethod
+    def get_projected_amounts_by_month(
+        cls, payment_dates: list[datetime.date], cache: dict
+    ) -> dict[datetime.date, Decimal]:
+        months = [payment_date.replace(day=1) for payment_date in payment_dates]
+        projected_amounts_by_month = dict(
+            CashflowForecastSnapshot.objects.filter(
+                month__in=months, computed_on__gte=get_today(cache=cache)
+            ).values_list("month", "projected_amount")
+        )
+
+        first_missing_index = next(
+            (
+                index
+                for index, month in enumerate(months)
+                if month not in projected_amounts_by_month
+            ),
+            None,
+        )
+        if first_missing_index is not None:
+            projected_amounts_by_month.update(
+                cls.refresh_snapshots(
+                    payment_dates=payment_dates,
+                    first_index_to_store=first_missing_index,
+                    cache=cache,
+                )
+            )
+
+        return projected_amounts_by_month
+
+    @classmethod
+    def refresh_snapshots(
+        cls,
+        payment_dates: list[datetime.date],
+        first_index_to_store: int,
+        cache: dict,
+    ) -> dict[datetime.date, Decimal]:
+        computed_on = get_today(cache=cache)
+        known_invalidation_ids = set(
+            CashflowForecastInvalidation.objects.values_list("id", flat=True)
+        )
+
+        generated_payments = GeneratedPaymentsLedger()
+        projected_amounts_by_month = {}
+        for index in range(
+            max(0, first_index_to_store - cls.NB_WARM_UP_MONTHS), len(payment_dates)
+        ):
+            payments = MonthPaymentBuilder.build_payments_for_month(
+                reference_date=payment_dates[index],
+                cache=cache,
+                generated_payments=generated_payments,
+            )
+            generated_payments.update(payments)
+
+            if index < first_index_to_store:
+                continue
+            projected_amounts_by_month[payment_dates[index].replace(day=1)] = sum(
+                [payment.amount for payment in payments], start=Decimal(0)
+            )
+
+        # Upserted so that two concurrent refreshes don't conflict on the unique month
+        CashflowForecastSnapshot.objects.bulk_create(
+            [
+                CashflowForecastSnapshot(
+                    month=month, projected_amount=amount, computed_on=computed_on
+                )
+                for month, amount in projected_amounts_by_month.items()
+            ],
+            update_conflicts=True,
+            unique_fields=["month"],
+            update_fields=["projected_amount", "computed_on", "updated_at"],
+        )
+        cls.delete_snapshots_invalidated_during_refresh(known_invalidation_ids)
+
+        return projected_amounts_by_month
+
+    @classmethod
+    def delete_snapshots_invalidated_during_refresh(cls, known_invalidation_ids: set):
+        """
+        An invalidation that happened while the refresh was computing may have deleted the snapshots
+        before the refresh stored its outdated amounts.
+        Invalidations log themselves before deleting and the refresh checks the log after storing,
+        so any such invalidation is either found here or deletes the stored snapshots itself.
+        """
+        first_invalidated_month = CashflowForecastInvalidation.objects.exclude(
+            id__in=known_invalidation_ids
+        ).aggregate(first_month=Min("month"))["first_month"]
+        if first_invalidated_month is None:
+            return
+
+        CashflowForecastSnapshot.objects.filter(
+            month__gte=first_invalidated_month
+        ).delete()
+
+    @classmethod
+    def get_actual_amounts_by_month(
+        cls, first_month: datetime.date
+    ) -> dict[datetime.date, Decimal]:
+        return dict(
+            Payment.objects.filter(due_date__gte=first_month)
+            .annotate(month=TruncMonth("due_date"))
+            .values("month")
+            .annotate(total=Sum("amount"))
+            .values_list("month", "total")
+        )
+
+    @classmethod
+    def rebuild_all_snapshots(cls, cache: dict):
+        CashflowForecastInvalidation.objects.filter(
+            created_at__lt=timezone.now() - cls.INVALIDATION_RETENTION
+        ).delete()
+        CashflowForecastSnapshot.objects.all().delete()
+        cls.refresh_snapshots(
+            payment_dates=cls.get_payment_dates(cache=cache),
+            first_index_to_store=0,
+            cache=cache,
+        )
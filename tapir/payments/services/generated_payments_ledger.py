@@ -0,0 +1,114 @@
+import bisect
+import datetime
+from collections.abc import Set
+from typing import Iterable, Iterator
+
+from tapir.utils.services.date_range_overlap_checker import DateRangeOverlapChecker
+from tapir.wirgarten.models import Payment
+
+
+class GeneratedPaymentsLedger(Set):
+    """
+    Payments that have been built but are not saved yet, for example when building payments for several months in a row.
+    The payments are indexed by mandate reference and payment type, and sorted by start of their payment range,
+    so that looking up the payments that overlap with a range doesn't require scanning all the generated payments.
+
+    union() doesn't copy the payments: the returned ledger reads through to this one,
+    so the payments added to this ledger afterward are also visible from the returned ledger.
+    """
+
+    def __init__(
+        self,
+        payments: Iterable[Payment] = (),
+        parent: "GeneratedPaymentsLedger | None" = None,
+    ):
+        self.parent = parent
+        self.payments: set[Payment] = set()
+        self.payments_by_mandate_ref_and_type: dict[tuple[str, str], list[Payment]] = {}
+        self.update(payments)
+
+    @classmethod
+    def from_payments(cls, payments: Iterable[Payment]) -> "GeneratedPaymentsLedger":
+        if isinstance(payments, GeneratedPaymentsLedger):
+            return payments
+        return cls(payments)
+
+    @staticmethod
+    def get_sort_key(payment: Payment) -> datetime.date:
+        return payment.subscription_payment_range_start or datetime.date.min
+
+    def add(self, payment: Payment):
+        if payment in self:
+            return
+
+        self.payments.add(payment)
+        bisect.insort(
+            self.payments_by_mandate_ref_and_type.setdefault(
+                (payment.mandate_ref_id, payment.type), []
+            ),
+            payment,
+            key=self.get_sort_key,
+        )
+
+    def update(self, payments: Iterable[Payment]):
+        for payment in payments:
+            self.add(payment)
+
+    def union(self, payments: Iterable[Payment]) -> "GeneratedPaymentsLedger":
+        return GeneratedPaymentsLedger(payments=payments, parent=self)
+
+    def get_payments_overlapping_with_range(
+        self,
+        mandate_ref_id: str,
+        payment_type: str,
+        range_start: datetime.date,
+        range_end: datetime.date | None,
+    ) -> list[Payment]:
+        payments = self.payments_by_mandate_ref_and_type.get(
+            (mandate_ref_id, payment_type), []
+        )
+        # Payments whose range starts after range_end can't overlap
+        nb_candidates = (
+            len(payments)
+            if range_end is None
+            else bisect.bisect_right(payments, range_end, key=self.get_sort_key)
+        )
+        result = [
+            payment
+            for payment in payments[:nb_candidates]
+            if DateRangeOverlapChecker.do_ranges_overlap(
+                range_1_start=range_start,
+                range_1_end=range_end,
+                range_2_start=payment.subscription_payment_range_start,
+                range_2_end=payment.subscription_payment_range_end,
+            )
+        ]
+
+        if self.parent is not None:
+            result.extend(
+                payment
+                for payment in self.parent.get_payments_overlapping_with_range(
+                    mandate_ref_id=mandate_ref_id,
+                    payment_type=payment_type,
+                    range_start=range_start,
+                    range_end=range_end,
+                )
+                if payment not in self.payments
+            )
+
+        return result
+
+    def __contains__(self, payment) -> bool:
+        return payment in self.payments or (
+            self.parent is not None and payment in self.parent
+        )
+
+    def __iter__(self) -> Iterator[Payment]:
+        yield from self.payments
+        if self.parent is not None:
+            yield from (
+                payment for payment in self.parent if payment not in self.payments
+            )
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
@@ -4,6 +4,7 @@ from decimal import Decimal
 from tapir.accounts.models import TapirUser
 from tapir.configuration.parameter import get_parameter_value
 from tapir.payments.models import MemberCredit, MemberCreditCreatedLogEntry
+from tapir.payments.services.generated_payments_ledger import GeneratedPaymentsLedger
 from tapir.payments.services.mandate_reference_provider import MandateReferenceProvider
 from tapir.payments.services.member_payment_rhythm_service import (
     MemberPaymentRhythmService,
@@ -148,7 +149,7 @@ class MemberCreditCreator:
             mandate_ref=mandate_ref,
             payment_type=payment_type,
             cache=cache,
-            generated_payments=set(),
+            generated_payments=GeneratedPaymentsLedger(),
         )
 
         if (
@@ -1,6 +1,7 @@
 import datetime
 
 from tapir.configuration.parameter import get_parameter_value
+from tapir.payments.services.generated_payments_ledger import GeneratedPaymentsLedger
 from tapir.payments.services.month_payment_builder_association_membership import (
     MonthPaymentBuilderAssociationMembership,
 )
@@ -25,9 +26,13 @@ class MonthPaymentBuilder:
         cls,
         reference_date: datetime.date,
         cache: dict,
-        generated_payments: set[Payment],
+        generated_payments: GeneratedPaymentsLedger,
+        member_id: str | None = None,
     ) -> list[Payment]:
+        # If member_id is given, only the payments of that member are built.
+        # The result is the same as filtering the payments of all members, without having to process the whole cooperative.
         first_of_month = reference_date.replace(day=1)
+        generated_payments = GeneratedPaymentsLedger.from_payments(generated_payments)
 
         payments_to_create_subscriptions_in_trial = (
             MonthPaymentBuilderSubscriptions.build_payments_for_subscriptions(
@@ -35,6 +40,7 @@ class MonthPaymentBuilder:
                 cache=cache,
                 generated_payments=generated_payments,
                 in_trial=True,
+                member_id=member_id,
             )
         )
 
@@ -46,6 +52,7 @@ class MonthPaymentBuilder:
                     payments_to_create_subscriptions_in_trial
                 ),
                 in_trial=False,
+                member_id=member_id,
             )
         )
 
@@ -54,6 +61,7 @@ class MonthPaymentBuilder:
             cache=cache,
             generated_payments=generated_payments,
             in_trial=True,
+            member_id=member_id,
         )
 
         payments_to_create_solidarity_contributions_not_in_trial = MonthPaymentBuilderSolidarityContributions.build_payments_for_solidarity_contributions(
@@ -63,12 +71,14 @@ class MonthPaymentBuilder:
                 payments_to_create_solidarity_contributions_in_trial
             ),
             in_trial=False,
+            member_id=member_id,
         )
 
         payments_to_create_association_membership = MonthPaymentBuilderAssociationMembership.build_payments_for_association_memberships(
             current_month=first_of_month,
             cache=cache,
             generated_payments=generated_payments,
+            member_id=member_id,
         )
 
         result = (
@@ -88,6 +98,7 @@ class MonthPaymentBuilder:
                     cache=cache,
                     generated_payments=generated_payments,
                     in_trial=True,
+                    member_id=member_id,
                 )
             )
 
@@ -99,6 +110,7 @@ class MonthPaymentBuilder:
                         payments_to_create_delivery_charges_in_trial
                     ),
                     in_trial=False,
+                    member_id=member_id,
                 )
             )
             result += (
@@ -7,6 +7,7 @@ from tapir.associations.models import AssociationMembership
 from tapir.associations.services.association_membership_price_type_getter import (
     AssociationMembershipTypePriceGetter,
 )
+from tapir.payments.services.generated_payments_ledger import GeneratedPaymentsLedger
 from tapir.payments.services.member_payment_rhythm_service import (
     MemberPaymentRhythmService,
 )
@@ -28,10 +29,11 @@ class MonthPaymentBuilderAssociationMembership:
         cls,
         current_month: datetime.date,
         cache: dict,
-        generated_payments: set[Payment],
+        generated_payments: GeneratedPaymentsLedger,
+        member_id: str | None = None,
     ) -> list[Payment]:
         active_memberships = cls.get_active_memberships(
-            cache=cache, first_of_month=current_month
+            cache=cache, first_of_month=current_month, member_id=member_id
         )
 
         memberships_by_member = cls.group_memberships_by_member(active_memberships)
@@ -97,9 +99,16 @@ class MonthPaymentBuilderAssociationMembership:
 
     @classmethod
     def get_active_memberships(
-        cls, cache: dict, first_of_month: datetime.date
+        cls, cache: dict, first_of_month: datetime.date, member_id: str | None = None
     ) -> list[AssociationMembership]:
-        existing_memberships = TapirCache.get_all_association_memberships(cache=cache)
+        if member_id is None:
+            existing_memberships = TapirCache.get_all_association_memberships(
+                cache=cache
+            )
+        else:
+            existing_memberships = TapirCache.get_association_memberships_of_member(
+                cache=cache, member_id=member_id
+            )
 
         current_growing_period = TapirCache.get_growing_period_at_date(
             reference_date=first_of_month, cache=cache
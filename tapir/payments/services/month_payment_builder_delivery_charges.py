@@ -6,6 +6,7 @@ from dateutil.relativedelta import relativedelta
 from tapir.configuration.parameter import get_parameter_value
 from tapir.deliveries.services.delivery_date_calculator import DeliveryDateCalculator
 from tapir.payments.models import MemberCredit, MemberPaymentRhythm
+from tapir.payments.services.generated_payments_ledger import GeneratedPaymentsLedger
 from tapir.payments.services.mandate_reference_provider import MandateReferenceProvider
 from tapir.payments.services.member_payment_rhythm_service import (
     MemberPaymentRhythmService,
@@ -55,8 +56,9 @@ class MonthPaymentBuilderDeliveryCharges:
         cls,
         current_month: datetime.date,
         cache: dict,
-        generated_payments: set[Payment],
+        generated_payments: GeneratedPaymentsLedger,
         in_trial: bool,
+        member_id: str | None = None,
     ) -> list[Payment]:
         target_month = current_month
         if in_trial:
@@ -64,7 +66,10 @@ class MonthPaymentBuilderDeliveryCharges:
 
         subscriptions = (
             MonthPaymentBuilderSubscriptions.get_current_and_renewed_subscriptions(
-                cache=cache, first_of_month=target_month, is_in_trial=in_trial
+                cache=cache,
+                first_of_month=target_month,
+                is_in_trial=in_trial,
+                member_id=member_id,
             )
         )
         subscriptions_by_member = cls._group_subscriptions_by_member(subscriptions)
@@ -100,7 +105,7 @@ class MonthPaymentBuilderDeliveryCharges:
         rhythm,
         in_trial: bool,
         cache: dict,
-        generated_payments: set[Payment],
+        generated_payments: GeneratedPaymentsLedger,
     ) -> list[Payment]:
         rhythm_period = cls._get_rhythm_period(
             rhythm=rhythm, first_of_month=first_of_month, cache=cache
@@ -154,14 +159,9 @@ class MonthPaymentBuilderDeliveryCharges:
         cache: dict,
     ) -> list[MemberCredit]:
         first_of_month = reference_date.replace(day=1)
-        subscriptions = MonthPaymentBuilderSubscriptions.get_current_and_renewed_subscriptions_ignoring_trial_state(
-            cache=cache, first_of_month=first_of_month
+        contracts = MonthPaymentBuilderSubscriptions.get_current_and_renewed_subscriptions_ignoring_trial_state(
+            cache=cache, first_of_month=first_of_month, member_id=member.id
         )
-        contracts = {
-            subscription
-            for subscription in subscriptions
-            if subscription.member_id == member.id
-        }
         if len(contracts) == 0:
             return []
 
@@ -187,7 +187,7 @@ class MonthPaymentBuilderDeliveryCharges:
             last_day_of_rhythm_period=last_day_of_rhythm_period,
             mandate_ref=mandate_ref,
             cache=cache,
-            generated_payments=set(),
+            generated_payments=GeneratedPaymentsLedger(),
         ):
             if delta.amount >= 0:
                 continue
@@ -239,7 +239,7 @@ class MonthPaymentBuilderDeliveryCharges:
         last_day_of_rhythm_period: datetime.date,
         mandate_ref,
         cache: dict,
-        generated_payments: set[Payment],
+        generated_payments: GeneratedPaymentsLedger,
     ) -> list[LocationDelta]:
         delivery_dates = cls.get_billable_delivery_dates_in_range(
             subscriptions=contracts,
@@ -334,7 +334,7 @@ class MonthPaymentBuilderDeliveryCharges:
         range_end: datetime.date,
         mandate_ref,
         cache: dict,
-        generated_payments: set[Payment],
+        generated_payments: GeneratedPaymentsLedger,
     ) -> dict[str, list[Payment]]:
         past_payments = MonthPaymentBuilderUtils.get_relevant_past_payments(
             range_start=range_start,
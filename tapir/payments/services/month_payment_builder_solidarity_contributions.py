@@ -4,6 +4,7 @@ from decimal import Decimal
 from dateutil.relativedelta import relativedelta
 
 from tapir.payments.models import MemberPaymentRhythm
+from tapir.payments.services.generated_payments_ledger import GeneratedPaymentsLedger
 from tapir.payments.services.member_payment_rhythm_service import (
     MemberPaymentRhythmService,
 )
@@ -30,8 +31,9 @@ class MonthPaymentBuilderSolidarityContributions:
         cls,
         current_month: datetime.date,
         cache: dict,
-        generated_payments: set[Payment],
+        generated_payments: GeneratedPaymentsLedger,
         in_trial: bool,
+        member_id: str | None = None,
     ) -> list[Payment]:
         target_month = current_month
         if in_trial:
@@ -39,7 +41,10 @@ class MonthPaymentBuilderSolidarityContributions:
 
         solidarity_contributions = (
             cls.get_solidarity_contributions_for_this_and_the_next_growing_period(
-                cache=cache, first_of_month=target_month, is_in_trial=in_trial
+                cache=cache,
+                first_of_month=target_month,
+                is_in_trial=in_trial,
+                member_id=member_id,
             )
         )
 
@@ -109,19 +114,32 @@ class MonthPaymentBuilderSolidarityContributions:
 
     @classmethod
     def get_solidarity_contributions_for_this_and_the_next_growing_period(
-        cls, cache: dict, first_of_month: datetime.date, is_in_trial: bool
+        cls,
+        cache: dict,
+        first_of_month: datetime.date,
+        is_in_trial: bool,
+        member_id: str | None = None,
     ) -> list[SolidarityContribution]:
-        existing_contributions = TapirCache.get_all_solidarity_contributions(
-            cache=cache
-        )
+        if member_id is None:
+            existing_contributions = TapirCache.get_all_solidarity_contributions(
+                cache=cache
+            )
+            contributions_that_will_be_renewed = AutomaticSolidarityContributionRenewalService.get_contributions_that_will_be_renewed(
+                reference_date=first_of_month, cache=cache
+            )
+        else:
+            existing_contributions = TapirCache.get_solidarity_contributions_of_member(
+                cache=cache, member_id=member_id
+            )
+            contributions_that_will_be_renewed = AutomaticSolidarityContributionRenewalService.get_contributions_of_member_that_will_be_renewed(
+                member_id=member_id, reference_date=first_of_month, cache=cache
+            )
 
         planned_renewed_contributions = [
             AutomaticSolidarityContributionRenewalService.build_renewed_contribution(
                 contribution=contribution, cache=cache
             )
-            for contribution in AutomaticSolidarityContributionRenewalService.get_contributions_that_will_be_renewed(
-                reference_date=first_of_month, cache=cache
-            )
+            for contribution in contributions_that_will_be_renewed
         ]
 
         current_growing_period = TapirCache.get_growing_period_at_date(
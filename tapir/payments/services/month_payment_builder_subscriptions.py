@@ -10,6 +10,7 @@ from tapir.deliveries.services.subscription_price_type_decider import (
     SubscriptionPricingStrategyDecider,
 )
 from tapir.payments.models import MemberPaymentRhythm
+from tapir.payments.services.generated_payments_ledger import GeneratedPaymentsLedger
 from tapir.payments.services.member_payment_rhythm_service import (
     MemberPaymentRhythmService,
 )
@@ -52,15 +53,19 @@ class MonthPaymentBuilderSubscriptions:
         cls,
         current_month: datetime.date,
         cache: dict,
-        generated_payments: set[Payment],
+        generated_payments: GeneratedPaymentsLedger,
         in_trial: bool,
+        member_id: str | None = None,
     ) -> list[Payment]:
         target_month = current_month
         if in_trial:
             target_month = (current_month - relativedelta(months=1)).replace(day=1)
 
         current_and_renewed_subscriptions = cls.get_current_and_renewed_subscriptions(
-            cache=cache, first_of_month=target_month, is_in_trial=in_trial
+            cache=cache,
+            first_of_month=target_month,
+            is_in_trial=in_trial,
+            member_id=member_id,
         )
 
         subscriptions_by_member_and_product_type = (
@@ -340,27 +345,42 @@ class MonthPaymentBuilderSubscriptions:
 
     @classmethod
     def get_current_and_renewed_subscriptions_ignoring_trial_state(
-        cls, cache: dict, first_of_month: datetime.date
+        cls, cache: dict, first_of_month: datetime.date, member_id: str | None = None
     ) -> set[Subscription]:
-        existing_subscriptions = TapirCache.get_all_subscriptions(cache=cache)
+        # When a member_id is given, only the subscriptions of that member get loaded and projected.
+        if member_id is None:
+            existing_subscriptions = TapirCache.get_all_subscriptions(cache=cache)
+            subscriptions_that_will_be_renewed = AutomaticSubscriptionRenewalService.get_subscriptions_that_will_be_renewed(
+                reference_date=first_of_month, cache=cache
+            )
+        else:
+            existing_subscriptions = TapirCache.get_subscriptions_of_member(
+                cache=cache, member_id=member_id
+            )
+            subscriptions_that_will_be_renewed = AutomaticSubscriptionRenewalService.get_subscriptions_of_member_that_will_be_renewed(
+                member_id=member_id, reference_date=first_of_month, cache=cache
+            )
+
         planned_renewed_subscriptions = {
             AutomaticSubscriptionRenewalService.build_renewed_subscription(
                 subscription=subscription, cache=cache
             )
-            for subscription in AutomaticSubscriptionRenewalService.get_subscriptions_that_will_be_renewed(
-                reference_date=first_of_month, cache=cache
-            )
+            for subscription in subscriptions_that_will_be_renewed
         }
         return existing_subscriptions.union(planned_renewed_subscriptions)
 
     @classmethod
     def get_current_and_renewed_subscriptions(
-        cls, cache: dict, first_of_month: datetime.date, is_in_trial: bool
+        cls,
+        cache: dict,
+        first_of_month: datetime.date,
+        is_in_trial: bool,
+        member_id: str | None = None,
     ) -> list[Subscription]:
         return [
             subscription
             for subscription in cls.get_current_and_renewed_subscriptions_ignoring_trial_state(
-                cache=cache, first_of_month=first_of_month
+                cache=cache, first_of_month=first_of_month, member_id=member_id
             )
             if TrialPeriodManager.is_contract_in_trial(
                 contract=subscription, reference_date=first_of_month, cache=cache
@@ -4,6 +4,7 @@ from decimal import Decimal
 from tapir.associations.models import AssociationMembership
 from tapir.configuration.parameter import get_parameter_value
 from tapir.payments.models import MemberCredit
+from tapir.payments.services.generated_payments_ledger import GeneratedPaymentsLedger
 from tapir.payments.services.mandate_reference_provider import MandateReferenceProvider
 from tapir.payments.services.member_payment_rhythm_service import (
     MemberPaymentRhythmService,
@@ -30,19 +31,12 @@ class MonthPaymentBuilderUtils:
         mandate_ref: MandateReference,
         payment_type: str,
         cache: dict,
-        generated_payments: set[Payment],
+        generated_payments: GeneratedPaymentsLedger,
     ):
         existing_payments = TapirCache.get_payments_by_mandate_ref_and_type(
             cache=cache, mandate_ref=mandate_ref, payment_type=payment_type
         )
 
-        existing_payments = existing_payments.union(
-            payment
-            for payment in generated_payments
-            if payment.mandate_ref_id == mandate_ref.ref
-            and payment.type == payment_type
-        )
-
         payments_for_this_period = [
             payment
             for payment in existing_payments
@@ -53,6 +47,18 @@ class MonthPaymentBuilderUtils:
                 range_2_end=payment.subscription_payment_range_end,
             )
         ]
+        payments_for_this_period.extend(
+            payment
+            for payment in GeneratedPaymentsLedger.from_payments(
+                generated_payments
+            ).get_payments_overlapping_with_range(
+                mandate_ref_id=mandate_ref.ref,
+                payment_type=payment_type,
+                range_start=range_start,
+                range_end=range_end,
+            )
+            if payment not in existing_payments
+        )
 
         return payments_for_this_period
 
@@ -87,7 +93,7 @@ class MonthPaymentBuilderUtils:
         mandate_ref: MandateReference,
         payment_type: str,
         cache: dict,
-        generated_payments: set[Payment],
+        generated_payments: GeneratedPaymentsLedger,
     ) -> Decimal:
         relevant_payments = cls.get_relevant_past_payments(
             range_start=range_start,
@@ -129,7 +135,7 @@ class MonthPaymentBuilderUtils:
         first_of_month: datetime.date,
         rhythm,
         cache: dict,
-        generated_payments: set[Payment],
+        generated_payments: GeneratedPaymentsLedger,
         in_trial: bool,
         total_to_pay_function,
         payment_type: str,
@@ -1,10 +1,10 @@
 import datetime
+import tempfile
 from decimal import Decimal
 from pathlib import Path
 
 from django.core.exceptions import ValidationError
 from lxml import etree
-from lxml.etree import Element
 from nanoid import generate
 
 from tapir.configuration.parameter import get_parameter_value
@@ -29,51 +29,80 @@ class Pain008XmlGenerator:
     namespace = "urn:iso:std:iso:20022:tech:xsd:pain.008.001.08"
     NOT_PROVIDED = "NOTPROVIDED"
 
+    XSI_NAMESPACE = "http://www.w3.org/2001/XMLSchema-instance"
+    _schema = None
+
     @classmethod
     def build_xml_string(
         cls, payments: list[Payment], cache: dict, collection_date: datetime.date
     ):
-        if len(payments) > 1:
-            for payment in payments:
-                cls.validate_single_payment(
-                    payment=payment, cache=cache, collection_date=collection_date
-                )
-
-        namespace_map = {
-            None: cls.namespace,
-            "xsi": "http://www.w3.org/2001/XMLSchema-instance",
-        }
-        document = cls._create_element("Document", nsmap=namespace_map)
-
-        document.set(
-            etree.QName("http://www.w3.org/2001/XMLSchema-instance", "schemaLocation"),
-            f"{cls.namespace} pain.008.001.08.xsd",
-        )
-
-        container = cls._append_element(document, "CstmrDrctDbtInitn")
-
         document_id = cls._get_document_id(get_now(cache=cache))
-        container.append(
-            cls._build_global_header(
-                payments=payments, cache=cache, document_id=document_id
-            )
+        # The headers are built before starting to write so that configuration errors are raised before any output
+        global_header = cls._build_global_header(
+            payments=payments, cache=cache, document_id=document_id
         )
-        container.append(
-            cls._build_payments(
+        payments_header = cls._build_payments_header(
+            cache=cache,
+            payments=payments,
+            document_id=document_id,
+            collection_date=collection_date,
+        )
+
+        # The document is written to a temporary file, so that its serialized bytes and the tree parsed for
+        # the validation are not held in memory at the same time. The bytes are only read back once the tree is released.
+        with tempfile.TemporaryFile() as output:
+            cls._write_document(
+                output=output,
                 payments=payments,
                 cache=cache,
-                document_id=document_id,
-                collection_date=collection_date,
+                global_header=global_header,
+                payments_header=payments_header,
             )
-        )
 
-        errors = cls._validate_document(document)
-        if len(errors) > 0:
-            raise ValidationError(", ".join(errors))
+            output.seek(0)
+            errors = cls._validate_document(etree.parse(output))
+            if len(errors) > 0:
+                if len(payments) > 1:
+                    # Only done on failure, to point at the payment that makes the document invalid
+                    for payment in payments:
+                        cls.validate_single_payment(
+                            payment=payment,
+                            cache=cache,
+                            collection_date=collection_date,
+                        )
+                raise ValidationError(", ".join(errors))
+
+            output.seek(0)
+            return output.read()
 
-        return etree.tostring(
-            document, pretty_print=True, xml_declaration=True, encoding="UTF-8"
-        )
+    @classmethod
+    def _write_document(
+        cls,
+        output,
+        payments: list[Payment],
+        cache: dict,
+        global_header,
+        payments_header,
+    ):
+        with etree.xmlfile(output, encoding="UTF-8") as xml_file:
+            xml_file.write_declaration()
+            with xml_file.element(
+                cls._get_tag("Document"),
+                attrib={
+                    f"{{{cls.XSI_NAMESPACE}}}schemaLocation": f"{cls.namespace} pain.008.001.08.xsd"
+                },
+                nsmap={None: cls.namespace, "xsi": cls.XSI_NAMESPACE},
+            ):
+                with xml_file.element(cls._get_tag("CstmrDrctDbtInitn")):
+                    xml_file.write(global_header, pretty_print=True)
+                    with xml_file.element(cls._get_tag("PmtInf")):
+                        for element in payments_header:
+                            xml_file.write(element, pretty_print=True)
+                        for payment in payments:
+                            xml_file.write(
+                                cls._build_payment(payment=payment, cache=cache),
+                                pretty_print=True,
+                            )
 
     @classmethod
     def validate_single_payment(
@@ -89,35 +118,8 @@ class Pain008XmlGenerator:
             )
 
     @classmethod
-    def _build_payments(
-        cls,
-        cache: dict,
-        payments: list[Payment],
-        document_id: str,
-        collection_date: datetime.date,
-    ):
-        payments_container = cls._create_element("PmtInf")
-
-        cls._add_payments_header(
-            cache=cache,
-            payments=payments,
-            payments_container=payments_container,
-            document_id=document_id,
-            collection_date=collection_date,
-        )
-
-        for payment in payments:
-            cls._add_payment(
-                payments_container=payments_container, payment=payment, cache=cache
-            )
-
-        return payments_container
-
-    @classmethod
-    def _add_payment(cls, payments_container, payment: Payment, cache: dict):
-        direct_debit_transaction_info = cls._append_element(
-            payments_container, "DrctDbtTxInf"
-        )
+    def _build_payment(cls, payment: Payment, cache: dict):
+        direct_debit_transaction_info = cls._create_element("DrctDbtTxInf")
 
         payment_id = cls._append_element(direct_debit_transaction_info, "PmtId")
         end_to_end_id = cls._append_element(payment_id, "EndToEndId")
@@ -172,15 +174,19 @@ class Pain008XmlGenerator:
             cache=cache,
         )
 
+        return direct_debit_transaction_info
+
     @classmethod
-    def _add_payments_header(
+    def _build_payments_header(
         cls,
         cache: dict,
-        payments_container,
         payments: list[Payment],
         document_id: str,
         collection_date: datetime.date,
     ):
+        # The elements of PmtInf that come before the transactions, in a container that is not part of the output
+        payments_container = cls._create_element("PmtInf")
+
         payment_id = cls._append_element(payments_container, "PmtInfId")
         payment_id.text = document_id
 
@@ -271,6 +277,8 @@ class Pain008XmlGenerator:
         creditor_scheme_proprietary = cls._append_element(creditor_scheme_name, "Prtry")
         creditor_scheme_proprietary.text = "SEPA"
 
+        return payments_container
+
     @classmethod
     def _build_global_header(
         cls, cache: dict, payments: list[Payment], document_id: str
@@ -296,18 +304,21 @@ class Pain008XmlGenerator:
         return header
 
     @classmethod
-    def _validate_document(cls, document: Element) -> list[str]:
-        path = Path(__file__).with_name("pain.008.001.08.xsd")
-        with path.open("rb") as file:
-            schema_root = etree.XML(file.read())
-
-        schema = etree.XMLSchema(schema_root)
-
+    def _validate_document(cls, document: etree._ElementTree) -> list[str]:
+        schema = cls._get_schema()
         if schema.validate(document):
             return []
 
         return [error.message for error in schema.error_log]
 
+    @classmethod
+    def _get_schema(cls) -> etree.XMLSchema:
+        if cls._schema is None:
+            path = Path(__file__).with_name("pain.008.001.08.xsd")
+            with path.open("rb") as file:
+                cls._schema = etree.XMLSchema(etree.XML(file.read()))
+        return cls._schema
+
     @classmethod
     def _get_document_id(cls, timestamp: datetime.datetime):
         return f"Tapir-{timestamp.strftime('%Y%m%d%H%M%S%f')}"
@@ -325,10 +336,16 @@ class Pain008XmlGenerator:
     def _format_date(cls, date: datetime.date):
         return date.strftime("%Y-%m-%d")
 
+    @classmethod
+    def _get_tag(cls, tag):
+        return f"{{{cls.namespace}}}{tag}"
+
     @classmethod
     def _create_element(cls, tag, **kwargs):
-        return etree.Element(f"{{{cls.namespace}}}{tag}", **kwargs)
+        # The elements are written on their own, declaring the default namespace keeps them without prefix
+        kwargs.setdefault("nsmap", {None: cls.namespace})
+        return etree.Element(cls._get_tag(tag), **kwargs)
 
     @classmethod
     def _append_element(cls, parent, tag, **kwargs):
-        return etree.SubElement(parent, f"{{{cls.namespace}}}{tag}", **kwargs)
+        return etree.SubElement(parent, cls._get_tag(tag), **kwargs)
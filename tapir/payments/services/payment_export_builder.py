@@ -2,6 +2,8 @@ import csv
 import datetime
 import io
 import locale
+import time
+from contextlib import contextmanager
 from decimal import Decimal
 from typing import Iterable
 
@@ -13,6 +15,7 @@ from tapir.payments.services.pain_008_xml_generator import Pain008XmlGenerator
 from tapir.payments.services.payment_export_intended_use_builder import (
     PaymentExportIntendedUseBuilder,
 )
+from tapir.utils.services.tapir_cache_manager import TapirCacheManager
 from tapir.utils.shortcuts import get_last_day_of_month
 from tapir.wirgarten.models import (
     Payment,
@@ -42,14 +45,17 @@ class PaymentExportBuilder:
     def export_all_unexported_payments(
         cls, reference_date: datetime.date, send_mail: bool, cache: dict
     ):
-        payments = cls.get_unexported_payments(reference_date=reference_date)
-        contract_payments, coop_share_payments = (
-            cls.split_payments_by_contract_or_coop_shares(payments)
-        )
+        stage_durations = {}
+        with cls.measure_stage(stage_durations, "load"):
+            payments = list(cls.get_unexported_payments(reference_date=reference_date))
+            contract_payments, coop_share_payments = (
+                cls.split_payments_by_contract_or_coop_shares(payments)
+            )
 
-        combined_contract_payments = cls.combine_contract_payments_by_mandate_ref(
-            contract_payments
-        ).values()
+        with cls.measure_stage(stage_durations, "combine"):
+            combined_contract_payments = cls.combine_contract_payments_by_mandate_ref(
+                contract_payments
+            ).values()
 
         cls.export_payments_if_necessary(
             combined_payments=combined_contract_payments,
@@ -58,6 +64,7 @@ class PaymentExportBuilder:
             reference_date=reference_date,
             send_mail=send_mail,
             cache=cache,
+            stage_durations=stage_durations,
         )
         if legal_status_is_cooperative(cache=cache):
             cls.export_payments_if_necessary(
@@ -67,8 +74,18 @@ class PaymentExportBuilder:
                 reference_date=reference_date,
                 send_mail=send_mail,
                 cache=cache,
+                stage_durations={"load": stage_durations["load"]},
             )
 
+    @staticmethod
+    @contextmanager
+    def measure_stage(stage_durations: dict[str, float], stage_name: str):
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            stage_durations[stage_name] = round(time.perf_counter() - start_time, 3)
+
     @classmethod
     def export_payments_if_necessary(
         cls,
@@ -78,18 +95,23 @@ class PaymentExportBuilder:
         reference_date: datetime.date,
         send_mail: bool,
         cache: dict,
+        stage_durations: dict[str, float] | None = None,
     ):
         if not cls.should_export_payments(
             is_contract_payments=is_contract_payments, reference_date=reference_date
         ):
             return
 
+        if stage_durations is None:
+            stage_durations = {}
+
         csv_file, xml_file = cls.create_csv_and_xml_files(
             payments=combined_payments,
             is_contract_payments=is_contract_payments,
             send_mail=send_mail,
             cache=cache,
             reference_date=reference_date,
+            stage_durations=stage_durations,
         )
 
         cls.create_and_assign_transaction(
@@ -98,6 +120,7 @@ class PaymentExportBuilder:
             is_contract_payments=is_contract_payments,
             payments=database_payments,
             reference_date=reference_date,
+            stage_durations=stage_durations,
         )
 
     @classmethod
@@ -129,19 +152,30 @@ class PaymentExportBuilder:
         is_contract_payments: bool,
         payments: Iterable[Payment],
         reference_date: datetime.date,
+        stage_durations: dict[str, float] | None = None,
     ):
-        payment_transaction = PaymentTransaction.objects.create(
-            csv_file=csv_file,
-            xml_file=xml_file,
-            type=PaymentExportIntendedUseBuilder.get_payment_type_display_legacy(
-                is_contract_payments
-            ),
-            month=reference_date.replace(day=1),
-        )
-        for payment in payments:
-            payment.transaction = payment_transaction
-            payment.status = Payment.PaymentStatus.PAID
-        Payment.objects.bulk_update(payments, ["transaction", "status"])
+        if stage_durations is None:
+            stage_durations = {}
+
+        with cls.measure_stage(stage_durations, "assign"):
+            payment_transaction = PaymentTransaction.objects.create(
+                csv_file=csv_file,
+                xml_file=xml_file,
+                type=PaymentExportIntendedUseBuilder.get_payment_type_display_legacy(
+                    is_contract_payments
+                ),
+                month=reference_date.replace(day=1),
+            )
+            for payment in payments:
+                payment.transaction = payment_transaction
+                payment.status = Payment.PaymentStatus.PAID
+            Payment.objects.bulk_update(payments, ["transaction", "status"])
+            TapirCacheManager.clear_category(
+                cache=None, category=TapirCacheManager.CATEGORY_PAYMENTS
+            )
+
+        payment_transaction.stage_durations = stage_durations
+        payment_transaction.save(update_fields=["stage_durations"])
 
     @classmethod
     def combine_contract_payments_by_mandate_ref(cls, payments: list[Payment]):
@@ -188,7 +222,7 @@ class PaymentExportBuilder:
         max_due_date = get_last_day_of_month(reference_date)
         return Payment.objects.filter(
             transaction__isnull=True, due_date__lte=max_due_date
-        )
+        ).select_related("mandate_ref__member")
 
     @classmethod
     def create_csv_and_xml_files(
@@ -198,11 +232,16 @@ class PaymentExportBuilder:
         send_mail: bool,
         reference_date: datetime.date,
         cache: dict,
+        stage_durations: dict[str, float] | None = None,
     ):
+        if stage_durations is None:
+            stage_durations = {}
+
         file_name = f"{PaymentExportIntendedUseBuilder.get_payment_type_display_legacy(is_contract_payments)}-Einzahlungen {format_month_and_year(reference_date)}"
         payments = list(payments)
 
-        csv_string = cls.build_csv_string(payments, is_contract_payments, cache)
+        with cls.measure_stage(stage_durations, "csv"):
+            csv_string = cls.build_csv_string(payments, is_contract_payments, cache)
         csv_file = export_file(
             filename=file_name,
             filetype=ExportedFile.FileType.CSV,
@@ -216,9 +255,10 @@ class PaymentExportBuilder:
 
         xml_file = None
         if len(payments) > 0:
-            xml_bytes = Pain008XmlGenerator.build_xml_string(
-                payments=payments, collection_date=reference_date, cache=cache
-            )
+            with cls.measure_stage(stage_durations, "xml"):
+                xml_bytes = Pain008XmlGenerator.build_xml_string(
+                    payments=payments, collection_date=reference_date, cache=cache
+                )
             xml_file = export_file(
                 filename=file_name,
                 filetype=ExportedFile.FileType.XML,
@@ -6,6 +6,7 @@ from tapir.payments.tasks import (
     create_payments_for_this_month,
     export_payments_for_this_month,
 )
+from tapir.utils.services.tapir_cache_manager import TapirCacheManager
 from tapir.utils.shortcuts import get_first_of_next_month
 from tapir.wirgarten.models import PaymentTransaction, Payment
 from tapir.wirgarten.parameter_keys import ParameterKeys
@@ -29,7 +30,16 @@ class SubscriptionPaymentsRebuilder:
         ).replace(day=1)
         today = get_today(cache=cache)
 
-        while current_date < today:
-            create_payments_for_this_month(reference_date=current_date)
-            export_payments_for_this_month(reference_date=current_date, send_mail=False)
-            current_date = get_first_of_next_month(current_date)
+        TapirCacheManager.clear_category(
+            cache=cache, category=TapirCacheManager.CATEGORY_PAYMENTS
+        )
+
+        # The cache is kept warm from one month to the next,
+        # only the keys that depend on the objects written while rebuilding get cleared.
+        with TapirCacheManager.invalidate_on_model_changes(cache):
+            while current_date < today:
+                create_payments_for_this_month(reference_date=current_date, cache=cache)
+                export_payments_for_this_month(
+                    reference_date=current_date, send_mail=False, cache=cache
+                )
+                current_date = get_first_of_next_month(current_date)
@@ -2,8 +2,11 @@ import datetime
 
 from celery import shared_task
 
+from tapir.payments.services.cashflow_forecast_service import CashflowForecastService
+from tapir.payments.services.generated_payments_ledger import GeneratedPaymentsLedger
 from tapir.payments.services.month_payment_builder import MonthPaymentBuilder
 from tapir.payments.services.payment_export_builder import PaymentExportBuilder
+from tapir.utils.services.tapir_cache_manager import TapirCacheManager
 from tapir.wirgarten.models import (
     Payment,
 )
@@ -13,31 +16,52 @@ from tapir.wirgarten.utils import (
 
 
 @shared_task
-def create_payments_for_this_month(reference_date: datetime.date = None):
-    cache = {}
+def create_payments_for_this_month(
+    reference_date: datetime.date = None, cache: dict = None
+):
+    if cache is None:
+        cache = {}
     if reference_date is None:
         reference_date = get_today(cache=cache)
     payments = MonthPaymentBuilder.build_payments_for_month(
-        reference_date=reference_date, cache=cache, generated_payments=set()
+        reference_date=reference_date,
+        cache=cache,
+        generated_payments=GeneratedPaymentsLedger(),
     )
     Payment.objects.bulk_create(payments)
+    TapirCacheManager.clear_category(
+        cache=cache, category=TapirCacheManager.CATEGORY_PAYMENTS
+    )
+    if len(payments) > 0:
+        CashflowForecastService.mark_stale_from(reference_date)
 
 
 @shared_task
 def export_payments_for_this_month(
-    reference_date: datetime.date = None, send_mail: bool = True
+    reference_date: datetime.date = None, send_mail: bool = True, cache: dict = None
 ):
-    cache = {}
+    if cache is None:
+        cache = {}
     if reference_date is None:
         reference_date = get_today(cache=cache)
 
     # export_payments_for_this_month will usually export on the first day of the month
     # depending on when create_payments_for_this_month is run, for example if the server was down from the 31st at 23:00 to 1st at 08:00,
     # the payments may not be created yet. So we make sure that they are created before exporting.
-    create_payments_for_this_month(reference_date)
+    create_payments_for_this_month(reference_date, cache=cache)
 
     PaymentExportBuilder.export_all_unexported_payments(
         reference_date=reference_date,
         send_mail=send_mail,
         cache=cache,
     )
+    TapirCacheManager.clear_category(
+        cache=cache, category=TapirCacheManager.CATEGORY_PAYMENTS
+    )
+
+
+@shared_task
+def refresh_cashflow_forecast(cache: dict = None):
+    if cache is None:
+        cache = {}
+    CashflowForecastService.rebuild_all_snapshots(cache=cache)
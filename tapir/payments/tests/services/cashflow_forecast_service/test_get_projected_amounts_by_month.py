@@ -0,0 +1,174 @@
+import datetime
+from decimal import Decimal
+from unittest.mock import patch, Mock
+
+from tapir.payments.models import CashflowForecastSnapshot
+from tapir.payments.services.cashflow_forecast_service import CashflowForecastService
+from tapir.payments.services.month_payment_builder import MonthPaymentBuilder
+from tapir.wirgarten.tests.test_utils import TapirIntegrationTest
+from tapir.wirgarten.utils import get_today
+
+
+class TestGetProjectedAmountsByMonth(TapirIntegrationTest):
+    PAYMENT_DATES = [
+        datetime.date(year=2025, month=1, day=15),
+        datetime.date(year=2025, month=2, day=15),
+        datetime.date(year=2025, month=3, day=15),
+    ]
+
+    @staticmethod
+    def build_payments(reference_date: datetime.date, **_):
+        return [Mock(amount=Decimal(reference_date.month))]
+
+    @patch.object(MonthPaymentBuilder, "build_payments_for_month", autospec=True)
+    def test_getProjectedAmountsByMonth_noSnapshots_computesAndStoresAllMonths(
+        self, mock_build_payments_for_month: Mock
+    ):
+        mock_build_payments_for_month.side_effect = self.build_payments
+
+        result = CashflowForecastService.get_projected_amounts_by_month(
+            payment_dates=self.PAYMENT_DATES, cache={}
+        )
+
+        expected = {
+            datetime.date(year=2025, month=1, day=1): Decimal(1),
+            datetime.date(year=2025, month=2, day=1): Decimal(2),
+            datetime.date(year=2025, month=3, day=1): Decimal(3),
+        }
+        self.assertEqual(expected, result)
+        self.assertEqual(
+            expected,
+            dict(
+                CashflowForecastSnapshot.objects.values_list(
+                    "month", "projected_amount"
+                )
+            ),
+        )
+        self.assertEqual(3, mock_build_payments_for_month.call_count)
+
+    @patch.object(MonthPaymentBuilder, "build_payments_for_month", autospec=True)
+    def test_getProjectedAmountsByMonth_allSnapshotsExist_doesNotBuildPayments(
+        self, mock_build_payments_for_month: Mock
+    ):
+        mock_build_payments_for_month.side_effect = self.build_payments
+        CashflowForecastService.get_projected_amounts_by_month(
+            payment_dates=self.PAYMENT_DATES, cache={}
+        )
+        mock_build_payments_for_month.reset_mock()
+
+        result = CashflowForecastService.get_projected_amounts_by_month(
+            payment_dates=self.PAYMENT_DATES, cache={}
+        )
+
+        self.assertEqual(Decimal(3), result[datetime.date(year=2025, month=3, day=1)])
+        mock_build_payments_for_month.assert_not_called()
+
+    @patch.object(MonthPaymentBuilder, "build_payments_for_month", autospec=True)
+    def test_getProjectedAmountsByMonth_markedStale_onlyRecomputesMonthsFromTheStaleDate(
+        self, mock_build_payments_for_month: Mock
+    ):
+        mock_build_payments_for_month.side_effect = self.build_payments
+        CashflowForecastService.get_projected_amounts_by_month(
+            payment_dates=self.PAYMENT_DATES, cache={}
+        )
+        CashflowForecastSnapshot.objects.filter(
+            month=datetime.date(year=2025, month=1, day=1)
+        ).update(projected_amount=Decimal(100))
+
+        CashflowForecastService.mark_stale_from(
+            datetime.date(year=2025, month=2, day=20)
+        )
+        result = CashflowForecastService.get_projected_amounts_by_month(
+            payment_dates=self.PAYMENT_DATES, cache={}
+        )
+
+        self.assertEqual(
+            {
+                datetime.date(year=2025, month=1, day=1): Decimal(100),
+                datetime.date(year=2025, month=2, day=1): Decimal(2),
+                datetime.date(year=2025, month=3, day=1): Decimal(3),
+            },
+            result,
+        )
+
+    @patch.object(MonthPaymentBuilder, "build_payments_for_month", autospec=True)
+    def test_refreshSnapshots_snapshotsAlreadyStoredConcurrently_updatesThem(
+        self, mock_build_payments_for_month: Mock
+    ):
+        mock_build_payments_for_month.side_effect = self.build_payments
+        CashflowForecastSnapshot.objects.create(
+            month=datetime.date(year=2025, month=2, day=1),
+            projected_amount=Decimal(100),
+            computed_on=datetime.date(year=2025, month=1, day=1),
+        )
+
+        CashflowForecastService.refresh_snapshots(
+            payment_dates=self.PAYMENT_DATES, first_index_to_store=0, cache={}
+        )
+
+        self.assertEqual(
+            {
+                datetime.date(year=2025, month=1, day=1): Decimal(1),
+                datetime.date(year=2025, month=2, day=1): Decimal(2),
+                datetime.date(year=2025, month=3, day=1): Decimal(3),
+            },
+            dict(
+                CashflowForecastSnapshot.objects.values_list(
+                    "month", "projected_amount"
+                )
+            ),
+        )
+        self.assertEqual(
+            {get_today()},
+            set(CashflowForecastSnapshot.objects.values_list("computed_on", flat=True)),
+        )
+
+    @patch.object(MonthPaymentBuilder, "build_payments_for_month", autospec=True)
+    def test_getProjectedAmountsByMonth_snapshotsComputedOnAPreviousDay_recomputesThem(
+        self, mock_build_payments_for_month: Mock
+    ):
+        mock_build_payments_for_month.side_effect = self.build_payments
+        CashflowForecastSnapshot.objects.bulk_create(
+            [
+                CashflowForecastSnapshot(
+                    month=payment_date.replace(day=1),
+                    projected_amount=Decimal(100),
+                    computed_on=datetime.date(year=2025, month=1, day=1),
+                )
+                for payment_date in self.PAYMENT_DATES
+            ]
+        )
+
+        result = CashflowForecastService.get_projected_amounts_by_month(
+            payment_dates=self.PAYMENT_DATES, cache={}
+        )
+
+        self.assertEqual(
+            {
+                datetime.date(year=2025, month=1, day=1): Decimal(1),
+                datetime.date(year=2025, month=2, day=1): Decimal(2),
+                datetime.date(year=2025, month=3, day=1): Decimal(3),
+            },
+            result,
+        )
+        self.assertEqual(3, mock_build_payments_for_month.call_count)
+
+    @patch.object(MonthPaymentBuilder, "build_payments_for_month", autospec=True)
+    def test_refreshSnapshots_invalidatedWhileComputing_deletesTheSnapshotsFromTheInvalidatedMonth(
+        self, mock_build_payments_for_month: Mock
+    ):
+        def build_payments_and_invalidate(reference_date: datetime.date, **kwargs):
+            if reference_date == self.PAYMENT_DATES[-1]:
+                CashflowForecastService.mark_stale_from(self.PAYMENT_DATES[1])
+            return self.build_payments(reference_date, **kwargs)
+
+        mock_build_payments_for_month.side_effect = build_payments_and_invalidate
+
+        CashflowForecastService.refresh_snapshots(
+            payment_dates=self.PAYMENT_DATES, first_index_to_store=0, cache={}
+        )
+
+        self.assertEqual(
+            [datetime.date(year=2025, month=1, day=1)],
+            list(CashflowForecastSnapshot.objects.values_list("month", flat=True)),
+        )
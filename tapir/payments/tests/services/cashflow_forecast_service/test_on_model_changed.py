@@ -0,0 +1,87 @@
+import datetime
+from decimal import Decimal
+from unittest.mock import patch, Mock
+
+from django.db import transaction
+
+from tapir.configuration.models import TapirParameter
+from tapir.payments.models import CashflowForecastSnapshot
+from tapir.payments.services.cashflow_forecast_service import CashflowForecastService
+from tapir.wirgarten.parameters import ParameterDefinitions
+from tapir.wirgarten.tests.factories import GrowingPeriodFactory, SubscriptionFactory
+from tapir.wirgarten.tests.test_utils import TapirIntegrationTest
+from tapir.wirgarten.utils import get_today
+
+
+class TestOnModelChanged(TapirIntegrationTest):
+    MONTHS = [datetime.date(year=2025, month=month, day=1) for month in range(1, 7)]
+
+    @classmethod
+    def setUpTestData(cls):
+        ParameterDefinitions().import_definitions(bulk_create=True)
+
+    def setUp(self):
+        super().setUp()
+        with self.captureOnCommitCallbacks(execute=True):
+            growing_period = GrowingPeriodFactory.create(
+                start_date=datetime.date(year=2025, month=1, day=1),
+                end_date=datetime.date(year=2025, month=12, day=31),
+            )
+            self.subscription = SubscriptionFactory.create(
+                period=growing_period,
+                start_date=datetime.date(year=2025, month=2, day=1),
+            )
+
+    def create_snapshots(self):
+        CashflowForecastSnapshot.objects.all().delete()
+        CashflowForecastSnapshot.objects.bulk_create(
+            [
+                CashflowForecastSnapshot(
+                    month=month,
+                    projected_amount=Decimal(1),
+                    computed_on=get_today(),
+                )
+                for month in self.MONTHS
+            ]
+        )
+
+    def get_remaining_months(self):
+        return list(
+            CashflowForecastSnapshot.objects.order_by("month").values_list(
+                "month", flat=True
+            )
+        )
+
+    def test_onModelChanged_startDateMovedLater_invalidatesFromThePreviousDate(self):
+        self.create_snapshots()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.subscription.start_date = datetime.date(year=2025, month=4, day=1)
+            self.subscription.save()
+
+        self.assertEqual(self.MONTHS[:1], self.get_remaining_months())
+
+    @patch.object(CashflowForecastService, "mark_stale_from", autospec=True)
+    def test_onModelChanged_severalChangesInATransaction_invalidatesOnceFromTheEarliestDate(
+        self, mock_mark_stale_from: Mock
+    ):
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                self.subscription.end_date = datetime.date(year=2025, month=10, day=31)
+                self.subscription.save()
+                self.subscription.start_date = datetime.date(year=2025, month=3, day=1)
+                self.subscription.save()
+
+        mock_mark_stale_from.assert_called_once_with(
+            datetime.date(year=2025, month=2, day=1)
+        )
+
+    def test_onModelAffectingAllMonthsChanged_parameterSaved_invalidatesAllMonths(
+        self,
+    ):
+        self.create_snapshots()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            TapirParameter.objects.first().save()
+
+        self.assertEqual([], self.get_remaining_months())
@@ -0,0 +1,147 @@
+import datetime
+import random
+from unittest.mock import Mock
+
+from tapir.payments.services.generated_payments_ledger import GeneratedPaymentsLedger
+from tapir.utils.services.date_range_overlap_checker import DateRangeOverlapChecker
+from tapir.wirgarten.tests.test_utils import TapirUnitTest
+
+
+class TestGetPaymentsOverlappingWithRange(TapirUnitTest):
+    @staticmethod
+    def build_payment(
+        mandate_ref_id: str,
+        payment_type: str,
+        range_start: datetime.date,
+        range_end: datetime.date,
+    ):
+        return Mock(
+            mandate_ref_id=mandate_ref_id,
+            type=payment_type,
+            subscription_payment_range_start=range_start,
+            subscription_payment_range_end=range_end,
+        )
+
+    def test_getPaymentsOverlappingWithRange_default_returnsOnlyPaymentsOfTheGivenMandateRefAndTypeThatOverlap(
+        self,
+    ):
+        overlapping = self.build_payment(
+            "ref_1",
+            "type_1",
+            datetime.date(year=2024, month=1, day=1),
+            datetime.date(year=2024, month=1, day=31),
+        )
+        before = self.build_payment(
+            "ref_1",
+            "type_1",
+            datetime.date(year=2023, month=12, day=1),
+            datetime.date(year=2023, month=12, day=31),
+        )
+        after = self.build_payment(
+            "ref_1",
+            "type_1",
+            datetime.date(year=2024, month=2, day=1),
+            datetime.date(year=2024, month=2, day=29),
+        )
+        other_type = self.build_payment(
+            "ref_1",
+            "type_2",
+            datetime.date(year=2024, month=1, day=1),
+            datetime.date(year=2024, month=1, day=31),
+        )
+        other_mandate_ref = self.build_payment(
+            "ref_2",
+            "type_1",
+            datetime.date(year=2024, month=1, day=1),
+            datetime.date(year=2024, month=1, day=31),
+        )
+        ledger = GeneratedPaymentsLedger(
+            [overlapping, before, after, other_type, other_mandate_ref]
+        )
+
+        result = ledger.get_payments_overlapping_with_range(
+            mandate_ref_id="ref_1",
+            payment_type="type_1",
+            range_start=datetime.date(year=2024, month=1, day=15),
+            range_end=datetime.date(year=2024, month=1, day=20),
+        )
+
+        self.assertEqual([overlapping], result)
+
+    def test_getPaymentsOverlappingWithRange_ledgerBuiltWithUnion_includesPaymentsFromBothLedgers(
+        self,
+    ):
+        payment_1 = self.build_payment(
+            "ref_1",
+            "type_1",
+            datetime.date(year=2024, month=1, day=1),
+            datetime.date(year=2024, month=1, day=31),
+        )
+        payment_2 = self.build_payment(
+            "ref_1",
+            "type_1",
+            datetime.date(year=2024, month=1, day=10),
+            datetime.date(year=2024, month=2, day=10),
+        )
+        ledger = GeneratedPaymentsLedger([payment_1])
+
+        union = ledger.union([payment_2])
+
+        self.assertEqual({payment_1, payment_2}, union)
+        self.assertEqual({payment_1}, ledger)
+        self.assertEqual(
+            {payment_1, payment_2},
+            set(
+                union.get_payments_overlapping_with_range(
+                    mandate_ref_id="ref_1",
+                    payment_type="type_1",
+                    range_start=datetime.date(year=2024, month=1, day=15),
+                    range_end=datetime.date(year=2024, month=1, day=20),
+                )
+            ),
+        )
+
+    def test_getPaymentsOverlappingWithRange_randomPayments_sameResultAsLinearScan(
+        self,
+    ):
+        rng = random.Random(42)
+        first_day = datetime.date(year=2024, month=1, day=1)
+        payments = []
+        for _ in range(300):
+            range_start = first_day + datetime.timedelta(days=rng.randint(0, 365))
+            payments.append(
+                self.build_payment(
+                    rng.choice(["ref_1", "ref_2"]),
+                    rng.choice(["type_1", "type_2"]),
+                    range_start,
+                    range_start + datetime.timedelta(days=rng.randint(0, 90)),
+                )
+            )
+        ledger = GeneratedPaymentsLedger(payments[:150])
+        ledger = ledger.union(payments[150:])
+
+        for _ in range(100):
+            range_start = first_day + datetime.timedelta(days=rng.randint(-30, 400))
+            range_end = range_start + datetime.timedelta(days=rng.randint(0, 60))
+            expected = {
+                payment
+                for payment in payments
+                if payment.mandate_ref_id == "ref_1"
+                and payment.type == "type_2"
+                and DateRangeOverlapChecker.do_ranges_overlap(
+                    range_1_start=range_start,
+                    range_1_end=range_end,
+                    range_2_start=payment.subscription_payment_range_start,
+                    range_2_end=payment.subscription_payment_range_end,
+                )
+            }
+
+            result = ledger.get_payments_overlapping_with_range(
+                mandate_ref_id="ref_1",
+                payment_type="type_2",
+                range_start=range_start,
+                range_end=range_end,
+            )
+
+            self.assertEqual(expected, set(result))
+            self.assertEqual(len(expected), len(result))
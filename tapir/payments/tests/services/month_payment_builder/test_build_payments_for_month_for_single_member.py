@@ -0,0 +1,115 @@
+import datetime
+
+from tapir.configuration.models import TapirParameter
+from tapir.payments.services.month_payment_builder import MonthPaymentBuilder
+from tapir.solidarity_contribution.tests.factories import SolidarityContributionFactory
+from tapir.utils.shortcuts import get_first_of_next_month
+from tapir.wirgarten.parameter_keys import ParameterKeys
+from tapir.wirgarten.parameters import ParameterDefinitions
+from tapir.wirgarten.tests.factories import (
+    MemberFactory,
+    MemberPickupLocationFactory,
+    SubscriptionFactory,
+    GrowingPeriodFactory,
+    ProductPriceFactory,
+    ProductCapacityFactory,
+)
+from tapir.wirgarten.tests.test_utils import TapirIntegrationTest, mock_timezone
+
+
+class TestBuildPaymentsForMonthForSingleMember(TapirIntegrationTest):
+    @classmethod
+    def setUpTestData(cls):
+        ParameterDefinitions().import_definitions(bulk_create=True)
+        TapirParameter.objects.filter(key=ParameterKeys.PAYMENT_START_DATE).update(
+            value=datetime.date(year=2020, month=1, day=1)
+        )
+        TapirParameter.objects.filter(
+            key=ParameterKeys.SUBSCRIPTION_AUTOMATIC_RENEWAL
+        ).update(value=True)
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.now = mock_timezone(self, now=datetime.datetime(year=2020, month=5, day=7))
+        growing_period = GrowingPeriodFactory.create(
+            start_date=datetime.date(year=2020, month=1, day=1),
+            end_date=datetime.date(year=2020, month=12, day=31),
+        )
+        future_growing_period = GrowingPeriodFactory.create(
+            start_date=datetime.date(year=2021, month=1, day=1),
+            end_date=datetime.date(year=2021, month=12, day=31),
+        )
+
+        self.members = [MemberFactory.create() for _ in range(3)]
+        for member in self.members:
+            MemberPickupLocationFactory.create(
+                member=member, valid_from=datetime.date(year=2000, month=1, day=1)
+            )
+            subscription = SubscriptionFactory.create(
+                member=member, period=growing_period, quantity=1
+            )
+            ProductPriceFactory.create(
+                product=subscription.product,
+                price=10,
+                valid_from=datetime.date(year=2020, month=1, day=1),
+            )
+            ProductCapacityFactory.create(
+                period=future_growing_period, product_type=subscription.product.type
+            )
+            SolidarityContributionFactory.create(
+                member=member,
+                amount=5,
+                start_date=growing_period.start_date,
+                end_date=growing_period.end_date,
+            )
+
+    def test_buildPaymentsForMonth_givenMemberId_returnsSamePaymentsAsFilteringAllPayments(
+        self,
+    ):
+        member = self.members[1]
+        generated_payments_all = set()
+        generated_payments_member = set()
+        current_month = self.now.date().replace(day=1)
+
+        for _ in range(12):
+            payments_all = MonthPaymentBuilder.build_payments_for_month(
+                reference_date=current_month,
+                cache={},
+                generated_payments=generated_payments_all,
+            )
+            payments_all = [
+                payment
+                for payment in payments_all
+                if payment.mandate_ref.member_id == member.id
+            ]
+            payments_member = MonthPaymentBuilder.build_payments_for_month(
+                reference_date=current_month,
+                cache={},
+                generated_payments=generated_payments_member,
+                member_id=member.id,
+            )
+
+            self.assertEqual(
+                self.describe_payments(payments_all),
+                self.describe_payments(payments_member),
+            )
+
+            generated_payments_all.update(payments_all)
+            generated_payments_member.update(payments_member)
+            current_month = get_first_of_next_month(current_month)
+
+        self.assertGreater(len(generated_payments_member), 0)
+
+    @staticmethod
+    def describe_payments(payments):
+        return sorted(
+            (
+                payment.type,
+                payment.amount,
+                payment.due_date,
+                payment.subscription_payment_range_start,
+                payment.subscription_payment_range_end,
+                payment.mandate_ref_id,
+            )
+            for payment in payments
+        )
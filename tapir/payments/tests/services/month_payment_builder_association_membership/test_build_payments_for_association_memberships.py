@@ -77,7 +77,7 @@ class TestBuildPaymentsForAssociationMemberships(TapirUnitTest):
         self.assertEqual({payments[member_1], payments[member_3]}, set(result))
 
         mock_get_active_memberships.assert_called_once_with(
-            cache=cache, first_of_month=current_month
+            cache=cache, first_of_month=current_month, member_id=None
         )
         self.assertEqual(3, mock_get_member_payment_rhythm.call_count)
 
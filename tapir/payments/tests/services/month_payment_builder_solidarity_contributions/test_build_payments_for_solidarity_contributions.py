@@ -116,7 +116,10 @@ class TestBuildPaymentsForSolidarityContributions(TapirIntegrationTest):
         self.assertEqual({payment_m1, payment_m2}, set(result))
 
         mock_get_solidarity_contributions_for_this_and_the_next_growing_period.assert_called_once_with(
-            cache=cache, first_of_month=current_month, is_in_trial=False
+            cache=cache,
+            first_of_month=current_month,
+            is_in_trial=False,
+            member_id=None,
         )
         self.assertEqual(3, mock_get_member_payment_rhythm.call_count)
         mock_get_member_payment_rhythm.assert_has_calls(
@@ -228,7 +231,10 @@ class TestBuildPaymentsForSolidarityContributions(TapirIntegrationTest):
         self.assertEqual({payment_m1, payment_m2}, set(result))
 
         mock_get_solidarity_contributions_for_this_and_the_next_growing_period.assert_called_once_with(
-            cache=cache, first_of_month=first_of_previous_month, is_in_trial=True
+            cache=cache,
+            first_of_month=first_of_previous_month,
+            is_in_trial=True,
+            member_id=None,
         )
         mock_get_member_payment_rhythm.assert_not_called()
         self.assertEqual(3, mock_build_payment_for_contract_and_member.call_count)
@@ -300,6 +300,30 @@ class TestBuildXmlString(TapirUnitTest):
             error.exception.message,
         )
 
+    def test_buildXmlString_severalPaymentsWithOneInvalid_raisesErrorForInvalidPayment(
+        self,
+    ):
+        valid_payment = PaymentFactory.build(amount=Decimal("10"))
+        invalid_payment = PaymentFactory.build(
+            amount=Decimal("20"), mandate_ref__member__iban="INVALID"
+        )
+
+        with self.assertRaises(ValidationError) as error:
+            Pain008XmlGenerator.build_xml_string(
+                payments=[valid_payment, invalid_payment],
+                collection_date=datetime.date(year=2019, month=9, day=17),
+                cache=self.cache,
+            )
+
+        self.assertIn(
+            f"Error when building XML for payment: {invalid_payment}",
+            error.exception.message,
+        )
+        self.assertIn(
+            "The value 'INVALID' is not accepted by the pattern",
+            error.exception.message,
+        )
+
     @classmethod
     def _get_child(cls, path: str, tree):
         current_node = tree
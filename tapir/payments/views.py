@@ -43,6 +43,7 @@ from tapir.payments.serializers import (
     PaymentTransactionDetailsSerializer,
     JokerCreditIntendedUsePreviewResponseSerializer,
 )
+from tapir.payments.services.generated_payments_ledger import GeneratedPaymentsLedger
 from tapir.payments.services.intended_use_pattern_expander import (
     IntendedUsePatternExpander,
 )
@@ -163,12 +164,13 @@ class GetFutureMemberPaymentsApiView(APIView):
         )
         current_month = get_today(cache=self.cache)
         current_month = current_month.replace(day=1)
-        generated_payments = set()
+        generated_payments = GeneratedPaymentsLedger()
         for _ in range(12):
             payments = MonthPaymentBuilder.build_payments_for_month(
                 reference_date=current_month,
                 cache=self.cache,
                 generated_payments=generated_payments,
+                member_id=member_id,
             )
             member_payments.update(
                 [
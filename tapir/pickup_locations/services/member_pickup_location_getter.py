@@ -5,6 +5,7 @@ from django.db.models import QuerySet, OuterRef, Subquery
 
 from tapir.utils.services.tapir_cache import TapirCache
 from tapir.utils.services.tapir_cache_manager import TapirCacheManager
+from tapir.utils.services.tapir_shared_cache import TapirSharedCache
 from tapir.utils.shortcuts import get_from_cache_or_compute
 from tapir.wirgarten.models import Member, MemberPickupLocation, PickupLocation
 
@@ -119,6 +120,56 @@ class MemberPickupLocationGetter:
             members_at_date, reference_date, build_if_cache_miss
         )
 
+    @classmethod
+    def get_date_ranges_at_pickup_location_by_member_id(
+        cls, pickup_location: PickupLocation, cache: dict
+    ) -> dict[str, list[tuple[datetime.date, datetime.date]]]:
+        # Both bounds are inclusive, datetime.date.max means that the member never leaves
+        def build_if_cache_miss():
+            date_ranges_by_member_id = {}
+            for (
+                member_id,
+                member_pickup_locations,
+            ) in cls.get_member_pickup_locations_objects_by_member_id(cache).items():
+                pickup_location_id_by_valid_from = {}
+                for member_pickup_location in sorted(
+                    member_pickup_locations,
+                    key=lambda member_pickup_location: member_pickup_location.valid_from,
+                ):
+                    pickup_location_id_by_valid_from[
+                        member_pickup_location.valid_from
+                    ] = member_pickup_location.pickup_location_id
+
+                valid_from_dates = sorted(pickup_location_id_by_valid_from.keys())
+                for index, valid_from in enumerate(valid_from_dates):
+                    if (
+                        pickup_location_id_by_valid_from[valid_from]
+                        != pickup_location.id
+                    ):
+                        continue
+                    valid_until = (
+                        valid_from_dates[index + 1] - datetime.timedelta(days=1)
+                        if index + 1 < len(valid_from_dates)
+                        else datetime.date.max
+                    )
+                    date_ranges_by_member_id.setdefault(member_id, []).append(
+                        (valid_from, valid_until)
+                    )
+            return date_ranges_by_member_id
+
+        cache_for_pickup_location = get_from_cache_or_compute(
+            cache, pickup_location, lambda: {}
+        )
+        TapirCacheManager.register_key_in_category(
+            cache=cache,
+            key=pickup_location,
+            category=TapirCacheManager.CATEGORY_MEMBER_PICKUP_LOCATIONS,
+        )
+
+        return get_from_cache_or_compute(
+            cache_for_pickup_location, "date_ranges_by_member_id", build_if_cache_miss
+        )
+
     @classmethod
     def get_member_pickup_locations_objects_by_member_id(
         cls, cache: dict
@@ -143,7 +194,12 @@ class MemberPickupLocationGetter:
                 )
             return member_pickup_locations
 
-        return get_from_cache_or_compute(cache, key, build_if_cache_miss)
+        return TapirSharedCache.get_from_cache_or_compute(
+            cache,
+            key,
+            TapirCacheManager.CATEGORY_MEMBER_PICKUP_LOCATIONS,
+            build_if_cache_miss,
+        )
 
     @classmethod
     def get_member_pickup_location_id_from_cache(
@@ -3,8 +3,8 @@ import datetime
 from tapir.pickup_locations.services.member_pickup_location_getter import (
     MemberPickupLocationGetter,
 )
-from tapir.pickup_locations.services.pickup_location_highest_usage_after_date_service import (
-    PickupLocationHighestUsageAfterDateService,
+from tapir.pickup_locations.services.pickup_location_highest_share_usage_service import (
+    PickupLocationHighestShareUsageService,
 )
 from tapir.pickup_locations.services.share_capacities_service import (
     SharesCapacityService,
@@ -14,6 +14,7 @@ from tapir.subscriptions.services.automatic_subscription_renewal_service import
 )
 from tapir.subscriptions.types import TapirOrder
 from tapir.utils.services.tapir_cache import TapirCache
+from tapir.utils.shortcuts import get_from_cache_or_compute
 from tapir.waiting_list.services.waiting_list_reserved_capacity_calculator import (
     WaitingListReservedCapacityCalculator,
 )
@@ -24,10 +25,7 @@ from tapir.wirgarten.models import (
     ProductType,
     Subscription,
 )
-from tapir.wirgarten.service.products import (
-    get_active_subscriptions,
-    get_product_price,
-)
+from tapir.wirgarten.service.products import get_product_price
 
 
 class PickupLocationCapacityModeShareChecker:
@@ -182,12 +180,10 @@ class PickupLocationCapacityModeShareChecker:
             sum(
                 [
                     s.get_used_capacity(cache=cache)
-                    for s in get_active_subscriptions(
-                        subscription_start, cache=cache
-                    ).filter(
-                        member_id=member.id,
-                        product__type_id=product_type.id,
-                    )
+                    for s in TapirCache.get_active_subscriptions_by_member_id(
+                        cache=cache, reference_date=subscription_start
+                    ).get(member.id, [])
+                    if s.product.type_id == product_type.id
                 ]
             )
         )
@@ -217,18 +213,18 @@ class PickupLocationCapacityModeShareChecker:
         reference_date: datetime.date,
         cache: dict,
     ):
-        return PickupLocationHighestUsageAfterDateService.get_highest_usage_after_date_generic(
-            pickup_location=pickup_location,
-            reference_date=reference_date,
-            lambda_get_usage_at_date=lambda date: (
-                PickupLocationCapacityModeShareChecker.get_capacity_usage_at_date(
-                    pickup_location=pickup_location,
-                    product_type=product_type,
-                    reference_date=date,
-                    cache=cache,
-                )
+        highest_usage_by_date = get_from_cache_or_compute(
+            cache, "pickup_location_highest_share_usage_by_date", lambda: {}
+        )
+        return get_from_cache_or_compute(
+            highest_usage_by_date,
+            (pickup_location.id, product_type.id, reference_date),
+            lambda: PickupLocationHighestShareUsageService.get_highest_usage_after_date(
+                pickup_location=pickup_location,
+                product_type=product_type,
+                reference_date=reference_date,
+                cache=cache,
             ),
-            cache=cache,
         )
 
     @classmethod
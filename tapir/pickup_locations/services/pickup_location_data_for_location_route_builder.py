@@ -1,7 +1,7 @@
 import datetime
 from decimal import Decimal
 
-from tapir.deliveries.services.delivery_cycle_service import DeliveryCycleService
+from tapir.deliveries.services.delivery_date_calculator import DeliveryDateCalculator
 from tapir.pickup_locations.config import PICKING_MODE_BASKET, PICKING_MODE_SHARE
 from tapir.pickup_locations.services.basket_size_capacities_service import (
     BasketSizeCapacitiesService,
@@ -118,8 +118,11 @@ class PickupLocationDataForLocationRouteBuilder:
         products = [
             product
             for product in TapirCache.get_all_products(cache=cache)
-            if DeliveryCycleService.is_product_type_delivered_in_week(
-                product_type=product.type, date=reference_date, cache=cache
+            if DeliveryDateCalculator.is_week_delivered(
+                product_type=product.type,
+                delivery_date=reference_date,
+                check_for_weeks_without_delivery=False,
+                cache=cache,
             )
         ]
         products = sorted(
@@ -0,0 +1,207 @@
+import datetime
+from decimal import Decimal
+
+from tapir.pickup_locations.services.member_pickup_location_getter import (
+    MemberPickupLocationGetter,
+)
+from tapir.pickup_locations.services.pickup_location_highest_usage_after_date_service import (
+    PickupLocationHighestUsageAfterDateService,
+)
+from tapir.subscriptions.services.automatic_subscription_renewal_service import (
+    AutomaticSubscriptionRenewalService,
+)
+from tapir.utils.services.tapir_cache import TapirCache
+from tapir.wirgarten.models import (
+    GrowingPeriod,
+    PickupLocation,
+    ProductType,
+    Subscription,
+)
+from tapir.wirgarten.service.products import get_product_price
+
+
+class PickupLocationHighestShareUsageService:
+    """
+    Computes the same result as stepping week by week with
+    PickupLocationCapacityModeShareChecker.get_capacity_usage_at_date, but with a single sweep:
+    each subscription (or renewal) emits a +quantity event when it starts counting at the pickup location
+    and a -quantity event the day after it stops, and the events are applied in date order.
+    """
+
+    @classmethod
+    def get_highest_usage_after_date(
+        cls,
+        pickup_location: PickupLocation,
+        product_type: ProductType,
+        reference_date: datetime.date,
+        cache: dict,
+    ) -> float:
+        dates_to_check = PickupLocationHighestUsageAfterDateService.get_dates_to_check(
+            pickup_location=pickup_location,
+            reference_date=reference_date,
+            cache=cache,
+        )
+        if len(dates_to_check) == 0:
+            return 0
+
+        growing_period_by_date = {
+            date: TapirCache.get_growing_period_at_date(
+                reference_date=date, cache=cache
+            )
+            for date in dates_to_check
+        }
+
+        events = cls.build_events(
+            pickup_location=pickup_location,
+            product_type=product_type,
+            first_date_by_growing_period=cls.get_first_date_by_growing_period(
+                growing_period_by_date
+            ),
+            cache=cache,
+        )
+        events.sort(key=lambda event: event[0])
+
+        # Renewals are only counted within the growing period that they have been computed for,
+        # they are tracked separately from the real subscriptions under the key of that growing period.
+        quantity_by_product_id_by_growing_period = {None: {}}
+        max_usage = 0
+        event_index = 0
+        for date in dates_to_check:
+            while event_index < len(events) and events[event_index][0] <= date:
+                _, growing_period, product_id, quantity = events[event_index]
+                quantity_by_product_id = (
+                    quantity_by_product_id_by_growing_period.setdefault(
+                        growing_period, {}
+                    )
+                )
+                quantity_by_product_id[product_id] = (
+                    quantity_by_product_id.get(product_id, 0) + quantity
+                )
+                event_index += 1
+
+            max_usage = max(
+                max_usage,
+                cls.get_usage_at_date(
+                    reference_date=date,
+                    quantity_by_product_id_list=[
+                        quantity_by_product_id_by_growing_period[None],
+                        quantity_by_product_id_by_growing_period.get(
+                            growing_period_by_date[date], {}
+                        ),
+                    ],
+                    cache=cache,
+                ),
+            )
+
+        return max_usage
+
+    @classmethod
+    def get_first_date_by_growing_period(
+        cls, growing_period_by_date: dict[datetime.date, GrowingPeriod | None]
+    ) -> dict[GrowingPeriod, datetime.date]:
+        first_date_by_growing_period = {}
+        for date, growing_period in sorted(growing_period_by_date.items()):
+            if growing_period is None:
+                continue
+            first_date_by_growing_period.setdefault(growing_period, date)
+        return first_date_by_growing_period
+
+    @classmethod
+    def build_events(
+        cls,
+        pickup_location: PickupLocation,
+        product_type: ProductType,
+        first_date_by_growing_period: dict[GrowingPeriod, datetime.date],
+        cache: dict,
+    ) -> list[tuple[datetime.date, GrowingPeriod | None, str, int]]:
+        date_ranges_by_member_id = (
+            MemberPickupLocationGetter.get_date_ranges_at_pickup_location_by_member_id(
+                pickup_location=pickup_location, cache=cache
+            )
+        )
+        subscriptions_with_product_type = TapirCache.get_subscriptions_by_product_type(
+            cache
+        )[product_type]
+
+        events = []
+        for subscription in subscriptions_with_product_type:
+            cls.add_events_for_subscription(
+                events=events,
+                subscription=subscription,
+                range_start=subscription.start_date,
+                range_end=subscription.end_date or datetime.date.max,
+                growing_period=None,
+                date_ranges_at_pickup_location=date_ranges_by_member_id.get(
+                    subscription.member_id, []
+                ),
+            )
+
+        subscriptions_ids_with_product_type = {
+            subscription.id for subscription in subscriptions_with_product_type
+        }
+        for growing_period, first_date in first_date_by_growing_period.items():
+            # The set of renewed subscriptions only depends on the growing period of the given date
+            renewed_subscriptions = AutomaticSubscriptionRenewalService.get_subscriptions_that_will_be_renewed(
+                reference_date=first_date, cache=cache
+            )
+            for subscription in renewed_subscriptions:
+                if subscription.id not in subscriptions_ids_with_product_type:
+                    continue
+                cls.add_events_for_subscription(
+                    events=events,
+                    subscription=subscription,
+                    range_start=growing_period.start_date,
+                    range_end=growing_period.end_date,
+                    growing_period=growing_period,
+                    date_ranges_at_pickup_location=date_ranges_by_member_id.get(
+                        subscription.member_id, []
+                    ),
+                )
+
+        return events
+
+    @classmethod
+    def add_events_for_subscription(
+        cls,
+        events: list,
+        subscription: Subscription,
+        range_start: datetime.date,
+        range_end: datetime.date,
+        growing_period: GrowingPeriod | None,
+        date_ranges_at_pickup_location: list[tuple[datetime.date, datetime.date]],
+    ):
+        for valid_from, valid_until in date_ranges_at_pickup_location:
+            start = max(range_start, valid_from)
+            end = min(range_end, valid_until)
+            if end < start:
+                continue
+
+            events.append(
+                (start, growing_period, subscription.product_id, subscription.quantity)
+            )
+            if end < datetime.date.max:
+                events.append(
+                    (
+                        end + datetime.timedelta(days=1),
+                        growing_period,
+                        subscription.product_id,
+                        -subscription.quantity,
+                    )
+                )
+
+    @classmethod
+    def get_usage_at_date(
+        cls,
+        reference_date: datetime.date,
+        quantity_by_product_id_list: list[dict[str, int]],
+        cache: dict,
+    ) -> float:
+        total_size = Decimal(0)
+        for quantity_by_product_id in quantity_by_product_id_list:
+            for product_id, quantity in quantity_by_product_id.items():
+                if quantity == 0:
+                    continue
+                size = get_product_price(product_id, reference_date, cache).size
+                total_size += size * quantity
+
+        return float(total_size)
@@ -19,21 +19,39 @@ class PickupLocationHighestUsageAfterDateService:
         lambda_get_usage_at_date: Callable,
         cache: dict,
     ):
-        current_date = reference_date
         max_usage = 0
 
+        for current_date in cls.get_dates_to_check(
+            pickup_location=pickup_location,
+            reference_date=reference_date,
+            cache=cache,
+        ):
+            usage_at_date = lambda_get_usage_at_date(current_date)
+            max_usage = max(max_usage, usage_at_date)
+
+        return max_usage
+
+    @classmethod
+    def get_dates_to_check(
+        cls,
+        pickup_location: PickupLocation,
+        reference_date: datetime.date,
+        cache: dict,
+    ) -> list[datetime.date]:
+        # the reference date then all following mondays before the last possible change
         date_of_last_possible_capacity_change = (
             cls.get_date_of_last_possible_capacity_change(
                 cache=cache, pickup_location=pickup_location
             )
         )
 
+        dates = []
+        current_date = reference_date
         while current_date < date_of_last_possible_capacity_change:
-            usage_at_date = lambda_get_usage_at_date(current_date)
-            max_usage = max(max_usage, usage_at_date)
+            dates.append(current_date)
             current_date = get_monday(current_date + datetime.timedelta(days=7))
 
-        return max_usage
+        return dates
 
     @staticmethod
     def get_date_of_last_possible_capacity_change(
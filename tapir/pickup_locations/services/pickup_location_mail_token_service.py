@@ -4,6 +4,8 @@ from tapir.pickup_locations.services.member_pickup_location_getter import (
     MemberPickupLocationGetter,
 )
 from tapir.utils.services.tapir_cache import TapirCache
+from tapir.utils.services.tapir_cache_manager import TapirCacheManager
+from tapir.utils.shortcuts import get_from_cache_or_compute
 from tapir.utils.user_utils import UserUtils
 from tapir.wirgarten.constants import OPTIONS_WEEKDAYS
 from tapir.wirgarten.models import Member, PickupLocationOpeningTime
@@ -34,6 +36,28 @@ class PickupLocationMailTokenService:
             cache=cache, pickup_location_id=pickup_location_id
         )
 
+    @classmethod
+    def get_opening_times_by_pickup_location_id(
+        cls, cache: dict
+    ) -> dict[str, list[PickupLocationOpeningTime]]:
+        # Loaded once for all pickup locations, ordered by day like in the mails
+        key = "mail_opening_times_by_pickup_location_id"
+        TapirCacheManager.register_key_in_category(
+            cache=cache, key=key, category=TapirCacheManager.CATEGORY_PICKUP_LOCATIONS
+        )
+
+        def compute():
+            opening_times_by_pickup_location_id = {}
+            for opening_time in PickupLocationOpeningTime.objects.order_by(
+                "day_of_week"
+            ):
+                opening_times_by_pickup_location_id.setdefault(
+                    opening_time.pickup_location_id, []
+                ).append(opening_time)
+            return opening_times_by_pickup_location_id
+
+        return get_from_cache_or_compute(cache, key, compute)
+
     @classmethod
     def pickup_location_name(
         cls, recipient: Member | StaticSegmentRecipient, cache: dict
@@ -118,9 +142,9 @@ class PickupLocationMailTokenService:
             return cls.NOT_APPLICABLE
 
         formatted_times = []
-        for opening_time in PickupLocationOpeningTime.objects.filter(
-            pickup_location_id=pickup_location.id
-        ).order_by("day_of_week"):
+        for opening_time in cls.get_opening_times_by_pickup_location_id(
+            cache=cache
+        ).get(pickup_location.id, []):
             open_time = opening_time.open_time.strftime("%H:%M")
             close_time = opening_time.close_time.strftime("%H:%M")
 
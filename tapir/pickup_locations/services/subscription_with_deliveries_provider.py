@@ -2,7 +2,7 @@ import datetime
 from decimal import Decimal
 
 from tapir.configuration.parameter import get_parameter_value
-from tapir.deliveries.services.delivery_cycle_service import DeliveryCycleService
+from tapir.deliveries.services.delivery_date_calculator import DeliveryDateCalculator
 from tapir.deliveries.services.pick_list_builder import PickListBuilder
 from tapir.subscriptions.services.subscription_delivered_in_week_checked import (
     SubscriptionDeliveredInWeekChecker,
@@ -23,8 +23,11 @@ class SubscriptionsWithDeliveriesProvider:
     ):
         subscriptions = []
         for product_type in TapirCache.get_all_product_types(cache=cache):
-            if not DeliveryCycleService.is_product_type_delivered_in_week(
-                product_type=product_type, date=reference_datetime.date(), cache=cache
+            if not DeliveryDateCalculator.is_week_delivered(
+                product_type=product_type,
+                delivery_date=reference_datetime.date(),
+                check_for_weeks_without_delivery=False,
+                cache=cache,
             ):
                 continue
 
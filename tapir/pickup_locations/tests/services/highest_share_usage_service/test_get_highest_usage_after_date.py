@@ -0,0 +1,209 @@
+import datetime
+
+from tapir.pickup_locations.services.pickup_location_capacity_mode_share_checker import (
+    PickupLocationCapacityModeShareChecker,
+)
+from tapir.pickup_locations.services.pickup_location_highest_share_usage_service import (
+    PickupLocationHighestShareUsageService,
+)
+from tapir.pickup_locations.services.pickup_location_highest_usage_after_date_service import (
+    PickupLocationHighestUsageAfterDateService,
+)
+from tapir.wirgarten.parameter_keys import ParameterKeys
+from tapir.wirgarten.parameters import ParameterDefinitions
+from tapir.wirgarten.tests.factories import (
+    GrowingPeriodFactory,
+    MemberFactory,
+    MemberPickupLocationFactory,
+    PickupLocationFactory,
+    ProductCapacityFactory,
+    ProductFactory,
+    ProductPriceFactory,
+    ProductTypeFactory,
+    SubscriptionFactory,
+)
+from tapir.wirgarten.tests.test_utils import TapirIntegrationTest, mock_timezone
+
+
+class TestGetHighestUsageAfterDate(TapirIntegrationTest):
+    @classmethod
+    def setUpTestData(cls):
+        ParameterDefinitions().import_definitions(bulk_create=True)
+
+        cls.pickup_location = PickupLocationFactory.create()
+        other_pickup_location = PickupLocationFactory.create()
+        cls.product_type = ProductTypeFactory.create()
+        small_product = ProductFactory.create(type=cls.product_type)
+        big_product = ProductFactory.create(type=cls.product_type)
+        for product, size_before, size_after in [
+            (small_product, 1, 2),
+            (big_product, 3, 2),
+        ]:
+            ProductPriceFactory.create(
+                product=product,
+                size=size_before,
+                valid_from=datetime.date(year=2025, month=1, day=1),
+            )
+            ProductPriceFactory.create(
+                product=product,
+                size=size_after,
+                valid_from=datetime.date(year=2026, month=3, day=1),
+            )
+
+        past_growing_period = GrowingPeriodFactory.create(
+            start_date=datetime.date(year=2025, month=1, day=1),
+            end_date=datetime.date(year=2025, month=12, day=31),
+        )
+        current_growing_period = GrowingPeriodFactory.create(
+            start_date=datetime.date(year=2026, month=1, day=1),
+            end_date=datetime.date(year=2026, month=12, day=31),
+        )
+        for growing_period in [past_growing_period, current_growing_period]:
+            ProductCapacityFactory.create(
+                period=growing_period, product_type=cls.product_type
+            )
+
+        member_always_there = MemberFactory.create()
+        MemberPickupLocationFactory.create(
+            member=member_always_there,
+            pickup_location=cls.pickup_location,
+            valid_from=datetime.date(year=2024, month=6, day=1),
+        )
+        SubscriptionFactory.create(
+            member=member_always_there,
+            product=small_product,
+            period=past_growing_period,
+            quantity=2,
+        )
+
+        member_that_joins = MemberFactory.create()
+        MemberPickupLocationFactory.create(
+            member=member_that_joins,
+            pickup_location=other_pickup_location,
+            valid_from=datetime.date(year=2024, month=6, day=1),
+        )
+        MemberPickupLocationFactory.create(
+            member=member_that_joins,
+            pickup_location=cls.pickup_location,
+            valid_from=datetime.date(year=2025, month=9, day=15),
+        )
+        SubscriptionFactory.create(
+            member=member_that_joins,
+            product=big_product,
+            period=past_growing_period,
+            start_date=datetime.date(year=2025, month=3, day=3),
+            quantity=5,
+        )
+
+        member_that_leaves = MemberFactory.create()
+        MemberPickupLocationFactory.create(
+            member=member_that_leaves,
+            pickup_location=cls.pickup_location,
+            valid_from=datetime.date(year=2024, month=6, day=1),
+        )
+        MemberPickupLocationFactory.create(
+            member=member_that_leaves,
+            pickup_location=other_pickup_location,
+            valid_from=datetime.date(year=2026, month=2, day=2),
+        )
+        for growing_period in [past_growing_period, current_growing_period]:
+            SubscriptionFactory.create(
+                member=member_that_leaves,
+                product=big_product,
+                period=growing_period,
+                quantity=1,
+            )
+
+        member_that_cancelled = MemberFactory.create()
+        MemberPickupLocationFactory.create(
+            member=member_that_cancelled,
+            pickup_location=cls.pickup_location,
+            valid_from=datetime.date(year=2024, month=6, day=1),
+        )
+        SubscriptionFactory.create(
+            member=member_that_cancelled,
+            product=small_product,
+            period=past_growing_period,
+            end_date=datetime.date(year=2025, month=8, day=31),
+            cancellation_ts=datetime.datetime(year=2025, month=2, day=1),
+            quantity=4,
+        )
+
+    def setUp(self) -> None:
+        super().setUp()
+        mock_timezone(self, datetime.datetime(year=2025, month=2, day=10))
+
+    def get_highest_usage_by_stepping_week_by_week(self, reference_date):
+        cache = {}
+        return PickupLocationHighestUsageAfterDateService.get_highest_usage_after_date_generic(
+            pickup_location=self.pickup_location,
+            reference_date=reference_date,
+            lambda_get_usage_at_date=lambda date: PickupLocationCapacityModeShareChecker.get_capacity_usage_at_date(
+                pickup_location=self.pickup_location,
+                product_type=self.product_type,
+                reference_date=date,
+                cache=cache,
+            ),
+            cache=cache,
+        )
+
+    def assert_same_result_as_stepping_week_by_week(self):
+        for reference_date in [
+            datetime.date(year=2025, month=2, day=12),
+            datetime.date(year=2025, month=9, day=1),
+            datetime.date(year=2026, month=1, day=7),
+            datetime.date(year=2026, month=2, day=2),
+            datetime.date(year=2026, month=6, day=1),
+            datetime.date(year=2027, month=1, day=1),
+        ]:
+            self.assertEqual(
+                self.get_highest_usage_by_stepping_week_by_week(reference_date),
+                PickupLocationHighestShareUsageService.get_highest_usage_after_date(
+                    pickup_location=self.pickup_location,
+                    product_type=self.product_type,
+                    reference_date=reference_date,
+                    cache={},
+                ),
+                f"Different results for reference date {reference_date}",
+            )
+
+    def test_getHighestUsageAfterDate_automaticRenewalDisabled_sameResultAsSteppingWeekByWeek(
+        self,
+    ):
+        self._set_parameter(ParameterKeys.SUBSCRIPTION_AUTOMATIC_RENEWAL, False)
+
+        self.assert_same_result_as_stepping_week_by_week()
+
+    def test_getHighestUsageAfterDate_automaticRenewalEnabled_sameResultAsSteppingWeekByWeek(
+        self,
+    ):
+        self._set_parameter(ParameterKeys.SUBSCRIPTION_AUTOMATIC_RENEWAL, True)
+
+        self.assert_same_result_as_stepping_week_by_week()
+
+    def test_getHighestUsageAfterDate_automaticRenewalEnabled_renewedSubscriptionsCountedWithNewPrices(
+        self,
+    ):
+        self._set_parameter(ParameterKeys.SUBSCRIPTION_AUTOMATIC_RENEWAL, True)
+
+        result = PickupLocationHighestShareUsageService.get_highest_usage_after_date(
+            pickup_location=self.pickup_location,
+            product_type=self.product_type,
+            reference_date=datetime.date(year=2026, month=3, day=2),
+            cache={},
+        )
+
+        # member_always_there: 2 * 2 (renewed), member_that_joins: 5 * 2 (renewed)
+        self.assertEqual(14, result)
+
+    def test_getHighestUsageAfterDate_referenceDateAfterLastPossibleChange_returnsZero(
+        self,
+    ):
+        result = PickupLocationHighestShareUsageService.get_highest_usage_after_date(
+            pickup_location=self.pickup_location,
+            product_type=self.product_type,
+            reference_date=datetime.date(year=2027, month=6, day=1),
+            cache={},
+        )
+
+        self.assertEqual(0, result)
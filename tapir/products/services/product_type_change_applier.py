@@ -5,6 +5,7 @@ from tapir.products.services.product_type_change_validator import (
 )
 from tapir.products.services.tax_rate_service import TaxRateService
 from tapir.subscriptions.services.notice_period_manager import NoticePeriodManager
+from tapir.utils.services.tapir_cache_manager import TapirCacheManager
 from tapir.wirgarten.models import ProductType, ProductCapacity, Payment
 
 
@@ -66,6 +67,9 @@ class ProductTypeChangeApplier:
 
         if old_name != new_name:
             Payment.objects.filter(type=old_name).update(type=new_name)
+            TapirCacheManager.clear_category(
+                cache=None, category=TapirCacheManager.CATEGORY_PAYMENTS
+            )
 
     @classmethod
     def apply_custom_cycle_delivery_week_changes(
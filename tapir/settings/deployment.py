@@ -100,6 +100,10 @@ CELERY_BEAT_SCHEDULE = {
         "task": "tapir.payments.tasks.export_payments_for_this_month",
         "schedule": celery.schedules.crontab(hour="5", minute="0"),
     },
+    "refresh_cashflow_forecast": {
+        "task": "tapir.payments.tasks.refresh_cashflow_forecast",
+        "schedule": celery.schedules.crontab(hour="1", minute="0"),
+    },
     "clean_members_without_subscription_task": {
         "task": "tapir.pickup_locations.tasks.clean_members_without_subscription_task",
         "schedule": celery.schedules.crontab(hour="3", minute="0"),
@@ -108,6 +112,14 @@ CELERY_BEAT_SCHEDULE = {
         "task": "tapir.associations.tasks.trigger_association_membership_ends_today_mails",
         "schedule": celery.schedules.crontab(hour="13", minute="0"),
     },
+    "update_waiting_list_fulfillability": {
+        "task": "tapir.waiting_list.tasks.update_waiting_list_fulfillability",
+        "schedule": datetime.timedelta(minutes=10),
+    },
+    "materialize_daily_statistics": {
+        "task": "tapir.wirgarten.tasks.materialize_daily_statistics",
+        "schedule": celery.schedules.crontab(hour="0", minute="30"),
+    },
 }
 
 EMAIL_DISPATCH_BATCH_SIZE = (
@@ -205,6 +217,16 @@ CACHES = {
     }
 }
 
+# Shares reference data like parameters, products and growing periods between requests, see TapirSharedCache
+TAPIR_SHARED_CACHE_ENABLED = env.bool("TAPIR_SHARED_CACHE_ENABLED", default=False)
+TAPIR_SHARED_CACHE_TIMEOUT = env.int("TAPIR_SHARED_CACHE_TIMEOUT", default=60 * 60)
+
+# How long the roles of a user are kept before being requested from keycloak again, see KeycloakRoleCache
+KEYCLOAK_ROLE_CACHE_TIMEOUT = env.int("KEYCLOAK_ROLE_CACHE_TIMEOUT", default=5 * 60)
+
+# Number of processes that render the PDF exports that generate one file per segment entry, 1 renders them in the web or celery process
+PDF_EXPORT_NB_WORKERS = env.int("PDF_EXPORT_NB_WORKERS", default=1)
+
 TAPIR_MAIL_PATH = "/tapirmail"
 TAPIRMAIL_REACT_APP_API_ROOT = SITE_URL + TAPIR_MAIL_PATH
 TAPIRMAIL_REACT_APP_BASENAME = TAPIR_MAIL_PATH
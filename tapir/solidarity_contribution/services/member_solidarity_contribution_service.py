@@ -10,6 +10,7 @@ from tapir.solidarity_contribution.models import (
 )
 from tapir.subscriptions.services.trial_period_manager import TrialPeriodManager
 from tapir.utils.services.tapir_cache import TapirCache
+from tapir.utils.services.tapir_cache_manager import TapirCacheManager
 from tapir.wirgarten.constants import Permission
 from tapir.wirgarten.models import Member
 from tapir.wirgarten.service.products import get_next_growing_period
@@ -59,6 +60,9 @@ class MemberSolidarityContributionService:
             end_date=end_date,
             cancellation_ts=get_now(cache=cache),
         )
+        TapirCacheManager.clear_category(
+            cache=cache, category=TapirCacheManager.CATEGORY_SOLIDARITY_CONTRIBUTIONS
+        )
         if last_contribution:
             last_contribution.refresh_from_db()
         member_contributions.filter(start_date__gte=change_date).delete()
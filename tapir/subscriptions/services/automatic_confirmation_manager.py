@@ -4,6 +4,7 @@ from tapir.configuration.parameter import get_parameter_value
 from tapir.subscriptions.services.order_confirmation_mail_sender import (
     OrderConfirmationMailSender,
 )
+from tapir.utils.services.tapir_cache_manager import TapirCacheManager
 from tapir.wirgarten.models import Subscription, CoopShareTransaction
 from tapir.wirgarten.parameter_keys import ParameterKeys
 from tapir.wirgarten.service.get_next_delivery_date import get_next_delivery_date
@@ -24,6 +25,9 @@ class AutomaticConfirmationManager:
         Subscription.objects.filter(id__in=subscriptions_ids_to_confirm).update(
             auto_confirmed=get_now(cache=cache)
         )
+        TapirCacheManager.clear_category(
+            cache=cache, category=TapirCacheManager.CATEGORY_SUBSCRIPTIONS
+        )
 
         transactions = CoopShareTransaction.objects.filter(
             admin_confirmed__isnull=True,
@@ -36,6 +40,9 @@ class AutomaticConfirmationManager:
         CoopShareTransaction.objects.filter(id__in=transactions_ids_to_confirm).update(
             auto_confirmed=get_now(cache=cache)
         )
+        TapirCacheManager.clear_category(
+            cache=cache, category=TapirCacheManager.CATEGORY_COOP_SHARES
+        )
 
         OrderConfirmationMailSender.send_confirmation_mail_if_necessary(
             confirm_creation_ids=subscriptions_ids_to_confirm,
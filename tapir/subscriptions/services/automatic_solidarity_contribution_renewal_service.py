@@ -7,6 +7,7 @@ from tapir.subscriptions.services.automatic_subscription_renewal_service import
 )
 from tapir.subscriptions.services.notice_period_manager import NoticePeriodManager
 from tapir.utils.services.tapir_cache import TapirCache
+from tapir.utils.services.tapir_cache_manager import TapirCacheManager
 from tapir.wirgarten.parameter_keys import ParameterKeys
 from tapir.wirgarten.service.products import get_next_growing_period
 from tapir.wirgarten.utils import get_today
@@ -30,6 +31,9 @@ class AutomaticSolidarityContributionRenewalService:
             if cls.must_contribution_be_renewed(contribution, cache=cache)
         ]
         SolidarityContribution.objects.bulk_create(contributions_to_create)
+        TapirCacheManager.clear_category(
+            cache=cache, category=TapirCacheManager.CATEGORY_SOLIDARITY_CONTRIBUTIONS
+        )
 
     @classmethod
     def must_contribution_be_renewed(
@@ -125,6 +129,42 @@ class AutomaticSolidarityContributionRenewalService:
             and contribution.cancellation_ts is None
         }
 
+    @classmethod
+    def get_contributions_of_member_that_will_be_renewed(
+        cls, member_id: str, reference_date: datetime.date, cache: dict
+    ) -> set[SolidarityContribution]:
+        if not get_parameter_value(ParameterKeys.SUBSCRIPTION_AUTOMATIC_RENEWAL, cache):
+            return set()
+
+        current_growing_period = TapirCache.get_growing_period_at_date(
+            reference_date=reference_date, cache=cache
+        )
+        if current_growing_period is None:
+            return set()
+
+        member_contributions = TapirCache.get_solidarity_contributions_of_member(
+            cache=cache, member_id=member_id
+        )
+        if any(
+            contribution.start_date
+            <= current_growing_period.start_date
+            <= contribution.end_date
+            for contribution in member_contributions
+        ):
+            return set()
+
+        end_of_previous_growing_period = (
+            current_growing_period.start_date - datetime.timedelta(days=1)
+        )
+        return {
+            contribution
+            for contribution in member_contributions
+            if contribution.start_date
+            <= end_of_previous_growing_period
+            <= contribution.end_date
+            and contribution.cancellation_ts is None
+        }
+
     @classmethod
     def get_current_and_renewed_solidarity_contributions_at_date(
         cls, reference_date: datetime.date, cache: dict
@@ -1,11 +1,18 @@
 import datetime
+import logging
+import time
+from dataclasses import dataclass
 from typing import Callable
 
+from django.db import transaction
+
 from tapir.configuration.parameter import get_parameter_value
 from tapir.solidarity_contribution.models import SolidarityContribution
 from tapir.subscriptions.services.notice_period_manager import NoticePeriodManager
 from tapir.subscriptions.services.trial_period_manager import TrialPeriodManager
 from tapir.utils.services.tapir_cache import TapirCache
+from tapir.utils.services.tapir_cache_manager import TapirCacheManager
+from tapir.utils.shortcuts import get_from_cache_or_compute
 from tapir.wirgarten.models import Subscription
 from tapir.wirgarten.parameter_keys import ParameterKeys
 from tapir.wirgarten.service.products import (
@@ -14,24 +21,89 @@ from tapir.wirgarten.service.products import (
 )
 from tapir.wirgarten.utils import get_today
 
+LOG = logging.getLogger(__name__)
+
 
 class AutomaticSubscriptionRenewalService:
+    @dataclass
+    class RenewalReport:
+        nb_active_subscriptions: int
+        nb_renewed_subscriptions: int
+        duration_in_seconds: float
+
     @classmethod
-    def renew_subscriptions_if_necessary(cls):
+    def renew_subscriptions_if_necessary(cls) -> RenewalReport | None:
         cache = {}
         if not get_parameter_value(
             ParameterKeys.SUBSCRIPTION_AUTOMATIC_RENEWAL, cache=cache
         ):
-            return
+            return None
+
+        start_time = time.perf_counter()
+
+        active_subscriptions = list(
+            get_active_subscriptions(cache=cache).select_related(
+                "member", "mandate_ref"
+            )
+        )
+        members_and_products_in_next_growing_period = (
+            cls.get_members_and_products_in_next_growing_period(cache=cache)
+        )
+
+        subscriptions_to_create = []
+        for subscription in active_subscriptions:
+            if not cls.must_subscription_be_renewed(
+                subscription,
+                cache=cache,
+                members_and_products_in_next_growing_period=members_and_products_in_next_growing_period,
+            ):
+                continue
+            subscriptions_to_create.append(
+                cls.build_renewed_subscription(subscription, cache=cache)
+            )
+            members_and_products_in_next_growing_period.add(
+                (subscription.member_id, subscription.product_id)
+            )
+
+        with transaction.atomic():
+            Subscription.objects.bulk_create(subscriptions_to_create)
+            # bulk_create doesn't send post_save signals
+            TapirCacheManager.clear_category(
+                cache=cache, category=TapirCacheManager.CATEGORY_SUBSCRIPTIONS
+            )
+
+        report = cls.RenewalReport(
+            nb_active_subscriptions=len(active_subscriptions),
+            nb_renewed_subscriptions=len(subscriptions_to_create),
+            duration_in_seconds=time.perf_counter() - start_time,
+        )
+        LOG.info(
+            f"Automatic subscription renewal: {report.nb_renewed_subscriptions} subscriptions renewed "
+            f"out of {report.nb_active_subscriptions} active subscriptions "
+            f"in {report.duration_in_seconds:.2f}s"
+        )
+        return report
+
+    @classmethod
+    def get_members_and_products_in_next_growing_period(
+        cls, cache: dict
+    ) -> set[tuple[str, str]]:
+        next_growing_period = get_next_growing_period(cache=cache)
+        if not next_growing_period:
+            return set()
 
-        for subscription in get_active_subscriptions():
-            if cls.must_subscription_be_renewed(subscription, cache=cache):
-                subscription = cls.build_renewed_subscription(subscription, cache=cache)
-                subscription.save()
+        return set(
+            Subscription.objects.filter(period=next_growing_period).values_list(
+                "member_id", "product_id"
+            )
+        )
 
     @classmethod
     def must_subscription_be_renewed(
-        cls, subscription: Subscription, cache: dict
+        cls,
+        subscription: Subscription,
+        cache: dict,
+        members_and_products_in_next_growing_period: set[tuple[str, str]] | None = None,
     ) -> bool:
         if not get_parameter_value(
             ParameterKeys.SUBSCRIPTION_AUTOMATIC_RENEWAL, cache=cache
@@ -45,11 +117,17 @@ class AutomaticSubscriptionRenewalService:
         if not next_growing_period:
             return False
 
-        if Subscription.objects.filter(
-            member=subscription.member,
-            period=next_growing_period,
-            product=subscription.product,
-        ).exists():
+        if members_and_products_in_next_growing_period is None:
+            if Subscription.objects.filter(
+                member=subscription.member,
+                period=next_growing_period,
+                product=subscription.product,
+            ).exists():
+                return False
+        elif (
+            subscription.member_id,
+            subscription.product_id,
+        ) in members_and_products_in_next_growing_period:
             return False
 
         max_cancellation_date = (
@@ -141,14 +219,6 @@ class AutomaticSubscriptionRenewalService:
             current_growing_period.start_date, cache
         )
 
-        members_ids_currently_subbed_to_product_id = {
-            product.id: set() for product in TapirCache.get_all_products(cache)
-        }
-        for subscription in current_subscriptions:
-            members_ids_currently_subbed_to_product_id[subscription.product_id].add(
-                subscription.member_id
-            )
-
         end_of_previous_growing_period = (
             current_growing_period.start_date - datetime.timedelta(days=1)
         )
@@ -158,6 +228,68 @@ class AutomaticSubscriptionRenewalService:
             )
         )
 
+        return cls.filter_subscriptions_that_will_be_renewed(
+            current_subscriptions=current_subscriptions,
+            subscriptions_from_previous_growing_period=subscriptions_from_previous_growing_period,
+            reference_date=reference_date,
+            cache=cache,
+        )
+
+    @classmethod
+    def get_subscriptions_of_member_that_will_be_renewed(
+        cls, member_id: str, reference_date: datetime.date, cache: dict
+    ) -> set[Subscription]:
+        if not get_parameter_value(ParameterKeys.SUBSCRIPTION_AUTOMATIC_RENEWAL, cache):
+            return set()
+
+        current_growing_period = TapirCache.get_growing_period_at_date(
+            reference_date=reference_date, cache=cache
+        )
+        if current_growing_period is None:
+            return set()
+
+        member_subscriptions = TapirCache.get_subscriptions_of_member(
+            cache=cache, member_id=member_id
+        )
+        end_of_previous_growing_period = (
+            current_growing_period.start_date - datetime.timedelta(days=1)
+        )
+
+        return cls.filter_subscriptions_that_will_be_renewed(
+            current_subscriptions={
+                subscription
+                for subscription in member_subscriptions
+                if cls.is_subscription_active_at_date(
+                    subscription, current_growing_period.start_date
+                )
+            },
+            subscriptions_from_previous_growing_period={
+                subscription
+                for subscription in member_subscriptions
+                if cls.is_subscription_active_at_date(
+                    subscription, end_of_previous_growing_period
+                )
+            },
+            reference_date=reference_date,
+            cache=cache,
+        )
+
+    @classmethod
+    def filter_subscriptions_that_will_be_renewed(
+        cls,
+        current_subscriptions: set[Subscription],
+        subscriptions_from_previous_growing_period: set[Subscription],
+        reference_date: datetime.date,
+        cache: dict,
+    ) -> set[Subscription]:
+        members_ids_currently_subbed_to_product_id = {
+            product.id: set() for product in TapirCache.get_all_products(cache)
+        }
+        for subscription in current_subscriptions:
+            members_ids_currently_subbed_to_product_id[subscription.product_id].add(
+                subscription.member_id
+            )
+
         return {
             subscription
             for subscription in subscriptions_from_previous_growing_period
@@ -173,6 +305,48 @@ class AutomaticSubscriptionRenewalService:
             is not None
         }
 
+    @classmethod
+    def is_subscription_active_at_date(
+        cls, subscription: Subscription, reference_date: datetime.date
+    ) -> bool:
+        return subscription.start_date <= reference_date and (
+            subscription.end_date is None or reference_date <= subscription.end_date
+        )
+
+    @classmethod
+    def get_subscriptions_and_renewals_of_member(
+        cls, member_id: str, reference_date: datetime.date, cache: dict
+    ) -> set[Subscription]:
+        key = "subscriptions_and_renewals_by_member_id"
+        TapirCacheManager.register_key_in_category(
+            cache=cache, key=key, category=TapirCacheManager.CATEGORY_SUBSCRIPTIONS
+        )
+
+        def compute():
+            subscriptions = {
+                subscription
+                for subscription in TapirCache.get_subscriptions_of_member(
+                    cache=cache, member_id=member_id
+                )
+                if cls.is_subscription_active_at_date(subscription, reference_date)
+            }
+            subscriptions.update(
+                cls.get_subscriptions_of_member_that_will_be_renewed(
+                    member_id=member_id, reference_date=reference_date, cache=cache
+                )
+            )
+            return subscriptions
+
+        subscriptions_and_renewals_by_member_id = get_from_cache_or_compute(
+            cache, key, lambda: {}
+        )
+        subscriptions_and_renewals_by_date = get_from_cache_or_compute(
+            subscriptions_and_renewals_by_member_id, member_id, lambda: {}
+        )
+        return get_from_cache_or_compute(
+            subscriptions_and_renewals_by_date, reference_date, compute
+        )
+
     @classmethod
     def get_subscriptions_and_renewals(
         cls,
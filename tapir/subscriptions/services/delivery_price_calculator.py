@@ -1,7 +1,7 @@
 import datetime
 from decimal import Decimal
 
-from tapir.deliveries.services.delivery_cycle_service import DeliveryCycleService
+from tapir.deliveries.services.delivery_date_calculator import DeliveryDateCalculator
 from tapir.wirgarten.constants import (
     ODD_WEEKS,
     EVEN_WEEKS,
@@ -52,8 +52,11 @@ class DeliveryPriceCalculator:
         delivered_subscription_ids = [
             subscription.id
             for subscription in subscriptions
-            if DeliveryCycleService.is_product_type_delivered_in_week(
-                product_type=subscription.product.type, date=reference_date, cache=cache
+            if DeliveryDateCalculator.is_week_delivered(
+                product_type=subscription.product.type,
+                delivery_date=reference_date,
+                check_for_weeks_without_delivery=False,
+                cache=cache,
             )
         ]
 
@@ -7,9 +7,8 @@ from tapir.subscriptions.services.product_type_lowest_free_capacity_after_date_g
     ProductTypeLowestFreeCapacityAfterDateCalculator,
 )
 from tapir.utils.services.tapir_cache import TapirCache
-from tapir.utils.shortcuts import get_monday
+from tapir.utils.shortcuts import get_from_cache_or_compute, get_monday
 from tapir.wirgarten.models import Product
-from tapir.wirgarten.service.products import get_active_subscriptions
 
 
 class ProductCapacityChecker:
@@ -35,15 +34,11 @@ class ProductCapacityChecker:
 
         capacity_used_by_the_current_subscriptions = 0
         if member_id is not None:
-            subscription = (
-                get_active_subscriptions(
-                    reference_date=subscription_start_date, cache=cache
-                )
-                .filter(member_id=member_id)
-                .first()
-            )
-            if subscription is not None:
-                capacity_used_by_the_current_subscriptions = subscription.quantity
+            subscriptions = TapirCache.get_active_subscriptions_by_member_id(
+                cache=cache, reference_date=subscription_start_date
+            ).get(member_id, [])
+            if len(subscriptions) > 0:
+                capacity_used_by_the_current_subscriptions = subscriptions[0].quantity
 
         return (
             total_capacity
@@ -56,6 +51,21 @@ class ProductCapacityChecker:
     @classmethod
     def get_highest_capacity_usage_after_date(
         cls, product: Product, reference_date: datetime.date, cache: dict
+    ):
+        highest_usage_by_product_and_date = get_from_cache_or_compute(
+            cache, "highest_capacity_usage_by_product_and_date", lambda: {}
+        )
+        return get_from_cache_or_compute(
+            highest_usage_by_product_and_date,
+            (product.id, reference_date),
+            lambda: cls._compute_highest_capacity_usage_after_date(
+                product=product, reference_date=reference_date, cache=cache
+            ),
+        )
+
+    @classmethod
+    def _compute_highest_capacity_usage_after_date(
+        cls, product: Product, reference_date: datetime.date, cache: dict
     ):
         current_date = get_monday(reference_date)
 
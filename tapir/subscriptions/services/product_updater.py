@@ -4,6 +4,7 @@ from django.db import transaction
 
 from tapir.pickup_locations.models import ProductBasketSizeEquivalence
 from tapir.products.serializers import ExtendedProductSerializer
+from tapir.utils.services.tapir_cache_manager import TapirCacheManager
 from tapir.wirgarten.models import Product
 from tapir.wirgarten.service.products import update_product
 
@@ -44,3 +45,6 @@ class ProductUpdater:
                 for equivalence in serializer.validated_data["basket_size_equivalences"]
             ]
         )
+        TapirCacheManager.clear_category(
+            cache=None, category=TapirCacheManager.CATEGORY_PRODUCTS
+        )
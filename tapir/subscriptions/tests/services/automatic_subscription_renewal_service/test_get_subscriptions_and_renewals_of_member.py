@@ -0,0 +1,86 @@
+import datetime
+
+from tapir.subscriptions.services.automatic_subscription_renewal_service import (
+    AutomaticSubscriptionRenewalService,
+)
+from tapir.wirgarten.parameter_keys import ParameterKeys
+from tapir.wirgarten.parameters import ParameterDefinitions
+from tapir.wirgarten.tests.factories import (
+    GrowingPeriodFactory,
+    ProductCapacityFactory,
+    ProductFactory,
+    SubscriptionFactory,
+)
+from tapir.wirgarten.tests.test_utils import TapirIntegrationTest
+
+
+class TestGetSubscriptionsAndRenewalsOfMember(TapirIntegrationTest):
+    @classmethod
+    def setUpTestData(cls):
+        ParameterDefinitions().import_definitions(bulk_create=True)
+        cls._set_parameter(key=ParameterKeys.SUBSCRIPTION_AUTOMATIC_RENEWAL, value=True)
+
+        cls.product = ProductFactory.create()
+        cls.past_growing_period = GrowingPeriodFactory.create(
+            start_date=datetime.date(year=2024, month=1, day=1)
+        )
+        cls.current_growing_period = GrowingPeriodFactory.create(
+            start_date=datetime.date(year=2025, month=1, day=1)
+        )
+        ProductCapacityFactory(
+            period=cls.current_growing_period, product_type=cls.product.type
+        )
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.subscription_to_renew = SubscriptionFactory.create(
+            period=self.past_growing_period, product=self.product
+        )
+        self.current_subscription = SubscriptionFactory.create(
+            member=self.subscription_to_renew.member,
+            period=self.current_growing_period,
+            product=ProductFactory.create(type=self.product.type),
+        )
+        self.subscription_of_other_member = SubscriptionFactory.create(
+            period=self.current_growing_period, product=self.product
+        )
+
+    def test_getSubscriptionsAndRenewalsOfMember_default_returnsActiveSubscriptionsAndRenewalsOfTheMember(
+        self,
+    ):
+        result = AutomaticSubscriptionRenewalService.get_subscriptions_and_renewals_of_member(
+            member_id=self.subscription_to_renew.member_id,
+            reference_date=datetime.date(year=2025, month=3, day=2),
+            cache={},
+        )
+
+        self.assertEqual(
+            {self.subscription_to_renew, self.current_subscription}, result
+        )
+
+    def test_getSubscriptionsAndRenewalsOfMember_default_sameResultAsFilteringAllSubscriptionsAndRenewals(
+        self,
+    ):
+        for reference_date in [
+            datetime.date(year=2024, month=6, day=2),
+            datetime.date(year=2025, month=3, day=2),
+            datetime.date(year=2026, month=3, day=1),
+        ]:
+            for member_id in [
+                self.subscription_to_renew.member_id,
+                self.subscription_of_other_member.member_id,
+            ]:
+                expected = (
+                    AutomaticSubscriptionRenewalService.get_subscriptions_and_renewals(
+                        reference_date=reference_date,
+                        subscription_filter=lambda subscription: subscription.member_id
+                        == member_id,
+                        cache={},
+                    )
+                )
+
+                result = AutomaticSubscriptionRenewalService.get_subscriptions_and_renewals_of_member(
+                    member_id=member_id, reference_date=reference_date, cache={}
+                )
+
+                self.assertEqual(expected, result)
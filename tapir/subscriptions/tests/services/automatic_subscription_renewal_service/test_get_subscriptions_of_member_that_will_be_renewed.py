@@ -0,0 +1,92 @@
+import datetime
+
+from tapir.subscriptions.services.automatic_subscription_renewal_service import (
+    AutomaticSubscriptionRenewalService,
+)
+from tapir.wirgarten.parameter_keys import ParameterKeys
+from tapir.wirgarten.parameters import ParameterDefinitions
+from tapir.wirgarten.tests.factories import (
+    SubscriptionFactory,
+    ProductCapacityFactory,
+    GrowingPeriodFactory,
+    ProductFactory,
+)
+from tapir.wirgarten.tests.test_utils import TapirIntegrationTest
+
+
+class TestGetSubscriptionsOfMemberThatWillBeRenewed(TapirIntegrationTest):
+    @classmethod
+    def setUpTestData(cls):
+        ParameterDefinitions().import_definitions(bulk_create=True)
+        cls._set_parameter(key=ParameterKeys.SUBSCRIPTION_AUTOMATIC_RENEWAL, value=True)
+
+        cls.product = ProductFactory.create()
+        cls.new_growing_period = GrowingPeriodFactory.create(
+            start_date=datetime.date(year=2025, month=1, day=1)
+        )
+        ProductCapacityFactory(
+            period=cls.new_growing_period, product_type=cls.product.type
+        )
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.subscription = SubscriptionFactory.create(
+            period__start_date=datetime.date(year=2024, month=1, day=1),
+            product=self.product,
+        )
+        self.other_subscription = SubscriptionFactory.create(
+            period=self.subscription.period, product=self.product
+        )
+
+    def test_getSubscriptionsOfMemberThatWillBeRenewed_default_onlyReturnsSubscriptionsOfTheGivenMember(
+        self,
+    ):
+        result = AutomaticSubscriptionRenewalService.get_subscriptions_of_member_that_will_be_renewed(
+            member_id=self.subscription.member_id,
+            reference_date=datetime.date(year=2025, month=1, day=1),
+            cache={},
+        )
+
+        self.assertEqual({self.subscription}, result)
+
+    def test_getSubscriptionsOfMemberThatWillBeRenewed_memberAlreadyHasASubscriptionForTheSameProduct_subscriptionNotReturned(
+        self,
+    ):
+        SubscriptionFactory.create(
+            member=self.subscription.member,
+            product=self.subscription.product,
+            period=self.new_growing_period,
+        )
+
+        result = AutomaticSubscriptionRenewalService.get_subscriptions_of_member_that_will_be_renewed(
+            member_id=self.subscription.member_id,
+            reference_date=datetime.date(year=2025, month=1, day=1),
+            cache={},
+        )
+
+        self.assertEqual(set(), result)
+
+    def test_getSubscriptionsOfMemberThatWillBeRenewed_default_sameResultAsFilteringAllRenewedSubscriptions(
+        self,
+    ):
+        reference_date = datetime.date(year=2025, month=1, day=1)
+        all_renewed_subscriptions = (
+            AutomaticSubscriptionRenewalService.get_subscriptions_that_will_be_renewed(
+                reference_date=reference_date, cache={}
+            )
+        )
+
+        for subscription in [self.subscription, self.other_subscription]:
+            result = AutomaticSubscriptionRenewalService.get_subscriptions_of_member_that_will_be_renewed(
+                member_id=subscription.member_id,
+                reference_date=reference_date,
+                cache={},
+            )
+            self.assertEqual(
+                {
+                    renewed_subscription
+                    for renewed_subscription in all_renewed_subscriptions
+                    if renewed_subscription.member_id == subscription.member_id
+                },
+                result,
+            )
@@ -5,6 +5,7 @@ from tapir.wirgarten.tests.test_utils import TapirUnitTest
 from tapir.subscriptions.services.automatic_subscription_renewal_service import (
     AutomaticSubscriptionRenewalService,
 )
+from tapir.wirgarten.models import Subscription
 from tapir.wirgarten.parameter_keys import ParameterKeys
 
 
@@ -31,6 +32,14 @@ class TestRenewSubscriptionIfNecessary(TapirUnitTest):
 
         mock_build_renewed_subscription.assert_not_called()
 
+    @patch(
+        "tapir.subscriptions.services.automatic_subscription_renewal_service.transaction"
+    )
+    @patch.object(Subscription, "objects")
+    @patch.object(
+        AutomaticSubscriptionRenewalService,
+        "get_members_and_products_in_next_growing_period",
+    )
     @patch.object(AutomaticSubscriptionRenewalService, "build_renewed_subscription")
     @patch.object(AutomaticSubscriptionRenewalService, "must_subscription_be_renewed")
     @patch(
@@ -45,10 +54,19 @@ class TestRenewSubscriptionIfNecessary(TapirUnitTest):
         mock_get_active_subscriptions: Mock,
         mock_must_subscription_be_renewed: Mock,
         mock_build_renewed_subscription: Mock,
+        mock_get_members_and_products_in_next_growing_period: Mock,
+        mock_subscription_objects: Mock,
+        mock_transaction: Mock,
     ):
         mock_get_parameter_value.return_value = True
-        subscription = Mock
-        mock_get_active_subscriptions.return_value = [subscription]
+        subscription = Mock()
+        mock_get_active_subscriptions.return_value.select_related.return_value = [
+            subscription
+        ]
+        members_and_products_in_next_growing_period = set()
+        mock_get_members_and_products_in_next_growing_period.return_value = (
+            members_and_products_in_next_growing_period
+        )
         mock_must_subscription_be_renewed.return_value = False
 
         AutomaticSubscriptionRenewalService.renew_subscriptions_if_necessary()
@@ -57,10 +75,21 @@ class TestRenewSubscriptionIfNecessary(TapirUnitTest):
             ParameterKeys.SUBSCRIPTION_AUTOMATIC_RENEWAL, cache=ANY
         )
         mock_must_subscription_be_renewed.assert_called_once_with(
-            subscription, cache=ANY
+            subscription,
+            cache=ANY,
+            members_and_products_in_next_growing_period=members_and_products_in_next_growing_period,
         )
         mock_build_renewed_subscription.assert_not_called()
+        mock_subscription_objects.bulk_create.assert_called_once_with([])
 
+    @patch(
+        "tapir.subscriptions.services.automatic_subscription_renewal_service.transaction"
+    )
+    @patch.object(Subscription, "objects")
+    @patch.object(
+        AutomaticSubscriptionRenewalService,
+        "get_members_and_products_in_next_growing_period",
+    )
     @patch.object(AutomaticSubscriptionRenewalService, "build_renewed_subscription")
     @patch.object(AutomaticSubscriptionRenewalService, "must_subscription_be_renewed")
     @patch(
@@ -75,10 +104,19 @@ class TestRenewSubscriptionIfNecessary(TapirUnitTest):
         mock_get_active_subscriptions: Mock,
         mock_must_subscription_be_renewed: Mock,
         mock_build_renewed_subscription: Mock,
+        mock_get_members_and_products_in_next_growing_period: Mock,
+        mock_subscription_objects: Mock,
+        mock_transaction: Mock,
     ):
         mock_get_parameter_value.return_value = True
-        subscription = Mock
-        mock_get_active_subscriptions.return_value = [subscription]
+        subscription = Mock()
+        mock_get_active_subscriptions.return_value.select_related.return_value = [
+            subscription
+        ]
+        members_and_products_in_next_growing_period = set()
+        mock_get_members_and_products_in_next_growing_period.return_value = (
+            members_and_products_in_next_growing_period
+        )
         mock_must_subscription_be_renewed.return_value = True
 
         AutomaticSubscriptionRenewalService.renew_subscriptions_if_necessary()
@@ -87,6 +125,11 @@ class TestRenewSubscriptionIfNecessary(TapirUnitTest):
             ParameterKeys.SUBSCRIPTION_AUTOMATIC_RENEWAL, cache=ANY
         )
         mock_must_subscription_be_renewed.assert_called_once_with(
-            subscription, cache=ANY
+            subscription,
+            cache=ANY,
+            members_and_products_in_next_growing_period=members_and_products_in_next_growing_period,
         )
         mock_build_renewed_subscription.assert_called_once_with(subscription, cache=ANY)
+        mock_subscription_objects.bulk_create.assert_called_once_with(
+            [mock_build_renewed_subscription.return_value]
+        )
@@ -0,0 +1,93 @@
+import datetime
+
+from tapir.subscriptions.services.automatic_subscription_renewal_service import (
+    AutomaticSubscriptionRenewalService,
+)
+from tapir.wirgarten.models import Subscription
+from tapir.wirgarten.parameter_keys import ParameterKeys
+from tapir.wirgarten.parameters import ParameterDefinitions
+from tapir.wirgarten.tests.factories import (
+    GrowingPeriodFactory,
+    MemberFactory,
+    ProductCapacityFactory,
+    ProductFactory,
+    SubscriptionFactory,
+)
+from tapir.wirgarten.tests.test_utils import TapirIntegrationTest, mock_timezone
+
+
+class TestRenewSubscriptionsIfNecessaryIntegration(TapirIntegrationTest):
+    @classmethod
+    def setUpTestData(cls):
+        ParameterDefinitions().import_definitions(bulk_create=True)
+
+    def setUp(self) -> None:
+        super().setUp()
+        mock_timezone(self, datetime.datetime(year=2025, month=11, day=15))
+        self._set_parameter(ParameterKeys.SUBSCRIPTION_AUTOMATIC_RENEWAL, True)
+
+        self.current_growing_period = GrowingPeriodFactory.create(
+            start_date=datetime.date(year=2025, month=1, day=1),
+            end_date=datetime.date(year=2025, month=12, day=31),
+        )
+        self.next_growing_period = GrowingPeriodFactory.create(
+            start_date=datetime.date(year=2026, month=1, day=1),
+            end_date=datetime.date(year=2026, month=12, day=31),
+        )
+        self.product = ProductFactory.create()
+        ProductCapacityFactory.create(
+            period=self.current_growing_period, product_type=self.product.type
+        )
+
+    def test_renewSubscriptionsIfNecessary_default_createsRenewedSubscriptionsInOneBatch(
+        self,
+    ):
+        member_to_renew = MemberFactory.create()
+        SubscriptionFactory.create(
+            member=member_to_renew,
+            product=self.product,
+            period=self.current_growing_period,
+            quantity=2,
+        )
+        member_already_renewed = MemberFactory.create()
+        for growing_period in [self.current_growing_period, self.next_growing_period]:
+            SubscriptionFactory.create(
+                member=member_already_renewed,
+                product=self.product,
+                period=growing_period,
+            )
+
+        report = AutomaticSubscriptionRenewalService.renew_subscriptions_if_necessary()
+
+        self.assertEqual(2, report.nb_active_subscriptions)
+        self.assertEqual(1, report.nb_renewed_subscriptions)
+
+        renewed_subscription = Subscription.objects.get(
+            member=member_to_renew, period=self.next_growing_period
+        )
+        self.assertEqual(2, renewed_subscription.quantity)
+        self.assertEqual(self.product, renewed_subscription.product)
+        self.assertEqual(
+            self.next_growing_period.start_date, renewed_subscription.start_date
+        )
+        self.assertEqual(
+            1,
+            Subscription.objects.filter(
+                member=member_already_renewed, period=self.next_growing_period
+            ).count(),
+        )
+
+    def test_renewSubscriptionsIfNecessary_calledTwice_secondCallDoesNotCreateDuplicates(
+        self,
+    ):
+        SubscriptionFactory.create(
+            product=self.product, period=self.current_growing_period
+        )
+
+        AutomaticSubscriptionRenewalService.renew_subscriptions_if_necessary()
+        report = AutomaticSubscriptionRenewalService.renew_subscriptions_if_necessary()
+
+        self.assertEqual(0, report.nb_renewed_subscriptions)
+        self.assertEqual(
+            1, Subscription.objects.filter(period=self.next_growing_period).count()
+        )
@@ -29,6 +29,7 @@ from tapir.subscriptions.services.order_confirmation_mail_sender import (
 )
 from tapir.subscriptions.services.trial_period_manager import TrialPeriodManager
 from tapir.utils.services.tapir_cache import TapirCache
+from tapir.utils.services.tapir_cache_manager import TapirCacheManager
 from tapir.wirgarten.mail_events import Events
 from tapir.wirgarten.models import (
     Member,
@@ -342,6 +343,7 @@ class ConfirmSubscriptionChangesView(APIView):
             )
 
         objects_to_confirm.update(**{confirmation_field: get_now(cache=cache)})
+        TapirCacheManager.clear_categories_of_model(cache=cache, model=model)
 
 
 class RevokeChangesApiView(APIView):
@@ -497,6 +499,9 @@ class RevokeChangesApiView(APIView):
                 for subscription in subscriptions
             ],
         )
+        TapirCacheManager.clear_category(
+            cache=cache, category=TapirCacheManager.CATEGORY_WAITING_LIST
+        )
 
     @staticmethod
     def delete_objects_or_404[T: Model](
@@ -0,0 +1,118 @@
+import datetime
+from typing import Callable, Iterable
+
+
+class DateRangeIndexNode[T]:
+    def __init__(
+        self,
+        center: datetime.date,
+        ranges: list[tuple[datetime.date, datetime.date, T]],
+        left: "DateRangeIndexNode[T] | None",
+        right: "DateRangeIndexNode[T] | None",
+    ):
+        self.center = center
+        self.ranges_by_start = sorted(ranges, key=lambda date_range: date_range[0])
+        self.ranges_by_end_descending = sorted(
+            ranges, key=lambda date_range: date_range[1], reverse=True
+        )
+        self.left = left
+        self.right = right
+
+
+class DateRangeIndex[T]:
+    """
+    Centered interval tree over objects that have a start date and an optional end date.
+    It is built once and then answers "active at date" and "overlapping with range" queries
+    in O(log n + number of results) instead of scanning all objects for every date.
+
+    Both bounds are inclusive, an end date of None means that the object never ends.
+    """
+
+    def __init__(
+        self,
+        objects: Iterable[T],
+        get_start_date: Callable[[T], datetime.date] = lambda obj: obj.start_date,
+        get_end_date: Callable[[T], datetime.date | None] = lambda obj: obj.end_date,
+    ):
+        ranges = []
+        for obj in objects:
+            start_date = get_start_date(obj)
+            end_date = get_end_date(obj) or datetime.date.max
+            if end_date < start_date:
+                # Such an object is never active, and it would break the tree construction
+                continue
+            ranges.append((start_date, end_date, obj))
+
+        self.root = self.build_node(ranges)
+
+    @classmethod
+    def build_node(
+        cls, ranges: list[tuple[datetime.date, datetime.date, T]]
+    ) -> DateRangeIndexNode[T] | None:
+        if len(ranges) == 0:
+            return None
+
+        endpoints = sorted(
+            date
+            for start_date, end_date, _ in ranges
+            for date in (start_date, end_date)
+        )
+        center = endpoints[len(endpoints) // 2]
+
+        ranges_before_center = []
+        ranges_after_center = []
+        ranges_containing_center = []
+        for date_range in ranges:
+            start_date, end_date, _ = date_range
+            if end_date < center:
+                ranges_before_center.append(date_range)
+            elif start_date > center:
+                ranges_after_center.append(date_range)
+            else:
+                ranges_containing_center.append(date_range)
+
+        return DateRangeIndexNode(
+            center=center,
+            ranges=ranges_containing_center,
+            left=cls.build_node(ranges_before_center),
+            right=cls.build_node(ranges_after_center),
+        )
+
+    def get_active_at_date(self, reference_date: datetime.date) -> set[T]:
+        return self.get_overlapping_with_range(
+            range_start=reference_date, range_end=reference_date
+        )
+
+    def get_overlapping_with_range(
+        self, range_start: datetime.date, range_end: datetime.date | None
+    ) -> set[T]:
+        if range_end is None:
+            range_end = datetime.date.max
+
+        result = set()
+        nodes_to_visit = [self.root]
+        while nodes_to_visit:
+            node = nodes_to_visit.pop()
+            if node is None:
+                continue
+
+            if range_end < node.center:
+                # All ranges of this node end after the given range, only the start date matters
+                for start_date, _, obj in node.ranges_by_start:
+                    if start_date > range_end:
+                        break
+                    result.add(obj)
+                nodes_to_visit.append(node.left)
+            elif range_start > node.center:
+                # All ranges of this node start before the given range, only the end date matters
+                for _, end_date, obj in node.ranges_by_end_descending:
+                    if end_date < range_start:
+                        break
+                    result.add(obj)
+                nodes_to_visit.append(node.right)
+            else:
+                result.update(obj for _, _, obj in node.ranges_by_start)
+                nodes_to_visit.append(node.left)
+                nodes_to_visit.append(node.right)
+
+        return result
@@ -0,0 +1,76 @@
+import bisect
+import datetime
+from typing import Iterable
+
+from tapir.wirgarten.models import ProductPrice
+
+
+class ProductPriceTimeline:
+    """
+    All the prices of all products, sorted by valid_from for each product.
+    A price is valid from its valid_from date until the valid_from of the next price of the same product.
+    Lookups are binary searches over the valid_from dates of the product.
+    """
+
+    def __init__(self, prices: Iterable[ProductPrice]):
+        prices_by_product_id: dict[str, list[ProductPrice]] = {}
+        for price in prices:
+            prices_by_product_id.setdefault(price.product_id, []).append(price)
+
+        self.prices_by_product_id: dict[str, list[ProductPrice]] = {}
+        self.valid_from_dates_by_product_id: dict[str, list[datetime.date]] = {}
+        for product_id, prices_of_product in prices_by_product_id.items():
+            prices_of_product.sort(key=lambda price: price.valid_from)
+            self.prices_by_product_id[product_id] = prices_of_product
+            self.valid_from_dates_by_product_id[product_id] = [
+                price.valid_from for price in prices_of_product
+            ]
+
+    @classmethod
+    def load(cls) -> "ProductPriceTimeline":
+        return cls(ProductPrice.objects.all())
+
+    def get_prices(self, product_id: str) -> list[ProductPrice]:
+        return self.prices_by_product_id.get(product_id, [])
+
+    def get_index_of_price_at_date(
+        self, product_id: str, reference_date: datetime.date
+    ) -> int | None:
+        valid_from_dates = self.valid_from_dates_by_product_id.get(product_id)
+        if not valid_from_dates:
+            return None
+
+        # If no price is defined at the reference date, the closest available price is the oldest one
+        return max(0, bisect.bisect_right(valid_from_dates, reference_date) - 1)
+
+    def get_price_at_date(
+        self, product_id: str, reference_date: datetime.date
+    ) -> ProductPrice | None:
+        index = self.get_index_of_price_at_date(product_id, reference_date)
+        if index is None:
+            return None
+        return self.prices_by_product_id[product_id][index]
+
+    def get_prices_at_date(
+        self, product_ids: Iterable[str], reference_date: datetime.date
+    ) -> dict[str, ProductPrice | None]:
+        return {
+            product_id: self.get_price_at_date(product_id, reference_date)
+            for product_id in product_ids
+        }
+
+    def get_prices_in_range(
+        self,
+        product_id: str,
+        range_start: datetime.date,
+        range_end: datetime.date,
+    ) -> list[ProductPrice]:
+        """
+        The prices that are valid on at least one day of the range, both bounds inclusive, in chronological order.
+        """
+        first_index = self.get_index_of_price_at_date(product_id, range_start)
+        if first_index is None:
+            return []
+
+        last_index = self.get_index_of_price_at_date(product_id, range_end)
+        return self.prices_by_product_id[product_id][first_index : last_index + 1]
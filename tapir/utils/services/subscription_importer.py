@@ -15,6 +15,7 @@ from tapir.utils.config import (
 )
 from tapir.utils.exceptions import TapirDataImportException
 from tapir.utils.services.data_import_utils import DataImportUtils
+from tapir.utils.services.tapir_cache_manager import TapirCacheManager
 from tapir.wirgarten.constants import NO_DELIVERY
 from tapir.wirgarten.models import Member, GrowingPeriod, Product, Subscription
 from tapir.wirgarten.utils import get_today
@@ -136,6 +137,9 @@ class SubscriptionImporter:
             Subscription.objects.filter(id=subscription.id).update(
                 created_at=F("start_date")
             )
+            TapirCacheManager.clear_category(
+                cache=None, category=TapirCacheManager.CATEGORY_SUBSCRIPTIONS
+            )
             import_status = MEMBER_IMPORT_STATUS_CREATED
 
         cls.update_trial_period_for_solidarity_contributions(member, subscription)
@@ -233,3 +237,7 @@ class SubscriptionImporter:
             contributions.update(
                 trial_end_date_override=subscription.trial_end_date_override
             )
+
+        TapirCacheManager.clear_category(
+            cache=None, category=TapirCacheManager.CATEGORY_SOLIDARITY_CONTRIBUTIONS
+        )
@@ -18,13 +18,15 @@ from tapir.pickup_locations.models import PickupLocationDeliveryCharge
 from tapir.pickup_locations.models import ProductBasketSizeEquivalence
 from tapir.solidarity_contribution.models import SolidarityContribution
 from tapir.subscriptions.models import NoticePeriod
+from tapir.utils.services.date_range_index import DateRangeIndex
+from tapir.utils.services.product_price_timeline import ProductPriceTimeline
 from tapir.utils.services.tapir_cache_manager import TapirCacheManager
+from tapir.utils.services.tapir_shared_cache import TapirSharedCache
 from tapir.utils.shortcuts import get_from_cache_or_compute
 from tapir.wirgarten.models import (
     Subscription,
     ProductType,
     Product,
-    ProductPrice,
     PickupLocation,
     PickupLocationOpeningTime,
     CoopShareTransaction,
@@ -41,19 +43,32 @@ from tapir.wirgarten.utils import get_today
 
 
 class TapirCache:
+    # The related objects are loaded with the subscriptions, so the value changes with any of them
+    ALL_SUBSCRIPTIONS_CATEGORIES = [
+        TapirCacheManager.CATEGORY_SUBSCRIPTIONS,
+        TapirCacheManager.CATEGORY_MEMBERS,
+        TapirCacheManager.CATEGORY_PRODUCTS,
+        TapirCacheManager.CATEGORY_PAYMENTS,
+    ]
+
     @classmethod
     def get_all_subscriptions(cls, cache: dict) -> Set[Subscription]:
         key = "all_subscriptions"
-        TapirCacheManager.register_key_in_category(
-            cache=cache, key=key, category=TapirCacheManager.CATEGORY_SUBSCRIPTIONS
-        )
+        for category in cls.ALL_SUBSCRIPTIONS_CATEGORIES:
+            TapirCacheManager.register_key_in_category(
+                cache=cache, key=key, category=category
+            )
         return get_from_cache_or_compute(
             cache,
             key,
-            lambda: set(
-                Subscription.objects.select_related(
-                    "member", "product", "product__type", "mandate_ref"
-                )
+            lambda: TapirSharedCache.get_from_shared_cache_or_compute_for_categories(
+                shared_key=key,
+                categories=cls.ALL_SUBSCRIPTIONS_CATEGORIES,
+                compute_function=lambda: set(
+                    Subscription.objects.select_related(
+                        "member", "product", "product__type", "mandate_ref"
+                    )
+                ),
             ),
         )
 
@@ -67,6 +82,60 @@ class TapirCache:
             lambda: set(SolidarityContribution.objects.select_related("member")),
         )
 
+    @classmethod
+    def get_subscriptions_of_member(
+        cls, cache: dict, member_id: str
+    ) -> Set[Subscription]:
+        key = "subscriptions_by_member_id"
+        TapirCacheManager.register_key_in_category(
+            cache=cache, key=key, category=TapirCacheManager.CATEGORY_SUBSCRIPTIONS
+        )
+
+        subscriptions_by_member_id = get_from_cache_or_compute(cache, key, lambda: {})
+        return get_from_cache_or_compute(
+            subscriptions_by_member_id,
+            member_id,
+            lambda: set(
+                Subscription.objects.filter(member_id=member_id).select_related(
+                    "member", "product", "product__type", "mandate_ref"
+                )
+            ),
+        )
+
+    @classmethod
+    def get_solidarity_contributions_of_member(
+        cls, cache: dict, member_id: str
+    ) -> Set[SolidarityContribution]:
+        key = "solidarity_contributions_of_member"
+        TapirCacheManager.register_key_in_category(
+            cache=cache,
+            key=key,
+            category=TapirCacheManager.CATEGORY_SOLIDARITY_CONTRIBUTIONS,
+        )
+
+        contributions_by_member_id = get_from_cache_or_compute(cache, key, lambda: {})
+        return get_from_cache_or_compute(
+            contributions_by_member_id,
+            member_id,
+            lambda: set(
+                SolidarityContribution.objects.filter(
+                    member_id=member_id
+                ).select_related("member")
+            ),
+        )
+
+    @classmethod
+    def get_subscriptions_date_range_index(
+        cls, cache: dict
+    ) -> DateRangeIndex[Subscription]:
+        key = "subscriptions_date_range_index"
+        TapirCacheManager.register_key_in_category(
+            cache=cache, key=key, category=TapirCacheManager.CATEGORY_SUBSCRIPTIONS
+        )
+        return get_from_cache_or_compute(
+            cache, key, lambda: DateRangeIndex(cls.get_all_subscriptions(cache))
+        )
+
     @classmethod
     def get_subscriptions_active_at_date(
         cls, reference_date: datetime.date, cache: dict
@@ -76,37 +145,61 @@ class TapirCache:
             cache=cache, key=key, category=TapirCacheManager.CATEGORY_SUBSCRIPTIONS
         )
 
-        def compute():
-            all_subscriptions = cls.get_all_subscriptions(cache)
-            return {
-                subscription
-                for subscription in all_subscriptions
-                if subscription.start_date <= reference_date
-                and (
-                    subscription.end_date is None
-                    or reference_date <= subscription.end_date
-                )
-            }
-
         subscriptions_by_date = get_from_cache_or_compute(cache, key, lambda: {})
-        return get_from_cache_or_compute(subscriptions_by_date, reference_date, compute)
+        return get_from_cache_or_compute(
+            subscriptions_by_date,
+            reference_date,
+            lambda: cls.get_subscriptions_date_range_index(cache).get_active_at_date(
+                reference_date
+            ),
+        )
+
+    @classmethod
+    def get_subscriptions_overlapping_with_range(
+        cls,
+        range_start: datetime.date,
+        range_end: datetime.date | None,
+        cache: dict,
+    ) -> set[Subscription]:
+        return cls.get_subscriptions_date_range_index(cache).get_overlapping_with_range(
+            range_start=range_start, range_end=range_end
+        )
+
+    @classmethod
+    def get_solidarity_contributions_date_range_index(
+        cls, cache: dict
+    ) -> DateRangeIndex[SolidarityContribution]:
+        return get_from_cache_or_compute(
+            cache,
+            "solidarity_contributions_date_range_index",
+            lambda: DateRangeIndex(cls.get_all_solidarity_contributions(cache)),
+        )
 
     @classmethod
     def get_solidarity_contributions_active_at_date(
         cls, reference_date: datetime.date, cache: dict
     ) -> set[SolidarityContribution]:
-        def compute():
-            all_contributions = cls.get_all_solidarity_contributions(cache)
-            return {
-                contribution
-                for contribution in all_contributions
-                if contribution.start_date <= reference_date <= contribution.end_date
-            }
-
         contributions_by_date = get_from_cache_or_compute(
             cache, "solidarity_contributions_by_date", lambda: {}
         )
-        return get_from_cache_or_compute(contributions_by_date, reference_date, compute)
+        return get_from_cache_or_compute(
+            contributions_by_date,
+            reference_date,
+            lambda: cls.get_solidarity_contributions_date_range_index(
+                cache
+            ).get_active_at_date(reference_date),
+        )
+
+    @classmethod
+    def get_solidarity_contributions_overlapping_with_range(
+        cls,
+        range_start: datetime.date,
+        range_end: datetime.date | None,
+        cache: dict,
+    ) -> set[SolidarityContribution]:
+        return cls.get_solidarity_contributions_date_range_index(
+            cache
+        ).get_overlapping_with_range(range_start=range_start, range_end=range_end)
 
     @classmethod
     def get_active_and_future_subscriptions_by_member_id(
@@ -138,6 +231,35 @@ class TapirCache:
             subscriptions_by_date_and_member_id, reference_date, compute
         )
 
+    @classmethod
+    def get_active_subscriptions_by_member_id(
+        cls, cache: dict, reference_date: datetime.date
+    ) -> dict[str, list[Subscription]]:
+        # Same order as get_active_subscriptions
+        key = "active_subscriptions_by_date_and_member_id"
+        TapirCacheManager.register_key_in_category(
+            cache=cache, key=key, category=TapirCacheManager.CATEGORY_SUBSCRIPTIONS
+        )
+
+        def compute():
+            from tapir.wirgarten.service.products import get_active_subscriptions
+
+            subscriptions_by_member_id: dict[str, list[Subscription]] = {}
+            for subscription in get_active_subscriptions(
+                reference_date=reference_date, cache=cache
+            ):
+                subscriptions_by_member_id.setdefault(
+                    subscription.member_id, []
+                ).append(subscription)
+            return subscriptions_by_member_id
+
+        active_subscriptions_by_date_and_member_id = get_from_cache_or_compute(
+            cache, key, lambda: {}
+        )
+        return get_from_cache_or_compute(
+            active_subscriptions_by_date_and_member_id, reference_date, compute
+        )
+
     @classmethod
     def get_subscriptions_by_delivery_cycle(
         cls, cache: dict, delivery_cycle
@@ -220,36 +342,46 @@ class TapirCache:
         )
 
     @classmethod
-    def get_product_prices_by_product_id(cls, cache: dict, product_id: str):
-        product_prices_by_product_id = get_from_cache_or_compute(
-            cache, "product_prices_by_product_id", lambda: {}
+    def get_product_price_timeline(cls, cache: dict) -> ProductPriceTimeline:
+        key = "product_price_timeline"
+        TapirCacheManager.register_key_in_category(
+            cache=cache, key=key, category=TapirCacheManager.CATEGORY_PRODUCT_PRICES
         )
-
-        def compute():
-            return set(
-                ProductPrice.objects.filter(product_id=product_id).order_by(
-                    "valid_from"
-                )
-            )
-
-        return get_from_cache_or_compute(
-            product_prices_by_product_id,
-            product_id,
-            compute,
+        return TapirSharedCache.get_from_cache_or_compute(
+            cache,
+            key,
+            TapirCacheManager.CATEGORY_PRODUCT_PRICES,
+            ProductPriceTimeline.load,
         )
 
+    @classmethod
+    def get_product_prices_by_product_id(cls, cache: dict, product_id: str):
+        return set(cls.get_product_price_timeline(cache=cache).get_prices(product_id))
+
     @classmethod
     def get_all_products(cls, cache: dict):
-        return get_from_cache_or_compute(
+        key = "all_products"
+        TapirCacheManager.register_key_in_category(
+            cache=cache, key=key, category=TapirCacheManager.CATEGORY_PRODUCTS
+        )
+        return TapirSharedCache.get_from_cache_or_compute(
             cache,
-            "all_products",
+            key,
+            TapirCacheManager.CATEGORY_PRODUCTS,
             lambda: set(Product.objects.order_by("id").select_related("type")),
         )
 
     @classmethod
     def get_all_product_types(cls, cache: dict):
-        return get_from_cache_or_compute(
-            cache, "all_product_types", lambda: set(ProductType.objects.order_by("id"))
+        key = "all_product_types"
+        TapirCacheManager.register_key_in_category(
+            cache=cache, key=key, category=TapirCacheManager.CATEGORY_PRODUCTS
+        )
+        return TapirSharedCache.get_from_cache_or_compute(
+            cache,
+            key,
+            TapirCacheManager.CATEGORY_PRODUCTS,
+            lambda: set(ProductType.objects.order_by("id")),
         )
 
     @classmethod
@@ -326,8 +458,12 @@ class TapirCache:
                 for pickup_location in PickupLocation.objects.all()
             }
 
-        pickup_location_by_id_cache = get_from_cache_or_compute(
-            cache, "pickup_location_by_id", lambda: compute()
+        key = "pickup_location_by_id"
+        TapirCacheManager.register_key_in_category(
+            cache=cache, key=key, category=TapirCacheManager.CATEGORY_PICKUP_LOCATIONS
+        )
+        pickup_location_by_id_cache = TapirSharedCache.get_from_cache_or_compute(
+            cache, key, TapirCacheManager.CATEGORY_PICKUP_LOCATIONS, compute
         )
         return pickup_location_by_id_cache.get(pickup_location_id, None)
 
@@ -342,8 +478,12 @@ class TapirCache:
                 for product in Product.objects.select_related("type")
             }
 
-        product_by_id_cache = get_from_cache_or_compute(
-            cache, "product_by_id", lambda: compute()
+        key = "product_by_id"
+        TapirCacheManager.register_key_in_category(
+            cache=cache, key=key, category=TapirCacheManager.CATEGORY_PRODUCTS
+        )
+        product_by_id_cache = TapirSharedCache.get_from_cache_or_compute(
+            cache, key, TapirCacheManager.CATEGORY_PRODUCTS, compute
         )
         return product_by_id_cache.get(product_id, None)
 
@@ -416,8 +556,14 @@ class TapirCache:
                 ] = product_capacity
             return result
 
-        product_type_capacities_by_growing_period = get_from_cache_or_compute(
-            cache, "product_type_capacities_by_growing_period", compute_full
+        key = "product_type_capacities_by_growing_period"
+        TapirCacheManager.register_key_in_category(
+            cache=cache, key=key, category=TapirCacheManager.CATEGORY_CAPACITIES
+        )
+        product_type_capacities_by_growing_period = (
+            TapirSharedCache.get_from_cache_or_compute(
+                cache, key, TapirCacheManager.CATEGORY_CAPACITIES, compute_full
+            )
         )
 
         growing_period = TapirCache.get_growing_period_at_date(
@@ -430,12 +576,27 @@ class TapirCache:
 
     @classmethod
     def get_all_growing_periods_ascending(cls, cache: dict):
-        return get_from_cache_or_compute(
+        key = "all_growing_periods"
+        TapirCacheManager.register_key_in_category(
+            cache=cache, key=key, category=TapirCacheManager.CATEGORY_GROWING_PERIODS
+        )
+        return TapirSharedCache.get_from_cache_or_compute(
             cache,
-            "all_growing_periods",
+            key,
+            TapirCacheManager.CATEGORY_GROWING_PERIODS,
             lambda: list(GrowingPeriod.objects.order_by("start_date")),
         )
 
+    @classmethod
+    def get_growing_periods_date_range_index(
+        cls, cache: dict
+    ) -> DateRangeIndex[GrowingPeriod]:
+        return get_from_cache_or_compute(
+            cache,
+            "growing_periods_date_range_index",
+            lambda: DateRangeIndex(cls.get_all_growing_periods_ascending(cache=cache)),
+        )
+
     @classmethod
     def get_growing_period_at_date(
         cls, reference_date: datetime.date, cache: dict
@@ -444,15 +605,15 @@ class TapirCache:
             reference_date = get_today(cache=cache)
 
         def compute():
-            growing_periods = cls.get_all_growing_periods_ascending(cache=cache)
-            for growing_period in growing_periods:
-                if (
-                    growing_period.start_date
-                    <= reference_date
-                    <= growing_period.end_date
-                ):
-                    return growing_period
-            return None
+            growing_periods = cls.get_growing_periods_date_range_index(
+                cache=cache
+            ).get_active_at_date(reference_date)
+            # Growing periods are not supposed to overlap, but if they do, return the earliest one.
+            return min(
+                growing_periods,
+                key=lambda growing_period: growing_period.start_date,
+                default=None,
+            )
 
         growing_periods_by_date_cache = get_from_cache_or_compute(
             cache, "growing_periods_by_date", lambda: {}
@@ -803,6 +964,28 @@ class TapirCache:
             lambda: set(AssociationMembership.objects.select_related("member", "type")),
         )
 
+    @classmethod
+    def get_association_memberships_of_member(
+        cls, cache: dict, member_id: str
+    ) -> Set[AssociationMembership]:
+        key = "association_memberships_of_member"
+        TapirCacheManager.register_key_in_category(
+            cache=cache,
+            key=key,
+            category=TapirCacheManager.CATEGORY_ASSOCIATION_MEMBERSHIPS,
+        )
+
+        memberships_by_member_id = get_from_cache_or_compute(cache, key, lambda: {})
+        return get_from_cache_or_compute(
+            memberships_by_member_id,
+            member_id,
+            lambda: set(
+                AssociationMembership.objects.filter(
+                    member_id=member_id
+                ).select_related("member", "type")
+            ),
+        )
+
     @classmethod
     def get_member_association_memberships(cls, cache: dict, member: Member):
         cache_by_member_id: dict[str, list[AssociationMembership]] = (
@@ -842,19 +1025,40 @@ class TapirCache:
         )
 
         def compute():
-            for membership in cls.get_member_association_memberships(
-                cache=cache, member=member
-            ):
-                if membership.start_date <= reference_date and (
-                    membership.end_date is None or membership.end_date >= reference_date
-                ):
-                    return membership
-            return None
+            return cls.get_association_memberships_by_member_id_active_at_date(
+                reference_date=reference_date, cache=cache
+            ).get(member.id, None)
 
         return get_from_cache_or_compute(
             cache=cache_by_date, key=reference_date, compute_function=compute
         )
 
+    @classmethod
+    def get_association_memberships_date_range_index(
+        cls, cache: dict
+    ) -> DateRangeIndex[AssociationMembership]:
+        return get_from_cache_or_compute(
+            cache,
+            "association_memberships_date_range_index",
+            lambda: DateRangeIndex(cls.get_all_association_memberships(cache=cache)),
+        )
+
+    @classmethod
+    def get_association_memberships_by_member_id_active_at_date(
+        cls, reference_date: datetime.date, cache: dict
+    ) -> dict[str, AssociationMembership]:
+        memberships_by_date = get_from_cache_or_compute(
+            cache, "association_memberships_by_member_id_by_date", lambda: {}
+        )
+
+        def compute():
+            memberships = cls.get_association_memberships_date_range_index(
+                cache=cache
+            ).get_active_at_date(reference_date)
+            return {membership.member_id: membership for membership in memberships}
+
+        return get_from_cache_or_compute(memberships_by_date, reference_date, compute)
+
     @classmethod
     def get_product_basket_size_equivalence_objects_by_product(cls, cache: dict):
         def compute():
@@ -1,6 +1,239 @@
+import threading
+from contextlib import contextmanager
+
+from django.db.models.signals import post_save, post_delete
+
+_tracked_caches = threading.local()
+
+
 class TapirCacheManager:
     CATEGORY_MEMBER_PICKUP_LOCATIONS = "member_pickup_locations"
     CATEGORY_SUBSCRIPTIONS = "subscriptions"
+    CATEGORY_PARAMETERS = "parameters"
+    CATEGORY_PRODUCTS = "products"
+    CATEGORY_PRODUCT_PRICES = "product_prices"
+    CATEGORY_CAPACITIES = "capacities"
+    CATEGORY_PICKUP_LOCATIONS = "pickup_locations"
+    CATEGORY_GROWING_PERIODS = "growing_periods"
+    CATEGORY_JOKERS = "jokers"
+    CATEGORY_DELIVERIES = "deliveries"
+    CATEGORY_SOLIDARITY_CONTRIBUTIONS = "solidarity_contributions"
+    CATEGORY_COOP_SHARES = "coop_shares"
+    CATEGORY_PAYMENTS = "payments"
+    CATEGORY_ASSOCIATION_MEMBERSHIPS = "association_memberships"
+    CATEGORY_WAITING_LIST = "waiting_list"
+    CATEGORY_MEMBERS = "members"
+
+    # Keys that are always part of their category, in addition to the keys registered with register_key_in_category.
+    # A key can depend on several categories.
+    KEYS_BY_CATEGORY = {
+        CATEGORY_SUBSCRIPTIONS: {
+            "all_subscriptions",
+            "subscriptions_by_member_id",
+            "subscriptions_date_range_index",
+            "subscriptions_by_date",
+            "subscriptions_by_date_and_member_id",
+            "active_subscriptions_by_date_and_member_id",
+            "highest_capacity_usage_by_product_and_date",
+            "pickup_location_highest_share_usage_by_date",
+            "subscriptions_by_delivery_cycle",
+            "subscriptions_affected_by_jokers",
+            "subscriptions_by_product_type",
+            "last_subscription",
+        },
+        CATEGORY_PARAMETERS: {
+            "parameters_by_key",
+            "parameter_cache",
+            "product_types_in_standard_order",
+            "opening_times_by_pickup_location_id",
+            "delivery_week_calendar",
+        },
+        CATEGORY_PRODUCTS: {
+            "all_subscriptions",
+            "product_types_by_id",
+            "product_by_product_type_id",
+            "all_products",
+            "all_product_types",
+            "subscriptions_by_product_type",
+            "products_by_name_iexact",
+            "product_types_in_standard_order",
+            "product_by_id",
+            "tax_rates_by_product_type",
+            "base_product_by_product_type_id",
+            "product_basket_size_equivalence_objects_by_product",
+        },
+        CATEGORY_PRODUCT_PRICES: {
+            "product_price_timeline",
+            "pickup_location_highest_share_usage_by_date",
+        },
+        CATEGORY_CAPACITIES: {
+            "product_type_capacities_by_growing_period",
+        },
+        CATEGORY_PICKUP_LOCATIONS: {
+            "pickup_location_by_id",
+            "opening_times_by_pickup_location_id",
+            "delivery_charges_by_pickup_location_id",
+            "pickup_location_highest_share_usage_by_date",
+        },
+        CATEGORY_MEMBER_PICKUP_LOCATIONS: {
+            "member_pickup_locations_objects_by_member_id",
+            "pickup_location_highest_share_usage_by_date",
+        },
+        CATEGORY_GROWING_PERIODS: {
+            "all_growing_periods",
+            "growing_periods_date_range_index",
+            "growing_periods_by_date",
+            "product_type_capacities_by_growing_period",
+            "notice_period_by_product_type",
+            "highest_capacity_usage_by_product_and_date",
+            "pickup_location_highest_share_usage_by_date",
+            "delivery_week_calendar",
+        },
+        CATEGORY_JOKERS: {
+            "number_of_jokers_used_by_member_in_growing_period",
+            "jokers_by_member_id",
+        },
+        CATEGORY_DELIVERIES: {
+            "delivery_adjustments_by_growing_period_id",
+            "donations_by_member_id",
+            "delivery_weeks_by_product_type_and_growing_period",
+            "scheduled_weeks_by_product_type",
+            "delivery_week_calendar",
+        },
+        CATEGORY_SOLIDARITY_CONTRIBUTIONS: {
+            "all_solidarity_contributions",
+            "solidarity_contributions_of_member",
+            "solidarity_contributions_date_range_index",
+            "solidarity_contributions_by_date",
+            "solidarity_contributions_by_member_id",
+        },
+        CATEGORY_COOP_SHARES: {
+            "unconfirmed_coop_share_transactions_by_member_id",
+            "unconfirmed_coop_share_purchases",
+            "coop_share_transaction_by_member_id",
+        },
+        CATEGORY_PAYMENTS: {
+            "all_subscriptions",
+            "payment_rhythms_by_member",
+            "payments_by_mandate_ref_and_type",
+            "credits_by_member",
+            "mandate_ref_cache",
+        },
+        CATEGORY_ASSOCIATION_MEMBERSHIPS: {
+            "all_association_memberships",
+            "association_memberships_of_member",
+            "association_memberships_by_member_id",
+            "association_memberships_by_member_id_and_date",
+            "association_memberships_date_range_index",
+            "association_memberships_by_member_id_by_date",
+            "association_membership_type_prices_by_type",
+            "membership_type_prices_by_type_and_date",
+        },
+        CATEGORY_WAITING_LIST: {
+            "waiting_list_reserved_capacities_by_product_type_and_pickup_location",
+        },
+        CATEGORY_MEMBERS: {
+            "all_subscriptions",
+        },
+    }
+
+    # Keys that hold a dict by member id where each entry only depends on the data of that member:
+    # when an object that belongs to a member changes, only the entry of that member has to be cleared.
+    MEMBER_SCOPED_KEYS = {
+        "subscriptions_by_member_id",
+        "solidarity_contributions_of_member",
+        "solidarity_contributions_by_member_id",
+        "number_of_jokers_used_by_member_in_growing_period",
+        "donations_by_member_id",
+        "association_memberships_of_member",
+        "association_memberships_by_member_id_and_date",
+    }
+
+    @classmethod
+    def get_models_by_category(cls) -> dict[str, list]:
+        from tapir.associations.models import (
+            AssociationMembership,
+            AssociationMembershipType,
+            AssociationMembershipTypePrice,
+        )
+        from tapir.configuration.models import TapirParameter
+        from tapir.deliveries.models import (
+            CustomCycleScheduledDeliveryWeek,
+            DeliveryDayAdjustment,
+            DeliveryDonation,
+            Joker,
+        )
+        from tapir.payments.models import MemberCredit, MemberPaymentRhythm
+        from tapir.pickup_locations.models import (
+            PickupLocationDeliveryCharge,
+            ProductBasketSizeEquivalence,
+        )
+        from tapir.solidarity_contribution.models import SolidarityContribution
+        from tapir.subscriptions.models import NoticePeriod
+        from tapir.wirgarten.models import (
+            CoopShareTransaction,
+            GrowingPeriod,
+            MandateReference,
+            Member,
+            MemberPickupLocation,
+            Payment,
+            PickupLocation,
+            PickupLocationOpeningTime,
+            Product,
+            ProductCapacity,
+            ProductPrice,
+            ProductType,
+            Subscription,
+            TaxRate,
+            WaitingListEntry,
+            WaitingListPickupLocationWish,
+            WaitingListProductWish,
+        )
+
+        return {
+            cls.CATEGORY_SUBSCRIPTIONS: [Subscription],
+            cls.CATEGORY_PARAMETERS: [TapirParameter],
+            cls.CATEGORY_PRODUCTS: [
+                Product,
+                ProductType,
+                TaxRate,
+                ProductBasketSizeEquivalence,
+            ],
+            cls.CATEGORY_PRODUCT_PRICES: [ProductPrice],
+            cls.CATEGORY_CAPACITIES: [ProductCapacity],
+            cls.CATEGORY_PICKUP_LOCATIONS: [
+                PickupLocation,
+                PickupLocationOpeningTime,
+                PickupLocationDeliveryCharge,
+            ],
+            cls.CATEGORY_MEMBER_PICKUP_LOCATIONS: [MemberPickupLocation],
+            cls.CATEGORY_GROWING_PERIODS: [GrowingPeriod, NoticePeriod],
+            cls.CATEGORY_JOKERS: [Joker],
+            cls.CATEGORY_DELIVERIES: [
+                DeliveryDayAdjustment,
+                DeliveryDonation,
+                CustomCycleScheduledDeliveryWeek,
+            ],
+            cls.CATEGORY_SOLIDARITY_CONTRIBUTIONS: [SolidarityContribution],
+            cls.CATEGORY_COOP_SHARES: [CoopShareTransaction],
+            cls.CATEGORY_PAYMENTS: [
+                MemberPaymentRhythm,
+                Payment,
+                MemberCredit,
+                MandateReference,
+            ],
+            cls.CATEGORY_ASSOCIATION_MEMBERSHIPS: [
+                AssociationMembership,
+                AssociationMembershipType,
+                AssociationMembershipTypePrice,
+            ],
+            cls.CATEGORY_WAITING_LIST: [
+                WaitingListEntry,
+                WaitingListPickupLocationWish,
+                WaitingListProductWish,
+            ],
+            cls.CATEGORY_MEMBERS: [Member],
+        }
 
     @classmethod
     def register_key_in_category(cls, cache: dict | None, key, category: str):
@@ -15,14 +248,95 @@ class TapirCacheManager:
 
         cache["categories"][category].add(key)
 
+    @classmethod
+    def get_keys_in_category(cls, cache: dict, category: str) -> set:
+        return cls.KEYS_BY_CATEGORY.get(category, set()) | cache.get(
+            "categories", {}
+        ).get(category, set())
+
     @classmethod
     def clear_category(cls, cache: dict, category: str):
+        from tapir.utils.services.tapir_shared_cache import TapirSharedCache
+
+        TapirSharedCache.on_category_changed(category)
+
         if cache is None:
             return
-        if "categories" not in cache:
-            return
-        if category not in cache["categories"]:
-            return
-        for key in cache["categories"][category]:
+        for key in cls.get_keys_in_category(cache, category):
             if key in cache:
                 del cache[key]
+
+    @classmethod
+    def clear_categories_of_model(cls, cache: dict | None, model):
+        for category, models in cls.get_models_by_category().items():
+            if model in models:
+                cls.clear_category(cache=cache, category=category)
+
+    @classmethod
+    def clear_keys_affected_by_change(cls, cache: dict, category: str, member_id):
+        for key in cls.get_keys_in_category(cache, category):
+            if key not in cache:
+                continue
+
+            if member_id is not None and key in cls.MEMBER_SCOPED_KEYS:
+                cache[key].pop(member_id, None)
+                cache[key].pop(str(member_id), None)
+                continue
+
+            del cache[key]
+
+    @classmethod
+    @contextmanager
+    def invalidate_on_model_changes(cls, cache: dict):
+        """
+        While inside this context, saving or deleting an object in the current thread
+        clears the keys of the given cache that depend on that object,
+        so that a long job can keep using the same cache while it writes.
+        Bulk operations don't send signals, clear_category must still be called after them.
+        """
+        if not hasattr(_tracked_caches, "caches"):
+            _tracked_caches.caches = []
+
+        _tracked_caches.caches.append(cache)
+        try:
+            yield cache
+        finally:
+            _tracked_caches.caches = [
+                tracked_cache
+                for tracked_cache in _tracked_caches.caches
+                if tracked_cache is not cache
+            ]
+
+    @classmethod
+    def connect_signals(cls):
+        for category, models in cls.get_models_by_category().items():
+            for model in models:
+                for signal_name, signal in [
+                    ("post_save", post_save),
+                    ("post_delete", post_delete),
+                ]:
+                    signal.connect(
+                        cls.build_signal_receiver(category),
+                        sender=model,
+                        weak=False,
+                        dispatch_uid=f"tapir_cache_manager:{signal_name}:{model.__name__}:{category}",
+                    )
+
+    @classmethod
+    def build_signal_receiver(cls, category: str):
+        def receiver(instance, **kwargs):
+            cls.on_model_changed(category=category, instance=instance)
+
+        return receiver
+
+    @classmethod
+    def on_model_changed(cls, category: str, instance):
+        from tapir.utils.services.tapir_shared_cache import TapirSharedCache
+
+        TapirSharedCache.on_category_changed(category)
+
+        member_id = getattr(instance, "member_id", None)
+        for cache in getattr(_tracked_caches, "caches", []):
+            cls.clear_keys_affected_by_change(
+                cache=cache, category=category, member_id=member_id
+            )
@@ -0,0 +1,148 @@
+import time
+from typing import Callable
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+from tapir.utils.shortcuts import get_from_cache_or_compute
+
+_MISSING = object()
+
+
+class TapirSharedCache:
+    """
+    Optional tier below the per-request cache dict, shared between requests and processes through a django cache backend.
+    Entries are stored under a version number per TapirCacheManager category.
+    Saving or deleting an object of a model of that category (see TapirCacheManager.get_models_by_category) increases the version,
+    outdated entries are then never read again and expire on their own.
+    """
+
+    KEY_PREFIX = "tapir_shared_cache"
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        return getattr(settings, "TAPIR_SHARED_CACHE_ENABLED", False)
+
+    @classmethod
+    def get_backend(cls):
+        return caches[getattr(settings, "TAPIR_SHARED_CACHE_ALIAS", "default")]
+
+    @classmethod
+    def get_timeout(cls) -> int:
+        return getattr(settings, "TAPIR_SHARED_CACHE_TIMEOUT", 60 * 60)
+
+    @classmethod
+    def get_from_cache_or_compute[T](
+        cls,
+        cache: dict | None,
+        key,
+        category: str,
+        compute_function: Callable[[], T],
+        shared_key: str | None = None,
+    ) -> T:
+        """
+        Same as get_from_cache_or_compute, but on a miss in the given cache dict, the shared tier is checked before computing.
+        shared_key must be given if the cache dict is nested inside the request cache, it defaults to key.
+        """
+        return get_from_cache_or_compute(
+            cache,
+            key,
+            lambda: cls.get_from_shared_cache_or_compute(
+                shared_key=shared_key if shared_key is not None else key,
+                category=category,
+                compute_function=compute_function,
+            ),
+        )
+
+    @classmethod
+    def get_from_shared_cache_or_compute[T](
+        cls, shared_key: str, category: str, compute_function: Callable[[], T]
+    ) -> T:
+        return cls.get_from_shared_cache_or_compute_for_categories(
+            shared_key=shared_key,
+            categories=[category],
+            compute_function=compute_function,
+        )
+
+    @classmethod
+    def get_from_shared_cache_or_compute_for_categories[T](
+        cls,
+        shared_key: str,
+        categories: list[str],
+        compute_function: Callable[[], T],
+    ) -> T:
+        """
+        For values that depend on several categories: the value is computed again if any of the categories changed.
+        """
+        # Inside a transaction, the data may not be committed yet: it must not be shared with other processes,
+        # and the entries of the shared tier may not include the changes of the transaction.
+        if not cls.is_enabled() or transaction.get_connection().in_atomic_block:
+            return compute_function()
+
+        backend = cls.get_backend()
+        versioned_key = cls.build_versioned_key(
+            shared_key=shared_key,
+            versions_by_category=cls.get_category_versions(categories),
+        )
+        value = backend.get(versioned_key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        value = compute_function()
+        backend.set(versioned_key, value, timeout=cls.get_timeout())
+        return value
+
+    @classmethod
+    def build_versioned_key(
+        cls, shared_key: str, versions_by_category: dict[str, int]
+    ) -> str:
+        versions = ":".join(
+            f"{category}:{version}"
+            for category, version in versions_by_category.items()
+        )
+        return f"{cls.KEY_PREFIX}:{versions}:{shared_key}"
+
+    @classmethod
+    def build_version_key(cls, category: str) -> str:
+        return f"{cls.KEY_PREFIX}:version:{category}"
+
+    @classmethod
+    def get_category_version(cls, category: str) -> int:
+        backend = cls.get_backend()
+        version_key = cls.build_version_key(category)
+        version = backend.get(version_key)
+        if version is not None:
+            return version
+
+        # The version starts at the current time rather than at 1, so that if the version key gets evicted,
+        # the entries stored under the previous versions don't become valid again.
+        backend.add(version_key, time.time_ns(), timeout=None)
+        return backend.get(version_key)
+
+    @classmethod
+    def get_category_versions(cls, categories: list[str]) -> dict[str, int]:
+        versions = cls.get_backend().get_many(
+            [cls.build_version_key(category) for category in categories]
+        )
+        return {
+            category: versions.get(cls.build_version_key(category))
+            or cls.get_category_version(category)
+            for category in categories
+        }
+
+    @classmethod
+    def increase_category_version(cls, category: str):
+        backend = cls.get_backend()
+        version_key = cls.build_version_key(category)
+        try:
+            backend.incr(version_key)
+        except ValueError:
+            backend.add(version_key, time.time_ns(), timeout=None)
+
+    @classmethod
+    def on_category_changed(cls, category: str):
+        if not cls.is_enabled():
+            return
+
+        transaction.on_commit(lambda: cls.increase_category_version(category))
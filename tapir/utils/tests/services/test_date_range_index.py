@@ -0,0 +1,112 @@
+import datetime
+import random
+from unittest.mock import Mock
+
+from tapir.utils.services.date_range_index import DateRangeIndex
+from tapir.wirgarten.tests.test_utils import TapirUnitTest
+
+
+class TestDateRangeIndex(TapirUnitTest):
+    @staticmethod
+    def build_object(start_date: datetime.date, end_date: datetime.date | None):
+        return Mock(start_date=start_date, end_date=end_date)
+
+    def test_getActiveAtDate_boundsAreInclusive_returnsObjectsOnTheirFirstAndLastDay(
+        self,
+    ):
+        obj = self.build_object(
+            start_date=datetime.date(year=2024, month=1, day=1),
+            end_date=datetime.date(year=2024, month=12, day=31),
+        )
+        index = DateRangeIndex([obj])
+
+        self.assertEqual(
+            {obj}, index.get_active_at_date(datetime.date(year=2024, month=1, day=1))
+        )
+        self.assertEqual(
+            {obj}, index.get_active_at_date(datetime.date(year=2024, month=12, day=31))
+        )
+        self.assertEqual(
+            set(), index.get_active_at_date(datetime.date(year=2023, month=12, day=31))
+        )
+        self.assertEqual(
+            set(), index.get_active_at_date(datetime.date(year=2025, month=1, day=1))
+        )
+
+    def test_getActiveAtDate_endDateIsNone_objectIsActiveForever(self):
+        obj = self.build_object(
+            start_date=datetime.date(year=2024, month=1, day=1), end_date=None
+        )
+        index = DateRangeIndex([obj])
+
+        self.assertEqual(
+            {obj}, index.get_active_at_date(datetime.date(year=2100, month=1, day=1))
+        )
+
+    def test_getActiveAtDate_endDateBeforeStartDate_objectIsNeverActive(self):
+        obj = self.build_object(
+            start_date=datetime.date(year=2024, month=5, day=1),
+            end_date=datetime.date(year=2024, month=4, day=1),
+        )
+        index = DateRangeIndex([obj])
+
+        self.assertEqual(
+            set(), index.get_active_at_date(datetime.date(year=2024, month=4, day=15))
+        )
+
+    def test_getOverlappingWithRange_default_returnsOnlyOverlappingObjects(self):
+        before = self.build_object(
+            start_date=datetime.date(year=2024, month=1, day=1),
+            end_date=datetime.date(year=2024, month=1, day=31),
+        )
+        overlapping_start = self.build_object(
+            start_date=datetime.date(year=2024, month=1, day=15),
+            end_date=datetime.date(year=2024, month=2, day=10),
+        )
+        overlapping_end = self.build_object(
+            start_date=datetime.date(year=2024, month=2, day=28),
+            end_date=None,
+        )
+        after = self.build_object(
+            start_date=datetime.date(year=2024, month=3, day=1),
+            end_date=datetime.date(year=2024, month=3, day=31),
+        )
+        index = DateRangeIndex([before, overlapping_start, overlapping_end, after])
+
+        result = index.get_overlapping_with_range(
+            range_start=datetime.date(year=2024, month=2, day=1),
+            range_end=datetime.date(year=2024, month=2, day=29),
+        )
+
+        self.assertEqual({overlapping_start, overlapping_end}, result)
+
+    def test_getOverlappingWithRange_randomRanges_sameResultAsLinearScan(self):
+        rng = random.Random(42)
+        first_day = datetime.date(year=2024, month=1, day=1)
+        objects = []
+        for _ in range(200):
+            start_date = first_day + datetime.timedelta(days=rng.randint(0, 365))
+            end_date = (
+                None
+                if rng.random() < 0.2
+                else start_date + datetime.timedelta(days=rng.randint(0, 120))
+            )
+            objects.append(self.build_object(start_date=start_date, end_date=end_date))
+        index = DateRangeIndex(objects)
+
+        for _ in range(100):
+            range_start = first_day + datetime.timedelta(days=rng.randint(-30, 500))
+            range_end = range_start + datetime.timedelta(days=rng.randint(0, 60))
+            expected = {
+                obj
+                for obj in objects
+                if obj.start_date <= range_end
+                and (obj.end_date is None or obj.end_date >= range_start)
+            }
+
+            self.assertEqual(
+                expected,
+                index.get_overlapping_with_range(
+                    range_start=range_start, range_end=range_end
+                ),
+            )
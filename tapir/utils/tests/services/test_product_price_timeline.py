@@ -0,0 +1,84 @@
+import datetime
+from unittest.mock import Mock
+
+from tapir.utils.services.product_price_timeline import ProductPriceTimeline
+from tapir.wirgarten.tests.test_utils import TapirUnitTest
+
+
+class TestProductPriceTimeline(TapirUnitTest):
+    def setUp(self):
+        super().setUp()
+        self.price_january = Mock(
+            product_id="product_1", valid_from=datetime.date(year=2024, month=1, day=1)
+        )
+        self.price_march = Mock(
+            product_id="product_1", valid_from=datetime.date(year=2024, month=3, day=1)
+        )
+        self.price_june = Mock(
+            product_id="product_1", valid_from=datetime.date(year=2024, month=6, day=1)
+        )
+        self.price_other_product = Mock(
+            product_id="product_2", valid_from=datetime.date(year=2024, month=2, day=1)
+        )
+        self.timeline = ProductPriceTimeline(
+            [
+                self.price_june,
+                self.price_other_product,
+                self.price_january,
+                self.price_march,
+            ]
+        )
+
+    def test_getPriceAtDate_dateBetweenTwoPrices_returnsTheOlderPrice(self):
+        self.assertEqual(
+            self.price_march,
+            self.timeline.get_price_at_date(
+                "product_1", datetime.date(year=2024, month=5, day=31)
+            ),
+        )
+
+    def test_getPriceAtDate_dateIsValidFromOfAPrice_returnsThatPrice(self):
+        self.assertEqual(
+            self.price_june,
+            self.timeline.get_price_at_date(
+                "product_1", datetime.date(year=2024, month=6, day=1)
+            ),
+        )
+
+    def test_getPriceAtDate_dateBeforeTheFirstPrice_returnsTheOldestPrice(self):
+        self.assertEqual(
+            self.price_january,
+            self.timeline.get_price_at_date(
+                "product_1", datetime.date(year=2023, month=6, day=1)
+            ),
+        )
+
+    def test_getPriceAtDate_productWithoutPrices_returnsNone(self):
+        self.assertIsNone(
+            self.timeline.get_price_at_date(
+                "product_3", datetime.date(year=2024, month=6, day=1)
+            )
+        )
+
+    def test_getPricesAtDate_default_returnsThePriceOfEachProduct(self):
+        self.assertEqual(
+            {
+                "product_1": self.price_january,
+                "product_2": self.price_other_product,
+                "product_3": None,
+            },
+            self.timeline.get_prices_at_date(
+                ["product_1", "product_2", "product_3"],
+                datetime.date(year=2024, month=2, day=15),
+            ),
+        )
+
+    def test_getPricesInRange_default_returnsThePricesValidDuringTheRange(self):
+        self.assertEqual(
+            [self.price_january, self.price_march],
+            self.timeline.get_prices_in_range(
+                "product_1",
+                datetime.date(year=2024, month=2, day=1),
+                datetime.date(year=2024, month=5, day=31),
+            ),
+        )
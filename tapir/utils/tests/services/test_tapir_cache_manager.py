@@ -0,0 +1,90 @@
+from unittest.mock import Mock
+
+from tapir.utils.services.tapir_cache_manager import TapirCacheManager
+from tapir.wirgarten.models import Payment
+from tapir.wirgarten.tests.test_utils import TapirUnitTest
+
+
+class TestTapirCacheManager(TapirUnitTest):
+    def test_clearCategory_default_clearsStaticAndRegisteredKeysOfTheCategory(self):
+        cache = {
+            "all_subscriptions": {"subscription"},
+            "all_products": {"product"},
+        }
+        TapirCacheManager.register_key_in_category(
+            cache=cache,
+            key="custom_key",
+            category=TapirCacheManager.CATEGORY_SUBSCRIPTIONS,
+        )
+        cache["custom_key"] = "value"
+
+        TapirCacheManager.clear_category(
+            cache=cache, category=TapirCacheManager.CATEGORY_SUBSCRIPTIONS
+        )
+
+        self.assertNotIn("all_subscriptions", cache)
+        self.assertNotIn("custom_key", cache)
+        self.assertEqual({"product"}, cache["all_products"])
+
+    def test_onModelChanged_cacheIsTracked_clearsOnlyTheAffectedKeys(self):
+        cache = {
+            "all_jokers": "unrelated",
+            "jokers_by_member_id": {"member_1": ["joker"], "member_2": ["joker"]},
+            "number_of_jokers_used_by_member_in_growing_period": {
+                "member_1": {"period": 1},
+                "member_2": {"period": 1},
+            },
+            "all_products": {"product"},
+        }
+
+        with TapirCacheManager.invalidate_on_model_changes(cache):
+            TapirCacheManager.on_model_changed(
+                category=TapirCacheManager.CATEGORY_JOKERS,
+                instance=Mock(member_id="member_1"),
+            )
+
+        self.assertNotIn("jokers_by_member_id", cache)
+        self.assertEqual(
+            {"member_2": {"period": 1}},
+            cache["number_of_jokers_used_by_member_in_growing_period"],
+        )
+        self.assertEqual({"product"}, cache["all_products"])
+        self.assertEqual("unrelated", cache["all_jokers"])
+
+    def test_onModelChanged_cacheIsNotTracked_cacheNotAffected(self):
+        cache = {"all_products": {"product"}}
+
+        with TapirCacheManager.invalidate_on_model_changes({}):
+            pass
+        TapirCacheManager.on_model_changed(
+            category=TapirCacheManager.CATEGORY_PRODUCTS, instance=Mock()
+        )
+
+        self.assertEqual({"product"}, cache["all_products"])
+
+    def test_clearCategory_relatedObjectOfTheSubscriptionsChanged_clearsAllSubscriptions(
+        self,
+    ):
+        for category in [
+            TapirCacheManager.CATEGORY_MEMBERS,
+            TapirCacheManager.CATEGORY_PRODUCTS,
+            TapirCacheManager.CATEGORY_PAYMENTS,
+        ]:
+            cache = {"all_subscriptions": {"subscription"}}
+
+            TapirCacheManager.clear_category(cache=cache, category=category)
+
+            self.assertNotIn("all_subscriptions", cache)
+
+    def test_clearCategoriesOfModel_default_clearsEveryCategoryOfTheModel(self):
+        cache = {
+            "all_subscriptions": {"subscription"},
+            "payments_by_mandate_ref_and_type": {"payment"},
+            "all_products": {"product"},
+        }
+
+        TapirCacheManager.clear_categories_of_model(cache=cache, model=Payment)
+
+        self.assertNotIn("all_subscriptions", cache)
+        self.assertNotIn("payments_by_mandate_ref_and_type", cache)
+        self.assertEqual({"product"}, cache["all_products"])
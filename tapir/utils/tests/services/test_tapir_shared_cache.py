@@ -0,0 +1,107 @@
+from unittest.mock import Mock
+
+from django.test import override_settings
+
+from tapir.utils.services.tapir_cache_manager import TapirCacheManager
+from tapir.utils.services.tapir_shared_cache import TapirSharedCache
+from tapir.wirgarten.tests.test_utils import TapirUnitTest
+
+
+@override_settings(
+    TAPIR_SHARED_CACHE_ENABLED=True,
+    TAPIR_SHARED_CACHE_ALIAS="tapir_shared_cache_test",
+    CACHES={
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+        "tapir_shared_cache_test": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "tapir_shared_cache_test",
+        },
+    },
+)
+class TestTapirSharedCache(TapirUnitTest):
+    def setUp(self):
+        super().setUp()
+        TapirSharedCache.get_backend().clear()
+
+    def test_getFromCacheOrCompute_calledFromTwoRequests_computesOnlyOnce(self):
+        compute = Mock(return_value={"value": 1})
+
+        first_result = TapirSharedCache.get_from_cache_or_compute(
+            {}, "test_key", TapirCacheManager.CATEGORY_PRODUCTS, compute
+        )
+        second_result = TapirSharedCache.get_from_cache_or_compute(
+            {}, "test_key", TapirCacheManager.CATEGORY_PRODUCTS, compute
+        )
+
+        self.assertEqual({"value": 1}, first_result)
+        self.assertEqual({"value": 1}, second_result)
+        compute.assert_called_once_with()
+
+    def test_getFromCacheOrCompute_categoryChangedBetweenRequests_computesAgain(self):
+        compute = Mock(side_effect=[1, 2])
+
+        TapirSharedCache.get_from_cache_or_compute(
+            {}, "test_key", TapirCacheManager.CATEGORY_PRODUCTS, compute
+        )
+        TapirSharedCache.on_category_changed(TapirCacheManager.CATEGORY_PRODUCTS)
+        result = TapirSharedCache.get_from_cache_or_compute(
+            {}, "test_key", TapirCacheManager.CATEGORY_PRODUCTS, compute
+        )
+
+        self.assertEqual(2, result)
+        self.assertEqual(2, compute.call_count)
+
+    def test_getFromCacheOrCompute_otherCategoryChanged_usesSharedValue(self):
+        compute = Mock(side_effect=[1, 2])
+
+        TapirSharedCache.get_from_cache_or_compute(
+            {}, "test_key", TapirCacheManager.CATEGORY_PRODUCTS, compute
+        )
+        TapirSharedCache.on_category_changed(TapirCacheManager.CATEGORY_SUBSCRIPTIONS)
+        result = TapirSharedCache.get_from_cache_or_compute(
+            {}, "test_key", TapirCacheManager.CATEGORY_PRODUCTS, compute
+        )
+
+        self.assertEqual(1, result)
+        compute.assert_called_once_with()
+
+    def test_getFromCacheOrCompute_valueInRequestCache_sharedTierIsNotUsed(self):
+        compute = Mock(return_value=2)
+
+        result = TapirSharedCache.get_from_cache_or_compute(
+            {"test_key": 1}, "test_key", TapirCacheManager.CATEGORY_PRODUCTS, compute
+        )
+
+        self.assertEqual(1, result)
+        compute.assert_not_called()
+
+    @override_settings(TAPIR_SHARED_CACHE_ENABLED=False)
+    def test_getFromCacheOrCompute_disabled_computesForEveryRequest(self):
+        compute = Mock(return_value=1)
+
+        for _ in range(2):
+            TapirSharedCache.get_from_cache_or_compute(
+                {}, "test_key", TapirCacheManager.CATEGORY_PRODUCTS, compute
+            )
+
+        self.assertEqual(2, compute.call_count)
+
+    def test_getFromSharedCacheOrComputeForCategories_anyOfTheCategoriesChanged_computesAgain(
+        self,
+    ):
+        compute = Mock(side_effect=[1, 2])
+        categories = [
+            TapirCacheManager.CATEGORY_PRODUCTS,
+            TapirCacheManager.CATEGORY_WAITING_LIST,
+        ]
+
+        TapirSharedCache.get_from_shared_cache_or_compute_for_categories(
+            "test_key", categories, compute
+        )
+        TapirSharedCache.on_category_changed(TapirCacheManager.CATEGORY_WAITING_LIST)
+        result = TapirSharedCache.get_from_shared_cache_or_compute_for_categories(
+            "test_key", categories, compute
+        )
+
+        self.assertEqual(2, result)
+        self.assertEqual(2, compute.call_count)
@@ -5,6 +5,7 @@ from tapir.pickup_locations.services.member_pickup_location_getter import (
     MemberPickupLocationGetter,
 )
 from tapir.subscriptions.types import TapirOrder
+from tapir.utils.services.tapir_cache_manager import TapirCacheManager
 from tapir.wirgarten.models import (
     WaitingListEntry,
     WaitingListProductWish,
@@ -102,6 +103,9 @@ class WaitingListEntryCreator:
                 )
             )
         WaitingListProductWish.objects.bulk_create(product_wishes)
+        TapirCacheManager.clear_category(
+            cache=None, category=TapirCacheManager.CATEGORY_WAITING_LIST
+        )
 
     @classmethod
     def create_pickup_location_wishes(
@@ -119,6 +123,9 @@ class WaitingListEntryCreator:
                 )
             )
         WaitingListPickupLocationWish.objects.bulk_create(pickup_location_wishes)
+        TapirCacheManager.clear_category(
+            cache=None, category=TapirCacheManager.CATEGORY_WAITING_LIST
+        )
 
     @classmethod
     def set_personal_data_from_validated_data(
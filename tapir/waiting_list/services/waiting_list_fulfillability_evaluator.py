@@ -0,0 +1,136 @@
+from typing import Iterable
+
+from tapir.pickup_locations.services.pickup_location_capacity_general_checker import (
+    PickupLocationCapacityGeneralChecker,
+)
+from tapir.subscriptions.services.global_capacity_checker import GlobalCapacityChecker
+from tapir.subscriptions.services.product_capacity_checker import ProductCapacityChecker
+from tapir.subscriptions.services.tapir_order_builder import TapirOrderBuilder
+from tapir.subscriptions.types import TapirOrder
+from tapir.waiting_list.services.waiting_list_entry_confirmation_applier import (
+    WaitingListEntryConfirmationApplier,
+)
+from tapir.wirgarten.models import WaitingListEntry
+
+
+class WaitingListFulfillabilityEvaluator:
+    """
+    The free capacities that the checks rely on (per product type, product and pickup location, at the contract start date)
+    don't depend on the entry and are stored in the cache the first time they are computed.
+    Evaluating many entries with the same cache only adds the part that is specific to each entry.
+    """
+
+    @classmethod
+    def get_entries_with_wishes(cls):
+        return WaitingListEntry.objects.prefetch_related(
+            "product_wishes__product__type",
+            "pickup_location_wishes__pickup_location",
+        ).select_related("member")
+
+    @classmethod
+    def evaluate_entries(
+        cls, entries: Iterable[WaitingListEntry], cache: dict
+    ) -> dict[str, bool]:
+        return {
+            entry.id: cls.check_if_entry_can_be_fulfilled(entry=entry, cache=cache)
+            for entry in entries
+        }
+
+    @classmethod
+    def evaluate_entries_not_stored_yet(cls, cache: dict) -> dict[str, bool]:
+        return cls.evaluate_entries(
+            entries=cls.get_entries_with_wishes().filter(can_be_fulfilled__isnull=True),
+            cache=cache,
+        )
+
+    @classmethod
+    def get_can_be_fulfilled(
+        cls,
+        entry: WaitingListEntry,
+        can_be_fulfilled_by_entry_id: dict[str, bool],
+        cache: dict,
+    ) -> bool:
+        if entry.can_be_fulfilled is not None:
+            return entry.can_be_fulfilled
+
+        # The entry may have been created after the flags were evaluated
+        can_be_fulfilled = can_be_fulfilled_by_entry_id.get(entry.id)
+        if can_be_fulfilled is None:
+            can_be_fulfilled = cls.check_if_entry_can_be_fulfilled(
+                entry=entry, cache=cache
+            )
+        return can_be_fulfilled
+
+    @classmethod
+    def update_stored_flags(cls, cache: dict) -> dict[str, bool]:
+        """
+        Called by the update_waiting_list_fulfillability task, the views only read the stored flags.
+        """
+        can_be_fulfilled_by_entry_id = {}
+        entries_to_update = []
+        for entry in cls.get_entries_with_wishes():
+            can_be_fulfilled = cls.check_if_entry_can_be_fulfilled(
+                entry=entry, cache=cache
+            )
+            can_be_fulfilled_by_entry_id[entry.id] = can_be_fulfilled
+            if entry.can_be_fulfilled == can_be_fulfilled:
+                continue
+            entry.can_be_fulfilled = can_be_fulfilled
+            entries_to_update.append(entry)
+        WaitingListEntry.objects.bulk_update(entries_to_update, ["can_be_fulfilled"])
+
+        return can_be_fulfilled_by_entry_id
+
+    @classmethod
+    def check_if_entry_can_be_fulfilled(cls, entry: WaitingListEntry, cache: dict):
+        pickup_location_wishes = entry.pickup_location_wishes.all()
+
+        if not pickup_location_wishes or not entry.product_wishes.all():
+            return False
+
+        order: TapirOrder = TapirOrderBuilder.build_tapir_order_from_waiting_list_entry(
+            entry
+        )
+
+        subscription_start = (
+            WaitingListEntryConfirmationApplier.get_contract_start_date(
+                waiting_list_entry=entry, cache=cache
+            )
+        )
+
+        product_type_ids_without_enough_capacity = GlobalCapacityChecker.get_product_type_ids_without_enough_capacity_for_order(
+            order_with_all_product_types=order,
+            member_id=str(entry.member_id) if entry.member else None,
+            subscription_start_date=subscription_start,
+            cache=cache,
+            check_waiting_list_entries=False,
+        )
+
+        if product_type_ids_without_enough_capacity:
+            return False
+
+        if not all(
+            ProductCapacityChecker.does_product_have_enough_free_capacity_to_add_order(
+                member_id=str(entry.member_id) if entry.member else None,
+                product=product,
+                ordered_quantity=quantity,
+                subscription_start_date=subscription_start,
+                cache=cache,
+            )
+            for product, quantity in order.items()
+        ):
+            return False
+
+        for pickup_location_wish in pickup_location_wishes:
+            has_capacity = PickupLocationCapacityGeneralChecker.does_pickup_location_have_enough_capacity_to_add_subscriptions(
+                pickup_location=pickup_location_wish.pickup_location,
+                order=order,
+                already_registered_member=entry.member,
+                subscription_start=subscription_start,
+                cache=cache,
+                check_waiting_list_entries=False,
+            )
+            if has_capacity:
+                return True
+
+        return False
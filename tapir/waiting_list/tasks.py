@@ -0,0 +1,10 @@
+from celery import shared_task
+
+from tapir.waiting_list.services.waiting_list_fulfillability_evaluator import (
+    WaitingListFulfillabilityEvaluator,
+)
+
+
+@shared_task
+def update_waiting_list_fulfillability():
+    WaitingListFulfillabilityEvaluator.update_stored_flags(cache={})
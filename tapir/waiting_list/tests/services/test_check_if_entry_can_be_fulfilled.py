@@ -1,7 +1,9 @@
 import datetime
 
 from tapir.waiting_list.tests.factories import WaitingListEntryFactory
-from tapir.waiting_list.views import WaitingListApiView
+from tapir.waiting_list.services.waiting_list_fulfillability_evaluator import (
+    WaitingListFulfillabilityEvaluator,
+)
 from tapir.wirgarten.constants import WEEKLY
 from tapir.wirgarten.models import (
     WaitingListProductWish,
@@ -53,7 +55,9 @@ class TestCheckIfEntryCanBeFulfilled(TapirIntegrationTest):
             waiting_list_entry=entry, product=self.product, quantity=1
         )
 
-        result = WaitingListApiView.check_if_entry_can_be_fulfilled(entry, cache={})
+        result = WaitingListFulfillabilityEvaluator.check_if_entry_can_be_fulfilled(
+            entry, cache={}
+        )
 
         self.assertFalse(result)
 
@@ -65,7 +69,9 @@ class TestCheckIfEntryCanBeFulfilled(TapirIntegrationTest):
             priority=1,
         )
 
-        result = WaitingListApiView.check_if_entry_can_be_fulfilled(entry, cache={})
+        result = WaitingListFulfillabilityEvaluator.check_if_entry_can_be_fulfilled(
+            entry, cache={}
+        )
 
         self.assertFalse(result)
 
@@ -86,7 +92,9 @@ class TestCheckIfEntryCanBeFulfilled(TapirIntegrationTest):
             priority=1,
         )
 
-        result = WaitingListApiView.check_if_entry_can_be_fulfilled(entry, cache={})
+        result = WaitingListFulfillabilityEvaluator.check_if_entry_can_be_fulfilled(
+            entry, cache={}
+        )
 
         self.assertFalse(result)
 
@@ -106,7 +114,9 @@ class TestCheckIfEntryCanBeFulfilled(TapirIntegrationTest):
             priority=1,
         )
 
-        result = WaitingListApiView.check_if_entry_can_be_fulfilled(entry, cache={})
+        result = WaitingListFulfillabilityEvaluator.check_if_entry_can_be_fulfilled(
+            entry, cache={}
+        )
 
         self.assertFalse(result)
 
@@ -133,7 +143,9 @@ class TestCheckIfEntryCanBeFulfilled(TapirIntegrationTest):
             priority=1,
         )
 
-        result = WaitingListApiView.check_if_entry_can_be_fulfilled(entry, cache={})
+        result = WaitingListFulfillabilityEvaluator.check_if_entry_can_be_fulfilled(
+            entry, cache={}
+        )
 
         self.assertTrue(result)
 
@@ -166,7 +178,9 @@ class TestCheckIfEntryCanBeFulfilled(TapirIntegrationTest):
             priority=2,
         )
 
-        result = WaitingListApiView.check_if_entry_can_be_fulfilled(entry, cache={})
+        result = WaitingListFulfillabilityEvaluator.check_if_entry_can_be_fulfilled(
+            entry, cache={}
+        )
 
         self.assertFalse(result)
 
@@ -186,7 +200,9 @@ class TestCheckIfEntryCanBeFulfilled(TapirIntegrationTest):
             priority=1,
         )
 
-        result = WaitingListApiView.check_if_entry_can_be_fulfilled(entry, cache={})
+        result = WaitingListFulfillabilityEvaluator.check_if_entry_can_be_fulfilled(
+            entry, cache={}
+        )
 
         self.assertTrue(result)
 
@@ -215,6 +231,8 @@ class TestCheckIfEntryCanBeFulfilled(TapirIntegrationTest):
             priority=2,
         )
 
-        result = WaitingListApiView.check_if_entry_can_be_fulfilled(entry, cache={})
+        result = WaitingListFulfillabilityEvaluator.check_if_entry_can_be_fulfilled(
+            entry, cache={}
+        )
 
         self.assertTrue(result)
@@ -0,0 +1,145 @@
+import datetime
+
+from tapir.waiting_list.services.waiting_list_fulfillability_evaluator import (
+    WaitingListFulfillabilityEvaluator,
+)
+from tapir.waiting_list.tests.factories import WaitingListEntryFactory
+from tapir.wirgarten.constants import WEEKLY
+from tapir.wirgarten.models import (
+    WaitingListProductWish,
+    WaitingListPickupLocationWish,
+    WaitingListEntry,
+)
+from tapir.wirgarten.parameters import ParameterDefinitions
+from tapir.wirgarten.tests.factories import (
+    ProductFactory,
+    PickupLocationFactory,
+    GrowingPeriodFactory,
+    ProductPriceFactory,
+    ProductCapacityFactory,
+    PickupLocationCapabilityFactory,
+)
+from tapir.wirgarten.tests.test_utils import TapirIntegrationTest, mock_timezone
+
+
+class TestWaitingListFulfillabilityEvaluator(TapirIntegrationTest):
+    @classmethod
+    def setUpTestData(cls):
+        ParameterDefinitions().import_definitions(bulk_create=True)
+        cls.product = ProductFactory.create(type__delivery_cycle=WEEKLY[0])
+        ProductPriceFactory.create(product=cls.product, size=1)
+        cls.growing_period = GrowingPeriodFactory.create(
+            start_date=datetime.date(year=2025, month=1, day=1),
+            end_date=datetime.date(year=2025, month=12, day=31),
+        )
+        ProductCapacityFactory.create(
+            product_type=cls.product.type,
+            period=cls.growing_period,
+            capacity=10,
+        )
+
+        cls.pickup_location = PickupLocationFactory.create()
+        PickupLocationCapabilityFactory.create(
+            pickup_location=cls.pickup_location,
+            product_type=cls.product.type,
+            max_capacity=100,
+        )
+
+    def setUp(self):
+        mock_timezone(self, datetime.datetime(year=2025, month=1, day=15))
+
+    def create_entry(self, quantity: int):
+        entry = WaitingListEntryFactory.create()
+        WaitingListProductWish.objects.create(
+            waiting_list_entry=entry, product=self.product, quantity=quantity
+        )
+        WaitingListPickupLocationWish.objects.create(
+            waiting_list_entry=entry,
+            pickup_location=self.pickup_location,
+            priority=1,
+        )
+        return entry
+
+    def test_updateStoredFlags_default_storesTheResultOfEachEntry(self):
+        fulfillable_entry = self.create_entry(quantity=1)
+        not_fulfillable_entry = self.create_entry(quantity=11)
+
+        result = WaitingListFulfillabilityEvaluator.update_stored_flags(cache={})
+
+        self.assertEqual(
+            {fulfillable_entry.id: True, not_fulfillable_entry.id: False}, result
+        )
+        self.assertEqual(
+            {fulfillable_entry.id},
+            set(
+                WaitingListEntry.objects.filter(can_be_fulfilled=True).values_list(
+                    "id", flat=True
+                )
+            ),
+        )
+        self.assertEqual(
+            {not_fulfillable_entry.id},
+            set(
+                WaitingListEntry.objects.filter(can_be_fulfilled=False).values_list(
+                    "id", flat=True
+                )
+            ),
+        )
+
+    def test_evaluateEntries_sharedCache_sameResultAsCheckingEachEntrySeparately(
+        self,
+    ):
+        entries = [self.create_entry(quantity=quantity) for quantity in [1, 5, 10, 11]]
+
+        result = WaitingListFulfillabilityEvaluator.evaluate_entries(
+            entries=entries, cache={}
+        )
+
+        self.assertEqual(
+            {
+                entry.id: WaitingListFulfillabilityEvaluator.check_if_entry_can_be_fulfilled(
+                    entry=entry, cache={}
+                )
+                for entry in entries
+            },
+            result,
+        )
+
+    def test_getCanBeFulfilled_entryCreatedAfterTheEvaluation_checksTheEntry(self):
+        can_be_fulfilled_by_entry_id = (
+            WaitingListFulfillabilityEvaluator.evaluate_entries(entries=[], cache={})
+        )
+        entry = self.create_entry(quantity=1)
+
+        result = WaitingListFulfillabilityEvaluator.get_can_be_fulfilled(
+            entry=entry,
+            can_be_fulfilled_by_entry_id=can_be_fulfilled_by_entry_id,
+            cache={},
+        )
+
+        self.assertTrue(result)
+
+    def test_getCanBeFulfilled_flagStored_returnsTheStoredFlag(self):
+        entry = self.create_entry(quantity=1)
+        entry.can_be_fulfilled = False
+
+        result = WaitingListFulfillabilityEvaluator.get_can_be_fulfilled(
+            entry=entry, can_be_fulfilled_by_entry_id={}, cache={}
+        )
+
+        self.assertFalse(result)
+
+    def test_evaluateEntriesNotStoredYet_default_evaluatesOnlyTheEntriesWithoutFlag(
+        self,
+    ):
+        not_evaluated_entry = self.create_entry(quantity=1)
+        evaluated_entry = self.create_entry(quantity=1)
+        WaitingListEntry.objects.filter(id=evaluated_entry.id).update(
+            can_be_fulfilled=False
+        )
+
+        result = WaitingListFulfillabilityEvaluator.evaluate_entries_not_stored_yet(
+            cache={}
+        )
+
+        self.assertEqual({not_evaluated_entry.id: True}, result)
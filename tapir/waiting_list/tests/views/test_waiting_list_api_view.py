@@ -196,3 +196,25 @@ class TestWaitingListAPIView(TapirIntegrationTest):
             response_content["results"][1]["url_to_member_profile"],
         )
         self.assertTrue(response_content["results"][1]["can_be_fulfilled"])
+
+    def test_waitingListView_filteredByCanBeFulfilled_usesTheStoredFlagsWithoutStoringNewOnes(
+        self,
+    ):
+        member = MemberFactory.create(is_superuser=True)
+        self.client.force_login(member)
+        fulfillable_entry = WaitingListEntryFactory.create(can_be_fulfilled=True)
+        WaitingListEntryFactory.create(can_be_fulfilled=False)
+        not_evaluated_entry = WaitingListEntryFactory.create()
+
+        url = reverse("waiting_list:api_list")
+        url = f"{url}?limit=10&offset=0&can_be_fulfilled=fulfillable"
+        response = self.client.get(url)
+
+        response_content = response.json()
+        self.assertEqual(
+            [fulfillable_entry.id],
+            [result["id"] for result in response_content["results"]],
+        )
+        self.assertTrue(response_content["results"][0]["can_be_fulfilled"])
+        not_evaluated_entry.refresh_from_db()
+        self.assertIsNone(not_evaluated_entry.can_be_fulfilled)
@@ -5,7 +5,16 @@ from django.conf import settings
 from django.contrib.auth.mixins import LoginRequiredMixin, PermissionRequiredMixin
 from django.core.exceptions import ValidationError
 from django.db import transaction
-from django.db.models import QuerySet, Subquery, OuterRef
+from django.db.models import (
+    BooleanField,
+    Case,
+    OuterRef,
+    QuerySet,
+    Subquery,
+    Value,
+    When,
+)
+from django.db.models.functions import Coalesce
 from django.shortcuts import get_object_or_404
 from django.urls import reverse
 from django.views.generic import TemplateView
@@ -31,20 +40,14 @@ from tapir.payments.services.member_payment_rhythm_service import (
 from tapir.pickup_locations.services.member_pickup_location_getter import (
     MemberPickupLocationGetter,
 )
-from tapir.pickup_locations.services.pickup_location_capacity_general_checker import (
-    PickupLocationCapacityGeneralChecker,
-)
 from tapir.solidarity_contribution.services.member_solidarity_contribution_service import (
     MemberSolidarityContributionService,
 )
 from tapir.subscriptions.serializers import OrderConfirmationResponseSerializer
-from tapir.subscriptions.services.global_capacity_checker import GlobalCapacityChecker
 from tapir.subscriptions.services.growing_period_choice_provider import (
     GrowingPeriodChoiceProvider,
 )
-from tapir.subscriptions.services.product_capacity_checker import ProductCapacityChecker
 from tapir.subscriptions.services.tapir_order_builder import TapirOrderBuilder
-from tapir.subscriptions.types import TapirOrder
 from tapir.utils.services.tapir_cache import TapirCache
 from tapir.waiting_list.serializers import (
     WaitingListEntryDetailsSerializer,
@@ -73,6 +76,9 @@ from tapir.waiting_list.services.waiting_list_entry_creator import (
 from tapir.waiting_list.services.waiting_list_entry_validator import (
     WaitingListEntryValidator,
 )
+from tapir.waiting_list.services.waiting_list_fulfillability_evaluator import (
+    WaitingListFulfillabilityEvaluator,
+)
 from tapir.wirgarten.constants import Permission
 from tapir.wirgarten.mail_events import Events
 from tapir.wirgarten.models import (
@@ -105,6 +111,7 @@ class WaitingListApiView(APIView):
     def __init__(self):
         super().__init__()
         self.cache = {}
+        self.can_be_fulfilled_by_entry_id = {}
 
     @extend_schema(
         responses={200: WaitingListEntryDetailsSerializer(many=True)},
@@ -143,18 +150,22 @@ class WaitingListApiView(APIView):
                 name="order_by",
                 type=str,
                 required=True,
-                enum=["created_at", "-created_at", "member_since", "-member_since"],
+                enum=[
+                    "created_at",
+                    "-created_at",
+                    "member_since",
+                    "-member_since",
+                    "can_be_fulfilled",
+                    "-can_be_fulfilled",
+                ],
             ),
         ],
     )
     def get(self, request):
         pagination = self.pagination_class()
 
-        entries = WaitingListEntry.objects.prefetch_related(
-            "product_wishes__product__type",
-            "pickup_location_wishes__pickup_location",
-        ).select_related(
-            "member",
+        entries = self.annotate_with_fulfillable(
+            WaitingListFulfillabilityEvaluator.get_entries_with_wishes()
         )
 
         filters = [
@@ -174,6 +185,10 @@ class WaitingListApiView(APIView):
         order_by = request.query_params.get("order_by", "-created_at")
         if "created_at" in order_by:
             entries = entries.order_by(order_by)
+        elif "can_be_fulfilled" in order_by:
+            entries = entries.order_by(
+                order_by.replace("can_be_fulfilled", "fulfillable"), "-created_at"
+            )
         else:
             entries = self.order_by_coop_entry_date(entries, descending="-" in order_by)
 
@@ -181,7 +196,18 @@ class WaitingListApiView(APIView):
 
         entries = pagination.paginate_queryset(entries, request)
 
-        data = [self.build_entry_data(entry, cache=self.cache) for entry in entries]
+        data = [
+            self.build_entry_data(
+                entry,
+                cache=self.cache,
+                can_be_fulfilled=WaitingListFulfillabilityEvaluator.get_can_be_fulfilled(
+                    entry=entry,
+                    can_be_fulfilled_by_entry_id=self.can_be_fulfilled_by_entry_id,
+                    cache=self.cache,
+                ),
+            )
+            for entry in entries
+        ]
         serializer = WaitingListEntryDetailsSerializer(
             data, many=True, context={"cache": self.cache}
         )
@@ -261,25 +287,37 @@ class WaitingListApiView(APIView):
         wishes = WaitingListProductWish.objects.filter(product_id=product_id)
         return entries.filter(product_wishes__in=wishes)
 
-    @classmethod
     def filter_by_can_be_fulfilled(
-        cls, value: str, entries: QuerySet[WaitingListEntry]
+        self, value: str, entries: QuerySet[WaitingListEntry]
     ):
         if not value or value == "any":
             return entries
 
-        cache = {}
-        filtered_entries = []
-        for entry in entries:
-            can_be_fulfilled = cls.check_if_entry_can_be_fulfilled(
-                entry=entry, cache=cache
-            )
-            if value == "fulfillable" and can_be_fulfilled:
-                filtered_entries.append(entry.id)
-            elif value == "not_fulfillable" and not can_be_fulfilled:
-                filtered_entries.append(entry.id)
+        return entries.filter(fulfillable=value == "fulfillable")
 
-        return entries.filter(id__in=filtered_entries)
+    def annotate_with_fulfillable(self, entries: QuerySet[WaitingListEntry]):
+        # The flags are stored by the update_waiting_list_fulfillability task, so that filtering, ordering and pagination can be done in SQL.
+        # Only the entries that were created or changed since the last run are evaluated here, without storing the result.
+        self.can_be_fulfilled_by_entry_id = (
+            WaitingListFulfillabilityEvaluator.evaluate_entries_not_stored_yet(
+                cache=self.cache
+            )
+        )
+        fulfillable_entry_ids = [
+            entry_id
+            for entry_id, can_be_fulfilled in self.can_be_fulfilled_by_entry_id.items()
+            if can_be_fulfilled
+        ]
+        return entries.annotate(
+            fulfillable=Coalesce(
+                "can_be_fulfilled",
+                Case(
+                    When(id__in=fulfillable_entry_ids, then=Value(True)),
+                    default=Value(False),
+                ),
+                output_field=BooleanField(),
+            )
+        )
 
     @classmethod
     def order_by_coop_entry_date(
@@ -305,7 +343,9 @@ class WaitingListApiView(APIView):
         return entries.order_by(order_by)
 
     @classmethod
-    def build_entry_data(cls, entry: WaitingListEntry, cache: dict):
+    def build_entry_data(
+        cls, entry: WaitingListEntry, cache: dict, can_be_fulfilled: bool | None = None
+    ):
         date_of_entry_in_cooperative = None
         current_pickup_location = None
         member_no = None
@@ -366,7 +406,12 @@ class WaitingListApiView(APIView):
                 entry.id, entry.confirmation_link_key
             )
 
-        can_be_fulfilled = cls.check_if_entry_can_be_fulfilled(entry=entry, cache=cache)
+        if can_be_fulfilled is None:
+            can_be_fulfilled = (
+                WaitingListFulfillabilityEvaluator.check_if_entry_can_be_fulfilled(
+                    entry=entry, cache=cache
+                )
+            )
 
         return {
             "id": entry.id,
@@ -407,60 +452,6 @@ class WaitingListApiView(APIView):
             "can_be_fulfilled": can_be_fulfilled,
         }
 
-    @classmethod
-    def check_if_entry_can_be_fulfilled(cls, entry: WaitingListEntry, cache: dict):
-        pickup_location_wishes = entry.pickup_location_wishes.all()
-
-        if not pickup_location_wishes or not entry.product_wishes.all():
-            return False
-
-        order: TapirOrder = TapirOrderBuilder.build_tapir_order_from_waiting_list_entry(
-            entry
-        )
-
-        subscription_start = (
-            WaitingListEntryConfirmationApplier.get_contract_start_date(
-                waiting_list_entry=entry, cache=cache
-            )
-        )
-
-        product_type_ids_without_enough_capacity = GlobalCapacityChecker.get_product_type_ids_without_enough_capacity_for_order(
-            order_with_all_product_types=order,
-            member_id=str(entry.member_id) if entry.member else None,
-            subscription_start_date=subscription_start,
-            cache=cache,
-            check_waiting_list_entries=False,
-        )
-
-        if product_type_ids_without_enough_capacity:
-            return False
-
-        if not all(
-            ProductCapacityChecker.does_product_have_enough_free_capacity_to_add_order(
-                member_id=str(entry.member_id) if entry.member else None,
-                product=product,
-                ordered_quantity=quantity,
-                subscription_start_date=subscription_start,
-                cache=cache,
-            )
-            for product, quantity in order.items()
-        ):
-            return False
-
-        for pickup_location_wish in pickup_location_wishes:
-            has_capacity = PickupLocationCapacityGeneralChecker.does_pickup_location_have_enough_capacity_to_add_subscriptions(
-                pickup_location=pickup_location_wish.pickup_location,
-                order=order,
-                already_registered_member=entry.member,
-                subscription_start=subscription_start,
-                cache=cache,
-                check_waiting_list_entries=False,
-            )
-            if has_capacity:
-                return True
-
-        return False
-
     @staticmethod
     def remove_renewals(subscriptions: list[Subscription], cache: dict):
         current_subscriptions = list(
@@ -569,6 +560,8 @@ class WaitingListEntryUpdateView(APIView):
         )
         waiting_list_entry.comment = serializer.validated_data["comment"]
         waiting_list_entry.category = serializer.validated_data.get("category", None)
+        # Evaluated again by the views until the next update_waiting_list_fulfillability run
+        waiting_list_entry.can_be_fulfilled = None
         waiting_list_entry.save()
 
         waiting_list_entry.product_wishes.all().delete()
@@ -7,5 +7,7 @@ class WirgartenConfig(AppConfig):
 
     def ready(self) -> None:
         from .tapirmail import configure_mail_module
+        from tapir.utils.services.tapir_cache_manager import TapirCacheManager
 
         configure_mail_module()
+        TapirCacheManager.connect_signals()
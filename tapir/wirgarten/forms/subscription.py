@@ -298,7 +298,9 @@ class BaseProductForm(forms.Form):
         for growing_period in available_growing_periods:
             prices = {
                 prod.id: get_product_price(
-                    prod, max(self.start_date, growing_period.start_date)
+                    prod,
+                    max(self.start_date, growing_period.start_date),
+                    cache=self.cache,
                 ).price
                 for prod in harvest_share_products
             }
@@ -797,6 +799,9 @@ class AdditionalProductForm(forms.Form):
             cache=self.cache, category=TapirCacheManager.CATEGORY_SUBSCRIPTIONS
         )
         Member.objects.filter(id=member_id).update(sepa_consent=get_now())
+        TapirCacheManager.clear_category(
+            cache=self.cache, category=TapirCacheManager.CATEGORY_MEMBERS
+        )
 
         new_pickup_location = self.cleaned_data.get("pickup_location")
         change_date = self.cleaned_data.get("pickup_location_change_date")
@@ -828,7 +833,7 @@ class AdditionalProductForm(forms.Form):
                     type_id=self.product_type.id,
                     name__iexact=key.replace(self.field_prefix, ""),
                 )
-                total += float(get_product_price(product).size)
+                total += float(get_product_price(product, cache=self.cache).size)
         return total
 
     def validate_contract_signed(self):
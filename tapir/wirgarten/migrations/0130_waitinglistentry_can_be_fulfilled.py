@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("wirgarten", "0129_product_hidden_in_bestell_wizard"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="waitinglistentry",
+            name="can_be_fulfilled",
+            field=models.BooleanField(null=True),
+        ),
+    ]
@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("wirgarten", "0130_waitinglistentry_can_be_fulfilled"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="paymenttransaction",
+            name="stage_durations",
+            field=models.JSONField(default=dict),
+        ),
+    ]
@@ -0,0 +1,68 @@
+import functools
+
+from django.db import migrations, models
+
+import tapir.core.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("wirgarten", "0131_paymenttransaction_stage_durations"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DailyStatistic",
+            fields=[
+                (
+                    "id",
+                    models.CharField(
+                        default=functools.partial(tapir.core.models.generate_id),
+                        max_length=10,
+                        primary_key=True,
+                        serialize=False,
+                        unique=True,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("date", models.DateField()),
+                (
+                    "metric",
+                    models.CharField(
+                        choices=[
+                            ("active_subscriptions", "Active Subscriptions"),
+                            ("cancelled_subscriptions", "Cancelled Subscriptions"),
+                            (
+                                "cancelled_subscriptions_in_trial",
+                                "Cancelled Subscriptions In Trial",
+                            ),
+                            (
+                                "cancelled_subscriptions_total",
+                                "Cancelled Subscriptions Total",
+                            ),
+                            ("traffic_source_responses", "Traffic Source Responses"),
+                            ("active_coop_members", "Active Coop Members"),
+                            ("coop_shares_quantity", "Coop Shares Quantity"),
+                            ("capacity_used", "Capacity Used"),
+                            ("capacity_base_share_size", "Capacity Base Share Size"),
+                        ],
+                        max_length=64,
+                    ),
+                ),
+                ("dimension", models.CharField(blank=True, default="", max_length=256)),
+                ("value", models.FloatField()),
+            ],
+            options={
+                "abstract": False,
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("date", "metric", "dimension"),
+                        name="unique_daily_statistic",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,56 @@
+from django.db import migrations
+from tapir_mail.models import ReleaseStatus
+
+TOKEN_REPLACEMENTS = {
+    "{{Empfänger.Abholort}}": "{{Empfänger (extra).Mitglied - Abholort}}",
+    "{{Empfänger.Ernteanteilsgrößen}}": "{{Empfänger (extra).Mitglied - Ernteanteilsgrößen}}",
+}
+
+
+def update_mail_tokens_pickup_location_and_base_subscriptions(apps, schema):
+    # The user tokens "Abholort" and "Ernteanteilsgrößen" are now dynamic tokens,
+    # so that they are resolved from the cache shared by all recipients of a dispatch
+    email_configuration_version_class = apps.get_model(
+        "tapir_mail", "EmailConfigurationVersion"
+    )
+
+    # The subject can contain tokens as well as the content
+    field_names = [
+        field_name
+        for field_name in ["subject", "content"]
+        if field_name
+        in {
+            field.name for field in email_configuration_version_class._meta.get_fields()
+        }
+    ]
+
+    for email_configuration_version in email_configuration_version_class.objects.filter(
+        status__in=[ReleaseStatus.RELEASED, ReleaseStatus.DRAFT]
+    ):
+        changed_field_names = []
+        for field_name in field_names:
+            value = getattr(email_configuration_version, field_name)
+            if not value:
+                continue
+            new_value = value
+            for old_token, new_token in TOKEN_REPLACEMENTS.items():
+                new_value = new_value.replace(old_token, new_token)
+            if new_value == value:
+                continue
+            setattr(email_configuration_version, field_name, new_value)
+            changed_field_names.append(field_name)
+
+        if len(changed_field_names) == 0:
+            continue
+        email_configuration_version.save(update_fields=changed_field_names)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("wirgarten", "0132_dailystatistic"),
+    ]
+
+    operations = [
+        migrations.RunPython(update_mail_tokens_pickup_location_and_base_subscriptions),
+    ]
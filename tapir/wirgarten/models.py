@@ -439,11 +439,10 @@ class Member(TapirUser):
         - “einen S-Ernteanteil + M-Ernteanteil + L-Ernteanteil”
         """
 
-        from collections import Counter
-        from tapir.wirgarten.service.products import (
-            get_product_price,
-            get_active_subscriptions,
+        from tapir.core.services.member_mail_token_service import (
+            MemberMailTokenService,
         )
+        from tapir.wirgarten.service.products import get_active_subscriptions
 
         cache = {}
 
@@ -451,39 +450,11 @@ class Member(TapirUser):
             member_id=self.id, product__type__must_be_subscribed_to=True
         )
 
-        if not subscriptions:
-            return ""
-
-        # Count the quantity of each base product subscribed
-        product_counts = Counter()
-        for sub in subscriptions:
-            product_counts[sub.product] += sub.quantity
-
-        # Create a list of tuples (product, quantity, price) and sort by price
-        product_info = []
-        today = get_today(cache=cache)
-        for product, quantity in product_counts.items():
-            price = get_product_price(product, today).price
-            product_info.append(
-                (
-                    f"{product.name}-{product.type.name[:-1] if quantity == 1 else product.type.name}",
-                    quantity,
-                    price,
-                )
-            )
-
-        # Sort products by price (ascending)
-        product_info.sort(key=lambda x: x[2])
-
-        # Create the human-readable text
-        base_subscription_texts = []
-        for product_name, quantity, _ in product_info:
-            if quantity == 1:
-                base_subscription_texts.append(f"einen {product_name}")
-            else:
-                base_subscription_texts.append(f"{quantity} {product_name}")
-
-        return " + ".join(base_subscription_texts)
+        return MemberMailTokenService.build_base_subscriptions_text(
+            subscriptions=subscriptions,
+            reference_date=get_today(cache=cache),
+            cache=cache,
+        )
 
     def __str__(self):
         return f"[{self.member_no or '---'}] {self.first_name} {self.last_name} ({self.email})"
@@ -737,6 +708,8 @@ class PaymentTransaction(TapirModel):
     )
     type = models.CharField(max_length=100)
     month = models.DateField()
+    # Duration in seconds of each stage of the export that created this transaction
+    stage_durations = models.JSONField(default=dict)
 
 
 class Payment(TapirModel):
@@ -1051,6 +1024,8 @@ class WaitingListEntry(TapirModel):
     category = models.CharField(max_length=100, null=True)
     confirmation_link_key = models.UUIDField(null=True)
     link_sent_date = models.DateTimeField(null=True)
+    # Set by the update_waiting_list_fulfillability task, null if the entry has not been evaluated since it was created or changed
+    can_be_fulfilled = models.BooleanField(null=True)
 
 
 class WaitingListPickupLocationWish(TapirModel):
@@ -1235,3 +1210,35 @@ class OrderFeedback(TapirModel):
             raise ValidationError(
                 "OrderFeedback must have either a member or a waiting_list_entry."
             )
+
+
+class DailyStatistic(TapirModel):
+    """
+    One value shown on the admin dashboard, as it was on the given day.
+    The rows of a day are written by DailyStatisticsMaterializer, usually from the nightly task, and kept for the history.
+    The dimension identifies the value within the metric (for example a month, a product type or a capacity), it is empty if the metric has a single value per day.
+    """
+
+    class Metric(models.TextChoices):
+        ACTIVE_SUBSCRIPTIONS = "active_subscriptions"
+        CANCELLED_SUBSCRIPTIONS = "cancelled_subscriptions"
+        CANCELLED_SUBSCRIPTIONS_IN_TRIAL = "cancelled_subscriptions_in_trial"
+        CANCELLED_SUBSCRIPTIONS_TOTAL = "cancelled_subscriptions_total"
+        TRAFFIC_SOURCE_RESPONSES = "traffic_source_responses"
+        ACTIVE_COOP_MEMBERS = "active_coop_members"
+        COOP_SHARES_QUANTITY = "coop_shares_quantity"
+        CAPACITY_USED = "capacity_used"
+        CAPACITY_BASE_SHARE_SIZE = "capacity_base_share_size"
+
+    class Meta:
+        constraints = [
+            UniqueConstraint(
+                fields=["date", "metric", "dimension"],
+                name="unique_daily_statistic",
+            ),
+        ]
+
+    date = models.DateField()
+    metric = models.CharField(max_length=64, choices=Metric.choices)
+    dimension = models.CharField(max_length=256, blank=True, default="")
+    value = models.FloatField()
@@ -7,6 +7,7 @@ from tapir.configuration.models import (
     TapirParameter,
 )
 from tapir.configuration.parameter import ParameterMeta, parameter_definition
+from tapir.utils.services.tapir_cache_manager import TapirCacheManager
 from tapir.wirgarten.parameter_definitions.parameter_definitions_bestellwizard import (
     ParameterDefinitionsBestellwizard,
 )
@@ -64,6 +65,9 @@ class ParameterDefinitions(TapirParameterDefinitionImporter):
         self.define_all_parameters()
         if bulk_create:
             TapirParameter.objects.bulk_create(self.parameters_to_create)
+            TapirCacheManager.clear_category(
+                cache=None, category=TapirCacheManager.CATEGORY_PARAMETERS
+            )
 
     def define_all_parameters(self):
         ParameterDefinitionsBestellwizard.define_all_member_bestellwizard(importer=self)
@@ -0,0 +1,315 @@
+import datetime
+
+from dateutil.relativedelta import relativedelta
+from django.db import transaction
+from django.db.models import Count, DateField, Sum
+from django.db.models.functions import TruncMonth
+from django.utils import timezone
+
+from tapir.subscriptions.services.contract_start_date_calculator import (
+    ContractStartDateCalculator,
+)
+from tapir.subscriptions.services.product_type_lowest_free_capacity_after_date_generic import (
+    ProductTypeLowestFreeCapacityAfterDateCalculator,
+)
+from tapir.subscriptions.services.trial_period_manager import TrialPeriodManager
+from tapir.utils.services.tapir_cache import TapirCache
+from tapir.utils.shortcuts import get_last_day_of_month
+from tapir.wirgarten.models import (
+    CoopShareTransaction,
+    DailyStatistic,
+    Member,
+    QuestionaireTrafficSourceResponse,
+    Subscription,
+)
+from tapir.wirgarten.service.member import (
+    annotate_member_queryset_with_coop_shares_total_value,
+)
+from tapir.wirgarten.service.products import (
+    get_active_product_capacities,
+    get_next_growing_period,
+    get_product_price,
+)
+from tapir.wirgarten.utils import legal_status_is_cooperative
+
+Metric = DailyStatistic.Metric
+
+
+class DailyStatisticsMaterializer:
+    """
+    Computes the values of the admin dashboard for a given day and stores them as DailyStatistic rows.
+    The dashboard then only reads the rows of the current day.
+    """
+
+    NB_MONTHS_IN_CHARTS = 13
+    CAPACITY_PREFIX_CURRENT = "current"
+    CAPACITY_PREFIX_NEXT = "next"
+
+    @classmethod
+    def get_statistics(
+        cls, reference_date: datetime.date, cache: dict, force_refresh: bool = False
+    ) -> dict[tuple[str, str], float]:
+        """
+        The statistics of the given day keyed by (metric, dimension).
+        If the nightly task hasn't run for that day yet, they are materialized now.
+        """
+        rows = []
+        if not force_refresh:
+            rows = list(
+                DailyStatistic.objects.filter(date=reference_date).values_list(
+                    "metric", "dimension", "value"
+                )
+            )
+        if len(rows) == 0:
+            rows = [
+                (statistic.metric, statistic.dimension, statistic.value)
+                for statistic in cls.materialize(
+                    reference_date=reference_date, cache=cache
+                )
+            ]
+
+        return {(metric, dimension): value for metric, dimension, value in rows}
+
+    @classmethod
+    def materialize(
+        cls, reference_date: datetime.date, cache: dict
+    ) -> list[DailyStatistic]:
+        values: dict[tuple[str, str], float] = {}
+        values.update(cls.build_active_subscriptions(reference_date))
+        values.update(cls.build_cancellations(reference_date, cache=cache))
+        values.update(cls.build_traffic_sources(reference_date))
+        values.update(cls.build_capacities(reference_date, cache=cache))
+        if legal_status_is_cooperative(cache=cache):
+            values.update(cls.build_coop_shares(reference_date, cache=cache))
+
+        statistics = [
+            DailyStatistic(
+                date=reference_date, metric=metric, dimension=dimension, value=value
+            )
+            for (metric, dimension), value in values.items()
+        ]
+        with transaction.atomic():
+            # Upserted so that concurrent materializations of the same day don't conflict
+            DailyStatistic.objects.bulk_create(
+                statistics,
+                update_conflicts=True,
+                unique_fields=["date", "metric", "dimension"],
+                update_fields=["value", "updated_at"],
+            )
+            # The rows of values that are not computed anymore, for example of a deleted capacity
+            stale_statistic_ids = [
+                statistic_id
+                for statistic_id, metric, dimension in DailyStatistic.objects.filter(
+                    date=reference_date
+                ).values_list("id", "metric", "dimension")
+                if (metric, dimension) not in values
+            ]
+            DailyStatistic.objects.filter(id__in=stale_statistic_ids).delete()
+
+        return statistics
+
+    @classmethod
+    def get_cancellation_months(cls, reference_date: datetime.date):
+        return [
+            reference_date + relativedelta(day=1, months=-i + 1)
+            for i in range(cls.NB_MONTHS_IN_CHARTS)
+        ][::-1]
+
+    @classmethod
+    def get_traffic_source_months(cls, reference_date: datetime.date):
+        return [
+            reference_date + relativedelta(day=1, months=-i)
+            for i in range(cls.NB_MONTHS_IN_CHARTS)
+        ][::-1]
+
+    @staticmethod
+    def build_month_dimension(month: datetime.date) -> str:
+        return month.strftime("%Y-%m")
+
+    @classmethod
+    def build_traffic_source_dimension(
+        cls, month: datetime.date, option_id: str | None
+    ) -> str:
+        # The members that didn't answer are stored without option id
+        return f"{cls.build_month_dimension(month)}/{option_id or ''}"
+
+    @staticmethod
+    def build_capacity_dimension(prefix: str, capacity_id: str) -> str:
+        return f"{prefix}/{capacity_id}"
+
+    @classmethod
+    def build_active_subscriptions(cls, reference_date: datetime.date):
+        rows = (
+            Subscription.objects.filter(
+                start_date__lte=reference_date, end_date__gte=reference_date
+            )
+            .values("product__type_id")
+            .annotate(count=Count("id"))
+            .values_list("product__type_id", "count")
+        )
+        return {
+            (Metric.ACTIVE_SUBSCRIPTIONS, product_type_id): count
+            for product_type_id, count in rows
+        }
+
+    @classmethod
+    def build_cancellations(cls, reference_date: datetime.date, cache: dict):
+        months = cls.get_cancellation_months(reference_date)
+        values = {}
+        for month in months:
+            values[
+                (Metric.CANCELLED_SUBSCRIPTIONS, cls.build_month_dimension(month))
+            ] = 0
+            values[
+                (
+                    Metric.CANCELLED_SUBSCRIPTIONS_IN_TRIAL,
+                    cls.build_month_dimension(month),
+                )
+            ] = 0
+
+        # cancellation_ts__date uses the current timezone, the same as the local month below
+        cancelled_subscriptions = Subscription.objects.filter(
+            cancellation_ts__date__gte=months[0],
+            cancellation_ts__date__lte=get_last_day_of_month(months[-1]),
+        )
+        for subscription in cancelled_subscriptions:
+            dimension = cls.build_month_dimension(
+                timezone.localtime(subscription.cancellation_ts).date()
+            )
+            values[(Metric.CANCELLED_SUBSCRIPTIONS, dimension)] += 1
+            if TrialPeriodManager.is_contract_in_trial(
+                subscription,
+                reference_date=subscription.cancellation_ts.date(),
+                cache=cache,
+            ):
+                values[(Metric.CANCELLED_SUBSCRIPTIONS_IN_TRIAL, dimension)] += 1
+
+        values[(Metric.CANCELLED_SUBSCRIPTIONS_TOTAL, "")] = (
+            Subscription.objects.filter(cancellation_ts__isnull=False).count()
+        )
+
+        return values
+
+    @classmethod
+    def build_traffic_sources(cls, reference_date: datetime.date):
+        months = cls.get_traffic_source_months(reference_date)
+        range_start = months[0]
+        range_end = get_last_day_of_month(months[-1])
+        values = {}
+
+        responses_per_option = (
+            QuestionaireTrafficSourceResponse.objects.filter(
+                timestamp__date__gte=range_start,
+                timestamp__date__lte=range_end,
+                sources__isnull=False,
+            )
+            .annotate(month=TruncMonth("timestamp", output_field=DateField()))
+            .values("month", "sources")
+            .annotate(count=Count("id", distinct=True))
+            .values_list("month", "sources", "count")
+        )
+        for month, option_id, count in responses_per_option:
+            values[
+                (
+                    Metric.TRAFFIC_SOURCE_RESPONSES,
+                    cls.build_traffic_source_dimension(month, option_id),
+                )
+            ] = count
+
+        # Members that joined in a month without answering the questionnaire in that month
+        months_with_response_by_member_id = {}
+        for member_id, timestamp in QuestionaireTrafficSourceResponse.objects.filter(
+            timestamp__date__gte=range_start, timestamp__date__lte=range_end
+        ).values_list("member_id", "timestamp"):
+            months_with_response_by_member_id.setdefault(member_id, set()).add(
+                timezone.localtime(timestamp).date().replace(day=1)
+            )
+        for member_id, created_at in Member.objects.filter(
+            created_at__date__gte=range_start, created_at__date__lte=range_end
+        ).values_list("id", "created_at"):
+            month = timezone.localtime(created_at).date().replace(day=1)
+            if month in months_with_response_by_member_id.get(member_id, set()):
+                continue
+            key = (
+                Metric.TRAFFIC_SOURCE_RESPONSES,
+                cls.build_traffic_source_dimension(month, None),
+            )
+            values[key] = values.get(key, 0) + 1
+
+        return values
+
+    @classmethod
+    def get_capacity_reference_dates(
+        cls, reference_date: datetime.date, cache: dict
+    ) -> dict[str, datetime.date]:
+        next_contract_start_date = (
+            ContractStartDateCalculator.get_next_contract_start_date(
+                reference_date=reference_date,
+                apply_buffer_time=True,
+                cache=cache,
+            )
+        )
+        reference_dates = {cls.CAPACITY_PREFIX_CURRENT: next_contract_start_date}
+
+        next_growing_period = get_next_growing_period(
+            next_contract_start_date, cache=cache
+        )
+        if next_growing_period:
+            reference_dates[cls.CAPACITY_PREFIX_NEXT] = next_growing_period.start_date
+
+        return reference_dates
+
+    @classmethod
+    def build_capacities(cls, reference_date: datetime.date, cache: dict):
+        values = {}
+        for prefix, capacity_reference_date in cls.get_capacity_reference_dates(
+            reference_date, cache=cache
+        ).items():
+            for product_capacity in get_active_product_capacities(
+                capacity_reference_date, cache=cache
+            ).select_related("product_type"):
+                dimension = cls.build_capacity_dimension(prefix, product_capacity.id)
+
+                total_capacity = (
+                    float(product_capacity.capacity) or 1
+                )  # "or 1" to avoid a division by 0
+                free_capacity = ProductTypeLowestFreeCapacityAfterDateCalculator.get_lowest_free_capacity_after_date(
+                    product_type=product_capacity.product_type,
+                    reference_date=capacity_reference_date,
+                    cache=cache,
+                )
+                values[(Metric.CAPACITY_USED, dimension)] = (
+                    total_capacity - free_capacity
+                )
+
+                base_product = TapirCache.get_base_product_by_product_type_id(
+                    product_type_id=product_capacity.product_type_id, cache=cache
+                )
+                product_price = get_product_price(
+                    base_product, capacity_reference_date, cache=cache
+                )
+                values[(Metric.CAPACITY_BASE_SHARE_SIZE, dimension)] = (
+                    float(product_price.size) if product_price is not None else 1
+                )
+
+        return values
+
+    @classmethod
+    def build_coop_shares(cls, reference_date: datetime.date, cache: dict):
+        next_contract_start_date = cls.get_capacity_reference_dates(
+            reference_date, cache=cache
+        )[cls.CAPACITY_PREFIX_CURRENT]
+
+        members_with_shares = annotate_member_queryset_with_coop_shares_total_value(
+            Member.objects.all(), cache=cache
+        ).filter(coop_shares_total_value__gt=0)
+
+        return {
+            (Metric.ACTIVE_COOP_MEMBERS, ""): members_with_shares.count(),
+            (Metric.COOP_SHARES_QUANTITY, ""): CoopShareTransaction.objects.filter(
+                valid_at__lt=next_contract_start_date
+            )
+            .aggregate(quantity=Sum("quantity"))
+            .get("quantity", 0)
+            or 0,
+        }
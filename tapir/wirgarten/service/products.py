@@ -153,6 +153,12 @@ def copy_growing_period(
     ]
     CustomCycleScheduledDeliveryWeek.objects.bulk_create(delivery_weeks_to_create)
 
+    for category in [
+        TapirCacheManager.CATEGORY_CAPACITIES,
+        TapirCacheManager.CATEGORY_DELIVERIES,
+    ]:
+        TapirCacheManager.clear_category(cache=None, category=category)
+
     return new_growing_period
 
 
@@ -295,29 +301,22 @@ def get_product_price(
     if isinstance(product, Product):
         product = product.id
 
-    cache_for_this_product = get_from_cache_or_compute(cache, product, lambda: {})
-    price_by_date_cache = get_from_cache_or_compute(
-        cache_for_this_product, "price_by_date", lambda: {}
-    )
-
-    def get_price():
-        prices = list(TapirCache.get_product_prices_by_product_id(cache, product))
-        if len(prices) == 0:
-            return None
-
-        prices.sort(key=lambda p: p.valid_from, reverse=False)
-        oldest_price = prices[0]
-        if oldest_price.valid_from > reference_date:
-            # If no price is defined at the subscription start date, get the closest available price
-            return oldest_price
-
-        prices.sort(key=lambda p: p.valid_from, reverse=True)
-        for price in prices:
-            if price.valid_from <= reference_date:
-                return price
-        return None
+    if cache is None:
+        # Without a cache to keep it, building the timeline of all prices would cost more than a single lookup
+        prices = ProductPrice.objects.filter(product_id=product)
+        price = (
+            prices.filter(valid_from__lte=reference_date)
+            .order_by("-valid_from")
+            .first()
+        )
+        if price is None:
+            # If no price is defined at the reference date, the closest available price is the oldest one
+            price = prices.order_by("valid_from").first()
+        return price
 
-    return get_from_cache_or_compute(price_by_date_cache, reference_date, get_price)
+    return TapirCache.get_product_price_timeline(cache=cache).get_price_at_date(
+        product_id=product, reference_date=reference_date
+    )
 
 
 @transaction.atomic
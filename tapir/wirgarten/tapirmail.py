@@ -36,6 +36,31 @@ TOKENS_COOP_ENTRY = {
     "Vereinsmitgliedschaft - Monatspreis": "membership_monthly_price",
 }
 
+USER_TOKENS = {
+    "Vorname": "first_name",
+    "Nachname": "last_name",
+    "Email": "email",
+    "Mitglieds-Nr": "member_no",
+    "Kontoempfänger": "account_owner",
+    "IBAN": "iban",
+}
+
+DYNAMIC_TOKENS = {
+    "Mitglied - Beitrittsdatum": OrganisationEntryDateAnnotator.get_organisation_entry_date,
+    "Mitglied - Post-Adresse": MemberMailTokenService.get_post_address,
+    "Mitglied - Abholort": MemberMailTokenService.get_pickup_location_name,
+    "Mitglied - Ernteanteilsgrößen": MemberMailTokenService.get_base_subscriptions_text,
+    "Verteilstation - Name": PickupLocationMailTokenService.pickup_location_name,
+    "Verteilstation - Adresse": PickupLocationMailTokenService.pickup_location_address,
+    "Verteilstation - Zugangscode": PickupLocationMailTokenService.pickup_location_access_code,
+    "Verteilstation - Messenger-Gruppe": PickupLocationMailTokenService.pickup_location_messenger_group_link,
+    "Verteilstation - Kontaktname": PickupLocationMailTokenService.pickup_location_contact_name,
+    "Verteilstation - Photo-Link": PickupLocationMailTokenService.pickup_location_photo_link,
+    "Verteilstation - Zusatzinfos": PickupLocationMailTokenService.pickup_location_info,
+    "Verteilstation - Abholzeiten": PickupLocationMailTokenService.pickup_location_opening_times,
+    "Newsletter - Verwaltungslink": NewsletterManagementLinkProvider.get_newsletter_management_link,
+}
+
 
 class Segments:
     ALL_USERS = "Alle Benutzer"
@@ -59,16 +84,7 @@ def configure_mail_module():
 def _register_tokens():
     cache = {}
     register_tokens(
-        user_tokens={
-            "Vorname": "first_name",
-            "Nachname": "last_name",
-            "Email": "email",
-            "Abholort": "pickup_location",
-            "Mitglieds-Nr": "member_no",
-            "Kontoempfänger": "account_owner",
-            "IBAN": "iban",
-            "Ernteanteilsgrößen": "base_subscriptions_text",
-        },
+        user_tokens=USER_TOKENS,
         general_tokens={
             "WirGarten Standort": lambda: get_parameter_value(
                 ParameterKeys.SITE_NAME, cache=cache
@@ -104,19 +120,7 @@ def _register_tokens():
             "Jahr (nächstes)": lambda: get_today(cache=cache).year + 1,
             "Jahr (übernächstes)": lambda: get_today(cache=cache).year + 2,
         },
-        dynamic_tokens={
-            "Mitglied - Beitrittsdatum": OrganisationEntryDateAnnotator.get_organisation_entry_date,
-            "Mitglied - Post-Adresse": MemberMailTokenService.get_post_address,
-            "Verteilstation - Name": PickupLocationMailTokenService.pickup_location_name,
-            "Verteilstation - Adresse": PickupLocationMailTokenService.pickup_location_address,
-            "Verteilstation - Zugangscode": PickupLocationMailTokenService.pickup_location_access_code,
-            "Verteilstation - Messenger-Gruppe": PickupLocationMailTokenService.pickup_location_messenger_group_link,
-            "Verteilstation - Kontaktname": PickupLocationMailTokenService.pickup_location_contact_name,
-            "Verteilstation - Photo-Link": PickupLocationMailTokenService.pickup_location_photo_link,
-            "Verteilstation - Zusatzinfos": PickupLocationMailTokenService.pickup_location_info,
-            "Verteilstation - Abholzeiten": PickupLocationMailTokenService.pickup_location_opening_times,
-            "Newsletter - Verwaltungslink": NewsletterManagementLinkProvider.get_newsletter_management_link,
-        },
+        dynamic_tokens=DYNAMIC_TOKENS,
     )
 
 
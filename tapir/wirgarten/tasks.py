@@ -19,6 +19,9 @@ from tapir.wirgarten.models import (
     ScheduledTask,
 )
 from tapir.wirgarten.parameter_keys import ParameterKeys
+from tapir.wirgarten.service.daily_statistics_materializer import (
+    DailyStatisticsMaterializer,
+)
 from tapir.wirgarten.service.file_export import export_file
 from tapir.wirgarten.service.get_next_delivery_date import get_next_delivery_date
 from tapir.wirgarten.service.products import (
@@ -188,3 +191,13 @@ def assign_member_numbers(cache: dict = None):
                 continue
 
             logger.info(f"assign_member_numbers: generated member_no for {member}")
+
+
+@shared_task
+def materialize_daily_statistics(cache: dict = None):
+    if cache is None:
+        cache = {}
+
+    DailyStatisticsMaterializer.materialize(
+        reference_date=get_today(cache=cache), cache=cache
+    )
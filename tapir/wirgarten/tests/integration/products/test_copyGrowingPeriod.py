@@ -0,0 +1,32 @@
+import datetime
+from unittest.mock import patch, Mock
+
+from tapir.utils.services.tapir_cache_manager import TapirCacheManager
+from tapir.utils.services.tapir_shared_cache import TapirSharedCache
+from tapir.wirgarten.models import ProductCapacity
+from tapir.wirgarten.service.products import copy_growing_period
+from tapir.wirgarten.tests.factories import ProductCapacityFactory
+from tapir.wirgarten.tests.test_utils import TapirIntegrationTest
+
+
+class TestCopyGrowingPeriod(TapirIntegrationTest):
+    @patch.object(TapirSharedCache, "on_category_changed", autospec=True)
+    def test_copyGrowingPeriod_default_copiesTheCapacitiesAndInvalidatesTheSharedCapacities(
+        self, mock_on_category_changed: Mock
+    ):
+        source_capacity = ProductCapacityFactory.create(
+            period__start_date=datetime.date(year=2025, month=1, day=1),
+            period__end_date=datetime.date(year=2025, month=12, day=31),
+        )
+        mock_on_category_changed.reset_mock()
+
+        new_growing_period = copy_growing_period(
+            growing_period_id=source_capacity.period_id,
+            start_date=datetime.date(year=2026, month=1, day=1),
+            end_date=datetime.date(year=2026, month=12, day=31),
+        )
+
+        new_capacity = ProductCapacity.objects.get(period=new_growing_period)
+        self.assertEqual(source_capacity.product_type_id, new_capacity.product_type_id)
+        self.assertEqual(source_capacity.capacity, new_capacity.capacity)
+        mock_on_category_changed.assert_any_call(TapirCacheManager.CATEGORY_CAPACITIES)
@@ -0,0 +1,36 @@
+import datetime
+
+from tapir.wirgarten.service.products import get_product_price
+from tapir.wirgarten.tests.factories import ProductFactory, ProductPriceFactory
+from tapir.wirgarten.tests.test_utils import TapirIntegrationTest
+
+
+class TestGetProductPrice(TapirIntegrationTest):
+    def setUp(self):
+        super().setUp()
+        self.product = ProductFactory.create()
+        for month in [1, 3, 6]:
+            ProductPriceFactory.create(
+                product=self.product,
+                valid_from=datetime.date(year=2024, month=month, day=1),
+            )
+
+    def test_getProductPrice_noCache_sameResultAsWithCache(self):
+        for reference_date in [
+            datetime.date(year=2023, month=12, day=31),
+            datetime.date(year=2024, month=3, day=1),
+            datetime.date(year=2024, month=5, day=31),
+            datetime.date(year=2024, month=7, day=1),
+        ]:
+            self.assertEqual(
+                get_product_price(self.product, reference_date, cache={}),
+                get_product_price(self.product, reference_date),
+            )
+
+    def test_getProductPrice_noCache_loadsASinglePrice(self):
+        with self.assertNumQueries(1):
+            price = get_product_price(
+                self.product, datetime.date(year=2024, month=5, day=31)
+            )
+
+        self.assertEqual(datetime.date(year=2024, month=3, day=1), price.valid_from)
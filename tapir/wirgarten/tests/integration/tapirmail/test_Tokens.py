@@ -1,8 +1,9 @@
 from tapir_mail.service.token import token_registry
 
 from tapir.wirgarten.parameters import ParameterDefinitions
-from tapir.wirgarten.tapirmail import _register_tokens
+from tapir.wirgarten.tapirmail import _register_tokens, DYNAMIC_TOKENS
 from tapir.wirgarten.tests.factories import (
+    MemberPickupLocationFactory,
     MemberWithSubscriptionFactory,
 )
 from tapir.wirgarten.tests.test_utils import TapirIntegrationTest
@@ -36,3 +37,25 @@ class TokenTest(TapirIntegrationTest):
                 v() if callable(v) else v
             except Exception as e:
                 self.fail(f"Failed to resolve general token '{k}': {e}")
+
+    def test_tokens_dynamicTokensWithACacheSharedByAllRecipients_sameValuesAsWithOneCachePerRecipient(
+        self,
+    ):
+        members = [MemberWithSubscriptionFactory.create() for _ in range(2)]
+        for member in members:
+            MemberPickupLocationFactory.create(member=member)
+
+        shared_cache = {}
+        for member in members:
+            for token_name, function in DYNAMIC_TOKENS.items():
+                self.assertEqual(
+                    function(member, {}), function(member, shared_cache), token_name
+                )
+            self.assertEqual(
+                member.pickup_location.name,
+                DYNAMIC_TOKENS["Mitglied - Abholort"](member, shared_cache),
+            )
+            self.assertEqual(
+                member.base_subscriptions_text,
+                DYNAMIC_TOKENS["Mitglied - Ernteanteilsgrößen"](member, shared_cache),
+            )
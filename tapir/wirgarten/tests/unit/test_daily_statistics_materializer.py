@@ -0,0 +1,246 @@
+import datetime
+from unittest.mock import patch
+
+from django.utils import timezone
+
+from tapir.wirgarten.models import DailyStatistic
+from tapir.wirgarten.parameters import ParameterDefinitions
+from tapir.wirgarten.service.daily_statistics_materializer import (
+    DailyStatisticsMaterializer,
+)
+from tapir.wirgarten.tests.factories import (
+    GrowingPeriodFactory,
+    SubscriptionFactory,
+)
+from tapir.wirgarten.tests.test_utils import TapirIntegrationTest
+
+
+class TestDailyStatisticsMaterializer(TapirIntegrationTest):
+    @classmethod
+    def setUpTestData(cls):
+        ParameterDefinitions().import_definitions(bulk_create=True)
+
+    def test_getStatistics_rowsExistForTheDay_returnsRowsWithoutMaterializing(
+        self,
+    ):
+        reference_date = datetime.date(year=2025, month=3, day=10)
+        DailyStatistic.objects.create(
+            date=reference_date,
+            metric=DailyStatistic.Metric.CANCELLED_SUBSCRIPTIONS_TOTAL,
+            value=4,
+        )
+
+        with patch.object(
+            DailyStatisticsMaterializer, "materialize", autospec=True
+        ) as mock_materialize:
+            statistics = DailyStatisticsMaterializer.get_statistics(
+                reference_date=reference_date, cache={}
+            )
+
+        mock_materialize.assert_not_called()
+        self.assertEqual(
+            {(DailyStatistic.Metric.CANCELLED_SUBSCRIPTIONS_TOTAL, ""): 4},
+            statistics,
+        )
+
+    def test_getStatistics_noRowsForTheDay_materializesTheDay(self):
+        reference_date = datetime.date(year=2025, month=3, day=10)
+        DailyStatistic.objects.create(
+            date=reference_date - datetime.timedelta(days=1),
+            metric=DailyStatistic.Metric.CANCELLED_SUBSCRIPTIONS_TOTAL,
+            value=4,
+        )
+
+        with patch.object(
+            DailyStatisticsMaterializer,
+            "materialize",
+            autospec=True,
+            return_value=[
+                DailyStatistic(
+                    date=reference_date,
+                    metric=DailyStatistic.Metric.CANCELLED_SUBSCRIPTIONS_TOTAL,
+                    value=5,
+                )
+            ],
+        ) as mock_materialize:
+            statistics = DailyStatisticsMaterializer.get_statistics(
+                reference_date=reference_date, cache={}
+            )
+
+        mock_materialize.assert_called_once_with(
+            reference_date=reference_date, cache={}
+        )
+        self.assertEqual(
+            {(DailyStatistic.Metric.CANCELLED_SUBSCRIPTIONS_TOTAL, ""): 5},
+            statistics,
+        )
+
+    def test_materialize_calledTwiceForTheSameDay_updatesTheValues(self):
+        reference_date = datetime.date(year=2025, month=3, day=10)
+        key = (DailyStatistic.Metric.CANCELLED_SUBSCRIPTIONS_TOTAL, "")
+
+        with (
+            patch.object(
+                DailyStatisticsMaterializer,
+                "build_active_subscriptions",
+                autospec=True,
+                return_value={},
+            ),
+            patch.object(
+                DailyStatisticsMaterializer, "build_cancellations", autospec=True
+            ) as mock_build_cancellations,
+            patch.object(
+                DailyStatisticsMaterializer,
+                "build_traffic_sources",
+                autospec=True,
+                return_value={},
+            ),
+            patch.object(
+                DailyStatisticsMaterializer,
+                "build_capacities",
+                autospec=True,
+                return_value={},
+            ),
+            patch.object(
+                DailyStatisticsMaterializer,
+                "build_coop_shares",
+                autospec=True,
+                return_value={},
+            ),
+        ):
+            mock_build_cancellations.return_value = {key: 4}
+            DailyStatisticsMaterializer.materialize(
+                reference_date=reference_date, cache={}
+            )
+            mock_build_cancellations.return_value = {key: 5}
+            DailyStatisticsMaterializer.materialize(
+                reference_date=reference_date, cache={}
+            )
+
+        self.assertEqual(
+            [5],
+            list(
+                DailyStatistic.objects.filter(date=reference_date).values_list(
+                    "value", flat=True
+                )
+            ),
+        )
+
+    def test_materialize_valueNotComputedAnymore_deletesItsRow(self):
+        reference_date = datetime.date(year=2025, month=3, day=10)
+        DailyStatistic.objects.create(
+            date=reference_date,
+            metric=DailyStatistic.Metric.CAPACITY_USED,
+            dimension="current/deleted_capacity",
+            value=4,
+        )
+        DailyStatistic.objects.create(
+            date=reference_date - datetime.timedelta(days=1),
+            metric=DailyStatistic.Metric.CAPACITY_USED,
+            dimension="current/deleted_capacity",
+            value=4,
+        )
+
+        with (
+            patch.object(
+                DailyStatisticsMaterializer,
+                "build_active_subscriptions",
+                autospec=True,
+                return_value={},
+            ),
+            patch.object(
+                DailyStatisticsMaterializer,
+                "build_cancellations",
+                autospec=True,
+                return_value={},
+            ),
+            patch.object(
+                DailyStatisticsMaterializer,
+                "build_traffic_sources",
+                autospec=True,
+                return_value={},
+            ),
+            patch.object(
+                DailyStatisticsMaterializer,
+                "build_capacities",
+                autospec=True,
+                return_value={},
+            ),
+            patch.object(
+                DailyStatisticsMaterializer,
+                "build_coop_shares",
+                autospec=True,
+                return_value={},
+            ),
+        ):
+            DailyStatisticsMaterializer.materialize(
+                reference_date=reference_date, cache={}
+            )
+
+        self.assertFalse(
+            DailyStatistic.objects.filter(
+                date=reference_date, dimension="current/deleted_capacity"
+            ).exists()
+        )
+        self.assertTrue(
+            DailyStatistic.objects.filter(
+                date=reference_date - datetime.timedelta(days=1),
+                dimension="current/deleted_capacity",
+            ).exists()
+        )
+
+    def test_buildActiveSubscriptions_default_countsOnlySubscriptionsActiveAtDatePerProductType(
+        self,
+    ):
+        growing_period = GrowingPeriodFactory.create(
+            start_date=datetime.date(year=2025, month=1, day=1),
+            end_date=datetime.date(year=2025, month=12, day=31),
+        )
+        subscription = SubscriptionFactory.create(period=growing_period)
+        SubscriptionFactory.create(period=growing_period, product=subscription.product)
+        SubscriptionFactory.create(
+            period=growing_period,
+            product=subscription.product,
+            start_date=datetime.date(year=2025, month=6, day=1),
+        )
+
+        values = DailyStatisticsMaterializer.build_active_subscriptions(
+            reference_date=datetime.date(year=2025, month=3, day=10)
+        )
+
+        self.assertEqual(
+            {
+                (
+                    DailyStatistic.Metric.ACTIVE_SUBSCRIPTIONS,
+                    subscription.product.type_id,
+                ): 2
+            },
+            values,
+        )
+
+    def test_buildCancellations_default_countsCancellationsPerMonth(self):
+        growing_period = GrowingPeriodFactory.create(
+            start_date=datetime.date(year=2025, month=1, day=1),
+            end_date=datetime.date(year=2025, month=12, day=31),
+        )
+        for cancellation_day in [3, 20]:
+            SubscriptionFactory.create(
+                period=growing_period,
+                cancellation_ts=timezone.make_aware(
+                    datetime.datetime(year=2025, month=2, day=cancellation_day, hour=12)
+                ),
+            )
+
+        values = DailyStatisticsMaterializer.build_cancellations(
+            reference_date=datetime.date(year=2025, month=3, day=10), cache={}
+        )
+
+        self.assertEqual(
+            2, values[(DailyStatistic.Metric.CANCELLED_SUBSCRIPTIONS, "2025-02")]
+        )
+        self.assertEqual(
+            0, values[(DailyStatistic.Metric.CANCELLED_SUBSCRIPTIONS, "2025-03")]
+        )
+        self.assertEqual(
+            2, values[(DailyStatistic.Metric.CANCELLED_SUBSCRIPTIONS_TOTAL, "")]
+        )
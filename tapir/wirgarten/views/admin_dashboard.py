@@ -2,7 +2,7 @@ import json
 
 from dateutil.relativedelta import relativedelta
 from django.contrib.auth.mixins import PermissionRequiredMixin
-from django.db.models import Count, Max, Sum
+from django.db.models import Count, Sum
 from django.db.models.functions import ExtractYear
 from django.http import JsonResponse
 from django.urls import reverse_lazy
@@ -11,43 +11,29 @@ from django.views.decorators.http import require_GET
 
 from tapir.associations.models import AssociationMembership
 from tapir.configuration.parameter import get_parameter_value
-from tapir.payments.services.month_payment_builder import MonthPaymentBuilder
+from tapir.payments.services.cashflow_forecast_service import CashflowForecastService
 from tapir.solidarity_contribution.services.solidarity_validator import (
     SolidarityValidator,
 )
-from tapir.subscriptions.services.contract_start_date_calculator import (
-    ContractStartDateCalculator,
-)
-from tapir.subscriptions.services.product_type_lowest_free_capacity_after_date_generic import (
-    ProductTypeLowestFreeCapacityAfterDateCalculator,
-)
-from tapir.subscriptions.services.trial_period_manager import TrialPeriodManager
 from tapir.utils.services.tapir_cache import TapirCache
 from tapir.utils.shortcuts import get_first_of_next_month
 from tapir.wirgarten.models import (
     CoopShareTransaction,
-    Member,
+    DailyStatistic,
     OrderFeedback,
     QuestionaireCancellationReasonResponse,
     QuestionaireTrafficSourceOption,
-    QuestionaireTrafficSourceResponse,
     Subscription,
-    Payment,
     ProductType,
 )
 from tapir.wirgarten.parameter_keys import ParameterKeys
-from tapir.wirgarten.service.member import (
-    annotate_member_queryset_with_coop_shares_total_value,
-)
-from tapir.wirgarten.service.payment import (
-    get_next_payment_date,
+from tapir.wirgarten.service.daily_statistics_materializer import (
+    DailyStatisticsMaterializer,
 )
 from tapir.wirgarten.service.products import (
     get_active_product_capacities,
     get_active_product_types,
     get_active_and_future_subscriptions,
-    get_next_growing_period,
-    get_product_price,
 )
 from tapir.wirgarten.utils import (
     format_currency,
@@ -61,38 +47,10 @@ from tapir.wirgarten.utils import (
 @require_GET
 def get_cashflow_chart_data(request):
     cache = {}
-    last_contract_end = Subscription.objects.aggregate(max_date=Max("end_date"))[
-        "max_date"
-    ]
-
-    payment_dates = [get_next_payment_date(cache=cache)]
-    while payment_dates[-1] < last_contract_end:
-        payment_dates.append(payment_dates[-1] + relativedelta(months=1))
-
-    generated_payments = set()
-    monthly_sums = []
-    all_payments = Payment.objects.all()
-    for payment_date in payment_dates:
-        generated_payments_for_this_month = (
-            MonthPaymentBuilder.build_payments_for_month(
-                reference_date=payment_date,
-                cache=cache,
-                generated_payments=generated_payments,
-            )
-        )
-        generated_payments.update(generated_payments_for_this_month)
-
-        sum_for_this_month = sum(
-            [payment.amount for payment in generated_payments_for_this_month]
-        ) + sum(
-            [
-                payment.amount
-                for payment in all_payments
-                if payment.due_date.year == payment_date.year
-                and payment.due_date.month == payment_date.month
-            ]
-        )
-        monthly_sums.append(sum_for_this_month)
+    payment_dates = CashflowForecastService.get_payment_dates(cache=cache)
+    monthly_sums = CashflowForecastService.get_monthly_totals(
+        payment_dates=payment_dates, cache=cache
+    )
 
     return JsonResponse(
         {
@@ -163,29 +121,27 @@ class AdminDashboardView(PermissionRequiredMixin, generic.TemplateView):
             return context
 
         self.harvest_share_type = base_product_type
+        self.statistics = DailyStatisticsMaterializer.get_statistics(
+            reference_date=today, cache=self.cache
+        )
 
-        next_contract_start_date = (
-            ContractStartDateCalculator.get_next_contract_start_date(
-                reference_date=today,
-                apply_buffer_time=True,
-                cache=self.cache,
+        capacity_reference_dates = (
+            DailyStatisticsMaterializer.get_capacity_reference_dates(
+                reference_date=today, cache=self.cache
             )
         )
-        next_growing_period = get_next_growing_period(
-            next_contract_start_date, cache=self.cache
-        )
+        next_contract_start_date = capacity_reference_dates[
+            DailyStatisticsMaterializer.CAPACITY_PREFIX_CURRENT
+        ]
 
         context["next_contract_start_date"] = next_contract_start_date
-        context["next_period_start_date"] = (
-            next_growing_period.start_date if next_growing_period else None
+        context["next_period_start_date"] = capacity_reference_dates.get(
+            DailyStatisticsMaterializer.CAPACITY_PREFIX_NEXT
         )
 
-        self.add_capacity_chart_context(
-            context, base_product_type.id, next_contract_start_date
-        )
-        if next_growing_period:
+        for prefix, reference_date in capacity_reference_dates.items():
             self.add_capacity_chart_context(
-                context, base_product_type.id, next_growing_period.start_date, "next"
+                context, base_product_type.id, reference_date, prefix
             )
         self.add_traffic_source_questionaire_chart_context(context)
         self.add_cancellation_chart_context(context)
@@ -194,24 +150,16 @@ class AdminDashboardView(PermissionRequiredMixin, generic.TemplateView):
         self.add_cancelled_association_memberships_context(context)
 
         if legal_status_is_cooperative(cache=self.cache):
-            members_with_shares = annotate_member_queryset_with_coop_shares_total_value(
-                Member.objects.all(), cache=self.cache
-            ).filter(coop_shares_total_value__gt=0)
-            context["active_members"] = members_with_shares.count()
+            context["active_members"] = self.get_statistic(
+                DailyStatistic.Metric.ACTIVE_COOP_MEMBERS
+            )
             context["coop_shares_value"] = format_currency(
-                (
-                    CoopShareTransaction.objects.filter(
-                        valid_at__lt=next_contract_start_date
-                    )
-                    .aggregate(quantity=Sum("quantity"))
-                    .get("quantity", 0)
-                    or 0
-                )
+                self.get_statistic(DailyStatistic.Metric.COOP_SHARES_QUANTITY)
                 * get_parameter_value(ParameterKeys.COOP_SHARE_PRICE, cache=self.cache)
             ).replace(",00", "")
 
-        context["cancellations_during_trial"] = len(
-            Subscription.objects.filter(cancellation_ts__isnull=False)
+        context["cancellations_during_trial"] = self.get_statistic(
+            DailyStatistic.Metric.CANCELLED_SUBSCRIPTIONS_TOTAL
         )
 
         context["solidarity_overplus"] = SolidarityValidator.get_solidarity_excess(
@@ -244,6 +192,10 @@ class AdminDashboardView(PermissionRequiredMixin, generic.TemplateView):
 
         return context
 
+    def get_statistic(self, metric: str, dimension: str = "") -> int:
+        # The values are stored as floats, the counts are shown as integers
+        return round(self.statistics.get((metric, dimension), 0))
+
     def add_cancelled_coop_shares_context(self, context):
         cancellations = {
             c["year"]: -c["total_quantity"]
@@ -307,10 +259,9 @@ class AdminDashboardView(PermissionRequiredMixin, generic.TemplateView):
         context["cancellations_other_reasons"] = custom_responses
 
     def add_cancellation_chart_context(self, context):
-        month_labels = [
-            get_today(cache=self.cache) + relativedelta(day=1, months=-i + 1)
-            for i in range(13)
-        ][::-1]
+        month_labels = DailyStatisticsMaterializer.get_cancellation_months(
+            get_today(cache=self.cache)
+        )
 
         cancellations_data = [
             {"label": "Probeverträge", "data": [0] * 13},
@@ -318,27 +269,13 @@ class AdminDashboardView(PermissionRequiredMixin, generic.TemplateView):
         ]
 
         for index, month in enumerate(month_labels):
-            cancelled_subscriptions = Subscription.objects.filter(
-                cancellation_ts__isnull=False,
-                cancellation_ts__year=month.year,
-                cancellation_ts__month=month.month,
+            dimension = DailyStatisticsMaterializer.build_month_dimension(month)
+            cancellations_data[0]["data"][index] = self.get_statistic(
+                DailyStatistic.Metric.CANCELLED_SUBSCRIPTIONS, dimension
             )
-            subscriptions_cancelled_while_in_trial = list(
-                filter(
-                    lambda subscription: TrialPeriodManager.is_contract_in_trial(
-                        subscription,
-                        reference_date=subscription.cancellation_ts.date(),
-                        cache=self.cache,
-                    ),
-                    cancelled_subscriptions,
-                )
+            cancellations_data[1]["data"][index] = self.get_statistic(
+                DailyStatistic.Metric.CANCELLED_SUBSCRIPTIONS_IN_TRIAL, dimension
             )
-            trial_cancelled_count = len(subscriptions_cancelled_while_in_trial)
-
-            total_count = cancelled_subscriptions.count()
-
-            cancellations_data[0]["data"][index] = total_count
-            cancellations_data[1]["data"][index] = trial_cancelled_count
 
         # Format the month values
         cancellations_labels = [month.strftime("%m/%y") for month in month_labels]
@@ -382,33 +319,39 @@ class AdminDashboardView(PermissionRequiredMixin, generic.TemplateView):
 
         for product_capacity in sorted_product_capacities:
             product_type = product_capacity.product_type
+            dimension = DailyStatisticsMaterializer.build_capacity_dimension(
+                prefix, product_capacity.id
+            )
+            if (DailyStatistic.Metric.CAPACITY_USED, dimension) not in self.statistics:
+                # The capacity was created after the statistics of the day were materialized
+                self.statistics = DailyStatisticsMaterializer.get_statistics(
+                    reference_date=get_today(cache=self.cache),
+                    cache=self.cache,
+                    force_refresh=True,
+                )
+                if (
+                    DailyStatistic.Metric.CAPACITY_USED,
+                    dimension,
+                ) not in self.statistics:
+                    continue
 
             total_capacity = (
                 float(product_capacity.capacity) or 1
             )  # "or 1" to avoid a division by 0
 
-            free_capacity = ProductTypeLowestFreeCapacityAfterDateCalculator.get_lowest_free_capacity_after_date(
-                product_type=product_type,
-                reference_date=reference_date,
-                cache=self.cache,
-            )
-            used_capacity = total_capacity - free_capacity
+            used_capacity = self.statistics[
+                (DailyStatistic.Metric.CAPACITY_USED, dimension)
+            ]
+            free_capacity = total_capacity - used_capacity
 
             context[KEY_USED_CAPACITY].append(used_capacity / total_capacity * 100)
             context[KEY_FREE_CAPACITY].append(free_capacity / total_capacity * 100)
             context[KEY_CAPACITY_LINKS].append(
                 f"{reverse_lazy('wirgarten:product')}?periodId={product_capacity.period.id}&capacityId={product_capacity.id}"
             )
-            base_product = TapirCache.get_base_product_by_product_type_id(
-                product_type_id=product_capacity.product_type_id, cache=self.cache
-            )
-
-            product_price = get_product_price(
-                base_product, reference_date, cache=self.cache
-            )
-            base_share_size = (
-                float(product_price.size) if product_price is not None else 1
-            )
+            base_share_size = self.statistics[
+                (DailyStatistic.Metric.CAPACITY_BASE_SHARE_SIZE, dimension)
+            ]
 
             free_share_count = round(free_capacity / base_share_size, 2)
             used_share_count = round(used_capacity / base_share_size, 2)
@@ -426,13 +369,12 @@ class AdminDashboardView(PermissionRequiredMixin, generic.TemplateView):
             )
 
     def add_traffic_source_questionaire_chart_context(self, context):
-        month_labels = [
-            get_today(cache=self.cache) + relativedelta(day=1, months=-i)
-            for i in range(13)
-        ][::-1]
+        month_labels = DailyStatisticsMaterializer.get_traffic_source_months(
+            get_today(cache=self.cache)
+        )
 
         # Create an additional queryset for "No Response"
-        no_response = QuestionaireTrafficSourceOption(name="Keine Angabe")
+        no_response = QuestionaireTrafficSourceOption(id=None, name="Keine Angabe")
 
         # Combine actual options and "No Response"
         options = list(QuestionaireTrafficSourceOption.objects.all()) + [no_response]
@@ -440,41 +382,20 @@ class AdminDashboardView(PermissionRequiredMixin, generic.TemplateView):
         output = []
 
         for option in options:
-            option_data = {
-                "label": option.name,
-                "data": [0]
-                * 13,  # Initialize data with zeros for each of the 13 months
-            }
-
-            for index, month in enumerate(month_labels):
-                if option != no_response:
-                    response_count = (
-                        QuestionaireTrafficSourceResponse.objects.filter(
-                            sources=option,
-                            timestamp__month=month.month,
-                            timestamp__year=month.year,
-                        )
-                        .distinct()
-                        .count()
-                    )
-                else:
-                    response_count = (
-                        Member.objects.filter(
-                            created_at__month=month.month, created_at__year=month.year
+            output.append(
+                {
+                    "label": option.name,
+                    "data": [
+                        self.get_statistic(
+                            DailyStatistic.Metric.TRAFFIC_SOURCE_RESPONSES,
+                            DailyStatisticsMaterializer.build_traffic_source_dimension(
+                                month, option.id
+                            ),
                         )
-                        .exclude(
-                            id__in=QuestionaireTrafficSourceResponse.objects.filter(
-                                timestamp__month=month.month, timestamp__year=month.year
-                            )
-                            .distinct()
-                            .values_list("member_id", flat=True)
-                        )
-                        .count()
-                    )
-
-                option_data["data"][index] = response_count
-
-            output.append(option_data)
+                        for month in month_labels
+                    ],
+                }
+            )
 
         # Calculate the total responses per month
         total_responses_per_month = [
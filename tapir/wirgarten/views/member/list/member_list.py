@@ -19,6 +19,9 @@ from django_filters import (
 from django_filters.views import FilterView
 
 from tapir.associations.models import AssociationMembershipType
+from tapir.associations.services.association_membership_at_date_filter import (
+    AssociationMembershipAtDateFilter,
+)
 from tapir.configuration.parameter import get_parameter_value
 from tapir.coop.services.member_search_service import MemberSearchService
 from tapir.core.config import LEGAL_STATUS_COOPERATIVE, LEGAL_STATUS_ASSOCIATION
@@ -31,7 +34,6 @@ from tapir.pickup_locations.services.member_pickup_location_getter import (
 from tapir.solidarity_contribution.services.member_solidarity_contribution_service import (
     MemberSolidarityContributionService,
 )
-from tapir.utils.services.tapir_cache import TapirCache
 from tapir.wirgarten.constants import Permission
 from tapir.wirgarten.models import (
     Member,
@@ -259,22 +261,15 @@ class MemberFilter(FilterSet):
             if value == "nicht-mitglied":
                 return queryset.filter(is_student=False)
         elif legal_status_is_association(cache=self.cache):
-            included_member_ids = set()
-            for member in queryset:
-                membership = TapirCache.get_member_association_membership_at_date(
-                    cache=self.cache,
-                    member=member,
-                    reference_date=get_today(cache=self.cache),
+            if value == "no_membership":
+                return AssociationMembershipAtDateFilter.filter_members_without_membership_at_date(
+                    queryset=queryset, reference_date=get_today(cache=self.cache)
                 )
-                if (
-                    value == "no_membership"
-                    and membership is None
-                    or membership is not None
-                    and membership.type_id == value
-                ):
-                    included_member_ids.add(member.id)
-
-            return queryset.filter(id__in=included_member_ids)
+            return AssociationMembershipAtDateFilter.filter_members_with_membership_at_date(
+                queryset=queryset,
+                reference_date=get_today(cache=self.cache),
+                membership_type_id=value,
+            )
 
 
 class MemberListView(PermissionRequiredMixin, FilterView):